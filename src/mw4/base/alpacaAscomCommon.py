@@ -15,10 +15,11 @@
 ###########################################################
 import queue
 import threading
+import time
 from dataclasses import dataclass, field
 from mw4.base.driverDataClass import DriverData
 from PySide6.QtCore import QThreadPool
-from typing import Any
+from typing import Any, ClassVar
 
 
 @dataclass
@@ -29,9 +30,33 @@ class CommandItem:
     value: Any = None
 
 
+@dataclass
+class PropertySchedule:
+    interval: float
+    due: float = 0.0
+    value: Any = None
+
+
 class AlpacaAscomCommon(DriverData):
+    """
+    The poll cycle reads the properties of pollData with adaptive intervals:
+    static properties (STATIC_PROPERTIES and the Can* capabilities) double
+    their interval with each unchanged read up to MAX_POLL_INTERVAL and are
+    read again with UPDATE_RATE once they changed. All other properties are
+    states, which could change at any time (e.g. Slewing, Position), and are
+    always read with UPDATE_RATE. Skipped properties keep their last value.
+    Any command sent to the device resets all intervals, so the changes caused
+    by it are seen immediately. All due properties of the last cycle are read
+    at the start of the cycle by readProperties, which allows the protocols to
+    read them in one batch.
+    """
+
     PROTOCOL_NAME: str = ""
     UPDATE_RATE: float = 0.25
+    MAX_POLL_INTERVAL: float = 4.0
+    STATIC_PROPERTIES: ClassVar[frozenset[str]] = frozenset(
+        {"Name", "DriverVersion", "DriverInfo"}
+    )
 
     def __init__(self, parent: Any) -> None:
         super().__init__(parent.data)
@@ -46,10 +71,18 @@ class AlpacaAscomCommon(DriverData):
         self.stopEvent: threading.Event = threading.Event()
         self.connectEvent: threading.Event = threading.Event()
         self.loggingTrace: bool = False
+        self.propertySchedules: dict[str, PropertySchedule] = {}
+        self.pollProperties: set[str] = set()
+        self.pollRequests: set[str] | None = None
+        self.prefetched: dict[str, Any] = {}
 
     def getDeviceProp(self, valueProp: str) -> Any:
         if valueProp in self.propertyExceptions:
             return None
+        if self.pollRequests is not None:
+            self.pollRequests.add(valueProp)
+        if valueProp in self.prefetched:
+            return self.prefetched.pop(valueProp)
         try:
             returnVal = getattr(self.device, valueProp)
             if self.loggingTrace and "ImageArray" not in valueProp:
@@ -111,8 +144,36 @@ class AlpacaAscomCommon(DriverData):
     def callDeviceMethodQueued(self, valueProp: str, **kwargs: Any) -> None:
         self.commandQueue.put(CommandItem(cmdType="call", valueProp=valueProp, kwargs=kwargs))
 
+    def isPropertyDue(self, valueProp: str, now: float) -> bool:
+        schedule = self.propertySchedules.get(valueProp)
+        return schedule is None or schedule.due <= now
+
+    def isStaticProperty(self, valueProp: str) -> bool:
+        return valueProp.startswith("Can") or valueProp in self.STATIC_PROPERTIES
+
+    def updatePropertySchedule(self, valueProp: str, value: Any, now: float) -> None:
+        schedule = self.propertySchedules.setdefault(
+            valueProp, PropertySchedule(interval=self.UPDATE_RATE)
+        )
+        if value == schedule.value and self.isStaticProperty(valueProp):
+            schedule.interval = min(2 * schedule.interval, self.MAX_POLL_INTERVAL)
+        else:
+            schedule.interval = self.UPDATE_RATE
+        schedule.value = value
+        schedule.due = now + schedule.interval
+
     def getAndStoreDeviceProp(self, valueProp: str, element: str) -> None:
-        value = self.getDeviceProp(valueProp)
+        if self.pollRequests is None:
+            self.storePropertyToData(self.getDeviceProp(valueProp), element)
+            return
+
+        now = time.monotonic()
+        if self.isPropertyDue(valueProp, now):
+            value = self.getDeviceProp(valueProp)
+            self.updatePropertySchedule(valueProp, value, now)
+        else:
+            self.pollRequests.add(valueProp)
+            value = self.propertySchedules[valueProp].value
         self.storePropertyToData(value, element)
 
     def connectDevice(self) -> bool:
@@ -136,12 +197,36 @@ class AlpacaAscomCommon(DriverData):
     def pollData(self) -> None:
         pass
 
+    def readProperties(self, valueProps: list[str]) -> dict[str, Any]:
+        """
+        returns the values of the properties, which could be read in one batch.
+        The remaining properties are read one by one by getDeviceProp.
+        """
+        return {}
+
+    def pollCycle(self) -> None:
+        now = time.monotonic()
+        due = [
+            valueProp
+            for valueProp in self.pollProperties
+            if valueProp not in self.propertyExceptions and self.isPropertyDue(valueProp, now)
+        ]
+        self.prefetched = self.readProperties(due)
+        self.pollRequests = set()
+        try:
+            self.pollData()
+        finally:
+            self.pollProperties = self.pollRequests
+            self.pollRequests = None
+            self.prefetched = {}
+
     def processCommandQueue(self) -> None:
         while not self.commandQueue.empty():
             try:
                 cmd = self.commandQueue.get_nowait()
             except queue.Empty:
                 break
+            self.propertySchedules.clear()
             if cmd.cmdType == "call":
                 self.callDeviceMethod(cmd.valueProp, **cmd.kwargs)
             elif cmd.cmdType == "set":
@@ -155,6 +240,8 @@ class AlpacaAscomCommon(DriverData):
         if not self.connectDevice():
             return
         self.deviceConnected = True
+        self.propertySchedules.clear()
+        self.pollProperties = set()
         self.signals.deviceConnected.emit(self.config.deviceName)
         self.getInitialConfig()
 
@@ -169,7 +256,7 @@ class AlpacaAscomCommon(DriverData):
             elif not self.getDeviceProp("Connected"):
                 self.handleDeviceDisconnect()
             else:
-                self.pollData()
+                self.pollCycle()
                 self.processCommandQueue()
             self.stopEvent.wait(timeout=self.UPDATE_RATE)
 
@@ -14,6 +14,9 @@
 #
 ###########################################################
 import alpaca.management as alpacaMgmt
+import itertools
+import random
+import requests
 from alpaca.camera import Camera as AlpycaCamera
 from alpaca.covercalibrator import CoverCalibrator as AlpycaCoverCalibrator
 from alpaca.dome import Dome as AlpycaDome
@@ -22,10 +25,12 @@ from alpaca.focuser import Focuser as AlpycaFocuser
 from alpaca.observingconditions import ObservingConditions as AlpycaObsConditions
 from alpaca.switch import Switch as AlpycaSwitch
 from alpaca.telescope import Telescope as AlpycaTelescope
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from mw4.base.alpacaAscomCommon import AlpacaAscomCommon
 from mw4.base.tpool import Worker
-from typing import Any, ClassVar
+from requests.adapters import HTTPAdapter
+from typing import Any, ClassVar, Final
 
 
 @dataclass
@@ -40,7 +45,27 @@ class DeviceConfigAlpaca:
 
 
 class AlpacaClass(AlpacaAscomCommon):
+    """
+    The polled properties are read by readProperties in parallel with a
+    session of its own, which keeps the connections to the server alive.
+    alpyca serializes all requests of all devices by one lock, so the batch
+    does not use it. Properties which alpyca converts, and any property with
+    an error in the batch, are read by alpyca as before. Session and
+    executor live from createAlpacaDevice until stopCommunication.
+    """
+
     PROTOCOL_NAME: str = "ALPACA"
+    MAX_WORKERS: Final[int] = 8
+    HTTP_TIMEOUT: Final[float] = 5.0
+    CLIENT_ID: Final[int] = random.randint(1, 65535)
+    DIRECT_PROPERTIES: ClassVar[set[str]] = {
+        "DeviceState",
+        "DriverInfo",
+        "ImageArray",
+        "ImageArrayRaw",
+        "UTCDate",
+    }
+    transactionIds: ClassVar[itertools.count] = itertools.count(1)
     DEVICE_TYPE_MAP: ClassVar[dict[str, type]] = {
         "camera": AlpycaCamera,
         "dome": AlpycaDome,
@@ -57,6 +82,8 @@ class AlpacaClass(AlpacaAscomCommon):
         self.parent = parent
         self.config = DeviceConfigAlpaca()
         self.workerCommunicationLoop: Worker | None = None
+        self.session: requests.Session | None = None
+        self.executor: ThreadPoolExecutor | None = None
 
     def createAlpacaDevice(self, deviceType: str) -> bool:
         deviceClass = self.DEVICE_TYPE_MAP.get(deviceType)
@@ -72,8 +99,70 @@ class AlpacaClass(AlpacaAscomCommon):
             return False
 
         self.log.debug(f"Created device at [{address}]")
+        self.createSession()
         return True
 
+    def createSession(self) -> None:
+        self.closeSession()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_WORKERS)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+
+    def closeSession(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def readProperty(self, valueProp: str) -> tuple[bool, Any]:
+        """
+        returns if the property could be read and its value.
+        """
+        params = {
+            "ClientID": self.CLIENT_ID,
+            "ClientTransactionID": next(self.transactionIds),
+        }
+        session = self.session
+        if session is None:
+            return False, None
+        try:
+            response = session.get(
+                f"{self.device.base_url}/{valueProp.lower()}",
+                params=params,
+                timeout=self.HTTP_TIMEOUT,
+            )
+            response.raise_for_status()
+            reply = response.json()
+        except (requests.RequestException, ValueError) as e:
+            self.log.debug(f"[{self.config.deviceName}] batch [{valueProp}] failed: {e}")
+            return False, None
+        if reply.get("ErrorNumber", 0):
+            return False, None
+        return True, reply.get("Value")
+
+    def readProperties(self, valueProps: list[str]) -> dict[str, Any]:
+        valueProps = [
+            valueProp
+            for valueProp in valueProps
+            if valueProp.isidentifier() and valueProp not in self.DIRECT_PROPERTIES
+        ]
+        executor = self.executor
+        if executor is None or not valueProps:
+            return {}
+        try:
+            results = list(executor.map(self.readProperty, valueProps))
+        except RuntimeError:
+            return {}
+        return {
+            valueProp: value
+            for valueProp, (suc, value) in zip(valueProps, results, strict=True)
+            if suc
+        }
+
     def startCommunication(self) -> None:
         self.deviceConnected = False
         self.data.clear()
@@ -84,6 +173,10 @@ class AlpacaClass(AlpacaAscomCommon):
         self.workerCommunicationLoop = Worker(self.runnerCommunicationLoop)
         self.threadPool.start(self.workerCommunicationLoop)
 
+    def stopCommunication(self) -> None:
+        super().stopCommunication()
+        self.closeSession()
+
     def discoverAPIVersion(self) -> int:
         address = f"{self.config.hostAddress}:{self.config.port}"
         try:
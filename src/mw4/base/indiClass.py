@@ -13,16 +13,15 @@
 # License APL2.0
 #
 ###########################################################
-import asyncio
 import logging
 import queue
 from dataclasses import dataclass, field
-from indipyclient.queclient import EventItem, QueClient, runqueclient
+from indipyclient.queclient import EventItem
 from mw4.base.indiClassAddOns import INDI_TYPES, INDIGO_CONV
-from mw4.base.tpool import Worker
+from mw4.base.indiConnection import IndiConnection, IndiConsumer
 from PySide6.QtCore import QMutex, QThreadPool
 from queue import Queue
-from typing import Any
+from typing import Any, Final
 
 
 @dataclass
@@ -38,6 +37,7 @@ class DeviceConfigIndi:
 class IndiClass:
     log = logging.getLogger("MW4")
     MAX_SEARCH: int = 20
+    VECTOR_EVENTS: Final[tuple[str, ...]] = ("Define", "DefineBLOB", "Set", "SetBLOB")
 
     def __init__(self, parent: Any) -> None:
         self.parent: Any = parent
@@ -47,18 +47,14 @@ class IndiClass:
         self.signals: Any = parent.signals
         self.config = DeviceConfigIndi()
         self.threadPool: QThreadPool = parent.app.threadPool
-        self.clientMutex: QMutex = QMutex()
         self.discoverMutex: QMutex = QMutex()
         self.deviceConnected: bool = False
         self.discoverList: list[str] = []
         self.isINDIGO: bool = False
         self.commandRunning: bool = False
         self.loggingTrace: bool = False
-        self.rxQ: Queue = Queue()
         self.txQ: Queue = Queue()
-        self.queueClient: QueClient | None = None
-        self.workerIndiQueueClient: Worker | None = None
-        self.workerProcessRxQueue: Worker | None = None
+        self.consumer: IndiConsumer | None = None
 
     def updateMessage(self, item: EventItem) -> None:
         if not self.config.showMessage:
@@ -79,6 +75,7 @@ class IndiClass:
         self.deviceConnected = status
 
     def writeVectorsToData(self, item: EventItem, vectors: dict) -> None:
+        changed = {}
         for vectorItem in vectors.values():
             vectorName = vectorItem["name"]
             for member, memberItem in vectorItem["members"].items():
@@ -87,56 +84,68 @@ class IndiClass:
                 value = False if value == "Off" else value
                 entry = f"{vectorName}.{member}"
                 entry = INDIGO_CONV.get(entry, entry) if self.isINDIGO else entry
+                if entry in self.data and self.data[entry] == value:
+                    continue
                 self.data[entry] = value
+                changed[entry] = value
+        if changed:
+            self.signals.dataChanged.emit(changed)
 
-    def runnerProcessRxQueue(self) -> None:
-        while self.commandRunning:
-            try:
-                item = self.rxQ.get(timeout=0.01)
-            except queue.Empty:
-                continue
-            if item.snapshot.get(self.config.deviceName) is None:
-                continue
-            if item.devicename != self.config.deviceName:
-                continue
-            if item.snapshot[self.config.deviceName].get("CONNECTION"):
-                self.setStatusDeviceConnected(item)
-            if item.eventtype == "Message":
-                self.updateMessage(item)
-            vectors = item.snapshot[self.config.deviceName].dictdump().get("vectors")
-            if vectors:
-                self.writeVectorsToData(item, vectors)
-
-    def cleanupStop(self) -> None:
-        self.queueClient = None
-        self.clientMutex.unlock()
+    def collectVectors(self, item: EventItem) -> dict:
+        """
+        for define and set events only the vector named in the event has changed
+        and the snapshot holds only this one, so only this one is dumped and
+        handed to writeVectorsToData. all other events (getProperties, Delete,
+        Message, ...) deliver the whole device and do a full dump to resync the
+        data.
+        """
+        device = item.snapshot[self.config.deviceName]
+        if item.eventtype in self.VECTOR_EVENTS and item.vectorname:
+            vector = device.get(item.vectorname)
+            if vector is None:
+                return {}
+            return {item.vectorname: vector.dictdump()}
+        return device.dictdump().get("vectors") or {}
 
-    def runnerQueueClient(self) -> None:
-        self.queueClient = QueClient(
-            self.txQ,
-            self.rxQ,
-            indihost=self.config.hostAddress,
-            indiport=self.config.port,
-            blobfolder=str(self.app.mwGlob["tempDir"]),
-        )
-        self.queueClient.debug_verbosity(3 if self.loggingTrace else 0)
-        asyncio.run(self.queueClient.asyncrun())
+    def processRxItem(self, item: EventItem) -> None:
+        if not self.commandRunning:
+            return
+        if item.snapshot.get(self.config.deviceName) is None:
+            return
+        if item.devicename != self.config.deviceName:
+            return
+        if item.snapshot[self.config.deviceName].get("CONNECTION"):
+            self.setStatusDeviceConnected(item)
+        if item.eventtype == "Message":
+            self.updateMessage(item)
+        vectors = self.collectVectors(item)
+        if vectors:
+            self.writeVectorsToData(item, vectors)
 
     def startCommunication(self) -> None:
-        if not self.clientMutex.tryLock():
+        """
+        the device is added as consumer to the connection shared by all devices
+        on the same indiserver. The txQ of a stopped device still has to be
+        sent up to the stop marker, so a new one is used.
+        """
+        if self.consumer is not None:
             return
-        self.txQ.queue.clear()
-        self.rxQ.queue.clear()
+        self.txQ = Queue()
         self.data.clear()
         self.commandRunning = True
-        self.workerIndiQueueClient = Worker(self.runnerQueueClient)
-        self.workerIndiQueueClient.signals.finished.connect(self.cleanupStop)
-        self.threadPool.start(self.workerIndiQueueClient)
-        self.workerProcessRxQueue = Worker(self.runnerProcessRxQueue)
-        self.threadPool.start(self.workerProcessRxQueue)
+        self.consumer = IndiConsumer(self.config.deviceName, self.txQ, self.processRxItem)
+        IndiConnection.register(
+            self.consumer,
+            self.config.hostAddress,
+            self.config.port,
+            str(self.app.mwGlob["tempDir"]),
+            self.threadPool,
+            loggingTrace=self.loggingTrace,
+        )
 
     def stopCommunication(self) -> None:
         self.txQ.put(None)
+        self.consumer = None
         self.commandRunning = False
         self.deviceConnected = False
         self.signals.deviceDisconnected.emit(self.config.deviceName)
@@ -151,8 +160,10 @@ class IndiClass:
         txQ = Queue()
         rxQ = Queue()
         discoverSet = set()
-        worker = Worker(runqueclient, txQ, rxQ, indihost=hostaddress, indiport=port)
-        self.threadPool.start(worker)
+        consumer = IndiConsumer("", txQ, rxQ.put)
+        IndiConnection.register(
+            consumer, hostaddress, port, str(self.app.mwGlob["tempDir"]), self.threadPool
+        )
         while n > 0:
             try:
                 item = rxQ.get(timeout=0.1)
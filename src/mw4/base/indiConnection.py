@@ -0,0 +1,203 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import asyncio
+import logging
+import queue
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from indipyclient.ipyclient import IPyClient, SnapDevice
+from indipyclient.queclient import EventItem
+from mw4.base.tpool import Worker
+from PySide6.QtCore import QMutex, QMutexLocker, QThreadPool
+from queue import Queue
+from typing import Any, ClassVar
+
+
+@dataclass(eq=False)
+class IndiConsumer:
+    """
+    a consumer gets the events of the device with deviceName or of all devices
+    if deviceName is empty. The items of its txQ are sent to the server, None
+    releases the consumer from the connection.
+    """
+
+    deviceName: str
+    txQ: Queue
+    rxEvent: Callable[[EventItem], None]
+
+
+class IndiConnection(IPyClient):
+    """
+    The class IndiConnection is the one connection to an indiserver, which is
+    shared by all devices on the same host and port. The received XML is parsed
+    once and the events are routed to the consumers of the event's device. The
+    events carry the same EventItem as from QueClient, but the snapshot holds
+    only the device of the event and for define and set events only the vector
+    of the event. One thread runs the event loop, a second one hands the events
+    to the consumers, so slow consumers do not block the socket. The connection
+    is started with its first consumer and shut down when the last one is
+    released or the event loop ends.
+    """
+
+    log = logging.getLogger("MW4")
+    BLOB_VALUES: ClassVar[tuple[str, ...]] = ("Never", "Also", "Only")
+    VECTOR_EVENTS: ClassVar[tuple[str, ...]] = ("Define", "DefineBLOB", "Set", "SetBLOB")
+    connections: ClassVar[dict[tuple[str, int], "IndiConnection"]] = {}
+    mutex: ClassVar[QMutex] = QMutex()
+
+    def __init__(self, hostAddress: str, port: int, blobFolder: str) -> None:
+        super().__init__(indihost=hostAddress, indiport=port)
+        self.BLOBfolder = blobFolder
+        self.consumers: list[IndiConsumer] = []
+        self.dispatchQ: Queue = Queue()
+        self.workerEventLoop: Worker | None = None
+        self.workerDispatch: Worker | None = None
+
+    @classmethod
+    def register(
+        cls,
+        consumer: IndiConsumer,
+        hostAddress: str,
+        port: int,
+        blobFolder: str,
+        threadPool: QThreadPool,
+        loggingTrace: bool = False,
+    ) -> "IndiConnection":
+        """
+        adds the consumer to the connection for host and port and starts it if
+        there is none. On a running connection the properties are requested
+        again, so the consumer gets the definitions of its device.
+        """
+        with QMutexLocker(cls.mutex):
+            connection = cls.connections.get((hostAddress, port))
+            if connection is None:
+                connection = cls(hostAddress, port, blobFolder)
+                cls.connections[(hostAddress, port)] = connection
+                connection.start(threadPool)
+            else:
+                consumer.txQ.put((consumer.deviceName or None, None, "Get"))
+            if loggingTrace:
+                connection.debug_verbosity(3)
+            connection.consumers.append(consumer)
+        return connection
+
+    def release(self, consumer: IndiConsumer) -> None:
+        with QMutexLocker(self.mutex):
+            if consumer in self.consumers:
+                self.consumers.remove(consumer)
+            if self.consumers:
+                return
+            if self.connections.get((self.indihost, self.indiport)) is self:
+                del self.connections[(self.indihost, self.indiport)]
+            self.shutdown()
+        self.log.debug(f"Released INDI connection [{self.indihost}:{self.indiport}]")
+
+    def start(self, threadPool: QThreadPool) -> None:
+        self.workerEventLoop = Worker(self.runnerEventLoop)
+        threadPool.start(self.workerEventLoop)
+        self.workerDispatch = Worker(self.runnerDispatch)
+        threadPool.start(self.workerDispatch)
+        self.log.debug(f"Started INDI connection [{self.indihost}:{self.indiport}]")
+
+    def runnerEventLoop(self) -> None:
+        try:
+            asyncio.run(self.asyncrun())
+        finally:
+            with QMutexLocker(self.mutex):
+                if self.connections.get((self.indihost, self.indiport)) is self:
+                    del self.connections[(self.indihost, self.indiport)]
+            self.dispatchQ.put(None)
+
+    def runnerDispatch(self) -> None:
+        while True:
+            entry = self.dispatchQ.get()
+            if entry is None:
+                break
+            consumer, item = entry
+            if consumer not in self.consumers:
+                continue
+            try:
+                consumer.rxEvent(item)
+            except Exception as e:
+                self.log.error(f"[{consumer.deviceName}] event [{item.eventtype}] error: {e}")
+
+    def snapshotEvent(self, eventType: str, deviceName: str, vectorName: str | None) -> Any:
+        """
+        define and set events change only their vector, so only this one is
+        copied. All other events (Delete, Message, ...) get a copy of the whole
+        device to resync the data.
+        """
+        device = self[deviceName]
+        if eventType not in self.VECTOR_EVENTS or vectorName not in device:
+            return device.snapshot()
+        snapDevice = SnapDevice(deviceName, device.messages, device.user_string, device.itemid)
+        snapDevice[vectorName] = device[vectorName].snapshot()
+        return snapDevice
+
+    def dispatch(
+        self, eventType: str, deviceName: str | None, vectorName: str | None, timestamp: Any
+    ) -> None:
+        """
+        hands the event to the consumers of the device. The snapshot is taken
+        once for all of them.
+        """
+        if not deviceName or deviceName not in self:
+            return
+        consumers = [x for x in list(self.consumers) if x.deviceName in ("", deviceName)]
+        if not consumers:
+            return
+        snapshot = {deviceName: self.snapshotEvent(eventType, deviceName, vectorName)}
+        item = EventItem(eventType, deviceName, vectorName, timestamp, snapshot)
+        for consumer in consumers:
+            self.dispatchQ.put((consumer, item))
+
+    async def rxevent(self, event: Any) -> None:
+        self.dispatch(event.eventtype, event.devicename, event.vectorname, event.timestamp)
+
+    async def transmit(self, consumer: IndiConsumer, item: Any) -> None:
+        """
+        sends an item of the txQ of a consumer like QueClient does: None
+        releases the consumer, "Get" requests the properties, a BLOB value
+        enables the BLOBs and a dictionary sets the members of the vector.
+        """
+        if item is None:
+            self.release(consumer)
+            return
+        if len(item) != 3:
+            return
+        deviceName, vectorName, value = item
+        if isinstance(value, dict):
+            timestamp = datetime.now(tz=UTC)
+            await self.send_newVector(deviceName, vectorName, timestamp, members=value)
+            self.dispatch("State", deviceName, vectorName, timestamp)
+        elif value == "Get":
+            await self.send_getProperties(deviceName, vectorName)
+        elif value in self.BLOB_VALUES:
+            await self.send_enableBLOB(value, deviceName, vectorName)
+
+    async def hardware(self) -> None:
+        while not self._stop:
+            sent = False
+            for consumer in list(self.consumers):
+                try:
+                    item = consumer.txQ.get_nowait()
+                except queue.Empty:
+                    continue
+                sent = True
+                await self.transmit(consumer, item)
+            if not sent:
+                await asyncio.sleep(0.02)
@@ -28,3 +28,4 @@ class Signals(QObject):
     message = Signal(str)
     version = Signal(int)
     result = Signal(object)
+    dataChanged = Signal(object)
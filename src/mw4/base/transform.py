@@ -16,73 +16,61 @@
 import erfa
 import logging
 import numpy as np
-from PySide6.QtCore import QMutex, QMutexLocker
 from skyfield.api import Angle
 from skyfield.timelib import Time
 from skyfield.toposlib import GeographicPosition
 
 log: logging.Logger = logging.getLogger("MW4")
-mutex: QMutex = QMutex()
+
+# the transformations are pure erfa ufunc calls without shared state, so they
+# are reentrant and could be called from several threads without locking. ra,
+# dec and the time could be scalars or arrays, which are broadcast against each
+# other. the erfa astrom context is calculated once per call and epoch and not
+# for every coordinate.
+
+
+def astromCIRS(timeJD: Time) -> tuple[np.ndarray, np.ndarray]:
+    return erfa.apci13(timeJD.ut1, 0.0)
+
+
+def astromObserved(
+    timeJD: Time, location: GeographicPosition
+) -> tuple[np.ndarray, np.ndarray]:
+    lat = location.latitude.radians
+    lon = location.longitude.radians
+    elevation = location.elevation.m
+    return erfa.apco13(timeJD.ut1, 0.0, 0, lon, lat, elevation, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
 
 def JNowToJ2000(ra: Angle, dec: Angle, timeJD: Time) -> tuple[Angle, Angle]:
-    with QMutexLocker(mutex):
-        ra = ra.radians
-        dec = dec.radians
-        ra = erfa.anp(ra + erfa.eo06a(timeJD.tt, 0.0))
-        raConv, decConv, _ = erfa.atic13(ra, dec, timeJD.ut1, 0.0)
-        ra = Angle(radians=raConv, preference="hours")
-        dec = Angle(radians=decConv, preference="degrees")
-        return ra, dec
+    astrom, _ = astromCIRS(timeJD)
+    ra = erfa.anp(ra.radians + erfa.eo06a(timeJD.tt, 0.0))
+    raConv, decConv = erfa.aticq(ra, dec.radians, astrom)
+    ra = Angle(radians=raConv, preference="hours")
+    dec = Angle(radians=decConv, preference="degrees")
+    return ra, dec
 
 
 def J2000ToJNow(ra: Angle, dec: Angle, timeJD: Time) -> tuple[Angle, Angle]:
-    with QMutexLocker(mutex):
-        ra = ra.radians
-        dec = dec.radians
-        raConv, decConv, eo = erfa.atci13(ra, dec, 0, 0, 0, 0, timeJD.ut1, 0)
-        raConv = erfa.anp(raConv - eo)
-        ra = Angle(radians=raConv, preference="hours")
-        dec = Angle(radians=decConv, preference="degrees")
-        return ra, dec
+    astrom, eo = astromCIRS(timeJD)
+    raConv, decConv = erfa.atciq(ra.radians, dec.radians, 0, 0, 0, 0, astrom)
+    raConv = erfa.anp(raConv - eo)
+    ra = Angle(radians=raConv, preference="hours")
+    dec = Angle(radians=decConv, preference="degrees")
+    return ra, dec
 
 
 def J2000ToAltAz(
     ra: Angle, dec: Angle, timeJD: Time, location: GeographicPosition
 ) -> tuple[Angle, Angle]:
-    with QMutexLocker(mutex):
-        ra = ra.radians
-        dec = dec.radians
-        lat = location.latitude.radians
-        lon = location.longitude.radians
-        elevation = location.elevation.m
-
-        v = erfa.atco13(
-            ra,
-            dec,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            timeJD.ut1,
-            0.0,
-            0,
-            lon,
-            lat,
-            elevation,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-        )
-        aob, zob, _hob, _dob, _rob, _eo = v
-        decConv = np.pi / 2 - zob
-
-        azimuth = Angle(radians=aob, preference="degrees")
-        altitude = Angle(radians=decConv, preference="degrees")
-        return azimuth, altitude
+    astrom, _ = astromObserved(timeJD, location)
+    ri, di = erfa.atciq(ra.radians, dec.radians, 0.0, 0.0, 0.0, 0.0, astrom)
+    aob, zob, _hob, _dob, _rob = erfa.atioq(ri, di, astrom)
+    decConv = np.pi / 2 - zob
+
+    azimuth = Angle(radians=aob, preference="degrees")
+    altitude = Angle(radians=decConv, preference="degrees")
+    return azimuth, altitude
 
 
 def diffModulusAbs(x: float, y: float, m: int) -> float:
@@ -97,6 +97,17 @@ class ImageTabs:
         self.ui.roundness.setImageColorMap(colorMapIndex)
         self.ui.aberration.setImageColorMap(colorMapIndex)
 
+    def analysisLevels(self) -> tuple[float, float]:
+        """
+        converts the levels of the displayed image to the native values of the
+        analysis image, which is used by the photometry views.
+        """
+        minL, maxL = self.ui.image.barItem.levels()
+        pyramid = self.fileHandler.pyramid
+        if pyramid is None or not pyramid.scale:
+            return minL, maxL
+        return minL / pyramid.scale, maxL / pyramid.scale
+
     def setCrosshair(self) -> None:
         self.ui.image.showCrosshair(self.ui.showCrosshair.isChecked())
 
@@ -129,15 +140,14 @@ class ImageTabs:
         tabIndex = getTabIndex(tab, "Image")
         tab.setTabEnabled(tabIndex, True)
 
-        if self.fileHandler.image is None:
+        if self.fileHandler.pyramid is None:
             self.msg.emit(0, "Image", "Rendering error", "Incompatible image format")
             return
 
         self.ui.slewCenter.setEnabled(self.fileHandler.hasCelestial)
         self.imageSourceRange = QRectF()
-        self.ui.image.setImage(
-            imageDisp=self.fileHandler.image,
-            updateGeometry=not self.imagingDeviceStat["exposeN"],
+        self.ui.image.setImagePyramid(
+            self.fileHandler.pyramid, updateGeometry=not self.imagingDeviceStat["exposeN"]
         )
         self.setBarColor()
         self.setCrosshair()
@@ -161,7 +171,7 @@ class ImageTabs:
         plotItem = self.ui.tiltSquare.p[0]
         self.clearImageTab(self.ui.tiltSquare)
         self.ui.tiltSquare.setImage(self.photometry.image)
-        self.ui.tiltSquare.barItem.setLevels(self.ui.image.barItem.levels())
+        self.ui.tiltSquare.barItem.setLevels(self.analysisLevels())
 
         # draw lines on image
         for i in range(1, 3):
@@ -282,7 +292,7 @@ class ImageTabs:
         plotItem = self.ui.tiltTriangle.p[0]
         self.clearImageTab(self.ui.tiltTriangle)
         self.ui.tiltTriangle.setImage(self.photometry.image)
-        self.ui.tiltTriangle.barItem.setLevels(self.ui.image.barItem.levels())
+        self.ui.tiltTriangle.barItem.setLevels(self.analysisLevels())
 
         # draw rings on image
         for rad in [r, r25]:
@@ -50,6 +50,7 @@ class ImageWindow(MWidget):
         self.slewInterface = SlewInterface(self)
         self.imageFileName: Path = Path()
         self.imageFileNameOld: Path = Path()
+        self.imageSolving: Path | None = None
         self.exposureTime: float = 1
         self.binning: int = 1
         self.folder: Path = Path()
@@ -134,6 +135,7 @@ class ImageWindow(MWidget):
 
     def closeEvent(self, closeEvent) -> None:
         self.storeConfig()
+        self.photometry.extraction.shutdown()
         super().closeEvent(closeEvent)
 
     def setupIcons(self) -> None:
@@ -220,7 +222,7 @@ class ImageWindow(MWidget):
         self.app.showImage.emit(self.imageFileName)
 
     def copyLevels(self) -> None:
-        level = self.ui.image.barItem.levels()
+        level = self.tabs.analysisLevels()
         self.ui.tiltSquare.barItem.setLevels(level)
         self.ui.tiltTriangle.barItem.setLevels(level)
         self.ui.aberration.barItem.setLevels(level)
@@ -247,14 +249,19 @@ class ImageWindow(MWidget):
     def processPhotometry(self) -> None:
         isPhotometry = self.ui.photometryGroup.isChecked()
         self.clearGui()
-        if self.fileHandler.image is None or not isPhotometry:
+        if not isPhotometry or self.fileHandler.pyramid is None:
             return
 
         changeStyleDynamic(self.ui.photometryGroup, "run", "true")
         self.ui.showValues.setEnabled(isPhotometry)
         self.ui.isoLayer.setEnabled(isPhotometry)
         snTarget = self.ui.snTarget.currentIndex()
-        self.photometry.processPhotometry(self.fileHandler.image, snTarget)
+        self.photometry.processPhotometry(
+            self.fileHandler.imagePath,
+            self.fileHandler.pyramid.analysisImage,
+            snTarget,
+            (self.fileHandler.flipH, self.fileHandler.flipV),
+        )
 
     def showImage(self, imagePath: Path) -> None:
         if not imagePath.is_file():
@@ -344,6 +351,11 @@ class ImageWindow(MWidget):
         self.app.operationRunning.emit(Model.STATUS_IDLE)
 
     def solveDone(self, result: dict) -> None:
+        # results of model run solves share the signal and are ignored here
+        imagePath = result.get("imagePath", self.imageSolving)
+        if self.imageSolving and imagePath != self.imageSolving:
+            return
+        self.imageSolving = None
         self.imagingDeviceStat["solve"] = False
         self.app.dReg["plateSolve"].signals.result.disconnect(self.solveDone)
 
@@ -374,8 +386,12 @@ class ImageWindow(MWidget):
             return
 
         self.app.operationRunning.emit(Model.STATUS_SOLVE)
+        self.imageSolving = imagePath
         self.app.dReg["plateSolve"].signals.result.connect(self.solveDone)
-        self.app.dReg["plateSolve"].instance.solve(imagePath, self.ui.embedData.isChecked())
+        plateSolve = self.app.dReg["plateSolve"].instance
+        plateSolve.solve(
+            imagePath, self.ui.embedData.isChecked(), plateSolve.PRIORITY_INTERACTIVE
+        )
         self.imagingDeviceStat["solve"] = True
         self.msg.emit(0, "Image", "Solving", imagePath.stem)
 
@@ -383,7 +399,8 @@ class ImageWindow(MWidget):
         self.signals.solveImage.emit(self.imageFileName)
 
     def abortSolve(self) -> None:
-        self.app.dReg["plateSolve"].instance.abort()
+        plateSolve = self.app.dReg["plateSolve"].instance
+        plateSolve.cancelJobs(plateSolve.PRIORITY_INTERACTIVE)
         self.app.operationRunning.emit(Model.STATUS_IDLE)
 
     def slewDirect(self, ra: Angle, dec: Angle) -> None:
@@ -93,18 +93,20 @@ class Model(TabAddon):
     def cancelBatch(self) -> None:
         if not self.modelData:
             return
-        self.modelData.cancelBatch = True
+        self.modelData.setCancelBatch()
+        plateSolve = self.app.dReg["plateSolve"].instance
+        plateSolve.cancelJobs(plateSolve.PRIORITY_BATCH)
 
     def pauseBatch(self) -> None:
         if not self.modelData:
             return
-        self.modelData.pauseBatch = not self.modelData.pauseBatch
+        self.modelData.setPauseBatch(not self.modelData.pauseBatch)
         changeStyleDynamic(self.ui.pauseModel, "pause", self.modelData.pauseBatch)
 
     def endBatch(self) -> None:
         if not self.modelData:
             return
-        self.modelData.endBatch = True
+        self.modelData.setEndBatch()
 
     def setModelOperationMode(self, status: int) -> None:
         if status == self.STATUS_MODEL_BATCH:
@@ -265,11 +267,11 @@ class Model(TabAddon):
 
     def setModelTiming(self) -> None:
         if self.ui.progressiveTiming.isChecked():
-            self.modelData.timing = self.modelData.PROGRESSIVE
+            self.modelData.modelTiming = self.modelData.PROGRESSIVE
         elif self.ui.normalTiming.isChecked():
-            self.modelData.timing = self.modelData.NORMAL
+            self.modelData.modelTiming = self.modelData.NORMAL
         elif self.ui.conservativeTiming.isChecked():
-            self.modelData.timing = self.modelData.CONSERVATIVE
+            self.modelData.modelTiming = self.modelData.CONSERVATIVE
 
     def runBatch(self) -> None:
         self.app.operationRunning.emit(self.STATUS_MODEL_BATCH)
@@ -67,6 +67,7 @@ class BuildPoints(TabAddon):
         self.ui.noSort.clicked.connect(self.rebuildPoints)
         self.ui.sortAZ.clicked.connect(self.rebuildPoints)
         self.ui.sortDomeAZ.clicked.connect(self.rebuildPoints)
+        self.ui.sortSlewTime.clicked.connect(self.rebuildPoints)
         self.ui.sortALT.clicked.connect(self.rebuildPoints)
         self.ui.ditherBuildPoints.clicked.connect(self.rebuildPoints)
         self.ui.avoidFlip.clicked.connect(self.rebuildPoints)
@@ -107,6 +108,7 @@ class BuildPoints(TabAddon):
         self.ui.noSort.setChecked(config.get("noSort", True))
         self.ui.sortAZ.setChecked(config.get("sortAZ", False))
         self.ui.sortDomeAZ.setChecked(config.get("sortDomeAZ", False))
+        self.ui.sortSlewTime.setChecked(config.get("sortSlewTime", False))
         self.ui.sortALT.setChecked(config.get("sortALT", False))
         self.ui.keepGeneratedPoints.setChecked(config.get("keepGeneratedPoints", False))
         self.ui.ditherBuildPoints.setChecked(config.get("ditherBuildPoints", False))
@@ -140,6 +142,7 @@ class BuildPoints(TabAddon):
         config["noSort"] = self.ui.noSort.isChecked()
         config["sortAZ"] = self.ui.sortAZ.isChecked()
         config["sortDomeAZ"] = self.ui.sortDomeAZ.isChecked()
+        config["sortSlewTime"] = self.ui.sortSlewTime.isChecked()
         config["sortALT"] = self.ui.sortALT.isChecked()
         config["keepGeneratedPoints"] = self.ui.keepGeneratedPoints.isChecked()
         config["ditherBuildPoints"] = self.ui.ditherBuildPoints.isChecked()
@@ -340,6 +343,9 @@ class BuildPoints(TabAddon):
             self.app.buildPoint.sortAz()
         if self.ui.sortDomeAZ.isChecked() and bool(self.app.deviceStat.get("dome")):
             self.app.buildPoint.sortDomeAz()
+        if self.ui.sortSlewTime.isChecked():
+            withDome = bool(self.app.deviceStat.get("dome"))
+            self.app.buildPoint.sortSlewTime(withDome=withDome)
         if self.ui.avoidFlip.isChecked():
             self.app.buildPoint.sortActualPierside()
 
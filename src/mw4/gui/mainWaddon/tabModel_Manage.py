@@ -19,6 +19,7 @@ from mw4.gui.mainWaddon.tabAddon import TabAddon
 from mw4.gui.utilities.nativeQt.qtInputDialog import MWInputDialog
 from mw4.gui.utilities.nativeQt.qtMessageDialog import MWMessageDialog
 from mw4.gui.utilities.qtHelpers import changeStyleDynamic
+from mw4.logic.modelBuild.modelIndex import getModelIndex
 from mw4.logic.modelBuild.modelRunSupport import (
     convertAngleToFloat,
     convertFloatToAngle,
@@ -248,6 +249,9 @@ class ModelManage(TabAddon):
         newModel = convertAngleToFloat(newModel)
         with open(newPath, "w+") as newFile:
             json.dump(newModel, newFile, sort_keys=True, indent=4)
+        modelIndex = getModelIndex(newPath.parent)
+        modelIndex.addFile(newPath)
+        modelIndex.save()
         self.fittedModelPath = newPath
 
     def clearRefreshModel(self) -> None:
@@ -20,17 +20,16 @@ from mw4.gui.mainWaddon.satData import SatData
 from mw4.gui.utilities.nativeQt.qtCustomTableWidgetItem import QCustomTableWidgetItem
 from mw4.gui.utilities.qtHelpers import changeStyleDynamic, positionCursorInTable
 from mw4.logic.databaseProcessing.sourceURL import satSourceURLs
-from mw4.logic.satellites.satellite_calculations import (
-    calcAppMag,
-    checkTwilight,
-    findRangeRate,
-    findSatUp,
-    findSunlit,
+from mw4.logic.satellites.satellite_batch import (
+    SatBatchResult,
+    calcSatStatesBatch,
+    checkTwilightBatch,
+    findSatMessagesBatch,
+    findSatUpBatch,
 )
-from PySide6.QtCore import QObject, QPoint, QRect, Qt, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 from PySide6.QtWidgets import QAbstractItemView, QTableWidgetItem
-from skyfield.api import EarthSatellite, Time
-from skyfield.toposlib import GeographicPosition
+from skyfield.api import EarthSatellite
 from typing import Any
 
 
@@ -206,6 +205,42 @@ class SatSearch(SatData):
             entry.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
             self.signals.setSatListItem.emit(row, 8, entry)
 
+    def collectSats(self, rows: list[int]) -> list[EarthSatellite]:
+        satTab = self.ui.listSats
+        return [self.satellites.objects[satTab.model().index(row, 1).data()] for row in rows]
+
+    def showSatStates(
+        self,
+        rows: list[int],
+        states: SatBatchResult,
+        timesUp: np.ndarray | None = None,
+        twilight: np.ndarray | None = None,
+    ) -> None:
+        ts = self.app.dReg["mount"].obsSite.ts
+        numSats = len(rows)
+        for i, row in enumerate(rows):
+            if timesUp is not None:
+                finished = (i + 1) / numSats * 100
+                self.ui.satFilterGroup.setTitle(f"Filter - processed: {finished:3.0f}%")
+            satParam = (
+                states.satRange[i],
+                states.radRate[i],
+                states.latRate[i],
+                states.lonRate[i],
+            )
+            if timesUp is None:
+                self.updateListSats(
+                    row, satParam, isSunlit=states.isSunlit[i], appMag=states.appMag[i]
+                )
+                continue
+            if np.isnan(satParam).any():
+                self.updateListSats(row, satParam, [], False, 99, 4)
+                continue
+            isUp = [] if np.isnan(timesUp[i]) else [ts.tt_jd(timesUp[i])]
+            self.updateListSats(
+                row, satParam, isUp, states.isSunlit[i], states.appMag[i], twilight[i]
+            )
+
     def calcSatListDynamic(self) -> None:
         # to optimize performance, we do not update if the tab is not visible
         if self.ui.satTabWidget.currentIndex() != 0 or not self.ui.satTabWidget.isVisible():
@@ -214,61 +249,21 @@ class SatSearch(SatData):
             return
 
         satTab = self.ui.listSats
+        rows = [row for row in range(satTab.rowCount()) if not satTab.isRowHidden(row)]
+        if not rows:
+            return
         loc = self.app.dReg["mount"].location
         eph = self.app.ephemeris
-        ts = self.app.dReg["mount"].obsSite.ts
-        timeNow = ts.now()
-        viewPortRect = QRect(QPoint(0, 0), satTab.viewport().size())
+        timeNow = self.app.dReg["mount"].obsSite.ts.now()
+        states = calcSatStatesBatch(self.collectSats(rows), loc, eph, timeNow)
+        self.showSatStates(rows, states)
 
-        for row in range(satTab.rowCount()):
-            rect = satTab.visualRect(satTab.model().index(row, 0))
-            if not viewPortRect.intersects(rect):
-                continue
-            if satTab.isRowHidden(row):
-                continue
-            name = satTab.model().index(row, 1).data()
-            sat = self.satellites.objects[name]
-            satParam = findRangeRate(sat, loc, timeNow)
-            if not np.isnan(satParam[0]) and sat:
-                isSunlit = findSunlit(sat, eph, timeNow)
-                satRange = satParam[0]
-                appMag = calcAppMag(sat, loc, eph, satRange, timeNow) if isSunlit else 99
-            else:
-                isSunlit = False
-                appMag = 99
-            self.updateListSats(row, satParam, isSunlit=isSunlit, appMag=appMag)
-
-    def checkSatOk(self, sat: EarthSatellite, tEnd: Time) -> bool:
-        msg = sat.at(tEnd).message
-        if msg:
-            self.mainW.log.warning(f"{sat.name} caused SGP4: [{msg}]")
+    def checkSatOk(self, sat: EarthSatellite, message: str | None) -> bool:
+        if message:
+            self.mainW.log.warning(f"{sat.name} caused SGP4: [{message}]")
             return False
         return True
 
-    def calcSat(
-        self,
-        sat: EarthSatellite,
-        row: int,
-        loc: GeographicPosition,
-        timeNow: Time,
-        timeNext: Time,
-        altMin: float,
-        eph: Any,
-    ) -> None:
-        satParam = findRangeRate(sat, loc, timeNow)
-        if not np.isnan(satParam).any():
-            isSunlit = findSunlit(sat, eph, timeNow)
-            isUp = findSatUp(sat, loc, timeNow, timeNext, altMin)
-            fitTwilight = checkTwilight(eph, loc, isUp)
-            satRange = satParam[0]
-            appMag = calcAppMag(sat, loc, eph, satRange, timeNow) if isSunlit else 99
-        else:
-            fitTwilight = 4
-            isSunlit = False
-            isUp = []
-            appMag = 99
-        self.updateListSats(row, satParam, isUp, isSunlit, appMag, fitTwilight)
-
     def runnerCalcSatList(self) -> None:
         satTab = self.ui.listSats
         loc = self.app.dReg["mount"].location
@@ -277,16 +272,20 @@ class SatSearch(SatData):
         timeNext = ts.tt_jd(timeNow.tt + 1)
         altMin = self.ui.satAltitudeMin.value()
         eph = self.app.ephemeris
-        numSats = satTab.rowCount()
-        for row in range(numSats):
-            finished = (row + 1) / numSats * 100
-            t = f"Filter - processed: {finished:3.0f}%"
-            self.ui.satFilterGroup.setTitle(t)
-            name = satTab.model().index(row, 1).data()
-            sat = self.satellites.objects[name]
-            if not self.checkSatOk(sat, timeNext):
-                continue
-            self.calcSat(sat, row, loc, timeNow, timeNext, altMin, eph)
+
+        rows = list(range(satTab.rowCount()))
+        sats = self.collectSats(rows)
+        messages = findSatMessagesBatch(sats, timeNext)
+        isOk = [self.checkSatOk(sat, msg) for sat, msg in zip(sats, messages)]
+        rows = [row for row, ok in zip(rows, isOk) if ok]
+        sats = [sat for sat, ok in zip(sats, isOk) if ok]
+        if not sats:
+            return
+
+        states = calcSatStatesBatch(sats, loc, eph, timeNow)
+        timesUp = findSatUpBatch(sats, loc, timeNow, timeNext, altMin)
+        twilight = checkTwilightBatch(eph, loc, ts, timesUp)
+        self.showSatStates(rows, states, timesUp, twilight)
 
     def calcSatList(self) -> None:
         title = "Setup " + self.app.timeMgr.timeZoneString()
@@ -315,25 +315,19 @@ class SatTrack(SatData):
     def filterHorizonForward(
         self, alt: np.ndarray, az: np.ndarray
     ) -> tuple[np.ndarray, np.ndarray, int]:
-        timeDelayStart = 0
-        for altitude, azimuth in zip(alt, az):
-            if self.app.buildPoint.isAboveHorizon([altitude, azimuth]):
-                break
-            timeDelayStart += 1
-            alt = np.delete(alt, 0)
-            az = np.delete(az, 0)
+        isAbove = self.app.buildPoint.isAboveHorizonBatch(alt, az)
+        timeDelayStart = int(np.argmax(isAbove)) if isAbove.any() else len(isAbove)
+        alt = np.asarray(alt)[timeDelayStart:]
+        az = np.asarray(az)[timeDelayStart:]
         return alt, az, timeDelayStart
 
     def filterHorizonReverse(
         self, alt: np.ndarray, az: np.ndarray
     ) -> tuple[np.ndarray, np.ndarray, int]:
-        timeDelayEnd = 0
-        for altitude, azimuth in reversed(list(zip(alt, az))):
-            if self.app.buildPoint.isAboveHorizon([altitude, azimuth]):
-                break
-            timeDelayEnd += 1
-            alt = np.delete(alt, -1)
-            az = np.delete(az, -1)
+        isAbove = self.app.buildPoint.isAboveHorizonBatch(alt, az)
+        timeDelayEnd = int(np.argmax(isAbove[::-1])) if isAbove.any() else len(isAbove)
+        alt = np.asarray(alt)[: len(isAbove) - timeDelayEnd]
+        az = np.asarray(az)[: len(isAbove) - timeDelayEnd]
         return alt, az, timeDelayEnd
 
     def filterHorizon(
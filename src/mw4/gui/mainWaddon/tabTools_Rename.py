@@ -13,10 +13,10 @@
 # License APL2.0
 #
 ###########################################################
-from astropy.io import fits
 from collections.abc import Callable
 from mw4.gui.mainWaddon.tabAddon import TabAddon
 from mw4.gui.utilities.nativeQt.qtFileDialog import MWFileDialog
+from mw4.logic.fits.fitsHeader import readHeader
 from pathlib import Path
 from PySide6.QtWidgets import QApplication, QListView
 from typing import Any, ClassVar
@@ -112,18 +112,17 @@ class Rename(TabAddon):
         return nameChunk
 
     def renameFile(self, fileName: Path) -> None:
-        with fits.open(name=fileName) as fd:
-            fitsHeader = fd[0].header
-            newObjectName = self.ui.newObjectName.text().upper()
-            newFileName = newObjectName or fitsHeader.get("OBJECT", "UNKNOWN").upper()
-
-            for selector in self.selectorsDropDowns.values():
-                selection = selector.currentText()
-                chunk = self.processSelectors(fitsHeader, selection)
-                if chunk:
-                    newFileName += f"_{chunk}"
-            newFileName = (self.renameDir / newFileName).with_suffix(".fits")
-            fileName.rename(newFileName)
+        fitsHeader = readHeader(fileName)
+        newObjectName = self.ui.newObjectName.text().upper()
+        newFileName = newObjectName or fitsHeader.get("OBJECT", "UNKNOWN").upper()
+
+        for selector in self.selectorsDropDowns.values():
+            selection = selector.currentText()
+            chunk = self.processSelectors(fitsHeader, selection)
+            if chunk:
+                newFileName += f"_{chunk}"
+        newFileName = (self.renameDir / newFileName).with_suffix(".fits")
+        fileName.rename(newFileName)
 
     def renameRunGUI(self) -> None:
         includeSubdirs = self.ui.includeSubdirs.isChecked()
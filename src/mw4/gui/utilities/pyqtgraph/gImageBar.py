@@ -16,11 +16,15 @@
 import numpy as np
 import pyqtgraph as pg
 from mw4.gui.utilities.pyqtgraph.gPlotBase import PlotBase
+from mw4.logic.file.imagePyramid import ImagePyramid
+from PySide6.QtCore import QRectF, QTimer
 from PySide6.QtGui import QTransform
-from typing import Any
+from typing import Any, Final
 
 
 class ImageBar(PlotBase):
+    TILE_DELAY: Final[int] = 100
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.lx = None
@@ -31,13 +35,22 @@ class ImageBar(PlotBase):
         for side in ("left", "top", "right", "bottom"):
             self.p[0].getAxis(side).setGrid(0)
         self.defRange = {}
+        self.pyramid: ImagePyramid | None = None
+        self.tileTimer = QTimer()
+        self.tileTimer.setSingleShot(True)
+        self.tileTimer.setInterval(self.TILE_DELAY)
+        self.tileTimer.timeout.connect(self.updateTile)
+        self.p[0].getViewBox().sigRangeChanged.connect(self.requestTile)
 
     def constructPlot(self) -> None:
         self.p[0].clear()
         self.p[0].showAxes(True, showValues=True)
         self.imageItem = pg.ImageItem()
         self.p[0].addItem(self.imageItem)
-        self.barItem.setImageItem(self.imageItem, insert_in=self.p[0])
+        self.tileItem = pg.ImageItem()
+        self.tileItem.setVisible(False)
+        self.p[0].addItem(self.tileItem)
+        self.barItem.setImageItem([self.imageItem, self.tileItem], insert_in=self.p[0])
         self.lx = self.p[0].addLine(x=0, pen=pg.mkPen(color=self.M_YELLOW))
         self.ly = self.p[0].addLine(y=0, pen=pg.mkPen(color=self.M_YELLOW))
         self.lx.setVisible(False)
@@ -46,12 +59,25 @@ class ImageBar(PlotBase):
     def setImageColorMap(self, colorMapIndex: int) -> None:
         self.barItem.setColorMap(self.colorMapStyle[colorMapIndex])
 
-    def setImage(self, imageDisp: np.ndarray, updateGeometry: bool = True) -> bool:
+    def setImage(
+        self,
+        imageDisp: np.ndarray,
+        updateGeometry: bool = True,
+        size: tuple[int, int] | None = None,
+    ) -> bool:
+        """
+        size gives the width and height of the image in data coordinates if
+        imageDisp is a downsampled version of it.
+        """
+        self.pyramid = None
         self.constructPlot()
         if imageDisp is None:
             return False
         self.imageItem.setImage(imageDisp)
         yMax, xMax = imageDisp.shape
+        if size is not None:
+            xMax, yMax = size
+            self.imageItem.setRect(QRectF(0, 0, xMax, yMax))
         xMinR = max(xMax / 100, 100)
         yMinR = max(yMax / 100, 100)
         self.p[0].setLimits(
@@ -69,6 +95,45 @@ class ImageBar(PlotBase):
         self.ly.setPos((0, yMax / 2))
         return True
 
+    def setImagePyramid(self, pyramid: ImagePyramid, updateGeometry: bool = True) -> bool:
+        """
+        shows the preview of the pyramid at once. When zooming in, the visible
+        region is rendered with a finer level as tile on top of the preview.
+        """
+        suc = self.setImage(pyramid.preview, updateGeometry, (pyramid.width, pyramid.height))
+        self.pyramid = pyramid
+        self.requestTile()
+        return suc
+
+    def requestTile(self) -> None:
+        if self.pyramid is not None:
+            self.tileTimer.start()
+
+    def updateTile(self) -> bool:
+        if self.pyramid is None:
+            return False
+        viewBox = self.p[0].getViewBox()
+        rect = viewBox.viewRect()
+        x0 = max(int(rect.left()), 0)
+        y0 = max(int(rect.top()), 0)
+        x1 = min(int(np.ceil(rect.right())), self.pyramid.width)
+        y1 = min(int(np.ceil(rect.bottom())), self.pyramid.height)
+        if x1 <= x0 or y1 <= y0:
+            self.tileItem.setVisible(False)
+            return False
+
+        step = self.pyramid.stepForScale((x1 - x0) / max(viewBox.width(), 1))
+        if step >= self.pyramid.previewStep:
+            self.tileItem.setVisible(False)
+            return False
+
+        tile = self.pyramid.tile(x0, y0, x1, y1, step)
+        h, w = tile.shape
+        self.tileItem.setImage(tile, autoLevels=False, levels=self.barItem.levels())
+        self.tileItem.setRect(QRectF(x0, y0, w * step, h * step))
+        self.tileItem.setVisible(True)
+        return True
+
     def showCrosshair(self, show: bool) -> None:
         if self.lx:
             self.lx.setVisible(show)
@@ -2877,7 +2877,7 @@ class Ui_MainWindow(object):
         self.noSort.setChecked(True)
         self.avoidFlip = QCheckBox(self.autoSortGroup)
         self.avoidFlip.setObjectName(u"avoidFlip")
-        self.avoidFlip.setGeometry(QRect(10, 50, 336, 20))
+        self.avoidFlip.setGeometry(QRect(10, 50, 211, 20))
         self.avoidFlip.setFont(font1)
         self.autoDeleteMeridian = QCheckBox(self.autoSortGroup)
         self.autoDeleteMeridian.setObjectName(u"autoDeleteMeridian")
@@ -2911,6 +2911,10 @@ class Ui_MainWindow(object):
         self.sortDomeAZ.setObjectName(u"sortDomeAZ")
         self.sortDomeAZ.setGeometry(QRect(170, 20, 101, 20))
         self.sortDomeAZ.setFont(font1)
+        self.sortSlewTime = QRadioButton(self.autoSortGroup)
+        self.sortSlewTime.setObjectName(u"sortSlewTime")
+        self.sortSlewTime.setGeometry(QRect(235, 50, 111, 20))
+        self.sortSlewTime.setFont(font1)
         self.dsoGroup = QGroupBox(self.GenerateBuildPoints)
         self.dsoGroup.setObjectName(u"dsoGroup")
         self.dsoGroup.setGeometry(QRect(405, 5, 366, 106))
@@ -6730,7 +6734,8 @@ class Ui_MainWindow(object):
         QWidget.setTabOrder(self.sensor1Group, self.sensor2Group)
         QWidget.setTabOrder(self.sensor2Group, self.numberGridPointsCol)
         QWidget.setTabOrder(self.numberGridPointsCol, self.sortDomeAZ)
-        QWidget.setTabOrder(self.sortDomeAZ, self.genBuildCelestial)
+        QWidget.setTabOrder(self.sortDomeAZ, self.sortSlewTime)
+        QWidget.setTabOrder(self.sortSlewTime, self.genBuildCelestial)
         QWidget.setTabOrder(self.genBuildCelestial, self.meridianDistanceFlip)
         QWidget.setTabOrder(self.meridianDistanceFlip, self.numberCelestialStepHA)
         QWidget.setTabOrder(self.numberCelestialStepHA, self.numberSpiral)
@@ -7834,9 +7839,13 @@ class Ui_MainWindow(object):
 #endif // QT_CONFIG(tooltip)
         self.label_162.setText(QCoreApplication.translate("MainWindow", u"\u00b0", None))
 #if QT_CONFIG(tooltip)
-        self.sortDomeAZ.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Sorts the model points EAST / WEST side of pier.</p></body></html>", None))
+        self.sortDomeAZ.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Sorts the model points by the azimuth of the dome, if a dome is connected.</p></body></html>", None))
 #endif // QT_CONFIG(tooltip)
         self.sortDomeAZ.setText(QCoreApplication.translate("MainWindow", u"Sort Dome AZ", None))
+#if QT_CONFIG(tooltip)
+        self.sortSlewTime.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Sorts the model points for the shortest slew time of the mount and the dome, if a dome is connected.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.sortSlewTime.setText(QCoreApplication.translate("MainWindow", u"Sort slew time", None))
         self.dsoGroup.setTitle(QCoreApplication.translate("MainWindow", u"As DSO tracks", None))
         self.label_188.setText(QCoreApplication.translate("MainWindow", u"Points", None))
 #if QT_CONFIG(tooltip)
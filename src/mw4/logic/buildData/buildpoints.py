@@ -19,12 +19,14 @@ import logging
 import numpy as np
 import random
 from mw4.base import transform
+from mw4.logic.buildData.horizonMask import HorizonMask
+from mw4.logic.buildData.slewPath import SlewPath
+from mw4.mountcontrol.convert import altAzToTopo
 from pathlib import Path
-from scipy.spatial import distance
 from skyfield import almanac
 from skyfield.api import Angle, Star, Timescale
 from skyfield.toposlib import GeographicPosition
-from typing import Any
+from typing import Any, Final
 
 
 def HaDecToAltAz(ha: float, dec: float, lat: float) -> tuple[float, float]:
@@ -49,6 +51,9 @@ class BuildPoint:
     UNPROCESSED = 0
     FAILED = 1
     SOLVED = 2
+    # slew rates in degrees per second if the mount does not report one
+    SLEW_RATE: Final[float] = 2.0
+    DOME_RATE: Final[float] = 3.0
 
     log = logging.getLogger("MW4")
 
@@ -57,6 +62,7 @@ class BuildPoint:
         self.configDir: Path = app.mwGlob["configDir"]
         self._horizonP: list[list[float]] = []
         self._buildP: list[tuple[float, float, int]] = []
+        self._horizonMask: HorizonMask | None = None
 
     @property
     def horizonP(self) -> list[list[float]]:
@@ -65,6 +71,17 @@ class BuildPoint:
     @horizonP.setter
     def horizonP(self, value: list[list[float]]) -> None:
         self._horizonP = value
+        self._horizonMask = None
+
+    @property
+    def horizonMask(self) -> HorizonMask:
+        """
+        the mask is compiled on first use after the horizon points were changed
+        by the setter or the horizon methods, which drop the old one.
+        """
+        if self._horizonMask is None:
+            self._horizonMask = HorizonMask(self._horizonP)
+        return self._horizonMask
 
     @property
     def buildP(self) -> list[tuple[float, float, int]]:
@@ -108,41 +125,22 @@ class BuildPoint:
     def addHorizonP(self, value: tuple[int, int], position: int = 0) -> None:
         position = max(0, min(len(self._horizonP), position))
         self._horizonP.insert(position, value)
+        self._horizonMask = None
 
     def delHorizonP(self, position: int) -> None:
         if 0 <= position < len(self._horizonP):
             self._horizonP.pop(position)
+            self._horizonMask = None
 
     def clearHorizonP(self) -> None:
         self._horizonP.clear()
-
-    @staticmethod
-    def isCloseHorizonLine(
-        point: tuple[int, int], margin: int, horizonI: list[tuple[int, int]]
-    ) -> bool:
-        """
-        https://codereview.stackexchange.com/questions
-        /28207/finding-the-closest-point-to-a-list-of-points
-        """
-        pointRef = np.asarray([point[1], point[0]])
-        closest_index = distance.cdist([pointRef], horizonI).argmin()
-        pointClose = horizonI[closest_index]
-        val = np.sqrt(np.sum((pointRef - pointClose) ** 2))
-
-        return val < margin
+        self._horizonMask = None
 
     def isAboveHorizon(self, point: tuple[int, int]) -> bool:
-        point[1] = min(max(point[1], 0), 360)
-        x = range(361)
-        if self.horizonP:
-            xRef = [i[1] for i in self.horizonP]
-            yRef = [i[0] for i in self.horizonP]
-        else:
-            xRef = [0]
-            yRef = [0]
+        return bool(self.horizonMask.isAbove(point[0], point[1]))
 
-        y = np.interp(x, xRef, yRef)
-        return point[0] > y[int(point[1])]
+    def isAboveHorizonBatch(self, alt: np.ndarray, az: np.ndarray) -> np.ndarray:
+        return self.horizonMask.isAbove(alt, az)
 
     def isCloseMeridian(self, point: tuple[int, int]) -> bool:
         slew = self.app.dReg["mount"].setting.meridianLimitSlew
@@ -153,35 +151,38 @@ class BuildPoint:
         return lower < point[1] < upper
 
     def deleteBelowHorizon(self) -> None:
-        self._buildP = [x for x in self._buildP if self.isAboveHorizon(x)]
+        if not self._buildP:
+            return
+        alt, az = np.asarray([x[0:2] for x in self._buildP], dtype=float).T
+        isAbove = self.horizonMask.isAbove(alt, az)
+        self._buildP = [x for x, above in zip(self._buildP, isAbove) if above]
 
     def deleteCloseMeridian(self) -> None:
         self._buildP = [x for x in self._buildP if not self.isCloseMeridian(x)]
 
     def deleteCloseHorizonLine(self, margin: int) -> None:
-        if not self.horizonP:
+        if not self.horizonP or not self._buildP:
             return
 
-        altH, azH = zip(*self.horizonP)
-        azI = range(0, 361, 1)
-        altI = np.interp(azI, azH, altH)
-        horizonInterpol = np.asarray([[x, y] for x, y in zip(azI, altI)])
-        self._buildP = [
-            x for x in self._buildP if not self.isCloseHorizonLine(x, margin, horizonInterpol)
-        ]
+        alt, az = np.asarray([x[0:2] for x in self._buildP], dtype=float).T
+        isClose = self.horizonMask.isClose(alt, az, margin)
+        self._buildP = [x for x, close in zip(self._buildP, isClose) if not close]
 
     def sortAz(self) -> None:
         self._buildP = sorted(self._buildP, key=lambda x: -x[1])
 
     def sortDomeAz(self) -> None:
-        pointsNew = []
-        for i, point in enumerate(self._buildP):
-            alt = point[0]
-            az = point[1]
-            _, domeAz = self.app.dReg["mount"].instance.calcMountAltAzToDomeAltAz(alt, az)
-            if domeAz is None:
-                continue
-            pointsNew.append([alt, az, self.app.buildPoint.UNPROCESSED, domeAz.degrees])
+        if not self._buildP:
+            return
+        alt = [point[0] for point in self._buildP]
+        az = [point[1] for point in self._buildP]
+        mount = self.app.dReg["mount"].instance
+        _, domeAz = mount.calcMountAltAzToDomeAltAzBatch(alt, az)
+        pointsNew = [
+            [point[0], point[1], self.UNPROCESSED, value]
+            for point, value in zip(self._buildP, domeAz.degrees)
+            if not np.isnan(value)
+        ]
         self._buildP = [p[0:3] for p in sorted(pointsNew, key=lambda x: -x[3])]
 
     def sortAlt(self) -> None:
@@ -195,6 +196,35 @@ class BuildPoint:
         else:
             self._buildP = [p[0:3] for p in west + east]
 
+    def sortSlewTime(self, withDome: bool = False) -> None:
+        """
+        sorts the points for the shortest time of mount and (if withDome)
+        dome to travel along them, starting at the actual mount position. The
+        pier side of the points is the one the mount normally chooses.
+        """
+        if len(self._buildP) < 2:
+            return
+        mount = self.app.dReg["mount"]
+        obsSite = mount.obsSite
+        alt = np.asarray([obsSite.Alt.degrees] + [x[0] for x in self._buildP], dtype=float)
+        az = np.asarray([obsSite.Az.degrees] + [x[1] for x in self._buildP], dtype=float)
+        ha, dec = altAzToTopo(Angle(degrees=alt), Angle(degrees=az), obsSite.location.latitude)
+        pierside = np.where(ha.hours < 0, "W", "E")
+        pierside[0] = obsSite.pierside
+
+        domeAz = None
+        if withDome:
+            _, domeAz = mount.instance.calcMountAltAzToDomeAltAzBatch(alt, az)
+            domeAz = domeAz.degrees
+        slewRate = mount.setting.slewRate or self.SLEW_RATE
+        slewPath = SlewPath(slewRate, self.DOME_RATE if withDome else 0)
+        times = slewPath.slewTimes(ha.degrees, dec.degrees, pierside, domeAz)
+        order = slewPath.optimize(times)
+        timeBefore = slewPath.pathTime(times, list(range(len(times))))
+        timeAfter = slewPath.pathTime(times, [0, *[index + 1 for index in order]])
+        self.log.debug(f"Slew time sorted: [{timeBefore:1.0f}] s -> [{timeAfter:1.0f}] s")
+        self._buildP = [self._buildP[i] for i in order]
+
     def loadModel(self, fullFileName: Path) -> list[tuple[int, int]]:
         with open(fullFileName) as handle:
             try:
@@ -265,8 +295,8 @@ class BuildPoint:
         elif fullFileName.suffix in [".hpts", ".txt"]:
             value = self.loadBPTS(fullFileName)
 
+        value.sort(key=lambda x: x[1])
         self.horizonP = value
-        self.horizonP.sort(key=lambda x: x[1])
         self.saveHorizonP(fullFileName.stem)
         return True
 
@@ -422,13 +452,13 @@ class BuildPoint:
         dec: Angle,
         location: GeographicPosition,
     ) -> list[tuple[int, int, int]]:
-        buildP = []
-        for i in range(numberPoints):
-            starTime = ts.tt_jd(edgeDSO + i / numberPoints)
-            az, alt = transform.J2000ToAltAz(ha, dec, starTime, location)
-            if alt.degrees > 0:
-                buildP.append([alt.degrees, az.degrees % 360, self.UNPROCESSED])
-        return buildP
+        starTimes = ts.tt_jd(edgeDSO + np.arange(numberPoints) / numberPoints)
+        az, alt = transform.J2000ToAltAz(ha, dec, starTimes, location)
+        return [
+            [altitude, azimuth % 360, self.UNPROCESSED]
+            for altitude, azimuth in zip(alt.degrees.tolist(), az.degrees.tolist())
+            if altitude > 0
+        ]
 
     def generateDSOPath(
         self,
@@ -0,0 +1,66 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+from collections.abc import Sequence
+from scipy.spatial import cKDTree
+from typing import Final
+
+
+class HorizonMask:
+    """
+    The class HorizonMask compiles the horizon points (alt, az) once into a
+    lookup of the interpolated horizon altitude on a fine azimuth grid and a
+    kd-tree over the same line in the (az, alt) plane. Visibility and clearance
+    of whole point arrays are then answered with one index lookup or one tree
+    query, independent of the number of horizon points.
+
+    The mask is built from a copy of the horizon points, so the owner has to
+    build a new one after changing them. Without horizon points the horizon is
+    flat at 0 degrees altitude.
+    """
+
+    RESOLUTION: Final[float] = 0.1
+
+    def __init__(self, horizonP: Sequence[Sequence[float]]) -> None:
+        self.source = self.signature(horizonP)
+        number = round(360 / self.RESOLUTION) + 1
+        self.azimuth = np.linspace(0, 360, number)
+        if self.source:
+            altH, azH = np.asarray(self.source, dtype=float).T
+            self.altitude = np.interp(self.azimuth, azH, altH)
+        else:
+            self.altitude = np.zeros(number)
+        self.tree = cKDTree(np.column_stack([self.azimuth, self.altitude]))
+
+    @staticmethod
+    def signature(horizonP: Sequence[Sequence[float]]) -> tuple:
+        return tuple((float(point[0]), float(point[1])) for point in horizonP)
+
+    def altitudeAt(self, az: np.ndarray) -> np.ndarray:
+        az = np.clip(np.asarray(az, dtype=float), 0, 360)
+        index = np.rint(az / self.RESOLUTION).astype(int)
+        return self.altitude[index]
+
+    def isAbove(self, alt: np.ndarray, az: np.ndarray) -> np.ndarray:
+        return np.asarray(alt, dtype=float) > self.altitudeAt(az)
+
+    def distance(self, alt: np.ndarray, az: np.ndarray) -> np.ndarray:
+        points = np.column_stack([np.asarray(az, dtype=float), np.asarray(alt, dtype=float)])
+        dist, _ = self.tree.query(points)
+        return dist
+
+    def isClose(self, alt: np.ndarray, az: np.ndarray, margin: float) -> np.ndarray:
+        return self.distance(alt, az) < margin
@@ -0,0 +1,181 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+import time
+from itertools import pairwise
+from typing import Final
+
+
+class SlewPath:
+    """
+    The class SlewPath orders the build points for the shortest time the mount
+    and the dome need to travel from point to point. The mount is modelled by
+    its two axes, which move at the same time with the slew rate, so the slew
+    time is given by the axis with the longer way. The axis positions depend
+    on the pier side: changing it means a meridian flip, which adds the travel
+    of both axes through the pole and a fixed flip time. The dome rotates the
+    shorter way to its azimuth at the same time as the mount, so the time from
+    point to point is the longer one of both.
+
+    The order is searched by a nearest neighbor tour from the start position,
+    which is improved by 2-opt (reversing parts of the path) and Or-opt
+    (moving up to three consecutive points) until no move shortens the path
+    or the time budget is used. The sort runs in the GUI thread when the build
+    points are rebuilt, so the budget is kept short.
+    """
+
+    FLIP_TIME: Final[float] = 10.0
+    TIME_BUDGET: Final[float] = 0.2
+    OR_OPT_LENGTH: Final[int] = 3
+
+    def __init__(self, slewRate: float, domeRate: float = 0) -> None:
+        self.slewRate = slewRate
+        self.domeRate = domeRate
+
+    @staticmethod
+    def axisPositions(
+        ha: np.ndarray, dec: np.ndarray, pierside: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        returns the angles of the ra and the dec axis in degrees for hour angle
+        and declination in degrees and the pier side ('E' / 'W').
+        """
+        ha = np.asarray(ha, dtype=float)
+        dec = np.asarray(dec, dtype=float)
+        isWest = np.asarray(pierside) == "W"
+        raAxis = np.where(isWest, ha + 90, ha - 90)
+        decAxis = np.where(isWest, dec, 180 - dec)
+        return raAxis, decAxis
+
+    def slewTimes(
+        self,
+        ha: np.ndarray,
+        dec: np.ndarray,
+        pierside: np.ndarray,
+        domeAz: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        returns the matrix of the times in seconds to slew from each position
+        to each other one. Positions without dome azimuth (nan) do not add dome
+        time.
+        """
+        raAxis, decAxis = self.axisPositions(ha, dec, pierside)
+        raWay = np.abs(raAxis[:, None] - raAxis[None, :])
+        decWay = np.abs(decAxis[:, None] - decAxis[None, :])
+        times = np.maximum(raWay, decWay) / self.slewRate
+        pierside = np.asarray(pierside)
+        times += np.where(pierside[:, None] != pierside[None, :], self.FLIP_TIME, 0)
+
+        if domeAz is None or not self.domeRate:
+            return times
+        domeAz = np.asarray(domeAz, dtype=float)
+        domeWay = np.abs(domeAz[:, None] - domeAz[None, :]) % 360
+        domeWay = np.minimum(domeWay, 360 - domeWay)
+        domeTimes = np.nan_to_num(domeWay / self.domeRate, nan=0)
+        return np.maximum(times, domeTimes)
+
+    @staticmethod
+    def pathTime(times: np.ndarray, path: list[int]) -> float:
+        return float(sum(times[a, b] for a, b in pairwise(path)))
+
+    @staticmethod
+    def nearestNeighbor(times: np.ndarray) -> list[int]:
+        """
+        returns the path starting at position 0, which always goes to the
+        closest position not visited yet.
+        """
+        number = len(times)
+        visited = np.zeros(number, dtype=bool)
+        visited[0] = True
+        path = [0]
+        for _ in range(number - 1):
+            remaining = np.where(visited, np.inf, times[path[-1]])
+            index = int(np.argmin(remaining))
+            visited[index] = True
+            path.append(index)
+        return path
+
+    @staticmethod
+    def twoOpt(times: np.ndarray, path: list[int]) -> bool:
+        """
+        reverses the part path[i:j + 1] of the path, if it shortens the path.
+        The path ends with a position of zero time to all others, so the last
+        point could be changed as any other one. Start and end are kept.
+        """
+        improved = False
+        for i in range(1, len(path) - 2):
+            a, b = path[i - 1], path[i]
+            c = np.asarray(path[i + 1 : -1])
+            d = np.asarray(path[i + 2 :])
+            delta = times[a, c] + times[b, d] - times[a, b] - times[c, d]
+            j = int(np.argmin(delta))
+            if delta[j] < -1e-9:
+                path[i : i + j + 2] = path[i : i + j + 2][::-1]
+                improved = True
+        return improved
+
+    def orOpt(self, times: np.ndarray, path: list[int]) -> bool:
+        """
+        moves a segment of up to OR_OPT_LENGTH points in either direction to
+        another place of the path, if it shortens the path.
+        """
+        improved = False
+        for length in range(1, self.OR_OPT_LENGTH + 1):
+            i = 1
+            while i + length < len(path):
+                first, last = path[i], path[i + length - 1]
+                before, after = path[i - 1], path[i + length]
+                removed = times[before, first] + times[last, after] - times[before, after]
+                rest = path[:i] + path[i + length :]
+                a = np.asarray(rest[:-1])
+                b = np.asarray(rest[1:])
+                forward = times[a, first] + times[last, b] - times[a, b]
+                reverse = times[a, last] + times[first, b] - times[a, b]
+                inserted = np.minimum(forward, reverse)
+                j = int(np.argmin(inserted))
+                if inserted[j] - removed < -1e-9:
+                    segment = path[i : i + length]
+                    if reverse[j] < forward[j]:
+                        segment = segment[::-1]
+                    path[:] = rest[: j + 1] + segment + rest[j + 1 :]
+                    improved = True
+                i += 1
+        return improved
+
+    def optimize(self, times: np.ndarray) -> list[int]:
+        """
+        returns the order of the positions 1 to n of the slew time matrix,
+        which starts at position 0. The order is given as index of the points
+        without the start position.
+        """
+        number = len(times)
+        if number < 3:
+            return list(range(number - 1))
+
+        # an end position with zero time from all others lets the path end
+        # at any point, so 2-opt and Or-opt work on an open path
+        extended = np.zeros((number + 1, number + 1))
+        extended[:number, :number] = times
+        path = [*self.nearestNeighbor(times), number]
+        timeEnd = time.monotonic() + self.TIME_BUDGET
+        while time.monotonic() < timeEnd:
+            improved = self.twoOpt(extended, path)
+            if time.monotonic() >= timeEnd:
+                break
+            improved |= self.orOpt(extended, path)
+            if not improved:
+                break
+        return [index - 1 for index in path[1:-1]]
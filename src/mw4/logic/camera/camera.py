@@ -15,12 +15,12 @@
 ###########################################################
 import logging
 import platform
-from astropy.io import fits
 from mw4.base.signalsDevices import Signals
 from mw4.logic.camera.cameraAlpaca import CameraAlpaca
 from mw4.logic.camera.cameraIndi import CameraIndi
 from mw4.logic.camera.cameraSGPro import CameraSGPro
 from mw4.logic.fits.fitsFunction import writeHeaderCamera, writeHeaderPointing
+from mw4.logic.fits.fitsHeader import updateHeader
 from pathlib import Path
 from typing import Any
 
@@ -158,7 +158,10 @@ class Camera:
         self.run[self.framework].sendGain(gain=gain)
 
     def writeImageFitsHeader(self) -> None:
-        with fits.open(self.imagePath, mode="update", output_verify="silentfix") as HDU:
-            header = writeHeaderCamera(HDU[0].header, self, self.app.dReg["mount"].obsSite)
-            header = writeHeaderPointing(header, self.app.dReg["mount"].obsSite)
-            HDU[0].header = header
+        obsSite = self.app.dReg["mount"].obsSite
+        updateHeader(
+            self.imagePath,
+            lambda header: writeHeaderPointing(
+                writeHeaderCamera(header, self, obsSite), obsSite
+            ),
+        )
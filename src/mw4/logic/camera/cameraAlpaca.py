@@ -13,9 +13,54 @@
 # License APL2.0
 #
 ###########################################################
+import numpy as np
+import requests
 from mw4.base.alpacaClass import AlpacaClass
 from mw4.logic.camera.cameraAlpacaAscomBase import CameraAlpacaAscomBase
+from mw4.logic.camera.imageBytes import MIME_TYPE, readImageBytes
+from typing import Any, Final
 
 
 class CameraAlpaca(CameraAlpacaAscomBase, AlpacaClass):
-    pass
+    """
+    The image is requested in the binary ImageBytes format and read from the
+    response stream directly into a numpy array. Devices which do not support
+    ImageBytes answer with JSON, which is converted as before. The download
+    uses the session of the device, so its connections are kept alive.
+    """
+
+    DOWNLOAD_TIMEOUT: Final[int] = 60
+
+    def imageFromJson(self, response: dict[str, Any]) -> np.ndarray:
+        if response.get("ErrorNumber", 0):
+            raise ValueError(f"ImageArray error: {response.get('ErrorMessage', '')}")
+        return np.array(response["Value"], dtype=np.uint16).transpose()
+
+    def getImageData(self) -> np.ndarray | None:
+        session = self.session
+        if session is None:
+            self.log.warning(f"[{self.config.deviceName}] image download without session")
+            return None
+        url = f"{self.device.base_url}/imagearray"
+        headers = {"Accept": f"{MIME_TYPE}, application/json"}
+        params = {
+            "ClientID": self.CLIENT_ID,
+            "ClientTransactionID": next(self.transactionIds),
+        }
+        try:
+            with session.get(
+                url,
+                headers=headers,
+                params=params,
+                stream=True,
+                timeout=self.DOWNLOAD_TIMEOUT,
+            ) as response:
+                response.raise_for_status()
+                if MIME_TYPE in response.headers.get("content-type", ""):
+                    response.raw.decode_content = True
+                    return readImageBytes(response.raw)
+                self.log.debug(f"[{self.config.deviceName}] sends ImageArray as JSON")
+                return self.imageFromJson(response.json())
+        except (requests.RequestException, ValueError, OSError) as e:
+            self.log.warning(f"[{self.config.deviceName}] image download failed: {e}")
+            return None
@@ -15,12 +15,26 @@
 ###########################################################
 import numpy as np
 import time
-from astropy.io import fits
 from mw4.base.alpacaAscomCommon import AlpacaAscomCommon
+from mw4.logic.fits.fitsHeader import writeImage
 from typing import Any, ClassVar
 
 
 class CameraAlpacaAscomBase(AlpacaAscomCommon):
+    STATIC_PROPERTIES: ClassVar[frozenset[str]] = AlpacaAscomCommon.STATIC_PROPERTIES | {
+        "CameraXSize",
+        "CameraYSize",
+        "PixelSizeX",
+        "PixelSizeY",
+        "MaxBinX",
+        "MaxBinY",
+        "GainMin",
+        "GainMax",
+        "Gains",
+        "OffsetMin",
+        "OffsetMax",
+        "Offsets",
+    }
     CAMERA_STATES: ClassVar[list[str]] = [
         "CameraIdle",
         "CameraWaiting",
@@ -58,6 +72,12 @@ class CameraAlpacaAscomBase(AlpacaAscomCommon):
         self.getAndStoreDeviceProp("StartY", "CCD_FRAME.Y")
         self.log.debug(f"Initial data: {self.data}")
 
+    def getImageData(self) -> np.ndarray | None:
+        data = self.getDeviceProp("ImageArray")
+        if data is None:
+            return None
+        return np.array(data, dtype=np.uint16).transpose()
+
     def setExposureState(self) -> None:
         if not self.parent.exposing:
             return
@@ -79,12 +99,12 @@ class CameraAlpacaAscomBase(AlpacaAscomCommon):
             return
         if not self.getDeviceProp("ImageReady"):
             return
-        data = self.getDeviceProp("ImageArray")
-        data = np.array(data, dtype=np.uint16).transpose()
+        data = self.getImageData()
+        if data is None:
+            return
         self.signals.downloaded.emit(self.parent.imagePath)
         self.signals.message.emit("saving")
-        hdu = fits.PrimaryHDU(data=data)
-        hdu.writeto(self.parent.imagePath, overwrite=True)
+        writeImage(self.parent.imagePath, data)
         self.parent.writeImageFitsHeader()
         self.parent.exposeFinished()
         self.exposing = False
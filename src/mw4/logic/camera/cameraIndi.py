@@ -13,11 +13,12 @@
 # License APL2.0
 #
 ###########################################################
+import xml.etree.ElementTree as ET
 from indipyclient.queclient import EventItem
 from mw4.base.indiClass import IndiClass
+from mw4.logic.file.xisfHeader import XisfHeader
 from pathlib import Path
 from typing import Any
-from xisf import XISF
 
 
 class CameraIndi(IndiClass):
@@ -80,28 +81,16 @@ class CameraIndi(IndiClass):
         self.data["CCD_OFFSET.OFFSET_MAX"] = offset["members"]["OFFSET"].get("max", 1)
 
     def writeImageXisfHeader(self) -> None:
-        xisf = XISF(self.parent.imagePath)
-        file_meta = xisf.get_file_metadata()
-        ims_meta = xisf.get_images_metadata()
-        im_data = xisf.read_image(0)
-        ims_meta[0]["FITSKeywords"]["OBJECT"] = [
-            {"value": "SKY_OBJECT", "comment": "default name from MW4"}
-        ]
-        ims_meta[0]["FITSKeywords"]["AUTHOR"] = [
-            {"value": "MountWizzard4", "comment": "default name from MW4"}
-        ]
-        ims_meta[0]["FITSKeywords"]["FRAME"] = [
-            {"value": "Light", "comment": "Modeling works with light frames"}
-        ]
-        XISF.write(
-            self.parent.imagePath,
-            im_data,
-            creator_app="MountWizzard4",
-            image_metadata=ims_meta[0],
-            xisf_metadata=file_meta,
-            codec="lz4hc",
-            shuffle=True,
-        )
+        try:
+            header = XisfHeader(self.parent.imagePath)
+            header.setFITSKeyword("OBJECT", "SKY_OBJECT", "default name from MW4")
+            header.setFITSKeyword("AUTHOR", "MountWizzard4", "default name from MW4")
+            header.setFITSKeyword("FRAME", "Light", "Modeling works with light frames")
+            header.save()
+        except (OSError, ValueError, ET.ParseError) as e:
+            self.log.warning(
+                f"Cannot write XISF header: [{self.parent.imagePath}], error: {e}"
+            )
 
     def saveImageBLOB(self, item: EventItem, vectors: dict) -> None:
         if item.eventtype != "SetBLOB":
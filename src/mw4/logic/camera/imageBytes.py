@@ -0,0 +1,95 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+from dataclasses import dataclass
+from typing import BinaryIO, Final
+
+# see https://ascom-standards.org/Developer/AlpacaImageBytes.pdf
+MIME_TYPE: Final[str] = "application/imagebytes"
+HEADER_LENGTH: Final[int] = 44
+# transmission element types of the protocol and their numpy types
+ELEMENT_TYPES: Final[dict[int, str]] = {
+    1: "<i2",
+    2: "<i4",
+    3: "<f8",
+    4: "<f4",
+    5: "<u8",
+    6: "u1",
+    7: "<i8",
+    8: "<u2",
+}
+
+
+@dataclass
+class ImageBytesHeader:
+    metadataVersion: int
+    errorNumber: int
+    clientTransactionID: int
+    serverTransactionID: int
+    dataStart: int
+    imageElementType: int
+    transmissionElementType: int
+    rank: int
+    dimension1: int
+    dimension2: int
+    dimension3: int
+
+    @classmethod
+    def fromBytes(cls, raw: bytes) -> "ImageBytesHeader":
+        if len(raw) != HEADER_LENGTH:
+            raise ValueError(f"ImageBytes header has [{len(raw)}] bytes")
+        return cls(*np.frombuffer(raw, dtype="<i4").tolist())
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """
+        returns the shape of the transmitted array, which is indexed [x][y]
+        like ImageArray.
+        """
+        if self.rank == 3:
+            return self.dimension1, self.dimension2, self.dimension3
+        return self.dimension1, self.dimension2
+
+
+def readExactly(stream: BinaryIO, buffer: memoryview) -> None:
+    position = 0
+    while position < len(buffer):
+        number = stream.readinto(buffer[position:])
+        if not number:
+            raise ValueError(f"ImageBytes data ended after [{position}] bytes")
+        position += number
+
+
+def readImageBytes(stream: BinaryIO) -> np.ndarray:
+    """
+    readImageBytes reads an ImageBytes response from the stream. The pixels
+    are read directly into a preallocated array without any conversion. The
+    returned array is a transposed view of it, so it is indexed [y][x] like an
+    image in numpy and astropy.
+    """
+    raw = bytearray(HEADER_LENGTH)
+    readExactly(stream, memoryview(raw))
+    header = ImageBytesHeader.fromBytes(bytes(raw))
+    if header.errorNumber:
+        message = stream.read().decode("utf-8", errors="replace")
+        raise ValueError(f"ImageBytes error [{header.errorNumber}]: {message}")
+    if header.transmissionElementType not in ELEMENT_TYPES:
+        raise ValueError(f"ImageBytes type [{header.transmissionElementType}] unknown")
+
+    readExactly(stream, memoryview(bytearray(header.dataStart - HEADER_LENGTH)))
+    data = np.empty(header.shape, dtype=ELEMENT_TYPES[header.transmissionElementType])
+    readExactly(stream, memoryview(data.reshape(-1).view(np.uint8)))
+    return data.transpose()
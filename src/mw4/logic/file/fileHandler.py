@@ -13,12 +13,13 @@
 # License APL2.0
 #
 ###########################################################
-import cv2
 import logging
 import numpy as np
 from astropy import wcs
 from astropy.io import fits
 from mw4.base.tpool import Worker
+from mw4.logic.file.imagePyramid import ImagePyramid
+from mw4.logic.fits.fitsHeader import readHeader, readImageData
 from mw4.mountcontrol.convert import valueToFloat
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal
@@ -42,77 +43,65 @@ class FileHandler:
         self.imagePath: Path = imagePath
         self.flipH: bool = flipH
         self.flipV: bool = flipV
-        self.image: np.ndarray = np.zeros((0, 0))
+        self.data: np.ndarray = np.zeros((0, 0))
+        self.scaling: tuple[float, float] = (1, 0)
+        self.pyramid: ImagePyramid | None = None
+        self._image: np.ndarray | None = np.zeros((0, 0))
         self.header: fits.Header = fits.Header()
         self.wcs: wcs.WCS = wcs.WCS(fits.Header())
         self.hasCelestial: bool = False
         self.sizeX: int = 0
         self.sizeY: int = 0
 
-    def debayerImage(self, pattern: str) -> bool:
-        if pattern == "GBRG":
-            R = self.image[1::2, 0::2]
-            B = self.image[0::2, 1::2]
-            G0 = self.image[0::2, 0::2]
-            G1 = self.image[1::2, 1::2]
-
-        elif pattern == "RGGB":
-            R = self.image[0::2, 0::2]
-            B = self.image[1::2, 1::2]
-            G0 = self.image[0::2, 1::2]
-            G1 = self.image[1::2, 0::2]
-
-        elif pattern == "GRBG":
-            R = self.image[0::2, 1::2]
-            B = self.image[1::2, 0::2]
-            G0 = self.image[0::2, 0::2]
-            G1 = self.image[1::2, 1::2]
-
-        elif pattern == "BGGR":
-            R = self.image[1::2, 1::2]
-            B = self.image[0::2, 0::2]
-            G0 = self.image[0::2, 1::2]
-            G1 = self.image[1::2, 0::2]
-
-        else:
-            self.log.info("Unknown debayer pattern, keep it")
-            return False
-
-        h, w = self.image.shape
-        self.image = 0.2989 * R + 0.5870 * (G0 + G1) / 2 + 0.1140 * B
-        self.image = cv2.resize(self.image, (w, h))
-        return True
+    @property
+    def image(self) -> np.ndarray | None:
+        """
+        the full resolution image for display and analysis is only rendered
+        from the pyramid when it is used the first time.
+        """
+        if self._image is None and self.pyramid is not None:
+            self._image = self.pyramid.fullImage()
+        return self._image
 
-    def cleanImageFormat(self) -> None:
-        if not self.flipV:
-            self.image = np.flipud(self.image)
-        if self.flipH:
-            self.image = np.fliplr(self.image)
-        self.image = (self.image / np.max(self.image) * 255).astype("uint8")
+    @image.setter
+    def image(self, value: np.ndarray | None) -> None:
+        self._image = value
 
     def checkValidImageFormat(self) -> bool:
-        if self.image is None or self.image.size == 0:
+        if self.data is None or self.data.size == 0:
             self.log.debug("No image data in FITS")
-            self.image = np.zeros((0, 0))
+            self.data = np.zeros((0, 0))
             self.header = fits.Header()
             return False
         if self.header is None:
             self.log.debug("No header data in FITS")
-            self.image = np.zeros((0, 0))
+            self.data = np.zeros((0, 0))
             return False
         if self.header.get("NAXIS") != 2:
             self.log.debug("Incompatible format in FITS")
-            self.image = np.zeros((0, 0))
+            self.data = np.zeros((0, 0))
             self.header = fits.Header()
             return False
         return True
 
     def loadFITS(self) -> None:
+        """
+        the data is read into memory and not mapped, as the same file name is
+        used for the next exposure, which rewrites the file while the image is
+        still shown.
+        """
+        data = readImageData(self.imagePath, scaled=False)
+        if data is not None:
+            self.data = data
+            self.header = readHeader(self.imagePath)
+            self.scaling = (self.header.get("BSCALE", 1), self.header.get("BZERO", 0))
+            return
+
         with fits.open(self.imagePath) as HDUList:
             for hdu in HDUList:
                 if hdu.data is None:
                     continue
-                self.image = hdu.data
+                self.data = hdu.data
                 self.header = hdu.header
                 break
 
@@ -136,11 +125,12 @@ class FileHandler:
 
     def loadXISF(self) -> None:
         headerXISF = {}
-        self.image = XISF.read(str(self.imagePath), image_metadata=headerXISF)[:, :, -1]
+        self.data = XISF.read(str(self.imagePath), image_metadata=headerXISF)[:, :, -1]
         self.header = self.convHeaderXISF2FITS(headerXISF)
 
     def runnerLoadImage(self, imagePath: Path) -> None:
         self.imagePath = imagePath
+        self.scaling = (1, 0)
         ext = self.imagePath.suffix
 
         if ext in [".fits", ".fit"]:
@@ -153,18 +143,17 @@ class FileHandler:
             self.signals.imageLoaded.emit()
             return
 
-        self.cleanImageFormat()
         bayerPattern = self.header.get("BAYERPAT", "").strip()
         if bayerPattern:
-            self.debayerImage(bayerPattern)
             self.log.debug(f"Image has bayer pattern: {bayerPattern}")
+        self.pyramid = ImagePyramid(
+            self.data, self.flipH, self.flipV, bayerPattern, self.scaling
+        )
+        self.image = None
 
         self.wcs = wcs.WCS(self.header)
         self.hasCelestial = self.wcs.has_celestial
         self.sizeY, self.sizeX = self.wcs.array_shape
-        # alphaChannel = np.ones(self.image.shape, dtype="uint8") * 255
-        # self.image = np.stack((self.image,) * 3, axis=-1)
-        # self.image = np.dstack((self.image, alphaChannel))
         self.signals.imageLoaded.emit()
 
     def loadImage(
@@ -173,7 +162,8 @@ class FileHandler:
         if not imagePath.is_file():
             return
 
-        self.image = np.zeros((0, 0, 4))
+        self.image = np.zeros((0, 0))
+        self.pyramid = None
         self.imagePath = imagePath
         self.flipH = flipH
         self.flipV = flipV
@@ -0,0 +1,206 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import cv2
+import logging
+import numpy as np
+from PySide6.QtCore import QMutex, QMutexLocker
+from typing import ClassVar, Final
+
+
+class ImagePyramid:
+    """
+    The class ImagePyramid renders the raw pixel data of an image for display.
+    Each level is addressed by its step, which is the number of raw pixels per
+    displayed pixel in each direction and always a power of two. The preview
+    level is built on creation by reading only every step-th row and column of
+    the data, so with memory mapped data most of the file is not read at all.
+    Finer levels are rendered on demand only for the requested region (tiles),
+    the full resolution image for the analysis in bands of rows to keep the
+    peak memory low.
+
+    All coordinates are display coordinates: the image is flipped up down
+    unless flipV is set and flipped left right if flipH is set. Bayer data is
+    converted to luminance per 2x2 cell, which gives half the resolution, and
+    scaled back to full resolution for step 1. The scaling (BSCALE, BZERO) of
+    raw FITS data is applied only to the pixels which are rendered.
+    """
+
+    log = logging.getLogger("MW4")
+    PREVIEW_SIZE: Final[int] = 2048
+    BAND_ROWS: Final[int] = 512
+    # row and column offset of R, B, G0 and G1 in a 2x2 cell
+    BAYER: ClassVar = {
+        "GBRG": ((1, 0), (0, 1), (0, 0), (1, 1)),
+        "RGGB": ((0, 0), (1, 1), (0, 1), (1, 0)),
+        "GRBG": ((0, 1), (1, 0), (0, 0), (1, 1)),
+        "BGGR": ((1, 1), (0, 0), (0, 1), (1, 0)),
+    }
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        flipH: bool = False,
+        flipV: bool = False,
+        bayerPattern: str = "",
+        scaling: tuple[float, float] = (1, 0),
+    ) -> None:
+        self.data = data
+        self.scaling = scaling
+        self.height, self.width = data.shape
+        self.flipH = flipH
+        self.flipV = flipV
+        self.bayer = self.BAYER.get(bayerPattern)
+        if bayerPattern and self.bayer is None:
+            self.log.info("Unknown debayer pattern, keep it")
+        self.mutex = QMutex()
+        self.levels: dict[int, np.ndarray] = {}
+        self.full: np.ndarray | None = None
+        self.analysis: np.ndarray | None = None
+
+        self.previewStep = 1
+        while max(self.width, self.height) / self.previewStep > self.PREVIEW_SIZE:
+            self.previewStep *= 2
+        maximum = self.maximum()
+        self.scale = 255 / maximum if maximum > 0 else 0
+        preview = self.luminance(0, 0, self.width, self.height, self.previewStep)
+        self.levels[self.previewStep] = self.toDisplay(preview)
+
+    @property
+    def preview(self) -> np.ndarray:
+        return self.levels[self.previewStep]
+
+    def maximum(self) -> float:
+        """
+        returns the maximum luminance of the full frame, so the preview and
+        all tiles are scaled the same, even if the brightest pixels are not
+        part of the preview. For bayer data the luminance of the cells is used,
+        which is the largest value the interpolated luminance could have.
+        """
+        if not self.data.size:
+            return 0
+        if self.bayer is not None:
+            return float(np.max(self.luminance(0, 0, self.width, self.height, 2)))
+        limits = self.physical(np.array([np.min(self.data), np.max(self.data)]))
+        return float(np.max(limits))
+
+    def physical(self, raw: np.ndarray) -> np.ndarray:
+        bScale, bZero = self.scaling
+        values = np.asarray(raw, dtype=np.float32)
+        if bScale == 1 and bZero == 0:
+            return values
+        return values * np.float32(bScale) + np.float32(bZero)
+
+    def toDisplay(self, luminance: np.ndarray) -> np.ndarray:
+        return np.clip(luminance * self.scale, 0, 255).astype(np.uint8)
+
+    def sourceRect(self, x0: int, y0: int, x1: int, y1: int) -> tuple[int, int, int, int]:
+        if self.flipH:
+            x0, x1 = self.width - x1, self.width - x0
+        if not self.flipV:
+            y0, y1 = self.height - y1, self.height - y0
+        return x0, y0, x1, y1
+
+    def debayer(self, x0: int, y0: int, x1: int, y1: int, step: int) -> np.ndarray:
+        """
+        for step 1 the region is extended by one cell on each side, so the
+        interpolation of a tile gives the same pixels as for the whole image.
+        """
+        margin = 2 if step == 1 else 0
+        x0a = max(x0 - x0 % 2 - margin, 0)
+        y0a = max(y0 - y0 % 2 - margin, 0)
+        x1a = min(x1 + margin, self.width)
+        y1a = min(y1 + margin, self.height)
+        cellStep = max(step, 2)
+        channels = [
+            self.data[y0a + r : y1a : cellStep, x0a + c : x1a : cellStep]
+            for r, c in self.bayer
+        ]
+        h = min(channel.shape[0] for channel in channels)
+        w = min(channel.shape[1] for channel in channels)
+        R, B, G0, G1 = (self.physical(channel[:h, :w]) for channel in channels)
+        luminance = 0.2989 * R + 0.5870 * (G0 + G1) / 2 + 0.1140 * B
+        if step > 1 or not luminance.size:
+            return luminance
+
+        luminance = cv2.resize(luminance, (2 * w, 2 * h))
+        luminance = luminance[y0 - y0a : y1 - y0a, x0 - x0a : x1 - x0a]
+        missing = ((0, y1 - y0 - luminance.shape[0]), (0, x1 - x0 - luminance.shape[1]))
+        return np.pad(luminance, missing, mode="edge")
+
+    def luminance(self, x0: int, y0: int, x1: int, y1: int, step: int) -> np.ndarray:
+        """
+        returns the luminance of the display region x0, y0, x1, y1 (end
+        exclusive) with every step-th pixel as float array in display
+        orientation.
+        """
+        x0, y0, x1, y1 = self.sourceRect(x0, y0, x1, y1)
+        if self.bayer is None:
+            luminance = self.physical(self.data[y0:y1:step, x0:x1:step])
+        else:
+            luminance = self.debayer(x0, y0, x1, y1, step)
+        if not self.flipV:
+            luminance = luminance[::-1]
+        if self.flipH:
+            luminance = luminance[:, ::-1]
+        return luminance
+
+    def stepForScale(self, pixelsPerScreenPixel: float) -> int:
+        step = 1
+        while step * 2 <= pixelsPerScreenPixel and step < self.previewStep:
+            step *= 2
+        return step
+
+    def tile(self, x0: int, y0: int, x1: int, y1: int, step: int = 1) -> np.ndarray:
+        x0, x1 = max(x0, 0), min(x1, self.width)
+        y0, y1 = max(y0, 0), min(y1, self.height)
+        return self.toDisplay(self.luminance(x0, y0, x1, y1, step))
+
+    def level(self, step: int) -> np.ndarray:
+        with QMutexLocker(self.mutex):
+            if step not in self.levels:
+                self.levels[step] = self.tile(0, 0, self.width, self.height, step)
+            return self.levels[step]
+
+    def fullImage(self) -> np.ndarray:
+        with QMutexLocker(self.mutex):
+            if self.full is not None:
+                return self.full
+            full = np.empty((self.height, self.width), dtype=np.uint8)
+            for y0 in range(0, self.height, self.BAND_ROWS):
+                y1 = min(y0 + self.BAND_ROWS, self.height)
+                if self.analysis is None:
+                    full[y0:y1] = self.tile(0, y0, self.width, y1)
+                else:
+                    full[y0:y1] = self.toDisplay(self.analysis[y0:y1])
+            self.full = full
+            return full
+
+    def analysisImage(self) -> np.ndarray:
+        """
+        returns the full resolution luminance with the native values of the
+        data as float32 in display orientation. It is converted once in bands
+        of rows and shared by all analysis steps, which must not change it
+        (sep does not accept read only arrays).
+        """
+        with QMutexLocker(self.mutex):
+            if self.analysis is not None:
+                return self.analysis
+            analysis = np.empty((self.height, self.width), dtype=np.float32)
+            for y0 in range(0, self.height, self.BAND_ROWS):
+                y1 = min(y0 + self.BAND_ROWS, self.height)
+                analysis[y0:y1] = self.luminance(0, y0, self.width, y1, 1)
+            self.analysis = analysis
+            return analysis
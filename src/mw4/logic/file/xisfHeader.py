@@ -0,0 +1,167 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import logging
+import os
+import re
+import shutil
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Final
+
+
+class XisfHeader:
+    """
+    The class XisfHeader edits the XML header of a monolithic XISF file without
+    touching the encoded data blocks. A XISF file starts with the signature,
+    the header length and a reserved field (16 bytes) followed by the XML
+    header. The data blocks are attached behind the header at absolute
+    positions, which are referenced in the location attributes of the header
+    as attachment:position:size.
+
+    If the changed header fits in front of the first data block, it is written
+    in place. Otherwise all attachment positions are moved by a multiple of the
+    block alignment and the data blocks are copied unchanged behind the new
+    header into a temporary file, which replaces the original one.
+
+    The prolog of the header (XML declaration and comments in front of the root
+    element) is written back unchanged. Comments and processing instructions
+    within the root element are kept, content behind it is dropped.
+    """
+
+    log = logging.getLogger("MW4")
+    SIGNATURE: Final[bytes] = b"XISF0100"
+    NAMESPACE: Final[str] = "http://www.pixinsight.com/xisf"
+    PREFIX_LENGTH: Final[int] = 16
+    BLOCK_ALIGNMENT: Final[int] = 4096
+    COPY_CHUNK: Final[int] = 1 << 20
+    PROLOG: Final[re.Pattern] = re.compile(rb"(?:\s*(?:<\?.*?\?>|<!--.*?-->))*\s*", re.DOTALL)
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.headerLength: int = 0
+        self.root: ET.Element | None = None
+        self.prolog: bytes = b""
+        ET.register_namespace("", self.NAMESPACE)
+        self.read()
+
+    def tag(self, name: str) -> str:
+        return f"{{{self.NAMESPACE}}}{name}"
+
+    def read(self) -> None:
+        with open(self.path, "rb") as inFile:
+            prefix = inFile.read(self.PREFIX_LENGTH)
+            if len(prefix) != self.PREFIX_LENGTH or not prefix.startswith(self.SIGNATURE):
+                raise ValueError(f"File {self.path} does not have a XISF signature")
+            self.headerLength = int.from_bytes(prefix[8:12], byteorder="little")
+            header = inFile.read(self.headerLength)
+        header = header.rstrip(b"\0")
+        self.prolog = self.PROLOG.match(header).group(0)
+        builder = ET.TreeBuilder(insert_comments=True, insert_pis=True)
+        parser = ET.XMLParser(target=builder)
+        parser.feed(header)
+        self.root = parser.close()
+
+    def attachments(self) -> list[tuple[ET.Element, int, int]]:
+        result = []
+        for element in self.root.iter():
+            location = element.attrib.get("location", "")
+            if not location.startswith("attachment:"):
+                continue
+            _, position, size = location.split(":")
+            result.append((element, int(position), int(size)))
+        return result
+
+    def image(self, index: int = 0) -> ET.Element:
+        return self.root.findall(self.tag("Image"))[index]
+
+    def setFITSKeyword(
+        self, name: str, value: str, comment: str = "", imageIndex: int = 0
+    ) -> None:
+        """
+        sets the keyword with the value and comment. Existing entries of the
+        keyword are replaced.
+        """
+        image = self.image(imageIndex)
+        for keyword in image.findall(self.tag("FITSKeyword")):
+            if keyword.attrib.get("name") == name:
+                image.remove(keyword)
+        ET.SubElement(
+            image,
+            self.tag("FITSKeyword"),
+            {"name": name, "value": str(value), "comment": comment},
+        )
+
+    def getFITSKeyword(self, name: str, imageIndex: int = 0) -> str | None:
+        for keyword in self.image(imageIndex).findall(self.tag("FITSKeyword")):
+            if keyword.attrib.get("name") == name:
+                return keyword.attrib.get("value", "").strip("'").strip()
+        return None
+
+    def serialize(self) -> bytes:
+        body = ET.tostring(self.root, encoding="utf-8", xml_declaration=False)
+        return self.prolog + body
+
+    def writePrefix(self, outFile, header: bytes) -> None:
+        outFile.write(self.SIGNATURE)
+        outFile.write(len(header).to_bytes(4, byteorder="little"))
+        outFile.write(bytes(4))
+
+    def relocate(self, attachments: list[tuple[ET.Element, int, int]], start: int) -> int:
+        """
+        moves all attachments by the smallest multiple of the block alignment,
+        which makes room for the header. As the positions are part of the
+        header, this is repeated until the header size is stable.
+        """
+        shift = 0
+        while True:
+            for element, position, size in attachments:
+                element.attrib["location"] = f"attachment:{position + shift}:{size}"
+            needed = self.PREFIX_LENGTH + len(self.serialize()) - start
+            if needed <= shift:
+                return shift
+            blocks = (needed + self.BLOCK_ALIGNMENT - 1) // self.BLOCK_ALIGNMENT
+            shift = blocks * self.BLOCK_ALIGNMENT
+
+    def save(self) -> bool:
+        """
+        returns True if the header was written in place and False if the data
+        blocks had to be moved.
+        """
+        header = self.serialize()
+        attachments = self.attachments()
+        start = min((position for _, position, _ in attachments), default=None)
+        if start is None or self.PREFIX_LENGTH + len(header) <= start:
+            padding = max(self.headerLength - len(header), 0)
+            with open(self.path, "r+b") as outFile:
+                self.writePrefix(outFile, header)
+                outFile.write(header)
+                outFile.write(bytes(padding))
+            self.headerLength = len(header)
+            return True
+
+        shift = self.relocate(attachments, start)
+        header = self.serialize()
+        tempPath = self.path.with_name(self.path.name + ".tmp")
+        with open(self.path, "rb") as inFile, open(tempPath, "wb") as outFile:
+            self.writePrefix(outFile, header)
+            outFile.write(header)
+            outFile.write(bytes(start + shift - outFile.tell()))
+            inFile.seek(start)
+            shutil.copyfileobj(inFile, outFile, self.COPY_CHUNK)
+        os.replace(tempPath, self.path)
+        self.headerLength = len(header)
+        self.log.debug(f"Moved data blocks of [{self.path}] by [{shift}] bytes")
+        return False
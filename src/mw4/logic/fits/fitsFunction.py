@@ -17,6 +17,7 @@ import logging
 import numpy as np
 from astropy.io import fits
 from mw4.base.transform import JNowToJ2000
+from mw4.logic.fits.fitsHeader import readHeader, updateHeader
 from mw4.mountcontrol.convert import (
     convertDecToAngle,
     convertRaToAngle,
@@ -34,8 +35,7 @@ log = logging.getLogger()
 
 
 def getImageHeader(imagePath: Path) -> fits.Header:
-    with fits.open(imagePath) as HDU:
-        return HDU[0].header
+    return readHeader(imagePath)
 
 
 def getCoordinatesFromHeader(header: fits.Header) -> tuple[Angle, Angle]:
@@ -167,8 +167,11 @@ def writeSolutionToHeader(header: fits.Header, solution: dict[str, Any]) -> fits
 
 
 def updateImageFileHeaderWithSolution(imagePath: Path, solution: dict[str, Any]) -> None:
-    with fits.open(imagePath, mode="update", output_verify="silentfix+warn") as HDU:
-        HDU[0].header = writeSolutionToHeader(HDU[0].header, solution)
+    updateHeader(
+        imagePath,
+        lambda header: writeSolutionToHeader(header, solution),
+        verify="silentfix+warn",
+    )
 
 
 def getSolutionFromWCSHeader(
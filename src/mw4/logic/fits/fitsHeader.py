@@ -0,0 +1,206 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import logging
+import numpy as np
+import os
+import shutil
+from astropy.io import fits
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final
+
+log = logging.getLogger("MW4")
+
+BLOCK_LENGTH: Final[int] = 2880
+CARD_LENGTH: Final[int] = 80
+COPY_CHUNK: Final[int] = 1 << 20
+END_CARD: Final[bytes] = b"END" + b" " * (CARD_LENGTH - 3)
+DATA_TYPES: Final[dict[int, str]] = {
+    8: "u1",
+    16: ">i2",
+    32: ">i4",
+    64: ">i8",
+    -32: ">f4",
+    -64: ">f8",
+}
+
+
+def readHeaderBlocks(imagePath: Path) -> bytes:
+    """
+    readHeaderBlocks reads the primary header of a FITS file block by block
+    until the END card is found. The image data is not touched, so the effort
+    depends only on the size of the header. The returned bytes include the
+    padding of the last block, so their length is the offset of the data.
+    """
+    blocks = []
+    with open(imagePath, "rb") as inFile:
+        while True:
+            block = inFile.read(BLOCK_LENGTH)
+            if len(block) != BLOCK_LENGTH:
+                raise ValueError(f"File {imagePath} has no complete FITS header")
+            if not blocks and not block.startswith(b"SIMPLE  ="):
+                raise ValueError(f"File {imagePath} does not start with SIMPLE")
+            blocks.append(block)
+            for start in range(0, BLOCK_LENGTH, CARD_LENGTH):
+                if block[start : start + CARD_LENGTH] == END_CARD:
+                    return b"".join(blocks)
+
+
+def parseHeader(header: bytes) -> fits.Header:
+    """
+    parseHeader replaces characters which are not ASCII by "?" as astropy
+    does it, so a header violating the standard could still be read and the
+    cards keep their length.
+    """
+    text = header.decode("ascii", errors="replace").replace("\ufffd", "?")
+    return fits.Header.fromstring(text)
+
+
+def readHeader(imagePath: Path) -> fits.Header:
+    return parseHeader(readHeaderBlocks(imagePath))
+
+
+def updateHeader(
+    imagePath: Path,
+    modify: Callable[[fits.Header], fits.Header],
+    verify: str = "silentfix",
+) -> bool:
+    """
+    updateHeader changes the primary header of a FITS file with the function
+    modify. The cards are verified with the option verify like fits.open does
+    it with output_verify before they are written. If the new header needs the
+    same number of blocks, it is written in place. Otherwise the data is copied
+    unchanged behind the new header into a temporary file, which replaces the
+    original one. Returns True if the header was written in place.
+    """
+    oldHeader = readHeaderBlocks(imagePath)
+    header = modify(parseHeader(oldHeader))
+    for card in header.cards:
+        card.verify(verify)
+    newHeader = header.tostring(endcard=True, padding=True).encode("ascii")
+
+    if len(newHeader) == len(oldHeader):
+        with open(imagePath, "r+b") as outFile:
+            outFile.write(newHeader)
+        return True
+
+    tempPath = imagePath.with_name(imagePath.name + ".tmp")
+    with open(imagePath, "rb") as inFile, open(tempPath, "wb") as outFile:
+        outFile.write(newHeader)
+        inFile.seek(len(oldHeader))
+        shutil.copyfileobj(inFile, outFile, COPY_CHUNK)
+    os.replace(tempPath, imagePath)
+    log.debug(f"Header of [{imagePath}] grew to [{len(newHeader)}] bytes")
+    return False
+
+
+def imageLayout(imagePath: Path) -> tuple[int, str, tuple[int, ...], fits.Header] | None:
+    """
+    returns the offset, the data type and the shape of the data of the
+    primary HDU together with its header or None if it has no data.
+    """
+    header = readHeaderBlocks(imagePath)
+    cards = parseHeader(header)
+    numberAxis = cards.get("NAXIS", 0)
+    shape = tuple(cards.get(f"NAXIS{i}", 0) for i in range(numberAxis, 0, -1))
+    if not shape or 0 in shape:
+        return None
+    return len(header), DATA_TYPES[cards["BITPIX"]], shape, cards
+
+
+def scaleImageData(data: np.ndarray, cards: fits.Header, scaled: bool) -> np.ndarray:
+    bitPix = cards["BITPIX"]
+    bZero = cards.get("BZERO", 0)
+    bScale = cards.get("BSCALE", 1)
+    if not scaled or (bZero == 0 and bScale == 1):
+        return data
+    if bitPix == 16 and bZero == 32768 and bScale == 1:
+        return data.view(">u2") ^ np.uint16(0x8000)
+    dataType = np.float32 if bitPix in [8, 16, -32] else np.float64
+    return data.astype(dataType) * bScale + bZero
+
+
+def mapImageData(imagePath: Path, scaled: bool = True) -> np.ndarray | None:
+    """
+    mapImageData maps the data of the primary HDU into memory, so only the
+    pixels which are used are read from disk. Data with BZERO / BSCALE is scaled
+    as astropy does it, which reads all pixels at this time. With scaled set to
+    False the raw values are returned and the caller applies the scaling.
+    Returns None if the primary HDU has no data. The file must not be
+    rewritten as long as the mapped data is used.
+    """
+    layout = imageLayout(imagePath)
+    if layout is None:
+        return None
+    offset, dataType, shape, cards = layout
+    data = np.memmap(imagePath, dtype=dataType, mode="r", offset=offset, shape=shape)
+    return scaleImageData(data, cards, scaled)
+
+
+def readImageData(imagePath: Path, scaled: bool = True) -> np.ndarray | None:
+    """
+    readImageData reads the data of the primary HDU like mapImageData, but
+    with one read into memory. The file is closed afterwards, so it could be
+    rewritten or replaced while the data is still used.
+    """
+    layout = imageLayout(imagePath)
+    if layout is None:
+        return None
+    offset, dataType, shape, cards = layout
+    data = np.fromfile(imagePath, dtype=dataType, count=int(np.prod(shape)), offset=offset)
+    return scaleImageData(data.reshape(shape), cards, scaled)
+
+
+def writeImage(imagePath: Path, data: np.ndarray) -> None:
+    """
+    writeImage writes the data as unsigned 16 bit FITS image with the same
+    header as astropy does (BZERO 32768). The data is converted directly into
+    the memory mapped file, so a transposed or differently typed view of the
+    data is written without an intermediate copy. Float data is clipped to the
+    range of unsigned 16 bit and converted before, other data types are
+    rejected. Both happens before the file is opened, so an existing file is
+    kept if the data could not be written.
+    """
+    data = np.asarray(data)
+    if np.issubdtype(data.dtype, np.floating):
+        data = np.clip(data, 0, 65535).astype(np.uint16)
+    elif not np.issubdtype(data.dtype, np.integer):
+        raise ValueError(f"Image data type [{data.dtype}] not supported")
+
+    header = fits.Header()
+    header["SIMPLE"] = True
+    header["BITPIX"] = 16
+    header["NAXIS"] = data.ndim
+    for axis, length in enumerate(reversed(data.shape), start=1):
+        header[f"NAXIS{axis}"] = length
+    header["EXTEND"] = True
+    header["BZERO"] = 32768
+    header["BSCALE"] = 1
+    headerBytes = header.tostring(endcard=True, padding=True).encode("ascii")
+    dataLength = data.size * 2
+    padding = -dataLength % BLOCK_LENGTH
+
+    with open(imagePath, "wb") as outFile:
+        outFile.write(headerBytes)
+        outFile.truncate(len(headerBytes) + dataLength + padding)
+    if not data.size:
+        return
+    out = np.memmap(
+        imagePath, dtype=">u2", mode="r+", offset=len(headerBytes), shape=data.shape
+    )
+    np.bitwise_xor(data, np.uint16(0x8000), out=out, casting="unsafe")
+    out.flush()
+    del out
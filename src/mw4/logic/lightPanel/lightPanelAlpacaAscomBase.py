@@ -14,10 +14,14 @@
 #
 ###########################################################
 from mw4.base.alpacaAscomCommon import AlpacaAscomCommon
-from typing import Any
+from typing import Any, ClassVar
 
 
 class LightPanelAlpacaAscomBase(AlpacaAscomCommon):
+    STATIC_PROPERTIES: ClassVar[frozenset[str]] = AlpacaAscomCommon.STATIC_PROPERTIES | {
+        "MaxBrightness"
+    }
+
     def __init__(self, parent: Any) -> None:
         super().__init__(parent=parent)
 
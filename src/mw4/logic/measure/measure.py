@@ -17,6 +17,7 @@ import logging
 import numpy as np
 from mw4.base.signalsDevices import Signals
 from mw4.logic.measure.measureAddOns import measure
+from mw4.logic.measure.measureBuffer import MeasureBuffer
 from mw4.logic.measure.measureCSV import MeasureDataCSV
 from mw4.logic.measure.measureRaw import MeasureDataRaw
 from PySide6.QtCore import QMutex
@@ -26,8 +27,9 @@ from typing import Any
 class MeasureData:
     DEVICE_TYPE = "misc"
     log = logging.getLogger("MW4")
-    MAXSIZE = 48 * 60 * 60
+    MAX_DURATION = 48 * 60 * 60
     CYCLE_UPDATE_TASK = 1000
+    MAXSIZE = MAX_DURATION * 1000 // CYCLE_UPDATE_TASK
 
     def __init__(self, app: Any) -> None:
         super().__init__()
@@ -36,6 +38,7 @@ class MeasureData:
         self.mutexMeasure = QMutex()
         self.shorteningStart: bool = True
         self.data: dict[str, Any] = {}
+        self.buffer = MeasureBuffer(self.MAXSIZE)
         self.measuredDevices: dict[str, Any] = {}
         self.framework: str = ""
         self.run: dict[str, Any] = {
@@ -51,14 +54,14 @@ class MeasureData:
             self.measuredDevices[name] = entry.instance
 
     def clearData(self) -> None:
-        self.data.clear()
-        self.data["time"] = np.empty(shape=[0, 1], dtype="datetime64")
+        items = []
         for device in self.measuredDevices:
             if device not in measure:
                 continue
-            for source in measure[device]:
-                item = f"{device}-{source}"
-                self.data[item] = np.empty(shape=[0, 1])
+            items += [f"{device}-{source}" for source in measure[device]]
+        self.buffer.configure(items)
+        self.data.clear()
+        self.data.update(self.buffer.views())
 
     def startCommunication(self) -> None:
         self.collectDataDevices()
@@ -71,27 +74,20 @@ class MeasureData:
         self.signals.deviceDisconnected.emit(self.run[self.framework].config.deviceName)
 
     def checkStart(self) -> None:
-        if self.shorteningStart and len(self.data["time"]) > 2:
+        if self.shorteningStart and self.buffer.size > 2:
             self.shorteningStart = False
-            for measure in self.data:
-                self.data[measure] = np.delete(self.data[measure], range(2))
-
-    def checkSize(self) -> None:
-        if len(self.data["time"]) < self.MAXSIZE:
-            return
-        for item in self.data:
-            self.data[item] = np.split(self.data[item], 2)[1]
+            self.buffer.discardOldest(2)
 
     def measureTask(self) -> None:
         if not self.mutexMeasure.tryLock():
             return
         self.checkStart()
-        self.checkSize()
         timeStamp = self.app.dReg["mount"].obsSite.timeJD.utc_datetime().replace(tzinfo=None)
-        self.data["time"] = np.append(self.data["time"], np.datetime64(timeStamp))
-        for device in self.measuredDevices:
-            for source in measure[device]:
-                value = self.measuredDevices[device].data.get(source, 0)
-                item = f"{device}-{source}"
-                self.data[item] = np.append(self.data[item], value)
+        values = [
+            self.measuredDevices[device].data.get(source, 0)
+            for device in self.measuredDevices
+            for source in measure[device]
+        ]
+        self.buffer.append(np.datetime64(timeStamp), values)
+        self.data.update(self.buffer.views())
         self.mutexMeasure.unlock()
@@ -0,0 +1,100 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+from collections.abc import Sequence
+from typing import Any, Final
+
+
+class MeasureBuffer:
+    """
+    The class MeasureBuffer holds the measured time series in one preallocated
+    block. Every row of the block is one column of the data set: row 0 the time
+    stamp, the following rows the channels in the order of items. As each row is
+    contiguous, the stored window of a channel could be handed out as a view
+    without copying.
+
+    The block starts with room for initial samples. New samples are written at
+    the end, and if more than capacity samples are stored, the oldest one is
+    dropped by moving the start index. When the end of the block is reached,
+    the stored window is copied to the front of a new block, which is twice as
+    large as the window, but never larger than capacity plus slack. This makes
+    append O(1) amortized and the memory grows with the recorded duration only.
+    Samples in the block are never written again, so views handed out before
+    keep their values and stay valid after the block was replaced. The time
+    stamps are stored as datetime64[us] bit patterns in the float64 block, so
+    the time row is a view as well.
+    """
+
+    TIME_UNIT = "datetime64[us]"
+    INITIAL_SIZE: Final[int] = 3600
+
+    def __init__(self, capacity: int, slack: int = 0, initial: int = 0) -> None:
+        self.capacity = capacity
+        self.slack = slack if slack > 0 else max(capacity // 4, 1)
+        self.initial = min(initial if initial > 0 else self.INITIAL_SIZE, self.maxWidth)
+        self.items: list[str] = []
+        self.block = np.zeros((1, self.initial))
+        self.start: int = 0
+        self.end: int = 0
+
+    @property
+    def maxWidth(self) -> int:
+        return self.capacity + self.slack
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+    def configure(self, items: Sequence[str]) -> None:
+        self.items = list(items)
+        self.block = np.zeros((len(self.items) + 1, self.initial))
+        self.start = 0
+        self.end = 0
+
+    def compact(self) -> None:
+        size = self.size
+        width = min(max(2 * size, self.initial), self.maxWidth)
+        block = np.zeros((self.block.shape[0], width))
+        block[:, :size] = self.block[:, self.start : self.end]
+        self.block = block
+        self.start = 0
+        self.end = size
+
+    @staticmethod
+    def toFloat(value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def append(self, timeStamp: np.datetime64, values: Sequence[Any]) -> None:
+        if self.end == self.block.shape[1]:
+            self.compact()
+        self.block[0].view(self.TIME_UNIT)[self.end] = np.datetime64(timeStamp, "us")
+        self.block[1:, self.end] = [self.toFloat(value) for value in values]
+        self.end += 1
+        if self.size > self.capacity:
+            self.start += 1
+
+    def discardOldest(self, number: int) -> None:
+        self.start += min(number, self.size)
+
+    def views(self) -> dict[str, np.ndarray]:
+        window = self.block[:, self.start : self.end]
+        data = {"time": window[0].view(self.TIME_UNIT)}
+        for i, item in enumerate(self.items, start=1):
+            data[item] = window[i]
+        return data
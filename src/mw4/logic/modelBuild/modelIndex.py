@@ -0,0 +1,182 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import json
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Final
+
+
+class ModelIndex:
+    """
+    The class ModelIndex keeps a catalogue of the model files in the model
+    directory in the file modelIndex.json next to them. Every entry holds the
+    modification time and size of the file, the number of points and the grid
+    cells of the mount model coordinates (ha, dec) of all points.
+
+    The cells are CELL_HA hours and CELL_DEC degrees wide, which is more than
+    twice the relative tolerance of 1e-4 used by findKeysSourceInDest for hour
+    angles up to 24h and declinations up to 90 degrees. So a point of a file,
+    which fits a mount model star, is always in the cell of the star or in one of
+    its neighbours. Counting these points per file gives an upper bound of the
+    fitting points and only files reaching MIN_POINTS have to be verified with
+    the real comparison.
+
+    Files are only parsed, when they are new or their modification time or
+    size changed, otherwise a refresh costs one stat per file.
+    """
+
+    log = logging.getLogger("MW4")
+    FILE_NAME: Final[str] = "modelIndex.json"
+    VERSION: Final[int] = 1
+    CELL_HA: Final[float] = 0.01
+    CELL_DEC: Final[float] = 0.02
+    MIN_POINTS: Final[int] = 3
+
+    def __init__(self, modelDir: Path) -> None:
+        self.modelDir = modelDir
+        self.indexPath = modelDir / self.FILE_NAME
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.cellIndex: dict[tuple[int, int], dict[str, int]] | None = None
+        self.changed: bool = False
+        self.load()
+
+    def load(self) -> None:
+        if not self.indexPath.is_file():
+            return
+        try:
+            with open(self.indexPath) as inFile:
+                index = json.load(inFile)
+        except (OSError, json.JSONDecodeError) as e:
+            self.log.warning(f"Cannot load model index: [{self.indexPath}], error: {e}")
+            return
+        if not isinstance(index, dict) or index.get("version") != self.VERSION:
+            self.log.info(f"Model index [{self.indexPath}] outdated, rebuilding")
+            return
+        self.entries = index.get("files", {})
+        self.cellIndex = None
+
+    def save(self) -> None:
+        if not self.changed:
+            return
+        index = {"version": self.VERSION, "files": self.entries}
+        try:
+            with open(self.indexPath, "w") as outFile:
+                json.dump(index, outFile, indent=1)
+        except OSError as e:
+            self.log.warning(f"Cannot save model index: [{self.indexPath}], error: {e}")
+            return
+        self.changed = False
+
+    @classmethod
+    def cellOf(cls, ha: float, dec: float) -> tuple[int, int]:
+        return round(ha / cls.CELL_HA), round(dec / cls.CELL_DEC)
+
+    @classmethod
+    def neighbourCells(cls, ha: float, dec: float) -> list[tuple[int, int]]:
+        cellHA, cellDEC = cls.cellOf(ha, dec)
+        return [(cellHA + dHA, cellDEC + dDEC) for dHA in (-1, 0, 1) for dDEC in (-1, 0, 1)]
+
+    @staticmethod
+    def fileState(modelFilePath: Path) -> tuple[int, int]:
+        stat = modelFilePath.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def buildEntry(self, modelFilePath: Path) -> dict[str, Any] | None:
+        try:
+            mtime, size = self.fileState(modelFilePath)
+            with open(modelFilePath) as inFile:
+                fileModel = json.load(inFile)
+        except (OSError, json.JSONDecodeError) as e:
+            self.log.warning(f"Cannot index model file: [{modelFilePath}], error: {e}")
+            return None
+
+        cells = [
+            list(self.cellOf(star.get("haMountModel", 0), star.get("decMountModel", 0)))
+            for star in fileModel
+            if isinstance(star, dict)
+        ]
+        return {"mtime": mtime, "size": size, "numberPoints": len(cells), "cells": cells}
+
+    def addFile(self, modelFilePath: Path) -> None:
+        entry = self.buildEntry(modelFilePath)
+        if entry is None:
+            self.entries.pop(modelFilePath.name, None)
+        else:
+            self.entries[modelFilePath.name] = entry
+        self.cellIndex = None
+        self.changed = True
+
+    def refresh(self) -> None:
+        files = {path.name: path for path in self.modelDir.glob("*.model")}
+        for name in list(self.entries):
+            if name not in files:
+                del self.entries[name]
+                self.cellIndex = None
+                self.changed = True
+
+        for name, path in files.items():
+            entry = self.entries.get(name)
+            try:
+                state = self.fileState(path)
+            except OSError:
+                continue
+            if entry is not None and (entry["mtime"], entry["size"]) == state:
+                continue
+            self.addFile(path)
+
+    def buildCellIndex(self) -> dict[tuple[int, int], dict[str, int]]:
+        cellIndex: dict[tuple[int, int], dict[str, int]] = defaultdict(dict)
+        for name, entry in self.entries.items():
+            for cell in entry["cells"]:
+                files = cellIndex[tuple(cell)]
+                files[name] = files.get(name, 0) + 1
+        return dict(cellIndex)
+
+    def findCandidates(self, mountModelData: dict[int, dict[str, float]]) -> list[Path]:
+        """
+        returns the model files which could hold at least MIN_POINTS of the mount
+        model stars, sorted by the file name without suffix.
+        """
+        if self.cellIndex is None:
+            self.cellIndex = self.buildCellIndex()
+
+        starCells = set()
+        for star in mountModelData.values():
+            starCells.update(self.neighbourCells(star["ha"], star["dec"]))
+
+        hits: dict[str, int] = defaultdict(int)
+        for cell in starCells:
+            for name, number in self.cellIndex.get(cell, {}).items():
+                hits[name] += number
+
+        candidates = [name for name, number in hits.items() if number >= self.MIN_POINTS]
+        return [
+            self.modelDir / name for name in sorted(candidates, key=lambda x: Path(x).stem)
+        ]
+
+
+modelIndexes: dict[Path, ModelIndex] = {}
+
+
+def getModelIndex(modelDir: Path) -> ModelIndex:
+    """
+    the index is kept per model directory for the lifetime of the application,
+    so a lookup only has to stat the files and not to reload the index.
+    """
+    if modelDir not in modelIndexes:
+        modelIndexes[modelDir] = ModelIndex(modelDir)
+    return modelIndexes[modelDir]
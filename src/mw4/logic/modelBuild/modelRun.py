@@ -17,22 +17,59 @@ import json
 import logging
 import time
 from collections.abc import Iterator
-from mw4.base.threadUtils import mainThreadSleep
+from itertools import pairwise
 from mw4.base.transform import JNowToJ2000
+from mw4.logic.modelBuild.modelIndex import getModelIndex
 from mw4.logic.modelBuild.modelRunSupport import convertAngleToFloat, writeRetrofitData
 from mw4.mountcontrol.progStar import ProgStar
 from pathlib import Path
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QEventLoop, QObject, QTimer, Signal
 from skyfield.api import Angle, Star
-from typing import Any
+from typing import Any, Final
 
 
 class ModelData(QObject):
+    """
+    The model run is driven by the signals of mount, dome, camera and plate
+    solver only: each completion starts the next stage of the point at once.
+    The run waits in an event loop, which is left as soon as all points are
+    processed or the run is cancelled or ended. The settle time after a slew
+    is a single shot timer, a paused run keeps the pending exposure until it
+    is resumed.
+
+    For each point the start time of each stage is recorded in stageTimes,
+    stageDurations returns the time spent in the stages.
+
+    With PROGRESSIVE timing the run is pipelined: the next slew starts as soon
+    as the exposure of a point is integrated, while download, save and solve
+    of the previous points continue. The points between the start of their
+    exposure and their solve result are in flight. Their number is limited by
+    the solve capacity and by the memory of the images, if the limit is
+    reached, the next slew waits for a solve result. An exposure waits until
+    the camera is free again. Solve results arrive in any order and are
+    stored per point, so the model data is kept in point order.
+    """
+
     log = logging.getLogger("MW4")
     progress = Signal(dict)
     PROGRESSIVE = 2
     NORMAL = 1
     CONSERVATIVE = 0
+    # stages of a point in their order, done marks the end of the last one
+    STAGES: Final[tuple[str, ...]] = (
+        "slew",
+        "settle",
+        "expose",
+        "download",
+        "save",
+        "solve",
+        "done",
+    )
+    # images of the points in flight held in memory by camera and solvers
+    MEMORY_BUDGET: Final[int] = 2 * 1024**3
+    BYTES_PER_PIXEL: Final[int] = 4
+    # solves per solve worker: one running and one waiting in the queue
+    SOLVES_PER_WORKER: Final[int] = 2
 
     statusExpose = Signal(object)
     statusSolve = Signal(object)
@@ -68,6 +105,15 @@ class ModelData(QObject):
         self.retriesReverse: bool = False
         self.mountSlewed: bool = False
         self.domeSlewed: bool = False
+        self.exposurePending: bool = False
+        self.stageTimes: dict[str, dict[str, float]] = {}
+        self.inFlight: set[str] = set()
+        self.maxInFlight: int = 1
+        self.slewPending: bool = False
+        self.runLoop: QEventLoop | None = None
+        self.settleTimer = QTimer()
+        self.settleTimer.setSingleShot(True)
+        self.settleTimer.timeout.connect(self.startNewImageExposure)
         self.startSlew.connect(self.startNewSlew)
 
     def setupSignals(self) -> None:
@@ -88,21 +134,86 @@ class ModelData(QObject):
         self.app.dReg["camera"].signals.saved.disconnect(self.startNewPlateSolve)
         self.app.dReg["plateSolve"].signals.result.disconnect(self.collectPlateSolveResult)
 
-    def setImageExposed(self) -> None:
+    def markStage(self, key: str, stage: str) -> None:
+        if key in self.modelBuildData:
+            self.stageTimes.setdefault(key, {})[stage] = time.monotonic()
+
+    def stageDurations(self, key: str) -> dict[str, float]:
+        """
+        returns the seconds spent in each finished stage of the point.
+        """
+        times = self.stageTimes.get(key, {})
+        durations = {}
+        for stage, nextStage in pairwise(self.STAGES):
+            if stage in times and nextStage in times:
+                durations[stage] = times[nextStage] - times[stage]
+        return durations
+
+    def logStageTimings(self) -> None:
+        sums: dict[str, list[float]] = {}
+        for key in self.stageTimes:
+            for stage, duration in self.stageDurations(key).items():
+                sums.setdefault(stage, []).append(duration)
+        t = ", ".join(
+            f"{stage}: [{sum(values) / len(values):1.2f}]" for stage, values in sums.items()
+        )
+        self.log.debug(f"{'Stage timings':15s}: {t}")
+
+    def inFlightLimit(self) -> int:
+        """
+        returns the number of points, which could be in flight at the same
+        time, limited by the solve workers and the memory for their images.
+        """
+        solveLimit = (
+            self.SOLVES_PER_WORKER * self.app.dReg["plateSolve"].instance.NUMBER_WORKERS
+        )
+        cam = self.app.dReg["camera"].instance
+        imageBytes = max(cam.widthASCOM * cam.heightASCOM, 1) * self.BYTES_PER_PIXEL
+        memoryLimit = self.MEMORY_BUDGET // imageBytes
+        return max(1, min(solveLimit, memoryLimit))
+
+    def startSlewIfCapacity(self) -> None:
+        self.slewPending = len(self.inFlight) >= self.maxInFlight
+        if self.slewPending:
+            t = f"{'Hold slew':15s}: In flight: [{len(self.inFlight)}]"
+            self.log.debug(t)
+            return
+        self.startSlew.emit()
+
+    def setImageExposed(self, imagePath: Path) -> None:
+        self.markStage(imagePath.stem, "download")
         if self.modelTiming == self.PROGRESSIVE:
-            self.startSlew.emit()
+            self.startSlewIfCapacity()
 
-    def setImageDownloaded(self) -> None:
+    def setImageDownloaded(self, imagePath: Path) -> None:
+        self.markStage(imagePath.stem, "save")
         if self.modelTiming == self.NORMAL:
             self.startSlew.emit()
 
-    def setImageSaved(self) -> None:
+    def setImageSaved(self, imagePath: Path) -> None:
+        self.markStage(imagePath.stem, "solve")
         if self.modelTiming == self.CONSERVATIVE:
             self.startSlew.emit()
+        if self.exposurePending and not self.pauseBatch:
+            self.startNewImageExposure()
+
+    def setPauseBatch(self, pause: bool) -> None:
+        self.pauseBatch = pause
+        if not pause and self.exposurePending:
+            self.startNewImageExposure()
+
+    def setCancelBatch(self) -> None:
+        self.cancelBatch = True
+        self.checkRunFinished()
+
+    def setEndBatch(self) -> None:
+        self.endBatch = True
+        self.checkRunFinished()
 
     def startExposureAfterSlew(self) -> None:
         if self.mountSlewed and self.domeSlewed:
-            self.startNewImageExposure()
+            self.markStage(self.modelRunKey, "settle")
+            self.settleTimer.start(int(self.waitTimeExposure * 1000))
 
     def setMountSlewed(self) -> None:
         self.mountSlewed = True
@@ -122,6 +233,7 @@ class ModelData(QObject):
         azimuth = self.modelBuildData[self.modelRunKey]["azimuth"]
         self.mountSlewed = False
         self.domeSlewed = False
+        self.markStage(self.modelRunKey, "slew")
         self.statusSlew.emit([self.modelRunKey, altitude.degrees, azimuth.degrees])
         if not self.app.dReg["mount"].obsSite.setTargetAltAz(altitude, azimuth):
             result = {
@@ -170,6 +282,9 @@ class ModelData(QObject):
         self.log.debug(f"{'Save model':15s}: Len: [{len(self.modelSaveData)}]")
         with open(modelPath, "w") as outfile:
             json.dump(self.modelSaveData, outfile, sort_keys=True, indent=4)
+        modelIndex = getModelIndex(modelPath.parent)
+        modelIndex.addFile(modelPath)
+        modelIndex.save()
 
     def buildProgModel(self) -> None:
         self.log.debug(f"{'Build progmodel':15s}: Len: [{len(self.modelBuildData)}]")
@@ -205,12 +320,12 @@ class ModelData(QObject):
     def startNewImageExposure(self) -> None:
         if self.cancelBatch or self.endBatch:
             return
+        self.exposurePending = self.pauseBatch or self.app.dReg["camera"].instance.exposing
+        if self.exposurePending:
+            return
 
-        waitTime = self.waitTimeExposure
-        while self.pauseBatch or waitTime > 0:
-            mainThreadSleep(500)
-            waitTime -= 1
-
+        self.markStage(self.modelRunKey, "expose")
+        self.inFlight.add(self.modelRunKey)
         self.addMountDataToModelBuildData()
         item = self.modelBuildData[self.modelRunKey]
         cam = self.app.dReg["camera"].instance
@@ -255,13 +370,19 @@ class ModelData(QObject):
         t = f"{'Collect solve':15s}: [{key}], [{item['message']}], [{item}]"
         self.app.updatePointMarker.emit()
         item["processed"] = True
+        self.markStage(key, "done")
         self.sendModelProgress()
         self.log.debug(t)
         self.statusSolve.emit(item)
+        self.inFlight.discard(key)
+        if self.slewPending:
+            self.startSlewIfCapacity()
+        self.checkRunFinished()
 
     def prepareModelBuildData(self) -> None:
         self.modelBuildData.clear()
         self.modelRunList.clear()
+        self.stageTimes.clear()
         self.retries = 0
         self.log.debug(f"{'Prepare model':15s}: Len: [{len(self.modelInputData)}]")
         for index, point in enumerate(self.modelInputData):
@@ -298,13 +419,27 @@ class ModelData(QObject):
     def checkModelFinished(self) -> bool:
         return all(self.modelBuildData[key]["processed"] for key in self.modelRunList)
 
+    def isRunFinished(self) -> bool:
+        return self.cancelBatch or self.endBatch or self.checkModelFinished()
+
+    def checkRunFinished(self) -> None:
+        if self.runLoop is not None and self.runLoop.isRunning() and self.isRunFinished():
+            self.runLoop.quit()
+
     def runThroughModelBuildData(self) -> None:
         self.endBatch = self.cancelBatch = False
         for key in self.modelRunList:
             self.modelBuildData[key]["processed"] = False
+        self.inFlight.clear()
+        self.maxInFlight = self.inFlightLimit()
+        self.runLoop = QEventLoop()
         self.startSlew.emit()
-        while not self.cancelBatch and not self.endBatch and not self.checkModelFinished():
-            mainThreadSleep(500)
+        if not self.isRunFinished():
+            self.runLoop.exec()
+        self.runLoop = None
+        self.settleTimer.stop()
+        self.exposurePending = False
+        self.slewPending = False
 
     def generateRunIterator(self) -> None:
         nextList = []
@@ -351,4 +486,5 @@ class ModelData(QObject):
             self.log.warning(f"Only {modelSize} points available")
             self.modelProgData = []
         self.log.debug(f"{'Finish model':15s}: len: [{modelSize}]")
+        self.logStageTimings()
         self.resetSignals()
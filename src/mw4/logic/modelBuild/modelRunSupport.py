@@ -16,6 +16,7 @@
 import json
 import logging
 from datetime import datetime
+from mw4.logic.modelBuild.modelIndex import getModelIndex
 from mw4.mountcontrol.model import Model
 from pathlib import Path
 from skyfield.api import Angle, load
@@ -182,11 +183,19 @@ def compareFile(
 
 
 def findFittingModel(mountModel: Model, modelPath: Path) -> tuple[Path, list]:
+    """
+    the model index preselects the files which could fit the mount model, only
+    these candidates are loaded and compared point by point.
+    """
     mountModelData = generateMountModelData(mountModel)
     fittedModelPath = Path()
 
+    modelIndex = getModelIndex(modelPath)
+    modelIndex.refresh()
+    modelIndex.save()
+
     pointsOut = []
-    for modelFilePath in sorted(modelPath.glob("*.model"), key=lambda x: x.stem):
+    for modelFilePath in modelIndex.findCandidates(mountModelData):
         pointsIn, pointsOut = compareFile(modelFilePath, mountModelData)
         if len(pointsIn) > 2:
             fittedModelPath = modelFilePath
@@ -0,0 +1,108 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import hashlib
+import logging
+import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from PySide6.QtCore import QMutex, QMutexLocker
+from typing import Any, Final
+
+
+@dataclass
+class AnalysisEntry:
+    results: dict[Any, dict[str, Any]] = field(default_factory=dict)
+    nbytes: int = field(default=0)
+
+
+class AnalysisCache:
+    """
+    The class AnalysisCache keeps the results of the photometry for the
+    recently analysed files. The analysis image itself is not kept, it is
+    rendered again by the image pyramid of the file. Files are identified by
+    the hash of their content, so copies and renamed files are found as well.
+    The hash is remembered for path, size and modification time, which means
+    an unchanged file is read for hashing only once. The number of files and
+    the size of the arrays in the results are limited, the least recently
+    used file is dropped first.
+    """
+
+    log = logging.getLogger("MW4")
+    MAX_FILES: Final[int] = 4
+    MAX_BYTES: Final[int] = 512 * 1024 * 1024
+
+    def __init__(self) -> None:
+        self.mutex = QMutex()
+        self.digests: dict[tuple[str, int, int], str] = {}
+        self.entries: OrderedDict[str, AnalysisEntry] = OrderedDict()
+
+    def contentKey(self, imagePath: Path) -> str:
+        stat = imagePath.stat()
+        fileKey = (str(imagePath.resolve()), stat.st_size, stat.st_mtime_ns)
+        with QMutexLocker(self.mutex):
+            if fileKey in self.digests:
+                return self.digests[fileKey]
+
+        with open(imagePath, "rb") as inFile:
+            digest = hashlib.file_digest(inFile, "blake2b").hexdigest()
+        with QMutexLocker(self.mutex):
+            self.digests[fileKey] = digest
+        return digest
+
+    def entry(self, key: str) -> AnalysisEntry:
+        """
+        returns the entry for the key and marks it as most recently used. The
+        mutex has to be locked by the caller.
+        """
+        if key not in self.entries:
+            self.entries[key] = AnalysisEntry()
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    @staticmethod
+    def resultBytes(result: dict[str, Any]) -> int:
+        return sum(value.nbytes for value in result.values() if isinstance(value, np.ndarray))
+
+    def evict(self) -> None:
+        """
+        drops the least recently used entries until the limits are kept. The
+        most recent entry is always kept. The mutex has to be locked by the
+        caller.
+        """
+        while len(self.entries) > 1 and (
+            len(self.entries) > self.MAX_FILES
+            or sum(entry.nbytes for entry in self.entries.values()) > self.MAX_BYTES
+        ):
+            self.entries.popitem(last=False)
+
+    def result(self, key: str, parameters: Any) -> dict[str, Any] | None:
+        with QMutexLocker(self.mutex):
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry.results.get(parameters)
+
+    def store(self, key: str, parameters: Any, result: dict[str, Any]) -> None:
+        with QMutexLocker(self.mutex):
+            entry = self.entry(key)
+            previous = entry.results.get(parameters)
+            if previous is not None:
+                entry.nbytes -= self.resultBytes(previous)
+            entry.results[parameters] = result
+            entry.nbytes += self.resultBytes(result)
+            self.evict()
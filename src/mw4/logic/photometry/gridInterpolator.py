@@ -0,0 +1,86 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+from scipy.ndimage import distance_transform_edt
+from scipy.spatial import Delaunay
+
+
+class GridInterpolator:
+    """
+    The class GridInterpolator prepares the interpolation of values given at
+    scattered points onto a regular grid once and shares it for all metrics.
+    Each metric is then interpolated by indexing only.
+
+    For the linear interpolation one Delaunay triangulation of the points gives
+    the containing triangle of each grid node together with the barycentric
+    weights, which is the same as griddata with method linear. For the nearest
+    interpolation each point is placed on its closest grid node and a distance
+    transform of the grid returns the closest occupied node for all nodes. This
+    avoids a KD tree search for every node and differs from griddata with method
+    nearest only by the placement of the points on the grid (half the node
+    spacing). If several points share a node, the last one is used.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, xm: np.ndarray, ym: np.ndarray) -> None:
+        points = np.column_stack((x, y))
+        grid = np.column_stack((np.ravel(xm), np.ravel(ym)))
+        self.shape = np.shape(xm)
+
+        owner = np.full(self.shape, -1, dtype=np.intp)
+        rows = self.nearestNode(ym[:, 0], points[:, 1])
+        columns = self.nearestNode(xm[0], points[:, 0])
+        owner[rows, columns] = np.arange(len(points))
+        spacing = [self.spacing(ym[:, 0]), self.spacing(xm[0])]
+        index = distance_transform_edt(
+            owner < 0, sampling=spacing, return_distances=False, return_indices=True
+        )
+        self.nearest = owner[index[0], index[1]]
+
+        triangulation = Delaunay(points)
+        simplex = triangulation.find_simplex(grid)
+        self.inside = simplex >= 0
+        simplex = simplex[self.inside]
+        transform = triangulation.transform[simplex]
+        delta = grid[self.inside] - transform[:, 2]
+        barycentric = np.einsum("ijk,ik->ij", transform[:, :2], delta)
+        self.weights = np.column_stack((barycentric, 1 - barycentric.sum(axis=1)))
+        self.vertices = triangulation.simplices[simplex]
+
+    @staticmethod
+    def spacing(axis: np.ndarray) -> float:
+        return float(axis[1] - axis[0]) if len(axis) > 1 else 1.0
+
+    @staticmethod
+    def nearestNode(axis: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        returns the index of the closest node of the ascending grid axis for
+        each value.
+        """
+        if len(axis) < 2:
+            return np.zeros(len(values), dtype=np.intp)
+        upper = np.clip(np.searchsorted(axis, values), 1, len(axis) - 1)
+        lower = upper - 1
+        closerLower = values - axis[lower] < axis[upper] - values
+        return np.where(closerLower, lower, upper)
+
+    def nearestGrid(self, values: np.ndarray) -> np.ndarray:
+        return np.asarray(values)[self.nearest]
+
+    def linearGrid(self, values: np.ndarray, fillValue: float = np.nan) -> np.ndarray:
+        grid = np.full(self.inside.shape, fillValue, dtype=float)
+        values = np.asarray(values, dtype=float)
+        grid[self.inside] = np.einsum("ij,ij->i", values[self.vertices], self.weights)
+        return grid.reshape(self.shape)
@@ -16,9 +16,13 @@
 import logging
 import numpy as np
 import sep
+from collections.abc import Callable
 from mw4.base.tpool import Worker
+from mw4.logic.photometry.analysisCache import AnalysisCache
+from mw4.logic.photometry.gridInterpolator import GridInterpolator
+from mw4.logic.photometry.tiledExtraction import TiledExtraction
+from pathlib import Path
 from PySide6.QtCore import QMutex, QObject, Signal
-from scipy.interpolate import griddata
 from scipy.ndimage import uniform_filter
 from typing import Any, ClassVar
 
@@ -40,6 +44,42 @@ class Photometry:
     FILTER_SCALE = 10
     SN: ClassVar = [30, 20, 15, 10, 10]
     SEP: ClassVar = [3.0, 3.0, 2.5, 2.5, 2.0]
+    # all attributes, which are set by the photometry of an image
+    RESULTS: ClassVar = [
+        "objs",
+        "objsAll",
+        "backGlobal",
+        "xm",
+        "ym",
+        "h",
+        "w",
+        "filterConstW",
+        "filterConstH",
+        "roundnessGrid",
+        "roundnessMin",
+        "roundnessMax",
+        "roundnessPercentile",
+        "background",
+        "backgroundMin",
+        "backgroundMax",
+        "backgroundRMS",
+        "backSignal",
+        "backRMS",
+        "aberrationImage",
+        "hfr",
+        "hfrAll",
+        "hfrMin",
+        "hfrMax",
+        "hfrPercentile",
+        "hfrMedian",
+        "hfrGrid",
+        "hfrInner",
+        "hfrOuter",
+        "hfrSegTriangle",
+        "hfrSegSquare",
+    ]
+    cache: ClassVar[AnalysisCache] = AnalysisCache()
+    extraction: ClassVar[TiledExtraction] = TiledExtraction()
 
     def __init__(self, parent: Any, image: np.ndarray, snSelector: int = 0) -> None:
         self.threadPool = parent.app.threadPool
@@ -54,7 +94,7 @@ class Photometry:
 
         self.objs: Any = None
         self.objsAll: Any = None
-        self.bkg: Any = None
+        self.interpolator: GridInterpolator | None = None
 
         self.xm: np.ndarray = np.array([])
         self.ym: np.ndarray = np.array([])
@@ -72,6 +112,7 @@ class Photometry:
         self.backgroundRMS: np.ndarray = np.zeros(0)
         self.backSignal: np.ndarray = np.zeros(0)
         self.backRMS: np.ndarray = np.zeros(0)
+        self.backGlobal: float = 1
 
         self.hfr: np.ndarray = np.zeros(30)
         self.hfrAll: np.ndarray = np.zeros(30)
@@ -105,13 +146,7 @@ class Photometry:
         self.hfrMedian = np.median(self.hfr)
 
     def runnerGetHFR(self) -> None:
-        img = griddata(
-            (self.objs["x"], self.objs["y"]),
-            self.hfr,
-            (self.xm, self.ym),
-            method="nearest",
-            fill_value=np.min(self.hfr),
-        )
+        img = self.interpolator.nearestGrid(self.hfr)
         self.hfrGrid = uniform_filter(img, size=[self.filterConstH, self.filterConstW])
         minB, maxB = np.percentile(self.hfrGrid, (50, 95))
         self.hfrMin = minB
@@ -123,13 +158,7 @@ class Photometry:
         b = self.objs["b"]
         aspectRatio = np.maximum(a / b, b / a)
         minB, maxB = np.percentile(aspectRatio, (50, 95))
-        img = griddata(
-            (self.objs["x"], self.objs["y"]),
-            aspectRatio,
-            (self.xm, self.ym),
-            method="linear",
-            fill_value=np.min(aspectRatio),
-        )
+        img = self.interpolator.linearGrid(aspectRatio, fillValue=np.min(aspectRatio))
         self.roundnessGrid = uniform_filter(img, size=[self.filterConstH, self.filterConstW])
         self.roundnessPercentile = np.percentile(aspectRatio, 90)
         self.roundnessMin = minB
@@ -192,9 +221,9 @@ class Photometry:
         self.signals.aberration.emit()
 
     def calcBackground(self) -> None:
-        maxB = float(np.max(self.backSignal)) / self.bkg.globalback
-        minB = float(np.min(self.backSignal)) / self.bkg.globalback
-        img = self.backSignal / self.bkg.globalback
+        maxB = float(np.max(self.backSignal)) / self.backGlobal
+        minB = float(np.min(self.backSignal)) / self.backGlobal
+        img = self.backSignal / self.backGlobal
         self.background = uniform_filter(img, size=[self.filterConstH, self.filterConstW])
         self.backgroundMin = minB
         self.backgroundMax = maxB
@@ -206,10 +235,14 @@ class Photometry:
         )
         self.signals.backgroundRMS.emit()
 
+    def calcInterpolator(self) -> None:
+        self.interpolator = GridInterpolator(self.objs["x"], self.objs["y"], self.xm, self.ym)
+
     def runCalcs(self) -> None:
         if len(self.hfr) < 10:
             return
         self.baseCalcs()
+        self.calcInterpolator()
         self.runnerGetHFR()
         self.runnerCalcTiltValuesSquare()
         self.runnerCalcTiltValuesTriangle()
@@ -219,18 +252,9 @@ class Photometry:
         self.calcBackgroundRMS()
 
     def runnerCalcPhotometry(self) -> None:
-        self.bkg = sep.Background(self.image, bw=32, bh=32)
-        image_sub = self.image - self.bkg
-        self.backRMS = self.bkg.rms()
-        self.backSignal = self.bkg.back()
-
         try:
-            objs = sep.extract(
-                image_sub,
-                self.sepThreshold,
-                err=self.backRMS,
-                filter_kernel=None,
-                minarea=7,
+            objs, self.backSignal, self.backRMS, self.backGlobal = self.extraction.extract(
+                self.image, self.sepThreshold
             )
         except (ValueError, RuntimeError, IndexError) as e:
             self.log.error(e)
@@ -240,6 +264,7 @@ class Photometry:
             self.hfrAll = np.zeros(0)
             return
 
+        image_sub = self.image - self.backSignal
         objsRaw = len(objs)
 
         # limiting the resulting object by some constraints
@@ -295,9 +320,7 @@ class Photometry:
         self.hfrAll = radius[:, 0]
 
         # limiting the resulting object by checking the S/N values
-        b = []
-        for x, y in zip(objs["x"], objs["y"]):
-            b.append(self.backSignal[int(y)][int(x)])
+        b = self.backSignal[objs["y"].astype(int), objs["x"].astype(int)]
 
         # calculate sn based on optimized version of
         # http://www1.phys.vt.edu/~jhs/phys3154/snr20040108.pdf
@@ -305,7 +328,7 @@ class Photometry:
 
         # pure version of source compared to use in stellarsolver
         # starNumPixels = np.abs(b * radius[:, 1] * radius[:, 1] * np.pi)
-        # varSky = self.bkg.globalrms * self.bkg.globalrms
+        # varSky = globalrms * globalrms
         # sn = flux / np.sqrt(flux + starNumPixels * varSky * (1 + 1 / (32 * 32)))
 
         mask = sn > self.snTarget
@@ -325,15 +348,74 @@ class Photometry:
     def unlockPhotometry(self) -> None:
         self.lock.unlock()
 
-    def processPhotometry(self, image: np.ndarray, snTarget: int) -> None:
-        self.image = image.astype(np.float32)
+    def snapshot(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.RESULTS}
+
+    def restore(self, result: dict[str, Any]) -> None:
+        for name, value in result.items():
+            setattr(self, name, value)
+
+    def emitResults(self) -> None:
+        if len(self.hfr) < 10:
+            return
+        self.signals.hfr.emit()
+        self.signals.hfrSquare.emit()
+        self.signals.hfrTriangle.emit()
+        self.signals.roundness.emit()
+        self.signals.aberration.emit()
+        self.signals.background.emit()
+        self.signals.backgroundRMS.emit()
+
+    def runnerAnalysis(
+        self,
+        imagePath: Path,
+        render: Callable[[], np.ndarray],
+        orientation: tuple[bool, bool] = (False, False),
+    ) -> None:
+        """
+        runs the photometry on the analysis image of the file. The results
+        are in display orientation and cached by the content of the file and
+        the orientation (flipH, flipV), so a repeated analysis of the same
+        image only restores the results.
+        """
+        parameters = (self.snTarget, self.sepThreshold, *orientation)
+        try:
+            key = self.cache.contentKey(imagePath)
+        except OSError as e:
+            self.log.warning(f"No cache for [{imagePath}]: {e}")
+            self.image = render()
+            self.runnerCalcPhotometry()
+            return
+
+        result = self.cache.result(key, parameters)
+        self.image = render()
+        if result is not None:
+            self.restore(result)
+            self.emitResults()
+            self.log.debug(f"Photometry of [{imagePath.name}] from cache")
+            return
+
+        self.runnerCalcPhotometry()
+        self.cache.store(key, parameters, self.snapshot())
+
+    def processPhotometry(
+        self,
+        imagePath: Path,
+        render: Callable[[], np.ndarray],
+        snTarget: int,
+        orientation: tuple[bool, bool] = (False, False),
+    ) -> None:
+        """
+        render returns the full resolution image with native values as
+        float32 in display orientation, which is given by (flipH, flipV).
+        """
         self.snTarget = self.SN[snTarget]
         self.sepThreshold = self.SEP[snTarget]
 
         if not self.lock.tryLock():
             return
 
-        self.workerCalcPhotometry = Worker(self.runnerCalcPhotometry)
+        self.workerCalcPhotometry = Worker(self.runnerAnalysis, imagePath, render, orientation)
         self.workerCalcPhotometry.signals.result.connect(
             lambda: self.signals.sepFinished.emit()
         )
@@ -0,0 +1,254 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import logging
+import multiprocessing
+import numpy as np
+import os
+import sep
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from PySide6.QtCore import QMutex, QMutexLocker
+from typing import Final
+
+# coordinates of the sources, which are shifted from tile to frame
+POSITION_X: Final[tuple[str, ...]] = ("x", "xmin", "xmax", "xpeak", "xcpeak")
+POSITION_Y: Final[tuple[str, ...]] = ("y", "ymin", "ymax", "ypeak", "ycpeak")
+
+
+@dataclass
+class TileResult:
+    objs: np.ndarray
+    back: np.ndarray
+    rms: np.ndarray
+    globalBack: float
+
+
+def extractTile(
+    data: np.ndarray,
+    threshold: float,
+    core: tuple[int, int, int, int],
+    origin: tuple[int, int],
+) -> TileResult:
+    """
+    extractTile estimates the background and extracts the sources of the tile
+    data. Only sources with their centroid in the core (y0, y1, x0, x1 in tile
+    pixels) are kept, the rest of the tile is the overlap to the neighbors.
+    The positions of the sources are returned in frame coordinates by adding
+    the origin (y, x) of the tile, the background and its rms for the core only.
+    It is a module function, so it could be run in a worker process.
+    """
+    bkg = sep.Background(data, bw=32, bh=32)
+    back = bkg.back()
+    rms = bkg.rms()
+    objs = sep.extract(data - back, threshold, err=rms, filter_kernel=None, minarea=7)
+
+    y0, y1, x0, x1 = core
+    keep = (objs["x"] >= x0 - 0.5) & (objs["x"] < x1 - 0.5)
+    keep &= (objs["y"] >= y0 - 0.5) & (objs["y"] < y1 - 0.5)
+    objs = objs[keep]
+    for name in POSITION_X:
+        objs[name] += origin[1]
+    for name in POSITION_Y:
+        objs[name] += origin[0]
+    return TileResult(objs, back[y0:y1, x0:x1], rms[y0:y1, x0:x1], bkg.globalback)
+
+
+def extractSharedTile(
+    names: tuple[str, str, str],
+    shape: tuple[int, int],
+    region: tuple[int, int, int, int],
+    core: tuple[int, int, int, int],
+    threshold: float,
+) -> tuple[np.ndarray, float]:
+    """
+    extractSharedTile runs extractTile in a worker process on the region of
+    the image in the shared memory with the first name. The background and its
+    rms are written to the shared memory with the second and third name, so
+    only the sources are sent back to the calling process.
+    """
+    memories = [SharedMemory(name) for name in names]
+    try:
+        image, back, rms = (
+            np.ndarray(shape, dtype=np.float32, buffer=memory.buf) for memory in memories
+        )
+        y0, y1, x0, x1 = region
+        cy0, cy1, cx0, cx1 = core
+        data = np.ascontiguousarray(image[y0:y1, x0:x1])
+        result = extractTile(data, threshold, core, (y0, x0))
+        back[y0 + cy0 : y0 + cy1, x0 + cx0 : x0 + cx1] = result.back
+        rms[y0 + cy0 : y0 + cy1, x0 + cx0 : x0 + cx1] = result.rms
+        del image, back, rms
+    finally:
+        for memory in memories:
+            memory.close()
+    return result.objs, result.globalBack
+
+
+class TiledExtraction:
+    """
+    The class TiledExtraction runs the background estimation and the source
+    extraction of sep on tiles of the frame. Each tile overlaps its neighbors by
+    OVERLAP pixels, which is larger than any source used for the photometry,
+    so a source cut by a tile border is complete in the neighbor tile. Sources
+    are kept only from the tile which contains their centroid in its core,
+    which removes the duplicates of the overlap. Tile borders are multiples of
+    the background mesh size, so the mesh is the same as for the whole frame.
+
+    The tiles are processed in the calling thread by default, as the smaller
+    tiles alone gave the measured speed up. sep holds the GIL during its
+    calculations, so only frames with at least POOL_MIN_TILES tiles on
+    machines with at least POOL_MIN_WORKERS cores use a pool of worker
+    processes, where the start of the pool and the copy of the frame to shared
+    memory are worth it. The pool is started with the first of these frames
+    and kept for the following ones. A broken pool is dropped and the frame
+    is processed in the calling thread.
+    """
+
+    log = logging.getLogger("MW4")
+    TILE_SIZE: Final[int] = 2048
+    OVERLAP: Final[int] = 64
+    NUMBER_WORKERS: Final[int] = max(1, os.cpu_count() or 1)
+    POOL_MIN_TILES: Final[int] = 16
+    POOL_MIN_WORKERS: Final[int] = 8
+
+    def __init__(self) -> None:
+        self.mutex = QMutex()
+        self.executor: ProcessPoolExecutor | None = None
+
+    def tiles(self, height: int, width: int) -> list[tuple[tuple[int, ...], ...]]:
+        """
+        returns for each tile the region (y0, y1, x0, x1) of the frame including
+        the overlap and the core (y0, y1, x0, x1) within this region.
+        """
+        result = []
+        for y0 in range(0, height, self.TILE_SIZE):
+            for x0 in range(0, width, self.TILE_SIZE):
+                y1 = min(y0 + self.TILE_SIZE, height)
+                x1 = min(x0 + self.TILE_SIZE, width)
+                ry0 = max(y0 - self.OVERLAP, 0)
+                rx0 = max(x0 - self.OVERLAP, 0)
+                ry1 = min(y1 + self.OVERLAP, height)
+                rx1 = min(x1 + self.OVERLAP, width)
+                region = (ry0, ry1, rx0, rx1)
+                core = (y0 - ry0, y1 - ry0, x0 - rx0, x1 - rx0)
+                result.append((region, core))
+        return result
+
+    def pool(self) -> ProcessPoolExecutor:
+        with QMutexLocker(self.mutex):
+            if self.executor is None:
+                context = multiprocessing.get_context("spawn")
+                self.executor = ProcessPoolExecutor(self.NUMBER_WORKERS, mp_context=context)
+            return self.executor
+
+    def shutdown(self) -> None:
+        with QMutexLocker(self.mutex):
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def dropPool(self, executor: ProcessPoolExecutor) -> None:
+        """
+        drops the broken pool executor, unless it was already replaced.
+        """
+        with QMutexLocker(self.mutex):
+            if self.executor is executor:
+                self.executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def usePool(self, numberTiles: int) -> bool:
+        return (
+            numberTiles >= self.POOL_MIN_TILES and self.NUMBER_WORKERS >= self.POOL_MIN_WORKERS
+        )
+
+    def extract(
+        self, image: np.ndarray, threshold: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """
+        returns the sources, the background, the background rms and the global
+        background of the image.
+        """
+        height, width = image.shape
+        tiles = self.tiles(height, width)
+        if not self.usePool(len(tiles)):
+            return self.extractLocal(image, threshold, tiles)
+        return self.extractShared(image, threshold, tiles)
+
+    def extractLocal(
+        self, image: np.ndarray, threshold: float, tiles: list
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        back = np.empty(image.shape, dtype=np.float32)
+        rms = np.empty(image.shape, dtype=np.float32)
+        objs = []
+        globalBacks = []
+        for (y0, y1, x0, x1), (cy0, cy1, cx0, cx1) in tiles:
+            data = np.ascontiguousarray(image[y0:y1, x0:x1])
+            result = extractTile(data, threshold, (cy0, cy1, cx0, cx1), (y0, x0))
+            back[y0 + cy0 : y0 + cy1, x0 + cx0 : x0 + cx1] = result.back
+            rms[y0 + cy0 : y0 + cy1, x0 + cx0 : x0 + cx1] = result.rms
+            objs.append(result.objs)
+            globalBacks.append(result.globalBack)
+        return np.concatenate(objs), back, rms, float(np.median(globalBacks))
+
+    def extractShared(
+        self, image: np.ndarray, threshold: float, tiles: list
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """
+        copies the image once into shared memory, from where the worker
+        processes read their tiles and write the background and its rms. A
+        pool which was shut down during the extraction ends it with a
+        RuntimeError.
+        """
+        size = image.size * np.dtype(np.float32).itemsize
+        memories = [SharedMemory(create=True, size=size) for _ in range(3)]
+        try:
+            shared, back, rms = (
+                np.ndarray(image.shape, dtype=np.float32, buffer=memory.buf)
+                for memory in memories
+            )
+            shared[:] = image
+            names = tuple(memory.name for memory in memories)
+            executor = self.pool()
+            try:
+                futures = [
+                    executor.submit(
+                        extractSharedTile, names, image.shape, region, core, threshold
+                    )
+                    for region, core in tiles
+                ]
+                results = [future.result() for future in futures]
+            except BrokenProcessPool as e:
+                self.log.warning(f"Worker pool broken, extracting in process: [{e}]")
+                self.dropPool(executor)
+                del shared, back, rms
+                return self.extractLocal(image, threshold, tiles)
+            except CancelledError as e:
+                del shared, back, rms
+                raise RuntimeError("Extraction cancelled by shutdown") from e
+            back = back.copy()
+            rms = rms.copy()
+            del shared
+        finally:
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+
+        objs = np.concatenate([objs for objs, _ in results])
+        globalBack = float(np.median([globalBack for _, globalBack in results]))
+        self.log.debug(f"Extracted [{len(objs)}] sources from [{len(tiles)}] tiles")
+        return objs, back, rms, globalBack
@@ -88,9 +88,12 @@ class ASTAP:
     def setDefaultBinPath(self) -> Path:
         return Path(self.config.appPath) / self.GUI
 
-    def solve(self, imagePath: Path, updateHeader: bool) -> dict[str, Any]:
-        tempPath = self.tempDir / "temp"
-        wcsPath = self.tempDir / "temp.wcs"
+    def solve(
+        self, imagePath: Path, updateHeader: bool, workDir: Path | None = None
+    ) -> dict[str, Any]:
+        workDir = workDir or self.tempDir
+        tempPath = workDir / "temp"
+        wcsPath = workDir / "temp.wcs"
         wcsPath.unlink(missing_ok=True)
         runnable = [self.binPath, "-f", imagePath, "-o", tempPath, "-wcs"]
         options = [
@@ -77,16 +77,19 @@ class Astrometry:
             outFile.write(f"add_path {self.config.indexPath}\n")
             outFile.write("autoindex\n")
 
-    def solve(self, imagePath: Path, updateHeader: bool) -> dict[str, Any]:
-        tempPath = self.tempDir / "temp.xy"
+    def solve(
+        self, imagePath: Path, updateHeader: bool, workDir: Path | None = None
+    ) -> dict[str, Any]:
+        workDir = workDir or self.tempDir
+        tempPath = workDir / "temp.xy"
         configPath = self.tempDir / "astrometry.cfg"
-        wcsPath = self.tempDir / "temp.wcs"
+        wcsPath = workDir / "temp.wcs"
         wcsPath.unlink(missing_ok=True)
         runnable = [Path(self.config.appPath) / "image2xy", "-O", "-o", tempPath, imagePath]
         suc, msg = self.parent.runSolverBin(runnable)
         if not suc:
             self.log.warning(f"IMAGE2XY error in [{imagePath}]")
-            return {"success": False, "message": "image2xy failed"}
+            return {"success": False, "message": "image2xy failed", "imagePath": imagePath}
 
         raHint, decHint, scaleHint = getHintFromImageFile(imagePath)
         searchRatio = 1.1
@@ -14,9 +14,12 @@
 #
 ###########################################################
 import logging
+import os
 import queue
 import subprocess
+import threading
 import time
+from dataclasses import dataclass, field
 from mw4.base.signalsDevices import Signals
 from mw4.base.tpool import Worker
 from mw4.base.transform import J2000ToJNow
@@ -29,26 +32,54 @@ from mw4.logic.plateSolve.astap import ASTAP
 from mw4.logic.plateSolve.astrometry import Astrometry
 from mw4.logic.plateSolve.watney import Watney
 from pathlib import Path
-from typing import Any
+from PySide6.QtCore import QMutex, QMutexLocker
+from typing import Any, Final
+
+
+@dataclass(order=True)
+class SolveJob:
+    priority: int
+    sequence: int
+    imagePath: Path = field(compare=False)
+    updateHeader: bool = field(compare=False, default=False)
 
 
 class PlateSolve:
     """
     Keyword definitions could be found under
         https://fits.gsfc.nasa.gov/fits_dictionary.html
+
+    Solve requests are queued by priority and handled by NUMBER_WORKERS solve
+    loops in parallel, each running its own solver process in its own scratch
+    directory below tempDir. Interactive solves from the image window are served
+    before the solves of a model run. A job is stale and skipped if the same
+    image was queued again meanwhile or if its priority was cancelled after it
+    was queued.
     """
 
     DEVICE_TYPE = "misc"
     log = logging.getLogger("MW4")
+    PRIORITY_INTERACTIVE: Final[int] = 0
+    PRIORITY_BATCH: Final[int] = 1
+    MAX_QUEUE_DEPTH: Final[int] = 64
+    NUMBER_WORKERS: Final[int] = min(4, max(1, (os.cpu_count() or 2) // 2))
 
     def __init__(self, app: Any) -> None:
         self.app = app
         self.threadPool = app.threadPool
         self.signals = Signals()
-        self.solveQueue: queue.Queue = queue.Queue()
+        self.tempDir: Path = app.mwGlob["tempDir"]
+        self.solveQueue: queue.PriorityQueue = queue.PriorityQueue(self.MAX_QUEUE_DEPTH)
         self.solveLoopRunning: bool = False
-        self.workerSolveLoop: Worker = Worker(self.runnerSolveLoop)
-        self.process: subprocess.Popen | None = None
+        self.workersSolveLoop: list[Worker] = [
+            Worker(self.runnerSolveLoop, index) for index in range(self.NUMBER_WORKERS)
+        ]
+        self.mutex = QMutex()
+        self.sequence: int = 0
+        self.latestJobs: dict[Path, int] = {}
+        self.cancelledUntil: dict[int, int] = {}
+        self.runningJobs: dict[int, SolveJob] = {}
+        self.processes: dict[int, subprocess.Popen] = {}
         self.data: dict[str, Any] = {}
         self.framework: str = ""
         self.run: dict = {
@@ -60,29 +91,37 @@ class PlateSolve:
 
     def runSolverBin(self, runnable: list[Any]) -> tuple[bool, str]:
         timeStart = time.time()
+        threadId = threading.get_ident()
         try:
-            self.process = subprocess.Popen(
+            process = subprocess.Popen(
                 args=runnable,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
             )
+            with QMutexLocker(self.mutex):
+                self.processes[threadId] = process
             timeout = self.run[self.framework].config.timeout
-            stdout, _ = self.process.communicate(timeout=timeout)
+            stdout, _ = process.communicate(timeout=timeout)
 
         except subprocess.TimeoutExpired as e:
             self.log.critical(e)
+            process.kill()
             return False, "Timeout expired"
 
         except (OSError, RuntimeError) as e:
             self.log.critical(f"Error: {e} happened")
             return False, f"Exception {e} during process run"
 
+        finally:
+            with QMutexLocker(self.mutex):
+                self.processes.pop(threadId, None)
+
         delta = time.time() - timeStart
         stdoutText = stdout.decode()
         self.log.debug(f"{'Solve Runtime':15s}: [{delta:2.2f}s]")
         for line in stdoutText.splitlines():
             self.log.debug(f"{'Solver output':15s}: [{line}]")
-        rCode = int(self.process.returncode)
+        rCode = int(process.returncode)
         suc = rCode == 0
         msg = self.run[self.framework].returnCodes.get(rCode, "Unknown code")
         return suc, msg
@@ -116,9 +155,15 @@ class PlateSolve:
         self.log.debug(f"{'Solve result':15s}: [{imagePath.stem:10s}], [{result}]")
         return result
 
-    def processSolveQueue(self, imagePath: Path, updateHeader: bool = False) -> None:
+    def processSolveQueue(
+        self, imagePath: Path, updateHeader: bool = False, workDir: Path | None = None
+    ) -> None:
         if not imagePath.is_file():
-            result = {"success": False, "message": f"{imagePath} not found"}
+            result = {
+                "success": False,
+                "message": f"{imagePath} not found",
+                "imagePath": imagePath,
+            }
         else:
             self.signals.message.emit("solving")
             t = f"{'Solver start':15s}: [{imagePath.stem}] with [{self.framework}], "
@@ -126,25 +171,59 @@ class PlateSolve:
             t += f"radius: [{self.run[self.framework].config.searchRadius}], "
             self.log.debug(t)
             result = self.run[self.framework].solve(
-                imagePath=imagePath, updateHeader=updateHeader
+                imagePath=imagePath, updateHeader=updateHeader, workDir=workDir
             )
+            result.setdefault("imagePath", imagePath)
         self.signals.message.emit("")
         self.signals.result.emit(result)
 
-    def runnerSolveLoop(self) -> None:
+    def checkJob(self, job: SolveJob) -> str:
+        """
+        checkJob returns the state of a job taken from the queue. a job which is
+        run is registered as running job of the calling thread.
+        """
+        with QMutexLocker(self.mutex):
+            if self.latestJobs.get(job.imagePath) != job.sequence:
+                return "superseded"
+            del self.latestJobs[job.imagePath]
+            if job.sequence <= self.cancelledUntil.get(job.priority, 0):
+                return "cancelled"
+            self.runningJobs[threading.get_ident()] = job
+            return "run"
+
+    def runnerSolveLoop(self, index: int = 0) -> None:
+        workDir = self.tempDir / f"solver-{index}"
+        workDir.mkdir(parents=True, exist_ok=True)
         while self.solveLoopRunning:
             try:
-                imagePath, updateHeader = self.solveQueue.get(timeout=0.5)
+                job = self.solveQueue.get(timeout=0.5)
             except queue.Empty:
                 continue
-            self.processSolveQueue(imagePath, updateHeader)
-            self.solveQueue.task_done()
+            state = self.checkJob(job)
+            if state != "run":
+                self.log.debug(f"{'Solve skipped':15s}: [{job.imagePath.stem}] {state}")
+                if state == "cancelled":
+                    result = {
+                        "success": False,
+                        "message": "Solve cancelled",
+                        "imagePath": job.imagePath,
+                    }
+                    self.signals.result.emit(result)
+                self.solveQueue.task_done()
+                continue
+            try:
+                self.processSolveQueue(job.imagePath, job.updateHeader, workDir)
+            finally:
+                with QMutexLocker(self.mutex):
+                    self.runningJobs.pop(threading.get_ident(), None)
+                self.solveQueue.task_done()
 
     def startSolveLoop(self) -> None:
         if self.solveLoopRunning:
             return
         self.solveLoopRunning = True
-        self.threadPool.start(self.workerSolveLoop)
+        for worker in self.workersSolveLoop:
+            self.threadPool.start(worker)
 
     def checkAvailabilityProgram(self, framework: str) -> bool:
         appPath = self.run[framework].config.appPath
@@ -165,10 +244,40 @@ class PlateSolve:
         self.solveLoopRunning = False
         self.signals.deviceDisconnected.emit(self.run[self.framework].config.deviceName)
 
-    def solve(self, imagePath: Path, updateHeader: bool = False) -> None:
-        data = (imagePath, updateHeader)
-        self.solveQueue.put(data)
+    def solve(
+        self, imagePath: Path, updateHeader: bool = False, priority: int = PRIORITY_BATCH
+    ) -> bool:
+        imagePath = Path(imagePath)
+        with QMutexLocker(self.mutex):
+            self.sequence += 1
+            job = SolveJob(priority, self.sequence, imagePath, updateHeader)
+            self.latestJobs[imagePath] = job.sequence
+        try:
+            self.solveQueue.put_nowait(job)
+        except queue.Full:
+            self.log.warning(f"Solve queue full, [{imagePath.stem}] rejected")
+            result = {"success": False, "message": "Solve queue full", "imagePath": imagePath}
+            self.signals.result.emit(result)
+            return False
+        return True
+
+    def cancelJobs(self, priority: int) -> None:
+        """
+        cancelJobs marks all queued jobs of the given priority as stale and stops
+        the solver processes already working on jobs of this priority.
+        """
+        with QMutexLocker(self.mutex):
+            self.cancelledUntil[priority] = self.sequence
+            processes = [
+                self.processes[threadId]
+                for threadId, job in self.runningJobs.items()
+                if job.priority == priority and threadId in self.processes
+            ]
+        for process in processes:
+            process.kill()
 
     def abort(self) -> None:
-        if self.process:
-            self.process.kill()
+        with QMutexLocker(self.mutex):
+            processes = list(self.processes.values())
+        for process in processes:
+            process.kill()
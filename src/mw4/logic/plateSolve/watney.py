@@ -59,10 +59,13 @@ class Watney:
             outFile.write("defaultStarDetectionBgOffset: 1.0\n")
             outFile.write("defaultLowerDensityOffset: 3\n")
 
-    def solve(self, imagePath: Path, updateHeader: bool) -> dict[str, Any]:
+    def solve(
+        self, imagePath: Path, updateHeader: bool, workDir: Path | None = None
+    ) -> dict[str, Any]:
+        workDir = workDir or self.tempDir
         isBlind = self.config.searchRadius == 180
-        jsonPath = self.tempDir / "solve.json"
-        wcsPath = self.tempDir / "temp.wcs"
+        jsonPath = workDir / "solve.json"
+        wcsPath = workDir / "temp.wcs"
         wcsPath.unlink(missing_ok=True)
 
         runnable = [Path(self.config.appPath) / "watney-solve"]
@@ -0,0 +1,238 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+from dataclasses import dataclass, field
+from sgp4.api import SGP4_ERRORS, SatrecArray
+from skyfield import almanac
+from skyfield.api import EarthSatellite, Time
+from skyfield.constants import AU_KM, AU_M, DAY_S, ERAD
+from skyfield.functions import mxm
+from skyfield.geometry import intersect_line_and_sphere
+from skyfield.positionlib import build_position
+from skyfield.sgp4lib import TEME
+from skyfield.toposlib import GeographicPosition
+from typing import Any
+
+CHUNK_SATELLITES: int = 256
+GRID_STEP_DAYS: float = 1 / 1440
+
+
+@dataclass
+class SatBatchResult:
+    satRange: np.ndarray = field(default_factory=lambda: np.empty(0))
+    radRate: np.ndarray = field(default_factory=lambda: np.empty(0))
+    latRate: np.ndarray = field(default_factory=lambda: np.empty(0))
+    lonRate: np.ndarray = field(default_factory=lambda: np.empty(0))
+    isSunlit: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    appMag: np.ndarray = field(default_factory=lambda: np.empty(0))
+    messages: list[str | None] = field(default_factory=list)
+
+
+def buildSatrecArray(sats: list[EarthSatellite]) -> SatrecArray:
+    return SatrecArray([sat.model for sat in sats])
+
+
+def splitUTC(t: Time) -> tuple[np.ndarray, np.ndarray]:
+    """
+    the same split of the julian date as in EarthSatellite, as the TLE epoch is
+    defined in UTC.
+    """
+    jd = np.atleast_1d(t.whole)
+    fraction = np.atleast_1d(t.tai_fraction - t._leap_seconds() / DAY_S)
+    return jd, fraction
+
+
+def propagateTEME(satrecs: SatrecArray, t: Time) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    returns position [km], velocity [km/s] in TEME and the error codes with the
+    shape (satellites, times, 3) and (satellites, times).
+    """
+    jd, fraction = splitUTC(t)
+    errors, r, v = satrecs.sgp4(jd, fraction)
+    return r, v, errors
+
+
+def propagateGCRS(
+    satrecs: SatrecArray, t: Time
+) -> tuple[np.ndarray, np.ndarray, list[str | None]]:
+    """
+    returns position [au] and velocity [au/d] in GCRS for a single time with
+    the shape (3, satellites) like an array valued skyfield position.
+    """
+    r, v, errors = propagateTEME(satrecs, t)
+    R = TEME.rotation_at(t).T
+    r = R @ (r[:, 0, :].T / AU_KM)
+    v = R @ (v[:, 0, :].T / AU_KM * DAY_S)
+    return r, v, [SGP4_ERRORS[error] if error else None for error in errors[:, 0]]
+
+
+def findSunlitBatch(rGCRS: np.ndarray, ephemeris: Any, t: Time) -> np.ndarray:
+    earth_m = -rGCRS * AU_M
+    sun_m = (ephemeris["sun"] - ephemeris["earth"]).at(t).xyz.m
+    _, far = intersect_line_and_sphere(sun_m[:, np.newaxis] + earth_m, earth_m, ERAD)
+    return np.nan_to_num(far) <= 0
+
+
+def calcAppMagBatch(phase: np.ndarray, satRange: np.ndarray) -> np.ndarray:
+    """
+    vectorized version of calcAppMag in satellite_calculations.
+    """
+    intMag = -1.3
+    with np.errstate(divide="ignore", invalid="ignore"):
+        term2 = +5.0 * np.log10(satRange / 1000.0)
+        arg = np.sin(phase) + (np.pi - phase) * np.cos(phase)
+        term3 = -2.5 * np.log10(arg)
+    return intMag + term2 + term3
+
+
+def calcSatStatesBatch(
+    sats: list[EarthSatellite], loc: GeographicPosition, ephemeris: Any, t: Time
+) -> SatBatchResult:
+    """
+    calcSatStatesBatch derives range, range rates, sunlit state and apparent
+    magnitude for all satellites at time t in one array operation. it reproduces
+    findRangeRate, findSunlit and calcAppMag. values for satellites, which could
+    not be propagated, are nan, not sunlit and have the magnitude 99.
+    """
+    if not sats:
+        return SatBatchResult()
+
+    rSat, vSat, messages = propagateGCRS(buildSatrecArray(sats), t)
+    locPos = loc.at(t)
+    rLoc = locPos.xyz.au[:, np.newaxis]
+    vLoc = locPos.velocity.au_per_d[:, np.newaxis]
+
+    topo = build_position(rSat - rLoc, vSat - vLoc, t, center=loc)
+    _, _, satRange, latRate, lonRate, radRate = topo.frame_latlon_and_rates(loc)
+    isSunlit = findSunlitBatch(rSat, ephemeris, t)
+
+    earthPos = ephemeris["earth"].at(t).xyz.au[:, np.newaxis]
+    sunSat = build_position(earthPos + rSat, t=t)
+    phase = topo.separation_from(sunSat).radians
+    appMag = calcAppMagBatch(phase, satRange.km)
+
+    valid = ~np.isnan(satRange.km)
+    isSunlit = isSunlit & valid
+    appMag = np.where(isSunlit, appMag, 99)
+    return SatBatchResult(
+        satRange=satRange.km,
+        radRate=radRate.km_per_s,
+        latRate=latRate.degrees.per_second,
+        lonRate=lonRate.degrees.per_second,
+        isSunlit=isSunlit,
+        appMag=appMag,
+        messages=messages,
+    )
+
+
+def calcAltitudeGrid(satrecs: SatrecArray, loc: GeographicPosition, tGrid: Time) -> np.ndarray:
+    """
+    returns the topocentric altitude in degrees with the shape (satellites,
+    times). the rotations TEME -> GCRS -> horizon are combined once per grid
+    time and shared by all satellites.
+    """
+    r, _, errors = propagateTEME(satrecs, tGrid)
+    rotTEME = np.transpose(TEME.rotation_at(tGrid), (1, 0, 2))
+    rotLoc = loc.rotation_at(tGrid)
+    A = mxm(rotLoc, rotTEME)
+    b = np.einsum("ijm,jm->mi", rotLoc, loc.at(tGrid).xyz.km)
+    local = np.einsum("ijm,nmj->nmi", A, r) - b[np.newaxis]
+    distance = np.linalg.norm(local, axis=2)
+    with np.errstate(invalid="ignore"):
+        alt = np.degrees(np.arcsin(local[:, :, 2] / distance))
+    alt[errors != 0] = np.nan
+    return alt
+
+
+def findCulminationTimes(alt: np.ndarray, tGridTT: np.ndarray, altMin: float) -> np.ndarray:
+    """
+    returns the tt julian date of the first culmination above altMin per
+    satellite or nan. the time of the maximum is refined with a parabola through
+    the neighbouring grid points.
+    """
+    result = np.full(alt.shape[0], np.nan)
+    if alt.shape[1] < 3:
+        return result
+
+    center = alt[:, 1:-1]
+    isPeak = (center > alt[:, :-2]) & (center >= alt[:, 2:]) & (center >= altMin)
+    hasPeak = isPeak.any(axis=1)
+    rows = np.nonzero(hasPeak)[0]
+    cols = np.argmax(isPeak[rows], axis=1) + 1
+
+    y0 = alt[rows, cols - 1]
+    y1 = alt[rows, cols]
+    y2 = alt[rows, cols + 1]
+    denominator = y0 - 2 * y1 + y2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = np.where(denominator != 0, 0.5 * (y0 - y2) / denominator, 0)
+    step = tGridTT[1] - tGridTT[0]
+    result[rows] = tGridTT[cols] + np.clip(offset, -1, 1) * step
+    return result
+
+
+def findSatUpBatch(
+    sats: list[EarthSatellite],
+    loc: GeographicPosition,
+    tStart: Time,
+    tEnd: Time,
+    altMin: float,
+    step: float = GRID_STEP_DAYS,
+) -> np.ndarray:
+    """
+    findSatUpBatch evaluates all satellites on one shared time grid and returns
+    the tt julian date of the first culmination above altMin like findSatUp.
+    satellites are processed in chunks to keep the memory footprint bounded.
+    """
+    if not sats:
+        return np.empty(0)
+
+    ts = tStart.ts
+    tGridTT = np.arange(tStart.tt, tEnd.tt + step, step)
+    tGrid = ts.tt_jd(tGridTT)
+    result = np.full(len(sats), np.nan)
+    for start in range(0, len(sats), CHUNK_SATELLITES):
+        chunk = sats[start : start + CHUNK_SATELLITES]
+        alt = calcAltitudeGrid(buildSatrecArray(chunk), loc, tGrid)
+        result[start : start + len(chunk)] = findCulminationTimes(alt, tGridTT, altMin)
+    return result
+
+
+def checkTwilightBatch(
+    ephemeris: Any, loc: GeographicPosition, ts: Any, timesTT: np.ndarray
+) -> np.ndarray:
+    """
+    vectorized version of checkTwilight. satellites without culmination get the
+    value 5 as in the scalar version.
+    """
+    twilight = np.full(len(timesTT), 5, dtype=int)
+    valid = ~np.isnan(timesTT)
+    if not valid.any():
+        return twilight
+    f = almanac.dark_twilight_day(ephemeris, loc)
+    twilight[valid] = f(ts.tt_jd(timesTT[valid]))
+    return twilight
+
+
+def findSatMessagesBatch(sats: list[EarthSatellite], t: Time) -> list[str | None]:
+    """
+    returns the SGP4 error message per satellite at time t like the message
+    attribute of a skyfield position.
+    """
+    if not sats:
+        return []
+    _, _, errors = propagateTEME(buildSatrecArray(sats), t)
+    return [SGP4_ERRORS[error] if error else None for error in errors[:, 0]]
@@ -0,0 +1,131 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import logging
+from dataclasses import dataclass, field
+from PySide6.QtCore import QMutex, QMutexLocker, QThread, QWaitCondition
+from typing import Any, Final
+
+
+@dataclass
+class BatchRequest:
+    commandString: str
+    numberOfChunks: int
+    suc: bool = field(default=False)
+    response: list[str] = field(default_factory=list)
+    done: bool = field(default=False)
+
+
+class CommandBatcher:
+    """
+    The class CommandBatcher coalesces command strings of different callers, which
+    arrive within a short window, into one pipelined write to the mount and hands
+    every caller its own part of the response.
+
+    The first caller of a window becomes the leader: it sends all pending requests
+    with its own connection and distributes the response. Requests arriving while
+    a batch is on the wire are sent with the next one. Only if the last round had
+    followers, the leader waits BATCH_WINDOW ms for other requests first, so a
+    single caller never pays for the window. All other callers block until their
+    request is done. As the mount answers in command order, the response is split
+    by the number of chunks each request expects. This only works for requests
+    with at least one chunk, where the last reply is terminated by '#', because
+    replies of COMMAND_B type have no end mark and would otherwise be glued to the
+    first chunk of the next request.
+    Connection.communicateBatched checks this before a request is submitted.
+    """
+
+    log = logging.getLogger("MW4")
+    BATCH_WINDOW: Final[int] = 20
+    MAX_BATCH_LENGTH: Final[int] = 512
+
+    def __init__(self) -> None:
+        self.mutex = QMutex()
+        self.condition = QWaitCondition()
+        self.pending: list[BatchRequest] = []
+        self.collecting: bool = False
+        self.concurrent: bool = False
+
+    def takeBatch(self) -> list[BatchRequest]:
+        """
+        takeBatch has to be called with the mutex locked. the first request is
+        always taken, even if it exceeds the length limit on its own.
+        """
+        batch: list[BatchRequest] = []
+        length = 0
+        while self.pending:
+            length += len(self.pending[0].commandString)
+            if batch and length > self.MAX_BATCH_LENGTH:
+                break
+            batch.append(self.pending.pop(0))
+        return batch
+
+    @staticmethod
+    def distribute(batch: list[BatchRequest], suc: bool, response: list[str]) -> None:
+        expected = sum(request.numberOfChunks for request in batch)
+        if suc and len(response) != expected:
+            CommandBatcher.log.warning(
+                f"Batch    : expected [{expected}] chunks, received [{len(response)}]"
+            )
+            suc = False
+        start = 0
+        for request in batch:
+            end = start + request.numberOfChunks
+            request.suc = suc
+            request.response = response[start:end] if suc else []
+            start = end
+
+    def sendBatches(self, connection: Any) -> None:
+        while True:
+            with QMutexLocker(self.mutex):
+                batch = self.takeBatch()
+                if not batch:
+                    self.collecting = False
+                    return
+
+            commandString = "".join(request.commandString for request in batch)
+            try:
+                suc, response, _ = connection.communicate(commandString)
+            except (OSError, Exception) as e:
+                self.log.warning(f"Batch    : error [{e}] for [{commandString}]")
+                suc, response = False, []
+            self.distribute(batch, suc, response)
+
+            with QMutexLocker(self.mutex):
+                for request in batch:
+                    request.done = True
+                self.condition.wakeAll()
+
+    def submit(
+        self, connection: Any, commandString: str, numberOfChunks: int
+    ) -> tuple[bool, list[str]]:
+        request = BatchRequest(commandString=commandString, numberOfChunks=numberOfChunks)
+        self.mutex.lock()
+        self.pending.append(request)
+        if self.collecting:
+            self.concurrent = True
+            while not request.done:
+                self.condition.wait(self.mutex)
+            self.mutex.unlock()
+            return request.suc, request.response
+
+        self.collecting = True
+        waitForFollowers = self.concurrent
+        self.concurrent = False
+        self.mutex.unlock()
+        if waitForFollowers:
+            QThread.msleep(self.BATCH_WINDOW)
+        self.sendBatches(connection)
+        return request.suc, request.response
@@ -36,7 +36,10 @@ class Connection:
           c) reply ended with '#'   this is normal feedback -> no special treatment
 
     The class itself needs parameters for the host and port to be able to interact
-    with the mount.
+    with the mount. Sockets used by communicate are taken from and returned to the
+    connection pool of the mount device, so consecutive commands of a thread reuse
+    the established connection. If a reused socket turns out to be closed by the
+    mount, the command is sent once again over a freshly built socket.
     """
 
     log = logging.getLogger("MW4")
@@ -285,6 +288,8 @@ class Connection:
         self.parent = parent
         self.host = (parent.config.hostAddress, parent.config.port)
         self.loggingTrace = parent.loggingTrace
+        self.pool = parent.connectionPool
+        self.batcher = parent.commandBatcher
         self.id = str(uuid.uuid4())[:8]
 
     def validCommand(self, command: str) -> bool:
@@ -325,6 +330,19 @@ class Connection:
             self.log.debug(t)
         return chunksToReceive, getData, minBytes
 
+    def isBatchable(self, commandString: str) -> bool:
+        """
+        a command string could be batched with others if it expects at least one
+        chunk and the last reply is terminated with '#'. otherwise the reply bytes
+        of COMMAND_B type commands at the end can't be assigned to the caller.
+        """
+        endsWithChunk = False
+        for command in commandString.split("#")[:-1]:
+            numberOfChunks, getData, _ = self.analyseCommand(command + "#")
+            if getData:
+                endsWithChunk = numberOfChunks == 1
+        return endsWithChunk
+
     def closeClientHard(self, client: QTcpSocket | None) -> None:
         if not client:
             return
@@ -362,6 +380,20 @@ class Connection:
         else:
             return client
 
+    def acquireClient(self) -> tuple[QTcpSocket | None, bool]:
+        if self.host and self.parent.mountIsUp:
+            client = self.pool.acquire(self.host)
+            if client is not None:
+                return client, True
+        return self.buildClient(), False
+
+    @staticmethod
+    def isClosedByPeer(client: QTcpSocket) -> bool:
+        try:
+            return client.state() != QAbstractSocket.SocketState.ConnectedState
+        except (OSError, Exception):
+            return True
+
     def sendData(self, client: QTcpSocket, commandString: str) -> bool:
         try:
             if self.loggingTrace:
@@ -419,26 +451,85 @@ class Connection:
                 self.log.debug(f"[Trace] Response [{self.id}]: [{response}]")
             return True, response
 
+    @staticmethod
+    def isReadOnly(commandString: str) -> bool:
+        """
+        a command string is read only if it contains :G queries only. it could be
+        sent again without changing the state of the mount.
+        """
+        commandSet = commandString.split("#")[:-1]
+        return bool(commandSet) and all(command.startswith(":G") for command in commandSet)
+
+    def exchange(
+        self, client: QTcpSocket, commandString: str, numberOfChunks: int, minBytes: int
+    ) -> tuple[bool, list[str], bool]:
+        """
+        exchange sends the command string over the given client and reads the
+        response if any. the last return value tells if the command could be
+        sent again over a fresh socket after the connection was lost. this is
+        only the case if the command string reads data only, otherwise the
+        mount might have received the command already and would run it twice.
+        pooled sockets which are found closed before anything is written are
+        already sorted out by the pool when they are acquired.
+        """
+        if not self.sendData(client, commandString):
+            return False, [], self.isReadOnly(commandString)
+        if numberOfChunks == 0 and minBytes == 0:
+            self.pool.release(self.host, client)
+            return True, [], False
+
+        suc, response = self.receiveData(client, numberOfChunks, minBytes)
+        if suc:
+            self.pool.release(self.host, client)
+            return True, response, False
+
+        lost = self.isClosedByPeer(client)
+        self.closeClientHard(client)
+        return False, response, lost and self.isReadOnly(commandString)
+
     def communicate(
         self, commandString: str, responseCheck: str = ""
     ) -> tuple[bool, list[str], int]:
         if not self.validCommandSet(commandString):
             return False, [], 0
 
-        client = self.buildClient()
+        client, reused = self.acquireClient()
         numberOfChunks, getData, minBytes = self.analyseCommand(commandString)
-
         if client is None:
             return False, [], numberOfChunks
-        if not self.sendData(client, commandString):
-            return False, [], numberOfChunks
+
+        suc, response, repeatable = self.exchange(
+            client, commandString, numberOfChunks, minBytes
+        )
+        if not suc and reused and repeatable:
+            self.log.debug(f"Reconnect[{self.id}]: pooled socket lost, sending again")
+            client = self.buildClient()
+            if client is None:
+                return False, [], numberOfChunks
+            suc, response, _ = self.exchange(client, commandString, numberOfChunks, minBytes)
+
         if not getData:
-            self.closeClientHard(client)
-            return True, [], numberOfChunks
+            return suc, [], numberOfChunks
+        if responseCheck:
+            suc = suc and response[0] == responseCheck
+        return suc, response, numberOfChunks
 
-        suc, response = self.receiveData(client, numberOfChunks, minBytes)
-        self.closeClientHard(client)
+    def communicateBatched(
+        self, commandString: str, responseCheck: str = ""
+    ) -> tuple[bool, list[str], int]:
+        """
+        communicateBatched has the same interface as communicate, but lets the
+        command batcher of the mount combine the command string with those of
+        other callers into one round trip. it's meant for the cyclic polls, which
+        are started in the same time tick.
+        """
+        if not self.validCommandSet(commandString):
+            return False, [], 0
+        if not self.isBatchable(commandString):
+            return self.communicate(commandString, responseCheck=responseCheck)
 
+        numberOfChunks, _, _ = self.analyseCommand(commandString)
+        suc, response = self.batcher.submit(self, commandString, numberOfChunks)
         if responseCheck:
             suc = suc and response[0] == responseCheck
         return suc, response, numberOfChunks
@@ -0,0 +1,164 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import logging
+import threading
+import time
+from functools import partial
+from PySide6.QtCore import QMutex, QMutexLocker, Qt, QThread
+from PySide6.QtNetwork import QAbstractSocket, QTcpSocket
+from typing import Final
+
+
+class ConnectionPool:
+    """
+    The class ConnectionPool keeps established command sockets to the mount
+    open between two calls of Connection.communicate, so polling and commands
+    don't pay a full TCP handshake and teardown for every request.
+
+    A QTcpSocket belongs to the thread which created it and must not be used
+    or closed from another one. Idle sockets are therefore stored per host and
+    per thread and only handed out again to the thread which released them. As
+    every thread runs one command at a time, there is at most one idle socket
+    per host and thread. Before a socket is handed out, it is checked: it has
+    to be connected, must not be idle for too long and must not hold any stale
+    bytes from an earlier reply. Sockets failing the check are closed and the
+    caller builds a fresh one.
+
+    Sockets are only closed by their own thread: expired ones when the thread
+    uses the pool again, the ones removed by clear() from another thread are
+    kept as retired until then. When a thread finishes (pool threads expire),
+    its finished signal closes all its remaining sockets in the thread itself.
+    """
+
+    log = logging.getLogger("MW4")
+    MAX_IDLE_TIME: Final[float] = 20.0
+
+    def __init__(self) -> None:
+        self.mutex = QMutex()
+        self.idleClients: dict[tuple[tuple[str, int], int], tuple[QTcpSocket, float]] = {}
+        self.retiredClients: dict[int, list[QTcpSocket]] = {}
+        self.watchedThreads: set[int] = set()
+
+    @staticmethod
+    def closeClient(client: QTcpSocket) -> None:
+        try:
+            client.abort()
+            client.close()
+        except (OSError, Exception) as e:
+            ConnectionPool.log.warning(f"Error    [pool]: closing socket client [{e}]")
+
+    @staticmethod
+    def isHealthy(client: QTcpSocket) -> bool:
+        """
+        waitForReadyRead with a zero timeout processes the pending socket events
+        without blocking. if the mount closed the connection meanwhile, the state
+        is no longer connected, if bytes arrived, they are leftovers from a reply
+        which was not read and the socket can't be used for framing anymore.
+        """
+        try:
+            if client.state() != QAbstractSocket.SocketState.ConnectedState:
+                return False
+            if client.waitForReadyRead(0) or client.bytesAvailable():
+                return False
+            return client.state() == QAbstractSocket.SocketState.ConnectedState
+        except (OSError, Exception):
+            return False
+
+    def takeThreadClients(self, threadId: int, expiredOnly: bool) -> list[QTcpSocket]:
+        """
+        takeThreadClients has to be called with the mutex locked. it removes the
+        retired and the idle (if expiredOnly only the expired) sockets of the
+        thread from the pool and returns them for closing.
+        """
+        now = time.monotonic()
+        clients = self.retiredClients.pop(threadId, [])
+        for key, (client, lastUsed) in list(self.idleClients.items()):
+            if key[1] != threadId:
+                continue
+            if expiredOnly and now - lastUsed < self.MAX_IDLE_TIME:
+                continue
+            del self.idleClients[key]
+            clients.append(client)
+        return clients
+
+    def closeThreadClients(self, threadId: int) -> None:
+        """
+        closeThreadClients is connected to the finished signal of each thread
+        which released a socket. it is called in the finishing thread itself.
+        """
+        with QMutexLocker(self.mutex):
+            clients = self.takeThreadClients(threadId, expiredOnly=False)
+            self.watchedThreads.discard(threadId)
+        for client in clients:
+            self.closeClient(client)
+
+    def watchThread(self, threadId: int) -> None:
+        with QMutexLocker(self.mutex):
+            if threadId in self.watchedThreads:
+                return
+            self.watchedThreads.add(threadId)
+        QThread.currentThread().finished.connect(
+            partial(self.closeThreadClients, threadId), Qt.ConnectionType.DirectConnection
+        )
+
+    def acquire(self, host: tuple[str, int]) -> QTcpSocket | None:
+        threadId = threading.get_ident()
+        key = (host, threadId)
+        with QMutexLocker(self.mutex):
+            expired = self.takeThreadClients(threadId, expiredOnly=True)
+            entry = self.idleClients.pop(key, None)
+        for client in expired:
+            self.closeClient(client)
+        if entry is None:
+            return None
+
+        client, _ = entry
+        if not self.isHealthy(client):
+            self.log.debug(f"Pool     [{host}]: discarding unhealthy socket")
+            self.closeClient(client)
+            return None
+        return client
+
+    def release(self, host: tuple[str, int], client: QTcpSocket) -> None:
+        if not self.isHealthy(client):
+            self.closeClient(client)
+            return
+
+        threadId = threading.get_ident()
+        self.watchThread(threadId)
+        key = (host, threadId)
+        with QMutexLocker(self.mutex):
+            retired = self.retiredClients.pop(threadId, [])
+            entry = self.idleClients.pop(key, None)
+            self.idleClients[key] = (client, time.monotonic())
+        if entry is not None and entry[0] is not client:
+            retired.append(entry[0])
+        for oldClient in retired:
+            self.closeClient(oldClient)
+
+    def clear(self) -> None:
+        """
+        clear closes the sockets of the calling thread. the sockets of other
+        threads are retired and closed by their thread later on.
+        """
+        threadId = threading.get_ident()
+        with QMutexLocker(self.mutex):
+            clients = self.takeThreadClients(threadId, expiredOnly=False)
+            for (_, owner), (client, _) in self.idleClients.items():
+                self.retiredClients.setdefault(owner, []).append(client)
+            self.idleClients.clear()
+        for client in clients:
+            self.closeClient(client)
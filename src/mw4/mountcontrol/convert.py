@@ -15,8 +15,24 @@
 ###########################################################
 import numpy as np
 import re
+from functools import cache
 from skyfield.api import Angle
-from typing import Any
+from typing import Any, Final
+
+FLOAT_PATTERN: Final[re.Pattern] = re.compile(r"([-+]?)(\d{1,3})[.,]?(\d*)?")
+COORD_PATTERN: Final[re.Pattern] = re.compile(
+    r"([+-]?)(\d{1,3})[\s:]+(\d\d)?[\s:]*(\d\d)?[.,]?(\d*)?"
+)
+
+
+@cache
+def latLonPattern(pf: str) -> re.Pattern:
+    return re.compile(r"(\d{1,3})([" + pf + r"])\s*(\d\d)?\s*(\d\d)?[.,]?(\d*)?")
+
+
+@cache
+def coordTypePattern(coordType: str) -> re.Pattern:
+    return re.compile(rf"([+-]?)(\d{{1,3}}){coordType}[\s:]*(\d\d)?[\s:]*(\d\d)?[.,]?(\d*)?")
 
 
 def stringToDegree(value: str) -> float:
@@ -110,6 +126,22 @@ def topoToAltAz(ha: Angle, dec: Angle, lat: Angle) -> tuple[Angle, Angle]:
     return Angle(degrees=alt), Angle(degrees=az)
 
 
+def altAzToTopo(alt: Angle, az: Angle, lat: Angle) -> tuple[Angle, Angle]:
+    """
+    altAzToTopo is the inverse of topoToAltAz and works on array valued angles as
+    well. hour angle is positive to the west.
+    """
+    alt = alt.radians
+    az = az.radians
+    lat = lat.radians
+    value = np.sin(alt) * np.sin(lat) + np.cos(alt) * np.cos(lat) * np.cos(az)
+    dec = np.arcsin(np.clip(value, -1, 1))
+    x = np.sin(alt) * np.cos(lat) - np.cos(alt) * np.sin(lat) * np.cos(az)
+    y = -np.cos(alt) * np.sin(az)
+    ha = np.arctan2(y, x)
+    return Angle(radians=ha, preference="hours"), Angle(radians=dec)
+
+
 def sexagesimalizeToInt(value: float, decimals: int = 0) -> tuple[int, int, int, int, int]:
     sign = int(np.sign(value))
     value = abs(value)
@@ -137,8 +169,8 @@ def convertToHMS(ra: Angle | float) -> str:
 
 def formatLatLonToAngle(value: str, pf: str) -> Angle:
     value = value.strip()
-    p1 = re.compile(r"(\d{1,3})([" + pf + r"])\s*(\d\d)?\s*(\d\d)?[.,]?(\d*)?")
-    p2 = re.compile(r"([-+]?)(\d{1,3})[.,]?(\d*)?")
+    p1 = latLonPattern(pf)
+    p2 = FLOAT_PATTERN
     isSexagesimal = p1.fullmatch(value) is not None
     isFloat = p2.fullmatch(value) is not None
 
@@ -186,9 +218,9 @@ def parseCoordToAngleString(value: str, coordType: str) -> tuple[bool, bool, lis
     matched.
     """
     value = value.strip()
-    p1 = re.compile(rf"([+-]?)(\d{{1,3}}){coordType}[\s:]*(\d\d)?[\s:]*(\d\d)?[.,]?(\d*)?")
-    p2 = re.compile(r"([+-]?)(\d{1,3})[\s:]+(\d\d)?[\s:]*(\d\d)?[.,]?(\d*)?")
-    p3 = re.compile(r"([+-]?)(\d{1,3})[.,]?(\d*)?")
+    p1 = coordTypePattern(coordType)
+    p2 = COORD_PATTERN
+    p3 = FLOAT_PATTERN
     isP1 = p1.fullmatch(value) is not None
     isP2 = p2.fullmatch(value) is not None
     isSexagesimal = isP1 or isP2
@@ -0,0 +1,85 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+import re
+from collections.abc import Iterable
+from mw4.mountcontrol.convert import stringToDegree, valueToFloat
+from skyfield.api import Angle
+from typing import Any, Final
+
+# the formats the mount sends: +DD*MM:SS.S, HH:MM:SS.SS, DDD:MM:SS.S and +DD*MM
+SEXAGESIMAL_PATTERN: Final[re.Pattern] = re.compile(
+    r"\s*([+-]?)(\d+(?:\.\d*)?)[*:](\d+(?:\.\d*)?)(?::(\d+(?:\.\d*)?))?\s*"
+)
+
+
+def stringsToDegrees(values: Iterable[Any]) -> np.ndarray:
+    """
+    stringsToDegrees converts a sequence of sexagesimal strings into an array
+    of decimal values like stringToDegree does for a single one. The formats
+    of the mount are matched with one precompiled pattern, all other values are
+    passed to stringToDegree, so malformed values give 0 in both cases. As in
+    stringToDegree, the sign is taken from the first field as a number, which
+    makes a negative zero degrees field positive.
+    """
+    values = list(values)
+    result = np.zeros(len(values))
+    match = SEXAGESIMAL_PATTERN.fullmatch
+    for i, value in enumerate(values):
+        found = match(value) if isinstance(value, str) else None
+        if found is None:
+            result[i] = stringToDegree(value)
+            continue
+
+        sign, first, minutes, seconds = found.groups()
+        first = float(first)
+        if seconds is None:
+            angle = first + float(minutes) / 60
+        else:
+            angle = first + float(minutes) / 60 + float(seconds) / 3600
+        result[i] = -angle if sign == "-" and first != 0 else angle
+    return result
+
+
+def valuesToFloats(values: Iterable[Any]) -> np.ndarray:
+    """
+    valuesToFloats converts a sequence of values into a float array like
+    valueToFloat does for a single one. Only if one of them could not be
+    converted directly, the values are converted one by one with valueToFloat.
+    """
+    values = list(values)
+    try:
+        return np.fromiter((float(value) for value in values), dtype=float, count=len(values))
+    except (ValueError, TypeError):
+        return np.array([valueToFloat(value) for value in values], dtype=float)
+
+
+def topoToAltAzArray(ha: Angle, dec: Angle, lat: Angle) -> tuple[Angle, Angle]:
+    """
+    topoToAltAzArray does the same calculation as topoToAltAz for array valued
+    hour angle and declination in one pass.
+    """
+    ha = (np.asarray(ha.radians) + 2 * np.pi) % (2 * np.pi)
+    dec = np.asarray(dec.radians)
+    lat = lat.radians
+    alt = np.arcsin(np.sin(dec) * np.sin(lat) + np.cos(dec) * np.cos(lat) * np.cos(ha))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = (np.sin(dec) - np.sin(alt) * np.sin(lat)) / (np.cos(alt) * np.cos(lat))
+    value = np.clip(value, -1, 1)
+    A = np.degrees(np.arccos(value))
+    alt = np.degrees(alt)
+    az = np.where(np.sin(ha) >= 0.0, 360.0 - A, A)
+    return Angle(degrees=alt), Angle(degrees=az)
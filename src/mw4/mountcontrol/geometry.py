@@ -439,3 +439,88 @@ class Geometry:
             self.log.debug(f"[Trace] az:{azDome}, alt:{altDome}")
 
         return altDome, azDome, intersect, PB, PD
+
+    @staticmethod
+    def transformRotStack(axis: str, angles: np.ndarray) -> np.ndarray:
+        """
+        transformRotStack returns the rotation matrices of transformRot for an
+        array of angles stacked with the shape (n, 4, 4).
+        """
+        rot = np.radians(angles)
+        tCos = np.cos(rot)
+        tSin = np.sin(rot)
+        T = np.zeros((len(rot), 4, 4))
+        T[:, 3, 3] = 1
+        match axis:
+            case "x":
+                T[:, 0, 0] = 1
+                T[:, 1, 1], T[:, 1, 2] = tCos, -tSin
+                T[:, 2, 1], T[:, 2, 2] = tSin, tCos
+            case "y":
+                T[:, 1, 1] = 1
+                T[:, 0, 0], T[:, 0, 2] = tCos, tSin
+                T[:, 2, 0], T[:, 2, 2] = -tSin, tCos
+            case _:
+                T[:, 2, 2] = 1
+                T[:, 0, 0], T[:, 0, 1] = tCos, -tSin
+                T[:, 1, 0], T[:, 1, 1] = tSin, tCos
+        return T
+
+    def calcTransformationMatricesBatch(
+        self, ha: Angle, dec: Angle, lat: Angle, pierside: Any
+    ) -> tuple[Angle, Angle, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        calcTransformationMatricesBatch is the array version of
+        calcTransformationMatrices for many pointings at once. ha and dec are
+        array valued angles, pierside is a sequence of 'E' / 'W' of the same
+        length. the part of the chain up to the GEM point only depends on the
+        latitude and is calculated once, the ha and dec rotations are applied as
+        stacked matrices. intersect, PB and PD have the shape (n, 3). pointings
+        without solution are returned as nan.
+        """
+        ha = np.atleast_1d(ha.degrees).astype(float)
+        dec = np.atleast_1d(dec.degrees).astype(float)
+        lat = lat.degrees
+        pierside = np.atleast_1d(np.asarray(pierside))
+
+        rotBase = self.azAdj if lat > 0 else self.azAdj + 180
+        T0 = self.transformTranslate([self.offNorth, -self.offEast, self.offVert])
+        T1 = np.dot(T0, self.transformRotZ(rotBase))
+        vec2 = [self.offBaseAltAxisX, 0, self.offBaseAltAxisZ]
+        T2 = np.dot(T1, self.transformTranslate(vec2))
+        self.altAdj = -abs(lat)
+        T3 = np.dot(T2, self.transformRotY(self.altAdj))
+        vec4 = [self.offAltAxisGemX, 0, self.offAltAxisGemZ]
+        T4 = np.dot(T3, self.transformTranslate(vec4))
+
+        if lat < 0:
+            ha = -ha
+            dec = -dec
+            isCheckPier = pierside == "W"
+        else:
+            isCheckPier = pierside == "E"
+
+        valueHa = np.where(isCheckPier, -ha + 90, -ha + 270)
+        valueDec = np.where(isCheckPier, 90 - dec, dec - 90)
+        T5 = T4 @ self.transformRotStack("x", valueHa)
+        T6 = T5 @ self.transformRotStack("z", valueDec)
+        T7 = T6 @ self.transformTranslate([0, 0, self.offPlateOTA + self.offGemPlate])
+        T8 = T7 @ self.transformTranslate([0, -self.cfg["offLAT"], 0])
+        T9 = T8 @ self.transformTranslate([1, 0, 0])
+
+        # multiplying with P0 = [0, 0, 0, 1] selects the translation column
+        PB = T8[:, :3, 3]
+        PD = T9[:, :3, 3] - PB
+
+        p = 2 * np.einsum("ij,ij->i", PD, PB)
+        q = np.einsum("ij,ij->i", PB, PB) - self.cfg["radius"] ** 2
+        discriminant = p * p / 4 - q
+        with np.errstate(invalid="ignore"):
+            t1 = -p / 2 + np.sqrt(discriminant)
+        t1[discriminant < 0] = np.nan
+        intersect = PB + t1[:, np.newaxis] * PD
+
+        x, y, z = intersect.T
+        azDome = Angle(radians=np.mod(-np.arctan2(y, x), 2 * np.pi))
+        altDome = Angle(radians=np.arctan2(z, np.sqrt(x * x + y * y)))
+        return altDome, azDome, intersect, PB, PD
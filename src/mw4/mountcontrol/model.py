@@ -19,12 +19,11 @@ import logging
 from mw4.mountcontrol.connection import Connection
 from mw4.mountcontrol.convert import (
     sexagesimalizeToInt,
-    stringToAngle,
-    topoToAltAz,
     valueToAngle,
     valueToFloat,
     valueToInt,
 )
+from mw4.mountcontrol.convertArray import stringsToDegrees, topoToAltAzArray, valuesToFloats
 from mw4.mountcontrol.modelStar import ModelStar
 from mw4.mountcontrol.progStar import ProgStar
 from skyfield.api import Angle, Star
@@ -151,15 +150,29 @@ class Model:
         if len(response) != numberOfChunks:
             self.log.warning("Wrong number of chunks")
             return False
-        for number, starData in enumerate(response):
-            ra, dec, err, angle = starData.split(",")
-            ra = stringToAngle(ra, preference="hours")
-            dec = stringToAngle(dec, preference="degrees")
-            coord = Star(ra=ra, dec=dec)
-            errorRMS = valueToFloat(err)
-            errorAngle = valueToAngle(angle)
-            alt, az = topoToAltAz(ra, dec, self.parent.obsSite.location.latitude)
-            modelStar = ModelStar(coord, errorRMS, errorAngle, number, alt, az)
+        rows = [starData.split(",") for starData in response]
+        if any(len(row) != 4 for row in rows):
+            self.log.warning(f"Malformed star data: [{response}]")
+            return False
+        if not rows:
+            return True
+
+        raS, decS, errS, angleS = zip(*rows, strict=True)
+        ra = Angle(hours=stringsToDegrees(raS))
+        dec = Angle(degrees=stringsToDegrees(decS))
+        errorRMS = valuesToFloats(errS)
+        errorAngle = valuesToFloats(angleS)
+        alt, az = topoToAltAzArray(ra, dec, self.parent.obsSite.location.latitude)
+        for number in range(len(rows)):
+            coord = Star(ra_hours=ra.hours[number], dec_degrees=dec.degrees[number])
+            modelStar = ModelStar(
+                coord,
+                errorRMS[number],
+                Angle(degrees=errorAngle[number]),
+                number,
+                Angle(degrees=alt.degrees[number]),
+                Angle(degrees=az.degrees[number]),
+            )
             self.addStar(modelStar)
         return True
 
@@ -14,9 +14,13 @@
 #
 ###########################################################
 import logging
+import numpy as np
 import wakeonlan
 from dataclasses import dataclass, field
 from mw4.base.tpool import Worker, startWorker
+from mw4.mountcontrol.commandBatcher import CommandBatcher
+from mw4.mountcontrol.connectionPool import ConnectionPool
+from mw4.mountcontrol.convert import altAzToTopo
 from mw4.mountcontrol.firmware import Firmware
 from mw4.mountcontrol.geometry import Geometry
 from mw4.mountcontrol.model import Model
@@ -73,6 +77,8 @@ class MountDevice(QObject):
         self.loggingTrace: bool = False
         self.mountIsUp: bool = False
         self.signals = MountSignals()
+        self.connectionPool = ConnectionPool()
+        self.commandBatcher = CommandBatcher()
         self.firmware = Firmware(self)
         self.setting = Setting(self)
         self.obsSite = ObsSite(self, verbose=self.verbose)
@@ -126,17 +132,18 @@ class MountDevice(QObject):
         self.decRef = self.obsSite.decJNow.degrees
 
     def collectData(self) -> None:
-        if self.obsSite.statusSlew:
-            self.raRef = self.obsSite.raJNow.degrees
-            self.decRef = self.obsSite.decJNow.degrees
+        pointing = self.obsSite.pointing
+        if pointing.statusSlew:
+            self.raRef = pointing.ra * 15
+            self.decRef = pointing.dec
 
-        deltaRaJNow = (self.obsSite.raJNow.degrees - self.raRef) * 3600
-        deltaDecJNow = (self.obsSite.decJNow.degrees - self.decRef) * 3600
+        deltaRaJNow = (pointing.ra * 15 - self.raRef) * 3600
+        deltaDecJNow = (pointing.dec - self.decRef) * 3600
         self.data["deltaRaJNow"] = deltaRaJNow
         self.data["deltaDecJNow"] = deltaDecJNow
-        self.data["errorAngularPosRA"] = self.obsSite.errorAngularPosRA.degrees * 3600
-        self.data["errorAngularPosDEC"] = self.obsSite.errorAngularPosDEC.degrees * 3600
-        self.data["status"] = self.obsSite.status
+        self.data["errorAngularPosRA"] = pointing.errorAngularPosRA * 3600
+        self.data["errorAngularPosDEC"] = pointing.errorAngularPosDEC * 3600
+        self.data["status"] = pointing.status
         self.data["timeDiff"] = self.mountTime.timeDiff * 1000
         self.data["rtt"] = self.mountTime.rtt * 1000
 
@@ -159,6 +166,7 @@ class MountDevice(QObject):
         elif not status and self.mountIsUp:
             self.signals.deviceDisconnected.emit("mount")
             self.mountIsUp = False
+            self.connectionPool.clear()
 
     def clearCyclePointing(self, result: bool) -> None:
         if self.obsSite.status in self.ALERT_STATUS_CODES:
@@ -382,3 +390,25 @@ class MountDevice(QObject):
             return None, None
         alt, az, _, _, _ = self.calcTransformationMatricesTarget()
         return alt, az
+
+    def calcMountAltAzToDomeAltAzBatch(
+        self, alt: np.ndarray, az: np.ndarray
+    ) -> tuple[Angle, Angle]:
+        """
+        calcMountAltAzToDomeAltAzBatch converts a whole set of points without
+        asking the mount for each target. hour angle and declination are
+        calculated locally and the pier side is the one the mount normally
+        chooses: pointing east of the meridian with the telescope on the west
+        side. refraction and flip limits are not taken into account.
+        """
+        lat = self.obsSite.location.latitude
+        ha, dec = altAzToTopo(
+            Angle(degrees=np.asarray(alt, dtype=float)),
+            Angle(degrees=np.asarray(az, dtype=float)),
+            lat,
+        )
+        pierside = np.where(ha.hours < 0, "W", "E")
+        altDome, azDome, _, _, _ = self.geometry.calcTransformationMatricesBatch(
+            ha, dec, lat, pierside
+        )
+        return altDome, azDome
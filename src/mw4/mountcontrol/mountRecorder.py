@@ -0,0 +1,241 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import argparse
+import contextlib
+import json
+import logging
+import socket
+import socketserver
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from mw4.mountcontrol.mountSimulator import (
+    SimulatedMount,
+    SimulatorConfig,
+    SimulatorHandler,
+    replyType,
+)
+from pathlib import Path
+from PySide6.QtCore import QMutex, QMutexLocker
+from typing import Final
+
+
+@dataclass
+class Exchange:
+    command: str = field(default="")
+    response: str = field(default="")
+    delay: float = field(default=0.0)
+
+
+def expectedReply(commandString: str) -> tuple[int, int]:
+    """
+    returns the number of '#' terminated chunks and the number of bytes without
+    end mark the mount replies to the command string, with the same rules as
+    Connection.analyseCommand.
+    """
+    chunks = 0
+    minBytes = 0
+    for command in commandString.split("#")[:-1]:
+        kind = replyType(command)
+        if kind == "B":
+            minBytes += 1
+        elif kind == "C":
+            chunks += 1
+    return chunks, minBytes
+
+
+def replyComplete(response: bytes, chunks: int, minBytes: int) -> bool:
+    if chunks:
+        return response.count(b"#") >= chunks
+    return len(response) >= minBytes
+
+
+def loadSession(sessionFile: Path) -> list[Exchange]:
+    with open(sessionFile) as inFile:
+        session = json.load(inFile)
+    return [Exchange(**exchange) for exchange in session.get("exchanges", [])]
+
+
+def saveSession(sessionFile: Path, exchanges: list[Exchange]) -> None:
+    session = {
+        "version": MountRecorder.VERSION,
+        "exchanges": [asdict(exchange) for exchange in exchanges],
+    }
+    with open(sessionFile, "w") as outFile:
+        json.dump(session, outFile, indent=1)
+
+
+class RecorderHandler(SimulatorHandler):
+    """
+    RecorderHandler keeps one connection to the mount per client connection, so
+    the mount sees the same connection pattern as without the recorder.
+    """
+
+    server: "MountRecorder"
+
+    def setup(self) -> None:
+        self.upstream = socket.create_connection(self.server.mountAddress, timeout=5)
+
+    def finish(self) -> None:
+        self.upstream.close()
+
+    def respond(self, commandString: str) -> str:
+        return self.server.forward(self.upstream, commandString)
+
+
+class MountRecorder(socketserver.ThreadingTCPServer):
+    """
+    The class MountRecorder sits as proxy between MountWizzard4 and a real mount.
+    Every command string is forwarded to the mount and the reply is read with
+    the framing rules of Connection. The command string, the reply and the time
+    the mount needed are recorded as exchange and could be saved into a session
+    file for a later replay with MountReplay. The replies are stored as latin-1
+    text, so they are replayed byte exact.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    log = logging.getLogger("MW4")
+    VERSION: Final[int] = 1
+    TIMEOUT: Final[float] = 5.0
+
+    def __init__(self, config: SimulatorConfig, mountAddress: tuple[str, int]) -> None:
+        self.config = config
+        self.mountAddress = mountAddress
+        self.exchanges: list[Exchange] = []
+        self.mutex = QMutex()
+        super().__init__((config.hostAddress, config.port), RecorderHandler)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self.server_address[0], self.server_address[1]
+
+    def forward(self, upstream: socket.socket, commandString: str) -> str:
+        chunks, minBytes = expectedReply(commandString)
+        timeStart = time.monotonic()
+        response = b""
+        try:
+            upstream.sendall(commandString.encode("latin-1"))
+            upstream.settimeout(self.TIMEOUT)
+            while (chunks or minBytes) and not replyComplete(response, chunks, minBytes):
+                data = upstream.recv(4096)
+                if not data:
+                    break
+                response += data
+        except OSError as e:
+            self.log.warning(f"Recorder error for [{commandString}]: [{e}]")
+        delay = time.monotonic() - timeStart
+
+        text = response.decode("latin-1")
+        with QMutexLocker(self.mutex):
+            self.exchanges.append(Exchange(commandString, text, delay))
+        return text
+
+    def save(self, sessionFile: Path) -> None:
+        with QMutexLocker(self.mutex):
+            exchanges = list(self.exchanges)
+        saveSession(sessionFile, exchanges)
+
+
+class MountReplay(socketserver.ThreadingTCPServer):
+    """
+    The class MountReplay answers a recorded session. Each command string gets
+    the recorded replies in the recorded order, the last one is repeated when
+    the recording is exhausted, so cyclic polls keep running. With realTime the
+    recorded delay of the mount is applied, otherwise the latency settings of
+    the config. Command strings, which are not part of the session, are
+    answered by the fallback simulator if given, otherwise not at all.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    log = logging.getLogger("MW4")
+
+    def __init__(
+        self,
+        config: SimulatorConfig,
+        exchanges: list[Exchange],
+        realTime: bool = False,
+        fallback: SimulatedMount | None = None,
+    ) -> None:
+        self.config = config
+        self.realTime = realTime
+        self.fallback = fallback
+        self.mutex = QMutex()
+        self.queues: dict[str, deque[Exchange]] = {}
+        for exchange in exchanges:
+            self.queues.setdefault(exchange.command, deque()).append(exchange)
+        super().__init__((config.hostAddress, config.port), SimulatorHandler)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self.server_address[0], self.server_address[1]
+
+    def nextExchange(self, commandString: str) -> Exchange | None:
+        with QMutexLocker(self.mutex):
+            queue = self.queues.get(commandString)
+            if not queue:
+                return None
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def respond(self, commandString: str) -> str:
+        exchange = self.nextExchange(commandString)
+        if exchange is None:
+            if self.fallback is None:
+                self.log.warning(f"Replay has no reply for [{commandString}]")
+                return ""
+            replies = self.fallback.replies(commandString)
+            return "".join(reply for _, reply in replies if reply is not None)
+
+        delay = exchange.delay if self.realTime else self.config.latency
+        time.sleep(delay)
+        return exchange.response
+
+
+def readOptions() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="mountRecorder",
+        description="Record or replay the traffic between MountWizzard4 and a mount",
+    )
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("session", type=Path, help="session file")
+    parser.add_argument("--host", default="127.0.0.1", dest="hostAddress")
+    parser.add_argument("--port", default=3492, type=int)
+    parser.add_argument("--mount", default="", help="mount address host:port to record")
+    parser.add_argument("--realTime", action="store_true", help="replay recorded timing")
+    parser.add_argument("--fallback", action="store_true", help="simulate unknown commands")
+    return parser.parse_args()
+
+
+def main() -> None:
+    options = readOptions()
+    config = SimulatorConfig(hostAddress=options.hostAddress, port=options.port)
+    if options.mode == "record":
+        host, port = options.mount.rsplit(":", 1)
+        with MountRecorder(config, (host, int(port))) as server:
+            with contextlib.suppress(KeyboardInterrupt):
+                server.serve_forever()
+            server.save(options.session)
+        return
+
+    fallback = SimulatedMount() if options.fallback else None
+    exchanges = loadSession(options.session)
+    with MountReplay(config, exchanges, options.realTime, fallback) as server:
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
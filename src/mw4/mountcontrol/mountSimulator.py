@@ -0,0 +1,714 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import argparse
+import logging
+import math
+import random
+import socketserver
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from mw4.mountcontrol.connection import Connection
+from mw4.mountcontrol.convert import (
+    altAzToTopo,
+    sexagesimalizeToInt,
+    stringToDegree,
+    topoToAltAz,
+)
+from mw4.mountcontrol.obsSite import MountStatus
+from PySide6.QtCore import QMutex, QMutexLocker
+from skyfield.api import Angle, EarthSatellite, load, wgs84
+from typing import Any, Final
+
+ts = load.timescale(builtin=True)
+
+
+@dataclass
+class SimulatorConfig:
+    hostAddress: str = field(default="127.0.0.1")
+    port: int = field(default=3492)
+    latency: float = field(default=0.0)
+    jitter: float = field(default=0.0)
+    seed: int = field(default=0)
+    slewTime: float = field(default=2.0)
+
+
+def formatHMS(hours: float, decimals: int = 2) -> str:
+    _, h, m, s, frac = sexagesimalizeToInt(hours % 24, decimals)
+    return f"{h:02d}:{m:02d}:{s:02d}.{frac:0{decimals}d}"
+
+
+def formatDMS(degrees: float, digits: int = 2, separator: str = "*") -> str:
+    sgn, d, m, s, frac = sexagesimalizeToInt(degrees, 1)
+    sign = "-" if sgn < 0 else "+"
+    return f"{sign}{d:0{digits}d}{separator}{m:02d}:{s:02d}.{frac:1d}"
+
+
+def replyType(command: str) -> str:
+    """
+    replyType classifies a single command like Connection.analyseCommand does:
+    'A' for no reply, 'B' for a reply without end mark and 'C' for a reply
+    terminated by '#'.
+    """
+    for key in Connection.COMMAND_A:
+        if command.startswith(key):
+            if len(command) != len(key) and key not in Connection.COMMAND_P:
+                continue
+            return "A"
+    for key in Connection.COMMAND_B:
+        if command.startswith(key):
+            return "B"
+    return "C"
+
+
+class SimulatedMount:
+    """
+    The class SimulatedMount holds the state of a simulated 10micron mount and
+    answers the command set used by ObsSite, Setting, Model, Satellite, Firmware
+    and MountTime. The replies follow the framing expected by Connection: no
+    reply for COMMAND_A types, a reply without '#' for COMMAND_B types and '#'
+    terminated chunks for all others.
+
+    The mount clock is derived from the given clock function, so tests could
+    run it on a fixed or stepped time base. A slew moves the mount linearly in
+    hour angle and declination within slewTime seconds from the actual position
+    to the target. While tracking, ra and dec are kept, otherwise hour angle and
+    declination. Commands of Connection.COMMANDS without a dedicated handler
+    get a neutral reply of the right framing, so any valid command string keeps
+    the chunk count the client expects.
+    """
+
+    log = logging.getLogger("MW4")
+    SIDEREAL: Final[float] = 1.00273790935
+    JD_UNIX_EPOCH: Final[float] = 2440587.5
+    TRACKING_RATES: Final[dict[str, str]] = {":RT0": "62.4", ":RT1": "60.3", ":RT2": "60.2"}
+
+    def __init__(self, slewTime: float = 2.0, clock: Callable[[], float] = time.time) -> None:
+        self.mutex = QMutex()
+        self.clock = clock
+        self.slewTime = slewTime
+        self.clockOffset: float = 0.0
+        self.latitude: float = 48 + 7 / 60
+        self.longitude: float = 11 + 35 / 60
+        self.elevation: float = 585.2
+        self.ra: float = 0.0
+        self.ha: float = -1.0
+        self.dec: float = 45.0
+        self.tracking: bool = False
+        self.status: int = MountStatus.TRACKING_OFF
+        self.slew: dict[str, float] | None = None
+        self.slewStatus: int = MountStatus.TRACKING
+        self.targetHA: float = 0.0
+        self.targetDec: float = 0.0
+        self.alignment: list[str] = []
+        self.stars: list[tuple[float, float, float, float]] = []
+        self.modelNames: list[str] = []
+        self.tle: list[str] = []
+        self.satellite: EarthSatellite | None = None
+        self.trajectoryStart: float = 0.0
+        self.trajectory: list[tuple[float, float]] = []
+        self.offsets: list[float] = [0.0, 0.0, 0.0, 0.0]
+        self.firmware: dict[str, str] = {
+            ":GVD": "Mar 01 2024",
+            ":GVN": "3.2.9",
+            ":GVP": "10micron GM1000HPS",
+            ":GVT": "12:00:00",
+            ":GVZ": "Q-TYPE2012",
+        }
+        self.settings: dict[str, str] = {
+            ":GMs": "15",
+            ":GMsa": "2",
+            ":GMsb": "20",
+            ":Gmte": "0426",
+            ":Glmt": "05",
+            ":Glms": "05",
+            ":GRTMP": "+010.0",
+            ":GRPRS": "0950.0",
+            ":GTMP1": "+012.5",
+            ":GREF": "1",
+            ":Guaf": "0",
+            ":Gdat": "1",
+            ":Gh": "+90*",
+            ":Go": "+00*",
+            ":GDUTV": "V,2027-01-01",
+            ":GINQ": "1",
+            ":gtg": "0",
+            ":GMAC": "00:00:00:00:00:00",
+            ":GWOL": "0",
+            ":WSG": "0",
+            ":WSP": "0950.0,0000",
+            ":WST": "+010.0,0000",
+            ":WSH": "050.0,0000",
+            ":WSD": "+000.0,0000",
+            ":GT": "60.2",
+            ":NTGweb": "1",
+            ":Gstm": "00000.000",
+            ":GAPO": "0",
+            ":GCFG": "E,G,N,H",
+            ":gtgpps": "0",
+        }
+        self.setters: dict[str, str] = {
+            ":Sw": ":GMs",
+            ":Slmt": ":Glmt",
+            ":Slms": ":Glms",
+            ":SRTMP": ":GRTMP",
+            ":SRPRS": ":GRPRS",
+            ":SREF": ":GREF",
+            ":Suaf": ":Guaf",
+            ":Sdat": ":Gdat",
+            ":SWOL": ":GWOL",
+            ":WSS": ":WSG",
+            ":NTSweb": ":NTGweb",
+            ":Sstm": ":Gstm",
+            ":SAPO": ":GAPO",
+        }
+        self.handlers: list[tuple[str, Callable[[str], str | None]]] = sorted(
+            [
+                (":GS", self.getSidereal),
+                (":GDUT", lambda _: "+0.1000000L"),
+                (":TLESCK", self.getSatelliteStatus),
+                (":Ginfo", self.getInfo),
+                (":GaE", self.getAngularPosition),
+                (":Gev", lambda _: f"{self.elevation:+07.1f}"),
+                (":Gg", lambda _: formatDMS(-self.longitude, 3, ":")),
+                (":Gt", lambda _: formatDMS(self.latitude, 2, ":")),
+                (":GJD1", lambda _: f"{self.julianDate():.8f}"),
+                (":GTsid", self.getTargetPierside),
+                (":Ga", lambda _: formatDMS(self.targetAltAz()[0])),
+                (":Gz", lambda _: formatDMS(self.targetAltAz()[1] % 360, 3)[1:]),
+                (":Gr", lambda _: formatHMS(self.localSidereal() - self.targetHA)),
+                (":Gd", lambda _: formatDMS(self.targetDec)),
+                (":Sa", self.setTargetAlt),
+                (":Sz", self.setTargetAz),
+                (":Sr", self.setTargetRa),
+                (":Sd", self.setTargetDec),
+                (":St", self.setLatitude),
+                (":Sg", self.setLongitude),
+                (":Sev", self.setElevation),
+                (":Sh", self.setHorizonHigh),
+                (":So", self.setHorizonLow),
+                (":MS", lambda _: self.startSlew(MountStatus.TRACKING)),
+                (":MSap", lambda _: self.startSlew(MountStatus.TRACKING)),
+                (":MSao", lambda _: self.startSlew(MountStatus.TRACKING)),
+                (":MA", lambda _: self.startSlew(MountStatus.TRACKING_OFF)),
+                (":MaX", lambda _: self.startSlew(MountStatus.TRACKING_OFF)),
+                (":PaX", self.park),
+                (":hP", self.park),
+                (":PO", self.unpark),
+                (":AP", lambda _: self.setTracking(True)),
+                (":RT9", lambda _: self.setTracking(False)),
+                (":STOP", self.stop),
+                (":FLIP", lambda _: "1"),
+                (":PiP", lambda _: "1"),
+                (":CMCFG", lambda _: "1"),
+                (":CM", lambda _: "Coordinates     matched        "),
+                (":RMs", lambda _: "0"),
+                (":NUtim", self.adjustClock),
+                (":SUDT", self.setClock),
+                (":getalst", lambda _: f"{len(self.stars)}"),
+                (":getain", self.getModelInfo),
+                (":getalp", self.getModelStar),
+                (":newalig", self.newAlignment),
+                (":newalpt", self.addAlignmentPoint),
+                (":endalig", self.endAlignment),
+                (":delalig", self.clearModel),
+                (":delalst", self.deleteModelStar),
+                (":modelcnt", lambda _: f"{len(self.modelNames)}"),
+                (":modelnam", self.getModelName),
+                (":modelsv0", self.storeModelName),
+                (":modelld0", lambda c: "1" if c[9:] in self.modelNames else "0"),
+                (":modeldel0", self.deleteModelName),
+                (":TLEL0", self.setTLE),
+                (":TLEG", self.getTLE),
+                (":TLEGAZ", self.getSatelliteAltAz),
+                (":TLEGEQ", self.getSatelliteRaDec),
+                (":TLEP", self.getSatellitePass),
+                (":TLES", self.slewSatellite),
+                (":TRNEW", self.newTrajectory),
+                (":TRADD", self.addTrajectoryPoint),
+                (":TRP", self.calcTrajectory),
+                (":TRREPLAY", self.calcTrajectory),
+                (":TROFFGET", lambda c: f"{self.offsets[self.offsetIndex(c[9:])]:+05.1f}"),
+                (":TROFFSET", self.setOffset),
+                (":TROFFADD", self.addOffset),
+                (":TROFFCLR", self.clearOffsets),
+            ]
+            + [(key, lambda c: self.setTrackingRate(c)) for key in self.TRACKING_RATES]
+            + [(key, lambda c, k=key: self.firmware[k]) for key in self.firmware],
+            key=lambda x: x[0],
+            reverse=True,
+        )
+
+    def now(self) -> float:
+        return self.clock() + self.clockOffset
+
+    def julianDate(self) -> float:
+        return self.now() / 86400 + self.JD_UNIX_EPOCH
+
+    def localSidereal(self) -> float:
+        gmst = 18.697374558 + 24 * self.SIDEREAL * (self.julianDate() - 2451545.0)
+        return (gmst + self.longitude / 15) % 24
+
+    def position(self) -> tuple[float, float]:
+        """
+        returns hour angle [h] and declination [deg] of the mount at the moment,
+        a finished slew is applied to the state.
+        """
+        if self.slew is not None:
+            fraction = (self.now() - self.slew["start"]) / max(self.slewTime, 1e-6)
+            if fraction < 1:
+                ha = self.slew["ha0"] + fraction * (self.slew["ha1"] - self.slew["ha0"])
+                dec = self.slew["dec0"] + fraction * (self.slew["dec1"] - self.slew["dec0"])
+                return ha, dec
+            self.finishSlew()
+        if self.tracking:
+            return (self.localSidereal() - self.ra + 12) % 24 - 12, self.dec
+        return self.ha, self.dec
+
+    def finishSlew(self) -> None:
+        self.ha = self.slew["ha1"]
+        self.dec = self.slew["dec1"]
+        self.status = self.slewStatus
+        self.tracking = self.status in [MountStatus.TRACKING, MountStatus.FOLLOWING_SATELLITE]
+        self.ra = self.slew["ra1"]
+        self.slew = None
+
+    def altAz(self, ha: float, dec: float) -> tuple[float, float]:
+        alt, az = topoToAltAz(
+            Angle(hours=ha), Angle(degrees=dec), Angle(degrees=self.latitude)
+        )
+        return float(alt.degrees), float(az.degrees)
+
+    def targetAltAz(self) -> tuple[float, float]:
+        return self.altAz(self.targetHA, self.targetDec)
+
+    @staticmethod
+    def pierside(ha: float) -> str:
+        return "W" if ha < 0 else "E"
+
+    def getSidereal(self, command: str) -> str:
+        return formatHMS(self.localSidereal())
+
+    def getInfo(self, command: str) -> str:
+        ha, dec = self.position()
+        alt, az = self.altAz(ha, dec)
+        ra = (self.localSidereal() - ha) % 24
+        slewing = "1" if self.slew is not None else "0"
+        return (
+            f"{ra:.5f},{dec:+.4f},{self.pierside(ha)},{az:08.4f},{alt:+.4f},"
+            f"{self.julianDate():.8f},{self.status:d},{slewing}"
+        )
+
+    def getAngularPosition(self, command: str) -> str:
+        ha, dec = self.position()
+        return f"{self.julianDate():.8f},{ha * 15:+.4f},0.0,{dec:+.4f},0.0"
+
+    def getTargetPierside(self, command: str) -> str:
+        alt, _ = self.targetAltAz()
+        if alt < 0:
+            return "0"
+        return "2" if self.pierside(self.targetHA) == "W" else "3"
+
+    def setTargetAlt(self, command: str) -> str:
+        _, az = self.targetAltAz()
+        self.setTargetAltAz(stringToDegree(command[3:]), az)
+        return "1"
+
+    def setTargetAz(self, command: str) -> str:
+        alt, _ = self.targetAltAz()
+        self.setTargetAltAz(alt, stringToDegree(command[3:]))
+        return "1"
+
+    def setTargetAltAz(self, alt: float, az: float) -> None:
+        ha, dec = altAzToTopo(
+            Angle(degrees=alt), Angle(degrees=az), Angle(degrees=self.latitude)
+        )
+        self.targetHA = float(ha.hours)
+        self.targetDec = float(dec.degrees)
+
+    def setTargetRa(self, command: str) -> str:
+        ra = stringToDegree(command[3:])
+        self.targetHA = (self.localSidereal() - ra + 12) % 24 - 12
+        return "1"
+
+    def setTargetDec(self, command: str) -> str:
+        self.targetDec = stringToDegree(command[3:])
+        return "1"
+
+    def setLatitude(self, command: str) -> str:
+        self.latitude = stringToDegree(command[3:])
+        return "1"
+
+    def setLongitude(self, command: str) -> str:
+        self.longitude = -stringToDegree(command[3:])
+        return "1"
+
+    def setElevation(self, command: str) -> str:
+        self.elevation = float(command[4:])
+        return "1"
+
+    def setHorizonHigh(self, command: str) -> str:
+        self.settings[":Gh"] = f"{int(command[3:]):+03d}*"
+        return "1"
+
+    def setHorizonLow(self, command: str) -> str:
+        self.settings[":Go"] = f"{int(command[3:]):+03d}*"
+        return "1"
+
+    def startSlew(self, status: int, ha: float | None = None, dec: float | None = None) -> str:
+        if self.status == MountStatus.PARKED:
+            return "1"
+        ha0, dec0 = self.position()
+        self.slew = {
+            "start": self.now(),
+            "ha0": ha0,
+            "dec0": dec0,
+            "ha1": self.targetHA if ha is None else ha,
+            "dec1": self.targetDec if dec is None else dec,
+        }
+        self.slew["ra1"] = (self.localSidereal() - self.slew["ha1"]) % 24
+        self.slewStatus = status
+        self.status = MountStatus.SLEWING
+        self.tracking = False
+        return "0"
+
+    def park(self, command: str) -> str:
+        self.startSlew(MountStatus.PARKED, ha=-6.0, dec=self.latitude)
+        self.status = MountStatus.SLEWING_TO_PARK
+        return "0"
+
+    def unpark(self, command: str) -> None:
+        if self.status == MountStatus.PARKED:
+            self.status = MountStatus.TRACKING_OFF
+
+    def setTracking(self, tracking: bool) -> None:
+        if self.slew is not None or self.status == MountStatus.PARKED:
+            return
+        ha, _ = self.position()
+        self.tracking = tracking
+        self.status = MountStatus.TRACKING if tracking else MountStatus.TRACKING_OFF
+        self.ha = ha
+        self.ra = (self.localSidereal() - ha) % 24
+
+    def stop(self, command: str) -> None:
+        ha, dec = self.position()
+        self.slew = None
+        self.tracking = False
+        self.ha = ha
+        self.dec = dec
+        self.status = MountStatus.STOPPED
+
+    def setTrackingRate(self, command: str) -> None:
+        self.settings[":GT"] = self.TRACKING_RATES[command]
+
+    def adjustClock(self, command: str) -> str:
+        self.clockOffset += int(command[6:]) / 1000
+        return "1"
+
+    def setClock(self, command: str) -> str:
+        utc = time.strptime(command[5:] + " UTC", "%Y-%m-%d,%H:%M:%S %Z")
+        self.clockOffset = time.mktime(utc) - time.timezone - self.clock()
+        return "1"
+
+    def getModelInfo(self, command: str) -> str:
+        if len(self.stars) < 3:
+            return "E"
+        rms = sum(star[2] for star in self.stars) / len(self.stars)
+        terms = min(len(self.stars), 25)
+        return f"+0.0100,+0.0200,00.0224,+045.0,+0.0050,-0.50,+0.30,{terms:02d},{rms:.1f}"
+
+    def getModelStar(self, command: str) -> str:
+        index = int(command[7:]) - 1
+        if not 0 <= index < len(self.stars):
+            return "E"
+        ha, dec, err, angle = self.stars[index]
+        return f"{formatHMS(ha)},{formatDMS(dec)},{err:7.1f},{angle:03.0f}"
+
+    def newAlignment(self, command: str) -> str:
+        self.alignment = []
+        return "V"
+
+    def addAlignmentPoint(self, command: str) -> str:
+        self.alignment.append(command[8:])
+        return f"{len(self.alignment)}"
+
+    def endAlignment(self, command: str) -> str:
+        """
+        every alignment point gets an error value derived from the difference
+        between mount and solved coordinates, which is deterministic.
+        """
+        self.stars = []
+        for point in self.alignment:
+            ra, dec, _, raSolve, decSolve, sidereal = point.split(",")
+            ha = (stringToDegree(sidereal) - stringToDegree(ra)) % 24
+            dRA = (stringToDegree(raSolve) - stringToDegree(ra)) * 15 * 3600
+            dDEC = (stringToDegree(decSolve) - stringToDegree(dec)) * 3600
+            err = min((dRA**2 + dDEC**2) ** 0.5, 99999)
+            angle = 0 if err == 0 else 180 + 57.29578 * math.atan2(dRA, dDEC)
+            self.stars.append((ha, stringToDegree(dec), err, angle % 360))
+        return "V" if len(self.stars) > 2 else "E"
+
+    def clearModel(self, command: str) -> str:
+        self.stars = []
+        return ""
+
+    def deleteModelStar(self, command: str) -> str:
+        index = int(command[8:]) - 1
+        if not 0 <= index < len(self.stars):
+            return "0"
+        self.stars.pop(index)
+        return "1"
+
+    def getModelName(self, command: str) -> str:
+        index = int(command[9:]) - 1
+        return self.modelNames[index] if 0 <= index < len(self.modelNames) else ""
+
+    def storeModelName(self, command: str) -> str:
+        if command[9:] not in self.modelNames:
+            self.modelNames.append(command[9:])
+        return "1"
+
+    def deleteModelName(self, command: str) -> str:
+        if command[10:] not in self.modelNames:
+            return "0"
+        self.modelNames.remove(command[10:])
+        return "1"
+
+    def setTLE(self, command: str) -> str:
+        lines = command[6:].split("$0a")
+        if len(lines) != 3:
+            return "E"
+        try:
+            self.satellite = EarthSatellite(lines[1], lines[2], lines[0].strip(), ts)
+        except ValueError:
+            return "E"
+        self.tle = lines
+        return "V"
+
+    def getTLE(self, command: str) -> str:
+        if not self.tle:
+            return "E"
+        return "$0A".join(self.tle) + "$0A"
+
+    def satellitePosition(self, julD: float) -> tuple[float, float, float, float]:
+        location = wgs84.latlon(self.latitude, self.longitude, self.elevation)
+        t = ts.tt_jd(julD)
+        topocentric = (self.satellite - location).at(t)
+        alt, az, _ = topocentric.altaz()
+        ra, dec, _ = topocentric.radec(epoch=t)
+        return alt.degrees, az.degrees, ra.hours, dec.degrees
+
+    def getSatelliteAltAz(self, command: str) -> str:
+        if self.satellite is None:
+            return "E"
+        alt, az, _, _ = self.satellitePosition(float(command[7:]))
+        return f"{alt:+.4f},{az:.4f}"
+
+    def getSatelliteRaDec(self, command: str) -> str:
+        if self.satellite is None:
+            return "E"
+        _, _, ra, dec = self.satellitePosition(float(command[7:]))
+        return f"{ra:.4f},{dec:+.4f}"
+
+    def getSatellitePass(self, command: str) -> str:
+        if self.satellite is None:
+            return "E"
+        julD, duration = command[5:].split(",")
+        location = wgs84.latlon(self.latitude, self.longitude, self.elevation)
+        t0 = ts.tt_jd(float(julD))
+        t1 = ts.tt_jd(float(julD) + int(duration) / 1440)
+        times, events = self.satellite.find_events(location, t0, t1, altitude_degrees=0)
+        rises = [t.tt for t, e in zip(times, events) if e == 0]
+        sets = [t.tt for t, e in zip(times, events) if e == 2 and rises and t.tt > rises[0]]
+        if not rises or not sets:
+            return "N"
+        return f"{rises[0]:.8f},{sets[0]:.8f},N"
+
+    def slewSatellite(self, command: str) -> str:
+        if self.satellite is None:
+            return "E"
+        self.status = MountStatus.FOLLOWING_SATELLITE
+        return "V"
+
+    def getSatelliteStatus(self, command: str) -> str:
+        return "T" if self.status == MountStatus.FOLLOWING_SATELLITE else "E"
+
+    def newTrajectory(self, command: str) -> str:
+        self.trajectoryStart = float(command[6:])
+        self.trajectory = []
+        return "V"
+
+    def addTrajectoryPoint(self, command: str) -> str:
+        az, alt = command[6:].split(",")
+        self.trajectory.append((float(alt), float(az)))
+        return f"{len(self.trajectory)}"
+
+    def calcTrajectory(self, command: str) -> str:
+        if not self.trajectory:
+            return "E"
+        end = self.trajectoryStart + len(self.trajectory) / 86400
+        return f"{self.trajectoryStart:.8f},{end:.8f},N"
+
+    @staticmethod
+    def offsetIndex(value: str) -> int:
+        return min(max(int(value) - 1, 0), 3)
+
+    def setOffset(self, command: str) -> str:
+        index, value = command[9:].split(",")
+        self.offsets[self.offsetIndex(index)] = float(value)
+        return "V"
+
+    def addOffset(self, command: str) -> str:
+        index, value = command[9:].split(",")
+        self.offsets[self.offsetIndex(index)] += float(value)
+        return "V"
+
+    def clearOffsets(self, command: str) -> str:
+        self.offsets = [0.0, 0.0, 0.0, 0.0]
+        return "V"
+
+    def storedReply(self, command: str) -> str | None:
+        """
+        setters of plain settings store their value for the according getter,
+        which answers it unchanged. setters are checked first, as some of them
+        share the prefix with handled commands (e.g. :Sdat and :Sd).
+        """
+        for key, setting in self.setters.items():
+            if command.startswith(key):
+                self.settings[setting] = command[len(key) :]
+                return "1"
+        return self.settings.get(command)
+
+    def reply(self, command: str) -> str | None:
+        """
+        reply returns the reply for a single command including the end mark '#'
+        if needed or None if the mount does not answer.
+        """
+        with QMutexLocker(self.mutex):
+            value = self.storedReply(command)
+            if value is None:
+                for key, handler in self.handlers:
+                    if command.startswith(key):
+                        value = handler(command)
+                        break
+                else:
+                    value = "1" if replyType(command) == "B" else "0"
+
+        kind = replyType(command)
+        if kind == "A":
+            return None
+        if kind == "B":
+            return value or ""
+        return f"{value or ''}#"
+
+    def replies(self, commandString: str) -> list[tuple[str, str | None]]:
+        commands = commandString.split("#")[:-1]
+        return [(command, self.reply(command)) for command in commands]
+
+
+class SimulatorHandler(socketserver.BaseRequestHandler):
+    """
+    SimulatorHandler splits the received data into command strings at the last
+    end mark '#' like the mount does and sends back the reply of the server.
+    """
+
+    server: Any
+
+    def respond(self, commandString: str) -> str:
+        return self.server.respond(commandString)
+
+    def handle(self) -> None:
+        buffer = b""
+        while True:
+            try:
+                data = self.request.recv(4096)
+            except OSError:
+                return
+            if not data:
+                return
+            buffer += data
+            if b"#" not in buffer:
+                continue
+            end = buffer.rindex(b"#") + 1
+            commandString, buffer = buffer[:end].decode("latin-1"), buffer[end:]
+            response = self.respond(commandString)
+            if response:
+                try:
+                    self.request.sendall(response.encode("latin-1"))
+                except OSError:
+                    return
+
+
+class MountSimulatorServer(socketserver.ThreadingTCPServer):
+    """
+    The class MountSimulatorServer serves a SimulatedMount over TCP like the
+    mount does on port 3492. Every reply is delayed by latency plus a uniform
+    jitter in seconds. The random generator is seeded, so the sequence of
+    delays is the same for every run. All replies of a command string are sent
+    at once after the sum of their delays.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    log = logging.getLogger("MW4")
+
+    def __init__(self, config: SimulatorConfig, mount: SimulatedMount | None = None) -> None:
+        self.config = config
+        self.mount = mount or SimulatedMount(slewTime=config.slewTime)
+        self.random = random.Random(config.seed)  # nosec B311 — simulated timing
+        self.randomMutex = QMutex()
+        super().__init__((config.hostAddress, config.port), SimulatorHandler)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self.server_address[0], self.server_address[1]
+
+    def delay(self) -> float:
+        with QMutexLocker(self.randomMutex):
+            jitter = self.random.uniform(-self.config.jitter, self.config.jitter)
+        return max(self.config.latency + jitter, 0)
+
+    def respond(self, commandString: str) -> str:
+        replies = self.mount.replies(commandString)
+        response = "".join(reply for _, reply in replies if reply is not None)
+        if response:
+            time.sleep(sum(self.delay() for _, reply in replies if reply is not None))
+        return response
+
+
+def readOptions() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="mountSimulator",
+        description="Simulated 10micron mount for benchmarking MountWizzard4",
+    )
+    parser.add_argument("--host", default="127.0.0.1", dest="hostAddress")
+    parser.add_argument("--port", default=3492, type=int, dest="port")
+    parser.add_argument("--latency", default=0.0, type=float, help="reply latency [s]")
+    parser.add_argument("--jitter", default=0.0, type=float, help="reply jitter [s]")
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument("--slewTime", default=2.0, type=float, help="slew duration [s]")
+    return parser.parse_args()
+
+
+def main() -> None:
+    options = readOptions()
+    config = SimulatorConfig(**vars(options))
+    with MountSimulatorServer(config) as server:
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
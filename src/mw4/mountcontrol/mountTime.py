@@ -142,6 +142,7 @@ class MountTime:
     def runnerPollSyncClock(self) -> None:
         conn = Connection(self.parent)
         commandString = ":GJD1#"
+        # not batched, as waiting for the other polls would bias the clock delta
         suc, response, _ = conn.communicate(commandString)
         if not suc:
             return
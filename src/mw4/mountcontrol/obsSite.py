@@ -15,6 +15,7 @@
 ###########################################################
 import logging
 import numpy as np
+from dataclasses import dataclass
 from enum import IntEnum
 from mw4.base.transform import diffModulusSign
 from mw4.mountcontrol.connection import Connection
@@ -80,6 +81,80 @@ _STATUS_LABELS: dict[MountStatus, str] = {
 }
 
 
+@dataclass(slots=True)
+class PointingState:
+    """
+    PointingState keeps the numeric values of the pointing poll
+    :GS#:GDUT#:TLESCK#:Ginfo#:GaE# as plain floats, so the cyclic poll updates
+    the same record in place. Angles are in hours for timeSidereal and ra,
+    otherwise in degrees, julianDate is the julian date of the mount (utc) and
+    ut1_utc is in days. ObsSite builds the skyfield objects from it only when
+    they are read.
+    """
+
+    STATUS_VALID: ClassVar[frozenset[int]] = frozenset(int(s) for s in MountStatus)
+    STATUS_SAT_VALID: ClassVar[frozenset[str]] = frozenset("VPSTQE")
+
+    timeSidereal: float = 0.0
+    ut1_utc: float = 0.0
+    statusSat: str = "E"
+    ra: float = 0.0
+    dec: float = 0.0
+    pierside: str = "E"
+    az: float = 0.0
+    alt: float = 0.0
+    julianDate: float = 0.0
+    status: int = MountStatus.ERROR
+    statusSlew: bool = False
+    angularPosRA: float = 0.0
+    angularPosDEC: float = 0.0
+    errorAngularPosRA: float = 0.0
+    errorAngularPosDEC: float = 0.0
+
+    def parse(self, response: list[str]) -> bool:
+        """
+        parse converts the five chunks in one pass. The numbers are converted
+        directly and only if one of them is malformed, the tolerant converters
+        are used, which set malformed values to 0 like the setters of ObsSite.
+        A pierside out of E and W keeps the last value.
+        """
+        info = response[3].split(",")
+        angular = response[4].split(",")
+        if len(info) != 8 or len(angular) != 5:
+            return False
+
+        try:
+            ra = float(info[0])
+            dec = float(info[1])
+            az = float(info[3])
+            alt = float(info[4])
+            julianDate = float(info[5])
+            status = int(info[6])
+            angularPos = [float(angular[1]), float(angular[3])]
+            errorAngularPos = [float(angular[2]), float(angular[4])]
+        except ValueError:
+            ra, dec, az, alt, julianDate = (valueToFloat(info[i]) for i in (0, 1, 3, 4, 5))
+            status = valueToInt(info[6])
+            angularPos = [valueToFloat(angular[1]), valueToFloat(angular[3])]
+            errorAngularPos = [valueToFloat(angular[2]), valueToFloat(angular[4])]
+
+        self.timeSidereal = stringToDegree(response[0])
+        self.ut1_utc = valueToFloat(response[1].replace("L", "")) / 86400
+        self.statusSat = response[2] if response[2] in self.STATUS_SAT_VALID else "E"
+        self.ra = ra
+        self.dec = dec
+        if info[2] in ("E", "W", "e", "w"):
+            self.pierside = info[2].upper()
+        self.az = az
+        self.alt = alt
+        self.julianDate = julianDate
+        self.status = status if status in self.STATUS_VALID else MountStatus.ERROR
+        self.statusSlew = info[7] == "1"
+        self.angularPosRA, self.angularPosDEC = angularPos
+        self.errorAngularPosRA, self.errorAngularPosDEC = errorAngularPos
+        return True
+
+
 class ObsSite:
     """
     The class Site inherits all information and handling site data
@@ -124,30 +199,24 @@ class ObsSite:
             latitude_degrees=0, longitude_degrees=0, elevation_m=0
         )
         self.ts: Timescale = load.timescale(builtin=True)
-        self._timeJD: Time = self.ts.now()
-        self.ut1_utc: float = 0
-        self._timeSidereal: Angle | None = Angle(hours=0)
-        self._raJNow: Angle = Angle(hours=0)
+        self.pointing = PointingState()
+        self._timeJD: Time | None = self.ts.now()
+        self._timeSidereal: Angle | None = None
+        self._raJNow: Angle | None = None
         self._raJNowTarget: Angle = Angle(hours=0)
-        self._decJNow: Angle = Angle(degrees=0)
+        self._decJNow: Angle | None = None
         self._decJNowTarget: Angle = Angle(degrees=0)
-        self._haJNow: Angle = Angle(hours=0)
-        self._haJNowTarget: Angle = Angle(degrees=0)
-        self._angularPosRA: Angle = Angle(degrees=0)
-        self._angularPosDEC: Angle = Angle(degrees=0)
-        self._errorAngularPosRA: Angle = Angle(degrees=0)
-        self._errorAngularPosDEC: Angle = Angle(degrees=0)
+        self._angularPosRA: Angle | None = None
+        self._angularPosDEC: Angle | None = None
+        self._errorAngularPosRA: Angle | None = None
+        self._errorAngularPosDEC: Angle | None = None
         self._angularPosRATarget: Angle = Angle(degrees=0)
         self._angularPosDECTarget: Angle = Angle(degrees=0)
-        self._pierside: str = "E"
         self._piersideTarget: str = "E"
-        self._Alt: Angle = Angle(degrees=0)
+        self._Alt: Angle | None = None
         self._AltTarget: Angle = Angle(degrees=0)
-        self._Az: Angle = Angle(degrees=0)
+        self._Az: Angle | None = None
         self._AzTarget: Angle = Angle(degrees=0)
-        self._status: int = MountStatus.ERROR
-        self._statusSat: str = "E"
-        self._statusSlew: bool = False
         self.UTC2TT: float = 0
         self.setLoaderAndTimescale()
 
@@ -191,29 +260,49 @@ class ObsSite:
             latitude_degrees=lat, longitude_degrees=lon, elevation_m=elev
         )
 
+    def invalidatePointing(self) -> None:
+        self._timeJD = None
+        self._timeSidereal = None
+        self._raJNow = None
+        self._decJNow = None
+        self._Az = None
+        self._Alt = None
+        self._angularPosRA = None
+        self._angularPosDEC = None
+        self._errorAngularPosRA = None
+        self._errorAngularPosDEC = None
+
     @property
     def timeJD(self) -> Time:
-        if self.parent.mountIsUp:
-            return self._timeJD
-        return self.ts.now()
+        if not self.parent.mountIsUp:
+            return self.ts.now()
+        value = self._timeJD
+        if value is None:
+            value = self.ts.tt_jd(self.pointing.julianDate + self.UTC2TT)
+            self._timeJD = value
+        return value
 
     @timeJD.setter
     def timeJD(self, value: Any) -> None:
-        value = valueToFloat(value)
-        self._timeJD = self.ts.tt_jd(value + self.UTC2TT)
+        self.pointing.julianDate = valueToFloat(value)
+        self._timeJD = self.ts.tt_jd(self.pointing.julianDate + self.UTC2TT)
 
     @property
     def ut1_utc(self) -> float:
-        return self._ut1_utc
+        return self.pointing.ut1_utc
 
     @ut1_utc.setter
     def ut1_utc(self, value: Any) -> None:
         value = valueToFloat(value)
-        self._ut1_utc = value / 86400
+        self.pointing.ut1_utc = value / 86400
 
     @property
     def timeSidereal(self) -> Angle | None:
-        return self._timeSidereal
+        value = self._timeSidereal
+        if value is None:
+            value = Angle(hours=self.pointing.timeSidereal)
+            self._timeSidereal = value
+        return value
 
     @timeSidereal.setter
     def timeSidereal(self, value: Any) -> None:
@@ -223,17 +312,25 @@ class ObsSite:
             self._timeSidereal = valueToAngle(value, preference="hours")
         elif isinstance(value, Angle):
             self._timeSidereal = value
+        else:
+            return
+        self.pointing.timeSidereal = self._timeSidereal.hours
 
     @property
     def raJNow(self) -> Angle:
-        return self._raJNow
+        value = self._raJNow
+        if value is None:
+            value = Angle(hours=self.pointing.ra)
+            self._raJNow = value
+        return value
 
     @raJNow.setter
     def raJNow(self, value: Any) -> None:
         if isinstance(value, Angle):
             self._raJNow = value
-            return
-        self._raJNow = valueToAngle(value, preference="hours")
+        else:
+            self._raJNow = valueToAngle(value, preference="hours")
+        self.pointing.ra = self._raJNow.hours
 
     @property
     def raJNowTarget(self) -> Angle:
@@ -249,25 +346,30 @@ class ObsSite:
     @property
     def haJNow(self) -> Angle:
         # ha, is always positive between 0 and 24 hours
-        ha = (self._timeSidereal.hours - self._raJNow.hours + 24) % 24
+        ha = (self.pointing.timeSidereal - self.pointing.ra + 24) % 24
         return Angle(hours=ha)
 
     @property
     def haJNowTarget(self) -> Angle:
         # ha, is always positive between 0 and 24 hours
-        ha = (self._timeSidereal.hours - self._raJNowTarget.hours + 24) % 24
+        ha = (self.pointing.timeSidereal - self._raJNowTarget.hours + 24) % 24
         return Angle(hours=ha)
 
     @property
     def decJNow(self) -> Angle:
-        return self._decJNow
+        value = self._decJNow
+        if value is None:
+            value = Angle(degrees=self.pointing.dec)
+            self._decJNow = value
+        return value
 
     @decJNow.setter
     def decJNow(self, value: Any) -> None:
         if isinstance(value, Angle):
             self._decJNow = value
-            return
-        self._decJNow = valueToAngle(value, preference="degrees")
+        else:
+            self._decJNow = valueToAngle(value, preference="degrees")
+        self.pointing.dec = self._decJNow.degrees
 
     @property
     def decJNowTarget(self) -> Angle:
@@ -282,47 +384,67 @@ class ObsSite:
 
     @property
     def angularPosRA(self) -> Angle:
-        return self._angularPosRA
+        value = self._angularPosRA
+        if value is None:
+            value = Angle(degrees=self.pointing.angularPosRA)
+            self._angularPosRA = value
+        return value
 
     @angularPosRA.setter
     def angularPosRA(self, value: Any) -> None:
         if isinstance(value, Angle):
             self._angularPosRA = value
-            return
-        self._angularPosRA = valueToAngle(value, preference="degrees")
+        else:
+            self._angularPosRA = valueToAngle(value, preference="degrees")
+        self.pointing.angularPosRA = self._angularPosRA.degrees
 
     @property
     def angularPosDEC(self) -> Angle:
-        return self._angularPosDEC
+        value = self._angularPosDEC
+        if value is None:
+            value = Angle(degrees=self.pointing.angularPosDEC)
+            self._angularPosDEC = value
+        return value
 
     @angularPosDEC.setter
     def angularPosDEC(self, value: Any) -> None:
         if isinstance(value, Angle):
             self._angularPosDEC = value
-            return
-        self._angularPosDEC = valueToAngle(value, preference="degrees")
+        else:
+            self._angularPosDEC = valueToAngle(value, preference="degrees")
+        self.pointing.angularPosDEC = self._angularPosDEC.degrees
 
     @property
     def errorAngularPosRA(self) -> Angle:
-        return self._errorAngularPosRA
+        value = self._errorAngularPosRA
+        if value is None:
+            value = Angle(degrees=self.pointing.errorAngularPosRA)
+            self._errorAngularPosRA = value
+        return value
 
     @errorAngularPosRA.setter
     def errorAngularPosRA(self, value: Any) -> None:
         if isinstance(value, Angle):
             self._errorAngularPosRA = value
-            return
-        self._errorAngularPosRA = valueToAngle(value, preference="degrees")
+        else:
+            self._errorAngularPosRA = valueToAngle(value, preference="degrees")
+        self.pointing.errorAngularPosRA = self._errorAngularPosRA.degrees
 
     @property
     def errorAngularPosDEC(self) -> Angle:
-        return self._errorAngularPosDEC
+        value = self._errorAngularPosDEC
+        if value is None:
+            value = Angle(degrees=self.pointing.errorAngularPosDEC)
+            self._errorAngularPosDEC = value
+        return value
 
     @errorAngularPosDEC.setter
     def errorAngularPosDEC(self, value: Any) -> None:
         if isinstance(value, Angle):
             self._errorAngularPosDEC = value
-            return
-        self._errorAngularPosDEC = valueToAngle(value, preference="degrees")
+        else:
+            self._errorAngularPosDEC = valueToAngle(value, preference="degrees")
+        self.pointing.errorAngularPosDEC = self._errorAngularPosDEC.degrees
 
     @property
     def angularPosRATarget(self) -> Angle:
@@ -348,13 +470,12 @@ class ObsSite:
 
     @property
     def pierside(self) -> str:
-        return self._pierside
+        return self.pointing.pierside
 
     @pierside.setter
     def pierside(self, value: Any) -> None:
         if value in ["E", "W", "e", "w"]:
-            value = value.capitalize()
-            self._pierside = value
+            self.pointing.pierside = value.capitalize()
         else:
             self.log.info(f"Malformed value: {value}")
 
@@ -371,14 +492,19 @@ class ObsSite:
 
     @property
     def Alt(self) -> Angle:
-        return self._Alt
+        value = self._Alt
+        if value is None:
+            value = Angle(degrees=self.pointing.alt)
+            self._Alt = value
+        return value
 
     @Alt.setter
     def Alt(self, value: Any) -> None:
         if isinstance(value, Angle):
             self._Alt = value
-            return
-        self._Alt = valueToAngle(value, preference="degrees")
+        else:
+            self._Alt = valueToAngle(value, preference="degrees")
+        self.pointing.alt = self._Alt.degrees
 
     @property
     def AltTarget(self) -> Angle:
@@ -393,7 +519,11 @@ class ObsSite:
 
     @property
     def Az(self) -> Angle:
-        return self._Az
+        value = self._Az
+        if value is None:
+            value = Angle(degrees=self.pointing.az)
+            self._Az = value
+        return value
 
     @Az.setter
     def Az(self, value: Any) -> None:
@@ -401,10 +531,11 @@ class ObsSite:
             self._Az = value
         else:
             self._Az = valueToAngle(value, preference="degrees")
+        self.updateAzDirection(self._Az.degrees)
 
-        az = self._Az.degrees
-        direction = np.sign(diffModulusSign(self.lastAz, az, 360))
-        self.AzDirection = direction
+    def updateAzDirection(self, az: float) -> None:
+        self.pointing.az = az
+        self.AzDirection = np.sign(diffModulusSign(self.lastAz, az, 360))
         self.lastAz = az
 
     @property
@@ -420,59 +551,60 @@ class ObsSite:
 
     @property
     def status(self) -> int:
-        return self._status
+        return self.pointing.status
 
     @status.setter
     def status(self, value: Any) -> None:
-        self._status = valueToInt(value)
-        if self._status not in self._STATUS_VALID:
-            self._status = MountStatus.ERROR
+        status = valueToInt(value)
+        if status not in self._STATUS_VALID:
+            status = MountStatus.ERROR
+        self.pointing.status = status
 
     @property
     def isTracking(self) -> bool:
-        return self._status == MountStatus.TRACKING
+        return self.pointing.status == MountStatus.TRACKING
 
     @property
     def isStopped(self) -> bool:
-        return self._status == MountStatus.STOPPED
+        return self.pointing.status == MountStatus.STOPPED
 
     @property
     def isParked(self) -> bool:
-        return self._status == MountStatus.PARKED
+        return self.pointing.status == MountStatus.PARKED
 
     @property
     def isFollowingSatellite(self) -> bool:
-        return self._status == MountStatus.FOLLOWING_SATELLITE
+        return self.pointing.status == MountStatus.FOLLOWING_SATELLITE
 
     def statusText(self) -> str:
-        reference = f"{self._status:d}"
+        reference = f"{self.status:d}"
         text = self.STAT.get(reference, "unknown Status")
         # Slewing states already convey motion; the "settle" suffix only
         # applies to other states while the mount is settling.
-        if self._status in (MountStatus.SLEWING_TO_PARK, MountStatus.SLEWING):
+        if self.status in (MountStatus.SLEWING_TO_PARK, MountStatus.SLEWING):
             return text
         return text + " - settle" if self.statusSlew else text
 
     @property
     def statusSat(self) -> str:
-        return self._statusSat
+        return self.pointing.statusSat
 
     @statusSat.setter
     def statusSat(self, value: str) -> None:
-        self._statusSat = value
-        if self._statusSat not in ["V", "P", "S", "T", "Q", "E"]:
-            self._statusSat = "E"
+        if value not in ["V", "P", "S", "T", "Q", "E"]:
+            value = "E"
+        self.pointing.statusSat = value
 
     def statusSatText(self) -> str:
-        return self.STAT_SAT.get(self._statusSat, "error")
+        return self.STAT_SAT.get(self.pointing.statusSat, "error")
 
     @property
     def statusSlew(self) -> bool:
-        return self._statusSlew
+        return self.pointing.statusSlew
 
     @statusSlew.setter
     def statusSlew(self, value: Any) -> None:
-        self._statusSlew = bool(value)
+        self.pointing.statusSlew = bool(value)
 
     def parseLocation(self, response: list, numberOfChunks: int) -> bool:
         """
@@ -502,32 +634,25 @@ class ObsSite:
         return self.parseLocation(response, numberOfChunks)
 
     def parsePointing(self, response: list, numberOfChunks: int) -> bool:
+        """
+        the values go into the pointing record without building skyfield
+        objects. The angle and time properties are built from it on the first
+        read after the poll.
+        """
         if len(response) != numberOfChunks:
             self.log.warning("Wrong number of chunks")
             return False
-        self.timeSidereal = response[0]
-        self.ut1_utc = response[1].replace("L", "")
-        self.statusSat = response[2]
-        responseSplit = response[3].split(",")
-        self.raJNow = responseSplit[0]
-        self.decJNow = responseSplit[1]
-        self.pierside = responseSplit[2]
-        self.Az = responseSplit[3]
-        self.Alt = responseSplit[4]
-        self.timeJD = responseSplit[5]
-        self.status = responseSplit[6]
-        self.statusSlew = responseSplit[7] == "1"
-        responseSplit = response[4].split(",")
-        self.angularPosRA = responseSplit[1]
-        self.angularPosDEC = responseSplit[3]
-        self.errorAngularPosRA = responseSplit[2]
-        self.errorAngularPosDEC = responseSplit[4]
+        if not self.pointing.parse(response):
+            self.log.warning(f"Malformed pointing response: [{response}]")
+            return False
+        self.invalidatePointing()
+        self.updateAzDirection(self.pointing.az)
         return True
 
     def pollPointing(self) -> bool:
         conn = Connection(self.parent)
         commandString = ":GS#:GDUT#:TLESCK#:Ginfo#:GaE#"
-        suc, response, numberOfChunks = conn.communicate(commandString)
+        suc, response, numberOfChunks = conn.communicateBatched(commandString)
         if not suc:
             return False
         return self.parsePointing(response, numberOfChunks)
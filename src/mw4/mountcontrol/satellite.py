@@ -162,7 +162,7 @@ class Satellite:
 
     def statTLE(self) -> bool:
         conn = Connection(self.parent)
-        suc, response, _numberOfChunks = conn.communicate(":TLESCK#")
+        suc, response, _numberOfChunks = conn.communicateBatched(":TLESCK#")
         if not suc:
             return False
         return self.parseStatTLE(response)
@@ -232,7 +232,7 @@ class Satellite:
     def getTrackingOffsets(self) -> bool:
         cmd = ":TROFFGET1#:TROFFGET2#:TROFFGET3#:TROFFGET4#"
         conn = Connection(self.parent)
-        suc, response, numberOfChunks = conn.communicate(commandString=cmd)
+        suc, response, numberOfChunks = conn.communicateBatched(commandString=cmd)
         if not suc:
             return False
 
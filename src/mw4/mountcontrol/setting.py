@@ -192,7 +192,7 @@ class Setting:
         if self.parent.firmware.checkNewer("3.2.5"):
             cs3 += ":GAPO#:GCFG#:gtgpps#"
         commandString = cs1 + cs2 + cs3
-        suc, response, numberOfChunks = conn.communicate(commandString)
+        suc, response, numberOfChunks = conn.communicateBatched(commandString)
         if not suc:
             return False
         return self.parseSetting(response, numberOfChunks)
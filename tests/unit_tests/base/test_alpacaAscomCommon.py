@@ -16,7 +16,7 @@
 import pytest
 import queue
 import threading
-from mw4.base.alpacaAscomCommon import AlpacaAscomCommon, CommandItem
+from mw4.base.alpacaAscomCommon import AlpacaAscomCommon, CommandItem, PropertySchedule
 from mw4.base.signalsDevices import Signals
 from pathlib import Path
 from PySide6.QtCore import QThreadPool
@@ -477,3 +477,151 @@ def test_callDeviceMethod_withLoggingTrace():
     # assert
     base.device.Halt.assert_called_once_with()
     assert result == "ok"
+
+
+def createBase() -> AlpacaAscomCommon:
+    base = AlpacaAscomCommon(parent=Parent())
+    base.config = mock.MagicMock()
+    base.config.deviceName = "TestDevice"
+    base.device = mock.MagicMock()
+    return base
+
+
+def test_propertySchedule():
+    schedule = PropertySchedule(interval=0.25)
+    assert schedule.due == 0.0
+    assert schedule.value is None
+
+
+def test_getDeviceProp_prefetched():
+    base = createBase()
+    base.device.Name = "Device"
+    base.prefetched = {"Name": "Prefetched"}
+    assert base.getDeviceProp("Name") == "Prefetched"
+    assert base.getDeviceProp("Name") == "Device"
+
+
+def test_getDeviceProp_pollRequests():
+    base = createBase()
+    base.pollRequests = set()
+    base.getDeviceProp("Name")
+    assert base.pollRequests == {"Name"}
+
+
+def test_isPropertyDue():
+    base = createBase()
+    assert base.isPropertyDue("Name", 10)
+    base.propertySchedules["Name"] = PropertySchedule(interval=1, due=11)
+    assert not base.isPropertyDue("Name", 10)
+    assert base.isPropertyDue("Name", 11)
+
+
+def test_updatePropertySchedule_changed():
+    base = createBase()
+    base.propertySchedules["Name"] = PropertySchedule(interval=2, value=1)
+    base.updatePropertySchedule("Name", 2, 10)
+    schedule = base.propertySchedules["Name"]
+    assert schedule.interval == base.UPDATE_RATE
+    assert schedule.due == 10 + base.UPDATE_RATE
+    assert schedule.value == 2
+
+
+def test_updatePropertySchedule_static():
+    base = createBase()
+    base.propertySchedules["Name"] = PropertySchedule(interval=0.25, value=1)
+    base.updatePropertySchedule("Name", 1, 10)
+    assert base.propertySchedules["Name"].interval == 0.5
+    base.propertySchedules["Name"].interval = base.MAX_POLL_INTERVAL
+    base.updatePropertySchedule("Name", 1, 10)
+    assert base.propertySchedules["Name"].interval == base.MAX_POLL_INTERVAL
+
+
+def test_updatePropertySchedule_state():
+    base = createBase()
+    base.propertySchedules["Slewing"] = PropertySchedule(interval=0.25, value=True)
+    base.updatePropertySchedule("Slewing", True, 10)
+    assert base.propertySchedules["Slewing"].interval == base.UPDATE_RATE
+    assert base.propertySchedules["Slewing"].due == 10 + base.UPDATE_RATE
+
+
+def test_isStaticProperty():
+    base = createBase()
+    assert base.isStaticProperty("Name")
+    assert base.isStaticProperty("CanAbortExposure")
+    assert not base.isStaticProperty("Slewing")
+    assert not base.isStaticProperty("CameraState")
+
+
+def test_getAndStoreDeviceProp_notPolling():
+    base = createBase()
+    base.device.Name = "Device"
+    base.getAndStoreDeviceProp("Name", "DRIVER_INFO.DRIVER_NAME")
+    assert base.data["DRIVER_INFO.DRIVER_NAME"] == "Device"
+    assert base.propertySchedules == {}
+
+
+def test_getAndStoreDeviceProp_due():
+    base = createBase()
+    base.device.Name = "Device"
+    base.pollRequests = set()
+    base.getAndStoreDeviceProp("Name", "DRIVER_INFO.DRIVER_NAME")
+    assert base.data["DRIVER_INFO.DRIVER_NAME"] == "Device"
+    assert base.propertySchedules["Name"].value == "Device"
+    assert base.pollRequests == {"Name"}
+
+
+def test_getAndStoreDeviceProp_notDue():
+    base = createBase()
+    base.device.Name = "Device"
+    base.propertySchedules["Name"] = PropertySchedule(interval=1, due=1e12, value="Old")
+    base.pollRequests = set()
+    base.getAndStoreDeviceProp("Name", "DRIVER_INFO.DRIVER_NAME")
+    base.getAndStoreDeviceProp("Name", "DRIVER_INFO.DRIVER_EXEC")
+    assert base.data["DRIVER_INFO.DRIVER_NAME"] == "Old"
+    assert base.data["DRIVER_INFO.DRIVER_EXEC"] == "Old"
+    assert base.pollRequests == {"Name"}
+
+
+def test_readProperties():
+    base = createBase()
+    assert base.readProperties(["Name"]) == {}
+
+
+def test_pollCycle():
+    base = createBase()
+    base.device.Azimuth = 10
+    base.pollProperties = {"Azimuth", "Name", "Broken"}
+    base.propertySchedules["Name"] = PropertySchedule(interval=1, due=1e12, value="Old")
+    base.propertyExceptions.append("Broken")
+
+    def pollData() -> None:
+        base.getAndStoreDeviceProp("Azimuth", "Azimuth")
+        base.getAndStoreDeviceProp("Name", "Name")
+
+    base.pollData = pollData
+    with mock.patch.object(
+        base, "readProperties", return_value={"Azimuth": 20}
+    ) as readProperties:
+        base.pollCycle()
+    readProperties.assert_called_once_with(["Azimuth"])
+    assert base.data["Azimuth"] == 20
+    assert base.data["Name"] == "Old"
+    assert base.pollProperties == {"Azimuth", "Name"}
+    assert base.pollRequests is None
+    assert base.prefetched == {}
+
+
+def test_pollCycle_exception():
+    base = createBase()
+    base.pollData = mock.MagicMock(side_effect=ValueError)
+    with pytest.raises(ValueError):
+        base.pollCycle()
+    assert base.pollRequests is None
+
+
+def test_processCommandQueue_resetSchedules():
+    base = createBase()
+    base.propertySchedules["Name"] = PropertySchedule(interval=4, due=1e12)
+    base.setDevicePropQueued("Name", "Test")
+    base.processCommandQueue()
+    assert base.propertySchedules == {}
@@ -16,6 +16,7 @@
 import alpaca.management as alpacaMgmt
 import pytest
 import queue
+import requests
 import threading
 from alpaca.exceptions import NotImplementedException as AlpycaNotImplError
 from mw4.base.alpacaClass import AlpacaClass
@@ -290,3 +291,107 @@ def test_startCommunication_2(function):
         assert not function.deviceConnected
         assert not function.stopEvent.is_set()
         m_start.assert_called_once()
+
+
+def test_createSession(function):
+    function.session = mock.MagicMock()
+    old = function.session
+    function.createSession()
+    old.close.assert_called_once()
+    assert function.session is not old
+    assert function.executor is not None
+    function.closeSession()
+
+
+def test_closeSession_1(function):
+    function.session = None
+    function.executor = None
+    function.closeSession()
+    assert function.session is None
+
+
+def test_closeSession_2(function):
+    function.createSession()
+    executor = function.executor
+    function.closeSession()
+    assert function.session is None
+    assert function.executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+def test_stopCommunication(function):
+    function.createSession()
+    with mock.patch.object(function, "setDevicePropQueued"):
+        function.stopCommunication()
+    assert function.stopEvent.is_set()
+    assert function.session is None
+    assert function.executor is None
+
+
+def test_readProperty_1(function):
+    function.session = mock.MagicMock()
+    function.device.base_url = "http://localhost:11111/api/v1/dome/0"
+    function.session.get.return_value.json.return_value = {"ErrorNumber": 0, "Value": 3}
+    suc, value = function.readProperty("Azimuth")
+    assert suc
+    assert value == 3
+    url = function.session.get.call_args.args[0]
+    assert url == "http://localhost:11111/api/v1/dome/0/azimuth"
+
+
+def test_readProperty_2(function):
+    function.session = mock.MagicMock()
+    function.session.get.return_value.json.return_value = {"ErrorNumber": 1024, "Value": 0}
+    suc, value = function.readProperty("Azimuth")
+    assert not suc
+    assert value is None
+    assert value is None
+
+
+def test_readProperty_3(function):
+    function.session = mock.MagicMock()
+    function.session.get.side_effect = requests.ConnectionError
+    suc, value = function.readProperty("Azimuth")
+    assert not suc
+    assert value is None
+
+
+def test_readProperty_4(function):
+    function.session = mock.MagicMock()
+    function.session.get.return_value.json.side_effect = ValueError
+    suc, value = function.readProperty("Azimuth")
+    assert not suc
+    assert value is None
+
+
+def test_readProperty_noSession(function):
+    function.session = None
+    suc, value = function.readProperty("Azimuth")
+    assert not suc
+    assert value is None
+
+
+def test_readProperties_1(function):
+    function.executor = None
+    assert function.readProperties(["Azimuth"]) == {}
+
+
+def test_readProperties_2(function):
+    function.executor = mock.MagicMock()
+    assert function.readProperties(["ImageArray", "GetSwitch(0)"]) == {}
+
+
+def test_readProperties_3(function):
+    function.createSession()
+    results = {"Azimuth": (True, 10), "Slewing": (False, None)}
+    with mock.patch.object(function, "readProperty", side_effect=results.get):
+        result = function.readProperties(["Azimuth", "Slewing"])
+    assert result == {"Azimuth": 10}
+    function.closeSession()
+
+
+def test_readProperties_shutdown(function):
+    function.executor = mock.MagicMock()
+    function.executor.map.side_effect = RuntimeError
+    assert function.readProperties(["Azimuth"]) == {}
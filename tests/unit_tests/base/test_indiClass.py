@@ -268,7 +268,75 @@ def test_writeVectorsToData_indigoNoConversion(function):
     assert function.data["UNKNOWN_VECTOR.MEMBER"] == 42
 
 
-# ─── runnerProcessRxQueue ──────────────────────────────────────────────────────────
+def test_writeVectorsToData_dataChanged(function):
+    function.isINDIGO = False
+    function.data = {"TEST_VECTOR.M1": 1, "TEST_VECTOR.M2": 2}
+    vectors = {
+        "v1": {
+            "name": "TEST_VECTOR",
+            "members": {"M1": {"value": 1}, "M2": {"value": 3}, "M3": {"value": 4}},
+        }
+    }
+    received = []
+    function.signals.dataChanged.connect(received.append)
+    function.writeVectorsToData(mock.MagicMock(), vectors)
+    function.signals.dataChanged.disconnect()
+    assert received == [{"TEST_VECTOR.M2": 3, "TEST_VECTOR.M3": 4}]
+
+
+def test_writeVectorsToData_noChange(function):
+    function.isINDIGO = False
+    function.data = {"TEST_VECTOR.M1": 1}
+    vectors = {"v1": {"name": "TEST_VECTOR", "members": {"M1": {"value": 1}}}}
+    received = []
+    function.signals.dataChanged.connect(received.append)
+    function.writeVectorsToData(mock.MagicMock(), vectors)
+    function.signals.dataChanged.disconnect()
+    assert received == []
+
+
+# ─── collectVectors ──────────────────────────────────────────────────────────
+
+
+def test_collectVectors_setEvent(function):
+    function.config.deviceName = "MyDevice"
+    vector = mock.MagicMock()
+    vector.dictdump.return_value = {"name": "CCD_TEMPERATURE", "members": {}}
+    snap_device = mock.MagicMock()
+    snap_device.get.return_value = vector
+    item = mock.MagicMock()
+    item.snapshot = {"MyDevice": snap_device}
+    item.eventtype = "Set"
+    item.vectorname = "CCD_TEMPERATURE"
+    vectors = function.collectVectors(item)
+    assert vectors == {"CCD_TEMPERATURE": {"name": "CCD_TEMPERATURE", "members": {}}}
+    snap_device.get.assert_called_once_with("CCD_TEMPERATURE")
+    snap_device.dictdump.assert_not_called()
+
+
+def test_collectVectors_vectorMissing(function):
+    function.config.deviceName = "MyDevice"
+    snap_device = mock.MagicMock()
+    snap_device.get.return_value = None
+    item = mock.MagicMock()
+    item.snapshot = {"MyDevice": snap_device}
+    item.eventtype = "Define"
+    item.vectorname = "CCD_TEMPERATURE"
+    assert function.collectVectors(item) == {}
+
+
+def test_collectVectors_fullDump(function):
+    function.config.deviceName = "MyDevice"
+    snap_device = mock.MagicMock()
+    snap_device.dictdump.return_value = {"vectors": {"V": {"name": "V"}}}
+    item = mock.MagicMock()
+    item.snapshot = {"MyDevice": snap_device}
+    item.eventtype = "Delete"
+    item.vectorname = None
+    assert function.collectVectors(item) == {"V": {"name": "V"}}
+
+
+# ─── processRxItem ───────────────────────────────────────────────────────────
 
 
 def _make_snap_val(connection=None, vectors=None):
@@ -281,51 +349,30 @@ def _make_snap_val(connection=None, vectors=None):
     return snap_val
 
 
-def runLoopOnce(function):
-    """Drive runnerProcessRxQueue's while-loop for exactly one iteration.
-
-    A commandRunning mock evaluates truthy once and then resets the
-    attribute back to a real ``False`` so no state leaks into the shared
-    module-scoped fixture. This keeps the test deterministic and avoids
-    real threads or sleeps that could hang the test run.
-    """
-    states = iter([True])
-
-    def booler():
-        try:
-            return next(states)
-        except StopIteration:
-            function.commandRunning = False
-            return False
-
-    flag = mock.MagicMock()
-    flag.__bool__.side_effect = booler
-    function.commandRunning = flag
-
-
-def test_processRxQueue_commandNotRunning(function):
+def test_processRxItem_commandNotRunning(function):
     function.commandRunning = False
-    function.runnerProcessRxQueue()
-
-
-def test_processRxQueue_emptyQueueThenStop(function):
-    runLoopOnce(function)
-    function.runnerProcessRxQueue()
+    function.config.deviceName = "MyDevice"
+    function.data = {}
+    vectors = {"v1": {"name": "TEST_VECTOR", "members": {"M1": {"value": 99}}}}
+    item = mock.MagicMock()
+    item.snapshot = {"MyDevice": _make_snap_val(connection=None, vectors=vectors)}
+    item.devicename = "MyDevice"
+    function.processRxItem(item)
+    assert function.data == {}
 
 
-def test_processRxQueue_deviceNotInSnapshot(function):
-    runLoopOnce(function)
+def test_processRxItem_deviceNotInSnapshot(function):
+    function.commandRunning = True
     function.config.deviceName = "MyDevice"
 
     item = mock.MagicMock()
-    item.snapshot = {}  # deviceName not present → .get() returns None → continue
-    function.rxQ.put(item)
+    item.snapshot = {}  # deviceName not present → .get() returns None → return
 
-    function.runnerProcessRxQueue()
+    function.processRxItem(item)
 
 
-def test_processRxQueue_connectionOn(function):
-    runLoopOnce(function)
+def test_processRxItem_connectionOn(function):
+    function.commandRunning = True
     function.config.deviceName = "MyDevice"
     function.deviceConnected = False
 
@@ -336,14 +383,13 @@ def test_processRxQueue_connectionOn(function):
     item = mock.MagicMock()
     item.snapshot = {"MyDevice": snap_val}
     item.devicename = "MyDevice"
-    function.rxQ.put(item)
 
-    function.runnerProcessRxQueue()
+    function.processRxItem(item)
     assert function.deviceConnected is True
 
 
-def test_processRxQueue_connectionOff(function):
-    runLoopOnce(function)
+def test_processRxItem_connectionOff(function):
+    function.commandRunning = True
     function.config.deviceName = "MyDevice"
     function.deviceConnected = True
 
@@ -354,28 +400,26 @@ def test_processRxQueue_connectionOff(function):
     item = mock.MagicMock()
     item.snapshot = {"MyDevice": snap_val}
     item.devicename = "MyDevice"
-    function.rxQ.put(item)
 
-    function.runnerProcessRxQueue()
+    function.processRxItem(item)
     assert function.deviceConnected is False
 
 
-def test_processRxQueue_devicenameMismatch(function):
+def test_processRxItem_devicenameMismatch(function):
     """item.devicename != deviceName → continue before vector processing."""
-    runLoopOnce(function)
+    function.commandRunning = True
     function.config.deviceName = "MyDevice"
 
     snap_val = _make_snap_val(connection=None, vectors=None)
     item = mock.MagicMock()
     item.snapshot = {"MyDevice": snap_val}
     item.devicename = "OtherDevice"
-    function.rxQ.put(item)
 
-    function.runnerProcessRxQueue()
+    function.processRxItem(item)
 
 
-def test_processRxQueue_withVectors(function):
-    runLoopOnce(function)
+def test_processRxItem_withVectors(function):
+    function.commandRunning = True
     function.config.deviceName = "MyDevice"
     function.data = {}
 
@@ -390,15 +434,14 @@ def test_processRxQueue_withVectors(function):
     item = mock.MagicMock()
     item.snapshot = {"MyDevice": snap_val}
     item.devicename = "MyDevice"
-    function.rxQ.put(item)
 
-    function.runnerProcessRxQueue()
+    function.processRxItem(item)
     assert function.data["TEST_VECTOR.M1"] == 99
 
 
-def test_processRxQueue_noVectors(function):
+def test_processRxItem_noVectors(function):
     """vectors is falsy → writeVectorsToData is NOT called."""
-    runLoopOnce(function)
+    function.commandRunning = True
     function.config.deviceName = "MyDevice"
     function.data = {}
 
@@ -407,15 +450,14 @@ def test_processRxQueue_noVectors(function):
     item = mock.MagicMock()
     item.snapshot = {"MyDevice": snap_val}
     item.devicename = "MyDevice"
-    function.rxQ.put(item)
 
-    function.runnerProcessRxQueue()
+    function.processRxItem(item)
     assert function.data == {}
 
 
-def test_processRxQueue_messageEvent(function):
+def test_processRxItem_messageEvent(function):
     """eventtype == 'Message' → updateMessage is called."""
-    runLoopOnce(function)
+    function.commandRunning = True
     function.config.deviceName = "MyDevice"
     function.config.showMessage = True
 
@@ -427,13 +469,12 @@ def test_processRxQueue_messageEvent(function):
     item.snapshot = {"MyDevice": snap_device}
     item.devicename = "MyDevice"
     item.eventtype = "Message"
-    function.rxQ.put(item)
 
     mock_msg = mock.MagicMock()
     original_msg, function.msg = function.msg, mock_msg
 
     try:
-        function.runnerProcessRxQueue()
+        function.processRxItem(item)
     finally:
         function.msg = original_msg
     mock_msg.emit.assert_called_once_with(
@@ -441,77 +482,33 @@ def test_processRxQueue_messageEvent(function):
     )
 
 
-# ─── cleanupStop ─────────────────────────────────────────────────────────────
-
-
-def test_cleanupStop(function):
-    function.clientMutex.lock()
-    function.cleanupStop()
-    # Verify mutex was unlocked by successfully locking it again
-    assert function.clientMutex.tryLock() is True
-    function.clientMutex.unlock()
-
-
-# ─── runnerQueueClient ──────────────────────────────────────────────────────────
-
-
-def test_runQueueClient_loggingTraceOff(function):
-    """runnerQueueClient creates QueClient, calls debug_verbosity(0) and runs asyncrun."""
-    function.config.hostAddress = "localhost"
-    function.config.port = 7624
-    function.loggingTrace = False
-    mock_client = mock.MagicMock()
-    with (
-        mock.patch("mw4.base.indiClass.QueClient", return_value=mock_client) as mock_qc,
-        mock.patch("mw4.base.indiClass.asyncio.run") as mock_asyncio_run,
-    ):
-        function.runnerQueueClient()
-    mock_qc.assert_called_once_with(
-        function.txQ,
-        function.rxQ,
-        indihost="localhost",
-        indiport=7624,
-        blobfolder=mock.ANY,
-    )
-    mock_client.debug_verbosity.assert_called_once_with(0)
-    mock_asyncio_run.assert_called_once_with(mock_client.asyncrun())
-    function.queueClient = None
-
-
-def test_runQueueClient_loggingTraceOn(function):
-    """runnerQueueClient calls debug_verbosity(3) when loggingTrace is True."""
-    function.loggingTrace = True
-    mock_client = mock.MagicMock()
-    with (
-        mock.patch("mw4.base.indiClass.QueClient", return_value=mock_client),
-        mock.patch("mw4.base.indiClass.asyncio.run"),
-    ):
-        function.runnerQueueClient()
-    mock_client.debug_verbosity.assert_called_once_with(3)
-    function.queueClient = None
-    function.loggingTrace = False
-
-
 # ─── startCommunication ──────────────────────────────────────────────────────
 
 
-def test_startCommunication_mutexAlreadyLocked(function):
-    function.clientMutex.lock()
-    function.startCommunication()
-    assert function.commandRunning is False
-    function.clientMutex.unlock()
+def test_startCommunication_running(function):
+    function.consumer = mock.MagicMock()
+    with mock.patch("mw4.base.indiClass.IndiConnection.register") as register:
+        function.startCommunication()
+    register.assert_not_called()
+    function.consumer = None
 
 
 def test_startCommunication_success(function):
-    with mock.patch("mw4.base.indiClass.Worker") as mock_worker_cls:
-        mock_worker_instance = mock.MagicMock()
-        mock_worker_cls.return_value = mock_worker_instance
-        with mock.patch.object(function.threadPool, "start"):
-            function.startCommunication()
+    function.commandRunning = False
+    function.config.deviceName = "MyDevice"
+    function.config.hostAddress = "localhost"
+    function.config.port = 7624
+    oldTxQ = function.txQ
+    with mock.patch("mw4.base.indiClass.IndiConnection.register") as register:
+        function.startCommunication()
     assert function.commandRunning is True
-    assert function.workerIndiQueueClient is mock_worker_instance
-    assert function.workerProcessRxQueue is mock_worker_instance
-    function.clientMutex.unlock()
+    assert function.txQ is not oldTxQ
+    consumer = register.call_args.args[0]
+    assert consumer is function.consumer
+    assert consumer.deviceName == "MyDevice"
+    assert consumer.txQ is function.txQ
+    assert consumer.rxEvent == function.processRxItem
+    assert register.call_args.args[1:3] == ("localhost", 7624)
 
 
 # ─── stopCommunication ───────────────────────────────────────────────────────
@@ -535,6 +532,7 @@ def test_stopCommunication(function):
     assert received == ["telescope"]
     # None must be queued to signal stop
     assert function.txQ.get_nowait() is None
+    assert function.consumer is None
 
 
 # ─── loadIndiConfig ──────────────────────────────────────────────────────────
@@ -564,8 +562,7 @@ def test_discoverDevices_mutexLocked(function):
 def test_discoverDevices_emptyQueue(function, monkeypatch):
     monkeypatch.setattr(IndiClass, "MAX_SEARCH", 1)
     with (
-        mock.patch("mw4.base.indiClass.Worker"),
-        mock.patch.object(function.threadPool, "start"),
+        mock.patch("mw4.base.indiClass.IndiConnection.register"),
         mock.patch("mw4.base.indiClass.Queue") as mock_queue_cls,
     ):
         mock_txQ = mock.MagicMock()
@@ -582,8 +579,7 @@ def test_discoverDevices_emptyQueue(function, monkeypatch):
 def test_discoverDevices_noneItem(function, monkeypatch):
     monkeypatch.setattr(IndiClass, "MAX_SEARCH", 1)
     with (
-        mock.patch("mw4.base.indiClass.Worker"),
-        mock.patch.object(function.threadPool, "start"),
+        mock.patch("mw4.base.indiClass.IndiConnection.register"),
         mock.patch("mw4.base.indiClass.Queue") as mock_queue_cls,
     ):
         mock_txQ = mock.MagicMock()
@@ -603,8 +599,7 @@ def test_discoverDevices_withoutDeviceName(function, monkeypatch):
     item.devicename = ""
 
     with (
-        mock.patch("mw4.base.indiClass.Worker"),
-        mock.patch.object(function.threadPool, "start"),
+        mock.patch("mw4.base.indiClass.IndiConnection.register"),
         mock.patch("mw4.base.indiClass.Queue") as mock_queue_cls,
     ):
         mock_txQ = mock.MagicMock()
@@ -628,8 +623,7 @@ def test_discoverDevices_driverMatchingType(function, monkeypatch):
     item.snapshot = {"TestDome": snapshot_value}
 
     with (
-        mock.patch("mw4.base.indiClass.Worker"),
-        mock.patch.object(function.threadPool, "start"),
+        mock.patch("mw4.base.indiClass.IndiConnection.register"),
         mock.patch("mw4.base.indiClass.Queue") as mock_queue_cls,
     ):
         mock_txQ = mock.MagicMock()
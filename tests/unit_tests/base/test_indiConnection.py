@@ -0,0 +1,322 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import asyncio
+import pytest
+from mw4.base.indiConnection import IndiConnection, IndiConsumer
+from queue import Queue
+from unittest import mock
+
+
+@pytest.fixture
+def function():
+    IndiConnection.connections.clear()
+    func = IndiConnection("localhost", 7624, "/tmp")
+    yield func
+    IndiConnection.connections.clear()
+
+
+def createConsumer(deviceName: str = "MyDevice") -> IndiConsumer:
+    return IndiConsumer(deviceName, Queue(), mock.MagicMock())
+
+
+def test_indiConsumer_identity():
+    consumer1 = createConsumer()
+    consumer2 = createConsumer()
+    consumer2.txQ = consumer1.txQ
+    consumer2.rxEvent = consumer1.rxEvent
+    assert consumer1 != consumer2
+
+
+def test_init(function):
+    assert function.consumers == []
+    assert function.indihost == "localhost"
+    assert function.indiport == 7624
+
+
+def test_register_new():
+    IndiConnection.connections.clear()
+    consumer = createConsumer()
+    with mock.patch.object(IndiConnection, "start") as start:
+        connection = IndiConnection.register(consumer, "localhost", 7624, "/tmp", None)
+    start.assert_called_once()
+    assert IndiConnection.connections[("localhost", 7624)] is connection
+    assert connection.consumers == [consumer]
+    assert consumer.txQ.empty()
+    IndiConnection.connections.clear()
+
+
+def test_register_existing(function):
+    IndiConnection.connections[("localhost", 7624)] = function
+    consumer = createConsumer()
+    discover = createConsumer("")
+    with mock.patch.object(IndiConnection, "start") as start:
+        connection = IndiConnection.register(consumer, "localhost", 7624, "/tmp", None)
+        IndiConnection.register(discover, "localhost", 7624, "/tmp", None, True)
+    start.assert_not_called()
+    assert connection is function
+    assert function.consumers == [consumer, discover]
+    assert consumer.txQ.get_nowait() == ("MyDevice", None, "Get")
+    assert discover.txQ.get_nowait() == (None, None, "Get")
+
+
+def test_release_notLast(function):
+    IndiConnection.connections[("localhost", 7624)] = function
+    consumer1 = createConsumer()
+    consumer2 = createConsumer()
+    function.consumers = [consumer1, consumer2]
+    function.release(consumer1)
+    assert function.consumers == [consumer2]
+    assert IndiConnection.connections[("localhost", 7624)] is function
+    assert not function._stop
+
+
+def test_release_last(function):
+    IndiConnection.connections[("localhost", 7624)] = function
+    consumer = createConsumer()
+    function.consumers = [consumer]
+    function.release(consumer)
+    assert function.consumers == []
+    assert IndiConnection.connections == {}
+    assert function._stop
+
+
+def test_release_replaced(function):
+    other = mock.MagicMock()
+    IndiConnection.connections[("localhost", 7624)] = other
+    function.release(createConsumer())
+    assert IndiConnection.connections[("localhost", 7624)] is other
+
+
+def test_start(function):
+    threadPool = mock.MagicMock()
+    function.start(threadPool)
+    assert threadPool.start.call_count == 2
+
+
+def test_runnerEventLoop(function):
+    with (
+        mock.patch.object(function, "asyncrun", new=mock.MagicMock()),
+        mock.patch("mw4.base.indiConnection.asyncio.run") as run,
+    ):
+        function.runnerEventLoop()
+        run.assert_called_once_with(function.asyncrun.return_value)
+    assert function.dispatchQ.get_nowait() is None
+
+
+def test_runnerEventLoop_unregister(function):
+    IndiConnection.connections[("localhost", 7624)] = function
+    with (
+        mock.patch.object(function, "asyncrun", new=mock.MagicMock()),
+        mock.patch("mw4.base.indiConnection.asyncio.run", side_effect=OSError),
+        pytest.raises(OSError),
+    ):
+        function.runnerEventLoop()
+    assert IndiConnection.connections == {}
+    assert function.dispatchQ.get_nowait() is None
+
+
+def test_runnerEventLoop_replaced(function):
+    other = IndiConnection("localhost", 7624, "/tmp")
+    IndiConnection.connections[("localhost", 7624)] = other
+    with (
+        mock.patch.object(function, "asyncrun", new=mock.MagicMock()),
+        mock.patch("mw4.base.indiConnection.asyncio.run"),
+    ):
+        function.runnerEventLoop()
+    assert IndiConnection.connections[("localhost", 7624)] is other
+
+
+def test_register_afterEventLoop():
+    IndiConnection.connections.clear()
+    with mock.patch.object(IndiConnection, "start"):
+        connection = IndiConnection.register(createConsumer(), "localhost", 7624, "/tmp", None)
+    with (
+        mock.patch.object(connection, "asyncrun", new=mock.MagicMock()),
+        mock.patch("mw4.base.indiConnection.asyncio.run"),
+    ):
+        connection.runnerEventLoop()
+    consumer = createConsumer()
+    with mock.patch.object(IndiConnection, "start") as start:
+        newConnection = IndiConnection.register(consumer, "localhost", 7624, "/tmp", None)
+    start.assert_called_once()
+    assert newConnection is not connection
+    assert IndiConnection.connections[("localhost", 7624)] is newConnection
+    assert newConnection.consumers == [consumer]
+    assert consumer.txQ.empty()
+    IndiConnection.connections.clear()
+
+
+def test_runnerDispatch(function):
+    consumer = createConsumer()
+    released = createConsumer()
+    failing = createConsumer()
+    failing.rxEvent.side_effect = ValueError
+    function.consumers = [consumer, failing]
+    item = mock.MagicMock()
+    function.dispatchQ.put((released, item))
+    function.dispatchQ.put((failing, item))
+    function.dispatchQ.put((consumer, item))
+    function.dispatchQ.put(None)
+    function.runnerDispatch()
+    consumer.rxEvent.assert_called_once_with(item)
+    released.rxEvent.assert_not_called()
+
+
+def test_dispatch_noDevice(function):
+    function.consumers = [createConsumer("")]
+    function.dispatch("ConnectionMade", None, None, None)
+    assert function.dispatchQ.empty()
+
+
+def test_dispatch_unknownDevice(function):
+    function.consumers = [createConsumer()]
+    function.dispatch("Set", "MyDevice", "POS", None)
+    assert function.dispatchQ.empty()
+
+
+def test_dispatch_noConsumer(function):
+    device = mock.MagicMock()
+    function.data["OtherDevice"] = device
+    function.consumers = [createConsumer()]
+    function.dispatch("Set", "OtherDevice", "POS", None)
+    assert function.dispatchQ.empty()
+    device.snapshot.assert_not_called()
+
+
+def test_dispatch_consumers(function):
+    device = mock.MagicMock()
+    function.data["MyDevice"] = device
+    consumer = createConsumer()
+    discover = createConsumer("")
+    function.consumers = [consumer, createConsumer("OtherDevice"), discover]
+    function.dispatch("Set", "MyDevice", "POS", 5)
+    device.snapshot.assert_called_once()
+    entry1 = function.dispatchQ.get_nowait()
+    entry2 = function.dispatchQ.get_nowait()
+    assert function.dispatchQ.empty()
+    assert entry1[0] is consumer
+    assert entry2[0] is discover
+    item = entry1[1]
+    assert item is entry2[1]
+    assert item.eventtype == "Set"
+    assert item.devicename == "MyDevice"
+    assert item.vectorname == "POS"
+    assert item.timestamp == 5
+    assert item.snapshot == {"MyDevice": device.snapshot()}
+
+
+def test_snapshotEvent_vector(function):
+    device = mock.MagicMock()
+    device.__contains__.return_value = True
+    device.messages = []
+    device.user_string = ""
+    device.itemid = 1
+    function.data["MyDevice"] = device
+    snapshot = function.snapshotEvent("Set", "MyDevice", "POS")
+    device.snapshot.assert_not_called()
+    device.__getitem__.assert_called_once_with("POS")
+    assert snapshot.devicename == "MyDevice"
+    assert list(snapshot) == ["POS"]
+    assert snapshot["POS"] == device["POS"].snapshot()
+
+
+def test_snapshotEvent_unknownVector(function):
+    device = mock.MagicMock()
+    device.__contains__.return_value = False
+    function.data["MyDevice"] = device
+    snapshot = function.snapshotEvent("Set", "MyDevice", "POS")
+    assert snapshot == device.snapshot()
+
+
+@pytest.mark.parametrize("eventType", ["Delete", "Message", "getProperties", "State"])
+def test_snapshotEvent_device(function, eventType):
+    device = mock.MagicMock()
+    device.__contains__.return_value = True
+    function.data["MyDevice"] = device
+    snapshot = function.snapshotEvent(eventType, "MyDevice", "POS")
+    device.snapshot.assert_called_once()
+    assert snapshot == device.snapshot()
+
+
+def test_rxevent(function):
+    event = mock.MagicMock()
+    with mock.patch.object(function, "dispatch") as dispatch:
+        asyncio.run(function.rxevent(event))
+    dispatch.assert_called_once_with(
+        event.eventtype, event.devicename, event.vectorname, event.timestamp
+    )
+
+
+def test_transmit_none(function):
+    consumer = createConsumer()
+    with mock.patch.object(function, "release") as release:
+        asyncio.run(function.transmit(consumer, None))
+    release.assert_called_once_with(consumer)
+
+
+def test_transmit_invalid(function):
+    with mock.patch.object(function, "send_getProperties") as send:
+        asyncio.run(function.transmit(createConsumer(), ("MyDevice", "Get")))
+    send.assert_not_called()
+
+
+def test_transmit_vector(function):
+    with (
+        mock.patch.object(function, "send_newVector") as send,
+        mock.patch.object(function, "dispatch") as dispatch,
+    ):
+        asyncio.run(function.transmit(createConsumer(), ("MyDevice", "POS", {"V": 5})))
+    send.assert_called_once_with("MyDevice", "POS", mock.ANY, members={"V": 5})
+    dispatch.assert_called_once_with("State", "MyDevice", "POS", mock.ANY)
+
+
+def test_transmit_get(function):
+    with mock.patch.object(function, "send_getProperties") as send:
+        asyncio.run(function.transmit(createConsumer(), (None, None, "Get")))
+    send.assert_called_once_with(None, None)
+
+
+def test_transmit_blob(function):
+    with mock.patch.object(function, "send_enableBLOB") as send:
+        asyncio.run(function.transmit(createConsumer(), ("MyDevice", None, "Also")))
+    send.assert_called_once_with("Also", "MyDevice", None)
+
+
+def test_hardware(function):
+    consumer1 = createConsumer()
+    consumer2 = createConsumer()
+    consumer1.txQ.put(("MyDevice", None, "Get"))
+    function.consumers = [consumer1, consumer2]
+    sent = []
+
+    async def transmit(consumer, item):
+        sent.append((consumer, item))
+        function.shutdown()
+
+    with mock.patch.object(function, "transmit", side_effect=transmit):
+        asyncio.run(function.hardware())
+    assert sent == [(consumer1, ("MyDevice", None, "Get"))]
+
+
+def test_hardware_idle(function):
+    function.consumers = [createConsumer()]
+
+    async def sleep(delay):
+        function.shutdown()
+
+    with mock.patch("mw4.base.indiConnection.asyncio.sleep", side_effect=sleep) as wait:
+        asyncio.run(function.hardware())
+    wait.assert_called_once_with(0.02)
@@ -14,8 +14,10 @@
 #
 ###########################################################
 
+import numpy as np
+import threading
 from mw4.base import transform
-from skyfield.api import Angle, wgs84
+from skyfield.api import Angle, load, wgs84
 
 
 def test_JNowToJ2000_3():
@@ -49,6 +51,55 @@ def test_J2000T0AltAz_3():
     assert az.degrees != 0
 
 
+def test_J2000ToJNow_array():
+    ts = load.timescale()
+    timeJD = ts.tt_jd(2460000.7)
+    ra = np.array([1.0, 6.0, 18.0])
+    dec = np.array([-30.0, 10.0, 60.0])
+    raJNow, decJNow = transform.J2000ToJNow(Angle(hours=ra), Angle(degrees=dec), timeJD)
+    raJ2000, decJ2000 = transform.JNowToJ2000(raJNow, decJNow, timeJD)
+    for i in range(3):
+        raS, decS = transform.J2000ToJNow(Angle(hours=ra[i]), Angle(degrees=dec[i]), timeJD)
+        assert raJNow.hours[i] == raS.hours
+        assert decJNow.degrees[i] == decS.degrees
+    assert np.allclose(raJ2000.hours, ra)
+    assert np.allclose(decJ2000.degrees, dec)
+
+
+def test_J2000ToAltAz_array_times():
+    ts = load.timescale()
+    timeJD = ts.tt_jd(2460000.7 + np.arange(5) / 10)
+    location = wgs84.latlon(latitude_degrees=50, longitude_degrees=11, elevation_m=500)
+    ra = Angle(hours=3)
+    dec = Angle(degrees=40)
+    az, alt = transform.J2000ToAltAz(ra, dec, timeJD, location)
+    assert az.degrees.shape == (5,)
+    for i in range(5):
+        azS, altS = transform.J2000ToAltAz(ra, dec, timeJD[i], location)
+        assert az.degrees[i] == azS.degrees
+        assert alt.degrees[i] == altS.degrees
+
+
+def test_J2000ToAltAz_threads():
+    ts = load.timescale()
+    timeJD = ts.tt_jd(2460000.7)
+    location = wgs84.latlon(latitude_degrees=50, longitude_degrees=11, elevation_m=500)
+    ra = Angle(hours=np.linspace(0, 24, 100))
+    dec = Angle(degrees=np.linspace(-80, 80, 100))
+    expected = transform.J2000ToAltAz(ra, dec, timeJD, location)[1].degrees
+    results = []
+
+    def run():
+        results.append(transform.J2000ToAltAz(ra, dec, timeJD, location)[1].degrees)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(np.array_equal(result, expected) for result in results)
+
+
 def test_diffModulusAbs_1():
     val = transform.diffModulusAbs(1, 20, 360)
     assert val == 19
@@ -23,6 +23,7 @@ from mw4.gui.extWindows.image.imageTabs import ImageTabs
 from mw4.gui.extWindows.image.imageW import ImageWindow
 from mw4.gui.utilities.pyqtgraph.gCustomViewBox import CustomViewBox
 from mw4.logic.file.fileHandler import FileHandler
+from mw4.logic.file.imagePyramid import ImagePyramid
 from mw4.logic.photometry.photometry import Photometry
 from PySide6.QtCore import QRectF
 from PySide6.QtWidgets import QApplication
@@ -77,13 +78,27 @@ def test_writeHeaderDataToGUI_4(function):
     function.writeHeaderDataToGUI(function.header)
 
 
+def test_analysisLevels_1(function):
+    function.fileHandler = FileHandler(function.parent)
+    function.fileHandler.pyramid = None
+    with mock.patch.object(function.ui.image.barItem, "levels", return_value=(10, 20)):
+        assert function.analysisLevels() == (10, 20)
+
+
+def test_analysisLevels_2(function):
+    function.fileHandler = FileHandler(function.parent)
+    function.fileHandler.pyramid = ImagePyramid(np.full((10, 10), 1020.0))
+    with mock.patch.object(function.ui.image.barItem, "levels", return_value=(10, 20)):
+        assert function.analysisLevels() == (40, 80)
+
+
 def test_clearImageTab(function):
     function.clearImageTab(function.ui.image)
 
 
 def test_showTabImage_1(function):
     function.fileHandler = FileHandler(function.parent)
-    function.fileHandler.image = np.random.rand(100, 100) + 1
+    function.fileHandler.pyramid = ImagePyramid(np.random.rand(100, 100) + 1)
     function.fileHandler.wcs = wcs.WCS()
     with (
         mock.patch.object(function, "setBarColor"),
@@ -95,7 +110,7 @@ def test_showTabImage_1(function):
 
 def test_showTabImage_2(function):
     function.fileHandler = FileHandler(function.parent)
-    function.fileHandler.image = None
+    function.fileHandler.pyramid = None
     function.showImage()
 
 
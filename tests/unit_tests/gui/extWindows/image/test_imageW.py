@@ -14,6 +14,7 @@
 #
 ###########################################################
 import mw4.gui.extWindows.image.imageW
+import numpy as np
 import pyqtgraph as pg
 import pytest
 import shutil
@@ -21,6 +22,7 @@ from mw4.gui.extWindows.image.imageTabs import ImageTabs
 from mw4.gui.extWindows.image.imageW import ImageWindow
 from mw4.gui.utilities.nativeQt.qtFileDialog import MWFileDialog
 from mw4.gui.utilities.qtMain import MWidget
+from mw4.logic.file.imagePyramid import ImagePyramid
 from pathlib import Path
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import QApplication
@@ -202,18 +204,28 @@ def test_resultPhotometry_2(function):
 
 def test_processPhotometry_1(function):
     function.ui.photometryGroup.setChecked(True)
-    function.fileHandler.image = 1
+    function.fileHandler.pyramid = ImagePyramid(np.ones((10, 10)))
     with (
-        mock.patch.object(function.photometry, "processPhotometry"),
+        mock.patch.object(function.photometry, "processPhotometry") as process,
         mock.patch.object(function, "clearGui"),
     ):
         function.processPhotometry()
+        assert process.call_args.args[1] == function.fileHandler.pyramid.analysisImage
+        assert process.call_args.args[3] == (
+            function.fileHandler.flipH,
+            function.fileHandler.flipV,
+        )
 
 
 def test_processPhotometry_2(function):
-    function.fileHandler.image = None
-    with mock.patch.object(function, "clearGui"):
+    function.ui.photometryGroup.setChecked(True)
+    function.fileHandler.pyramid = None
+    with (
+        mock.patch.object(function.photometry, "processPhotometry") as process,
+        mock.patch.object(function, "clearGui"),
+    ):
         function.processPhotometry()
+        process.assert_not_called()
 
 
 def test_showImage_1(function):
@@ -436,6 +448,15 @@ def test_solveDone_3(function):
     function.solveDone(result=result)
 
 
+def test_solveDone_4(function):
+    function.imageSolving = Path("image.fit")
+    function.imagingDeviceStat["solve"] = True
+    function.solveDone({"success": False, "imagePath": Path("model.fit")})
+    assert function.imagingDeviceStat["solve"]
+    assert function.imageSolving == Path("image.fit")
+    function.imageSolving = None
+
+
 def test_solveImage_1(function):
     function.solveImage(Path(""))
 
@@ -447,8 +468,12 @@ def test_solveImage_2(function):
 def test_solveImage_3(function):
     shutil.copy("tests/testData/m51.fit", "tests/work/image/m51.fit")
     file = Path("tests/work/image/m51.fit")
-    with mock.patch.object(function.app.dReg["plateSolve"].instance, "solve"):
+    plateSolve = function.app.dReg["plateSolve"].instance
+    with mock.patch.object(plateSolve, "solve") as solve:
         function.solveImage(imagePath=file)
+    assert function.imageSolving == file
+    assert solve.call_args.args[2] == plateSolve.PRIORITY_INTERACTIVE
+    function.imageSolving = None
 
 
 def test_solveCurrent(function):
@@ -68,8 +68,11 @@ def test_cancelBatch_1(function):
 
 def test_cancelBatch_2(function):
     function.modelData = ModelData(App)
-    function.cancelBatch()
+    plateSolve = function.app.dReg["plateSolve"].instance
+    with mock.patch.object(plateSolve, "cancelJobs") as cancelJobs:
+        function.cancelBatch()
     assert function.modelData.cancelBatch
+    assert cancelJobs.call_args.args[0] == plateSolve.PRIORITY_BATCH
 
 
 def test_pauseBatch_1(function):
@@ -179,18 +182,14 @@ def test_checkMountTimeSync_1(function):
 
 def test_checkMountTimeSync_2(function):
     function.app.dReg["mount"].config.syncTimeNone = False
-    with mock.patch.object(
-        MWMessageDialog, "question", return_value=1
-    ):
+    with mock.patch.object(MWMessageDialog, "question", return_value=1):
         result = function.checkMountTimeSync()
         assert result
 
 
 def test_checkMountTimeSync_3(function):
     function.app.dReg["mount"].config.syncTimeNone = False
-    with mock.patch.object(
-        MWMessageDialog, "question", return_value=0
-    ):
+    with mock.patch.object(MWMessageDialog, "question", return_value=0):
         result = function.checkMountTimeSync()
         assert not result
 
@@ -317,21 +316,21 @@ def test_setModelTiming_1(function):
     function.modelData = ModelData(App())
     function.ui.progressiveTiming.setChecked(True)
     function.setModelTiming()
-    assert function.modelData.timing == function.modelData.PROGRESSIVE
+    assert function.modelData.modelTiming == function.modelData.PROGRESSIVE
 
 
 def test_setModelTiming_2(function):
     function.modelData = ModelData(App())
     function.ui.normalTiming.setChecked(True)
     function.setModelTiming()
-    assert function.modelData.timing == function.modelData.NORMAL
+    assert function.modelData.modelTiming == function.modelData.NORMAL
 
 
 def test_setModelTiming_3(function):
     function.modelData = ModelData(App())
     function.ui.conservativeTiming.setChecked(True)
     function.setModelTiming()
-    assert function.modelData.timing == function.modelData.CONSERVATIVE
+    assert function.modelData.modelTiming == function.modelData.CONSERVATIVE
 
 
 def test_runBatch_1(function):
@@ -502,6 +502,25 @@ def test_autoSortPoints_dome_active(function):
     function.ui.sortDomeAZ.setChecked(False)
 
 
+def test_autoSortPoints_slewTime_noDome(function):
+    function.app.deviceStat["dome"] = None
+    function.ui.sortSlewTime.setChecked(True)
+    with mock.patch.object(function.app.buildPoint, "sortSlewTime") as mockSort:
+        function.autoSortPoints()
+        mockSort.assert_called_once_with(withDome=False)
+    function.ui.noSort.setChecked(True)
+
+
+def test_autoSortPoints_slewTime_dome(function):
+    function.app.deviceStat["dome"] = True
+    function.ui.sortSlewTime.setChecked(True)
+    with mock.patch.object(function.app.buildPoint, "sortSlewTime") as mockSort:
+        function.autoSortPoints()
+        mockSort.assert_called_once_with(withDome=True)
+    function.app.deviceStat["dome"] = None
+    function.ui.noSort.setChecked(True)
+
+
 def test_genBuildDSO_iteration_exhausted(function):
     function.app.mount.obsSite.raJNow = 0
     function.app.mount.obsSite.decJNow = 0
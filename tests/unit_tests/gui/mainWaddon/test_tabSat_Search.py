@@ -20,8 +20,8 @@ import pytest
 from mw4.gui.mainWaddon.tabSat_Search import SatSearch, SatSearchSignals
 from mw4.gui.utilities.qtMain import MWidget
 from mw4.gui.widgets.main_ui import Ui_MainWindow
+from mw4.logic.satellites.satellite_batch import SatBatchResult
 from pathlib import Path
-from PySide6.QtCore import QRect
 from PySide6.QtWidgets import QTableWidgetItem
 from skyfield.api import EarthSatellite
 from tests.unit_tests.unitTestAddOns.baseTestApp import App
@@ -246,317 +246,137 @@ def test_calcSatListDynamic_3(function: SatSearch) -> None:
         function.calcSatListDynamic()
 
 
-def test_calcSatListDynamic_4(function: SatSearch) -> None:
-    function.satellites.dataValid = True
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-    function.satellites.objects = {"NOAA 8": sat}
-
-    function.ui.mainTabWidget.setCurrentIndex(5)
-    function.ui.listSats.setRowCount(0)
-    function.ui.listSats.insertRow(0)
-    entry = QTableWidgetItem("test")
-    function.ui.listSats.setItem(0, 0, entry)
-    with (
-        mock.patch.object(function.ui.satTabWidget, "isVisible", return_value=True),
-        mock.patch.object(QRect, "intersects", return_value=False),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "calcAppMag", return_value=10),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSunlit", return_value=True),
-    ):
-        function.calcSatListDynamic()
-
-
-def test_calcSatListDynamic_5(function: SatSearch) -> None:
-    function.satellites.dataValid = True
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-    function.satellites.objects = {"NOAA 8": sat}
+NOAA_8 = [
+    "NOAA 8",
+    "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
+    "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
+]
 
-    function.ui.mainTabWidget.setCurrentIndex(5)
-    function.ui.listSats.setRowCount(0)
-    function.ui.listSats.insertRow(0)
-    entry = QTableWidgetItem("test")
-    function.ui.listSats.setItem(0, 0, entry)
-    function.ui.listSats.setRowHidden(0, True)
-    with (
-        mock.patch.object(function.ui.satTabWidget, "isVisible", return_value=True),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSunlit",
-                          return_value=True),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "calcAppMag",
-                          return_value=10),
-        mock.patch.object(QRect, "intersects", return_value=True),
-    ):
-        function.calcSatListDynamic()
 
+def prepareSatRow(function: SatSearch, hidden: bool = False) -> None:
+    sat = EarthSatellite(NOAA_8[1], NOAA_8[2], name=NOAA_8[0])
 
-def test_calcSatListDynamic_6(function: SatSearch) -> None:
-    function.satellites.dataValid = True
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
+    class Test:
+        objects: ClassVar = {"NOAA 8": sat}
+        dataValid = True
 
-    function.ui.mainTabWidget.setCurrentIndex(5)
+    function.satellites = Test()
     function.ui.listSats.setRowCount(0)
-    function.ui.listSats.setColumnCount(2)
+    function.ui.listSats.setColumnCount(9)
     function.ui.listSats.insertRow(0)
-    entry = QTableWidgetItem("NOAA 8")
-    function.ui.listSats.setItem(0, 1, entry)
-    function.ui.listSats.setRowHidden(0, False)
-    function.satellites.objects = {"NOAA 8": sat}
-    with (
-        mock.patch.object(function.ui.satTabWidget, "isVisible", return_value=True),
-        mock.patch.object(function, "updateListSats"),
-        mock.patch.object(
-            mw4.gui.mainWaddon.tabSat_Search, "findRangeRate",
-            return_value=[1, 2, 3]
-        ),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSunlit",
-                          return_value=False),
-        mock.patch.object(QRect, "intersects", return_value=True),
-    ):
-        function.calcSatListDynamic()
-
+    function.ui.listSats.setItem(0, 0, QTableWidgetItem("13923"))
+    function.ui.listSats.setItem(0, 1, QTableWidgetItem("NOAA 8"))
+    function.ui.listSats.setRowHidden(0, hidden)
 
-def test_calcSatListDynamic_7(function: SatSearch) -> None:
-    function.satellites.dataValid = True
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
 
-    function.ui.mainTabWidget.setCurrentIndex(5)
-    function.ui.listSats.setRowCount(0)
-    function.ui.listSats.setColumnCount(2)
-    function.ui.listSats.insertRow(0)
-    entry = QTableWidgetItem("NOAA 8")
-    function.ui.listSats.setItem(0, 1, entry)
-    function.ui.listSats.setRowHidden(0, False)
-    function.satellites.objects = {"NOAA 8": sat}
+def test_calcSatListDynamic_4(function: SatSearch) -> None:
+    prepareSatRow(function, hidden=True)
+    function.ui.satTabWidget.setCurrentIndex(0)
     with (
         mock.patch.object(function.ui.satTabWidget, "isVisible", return_value=True),
-        mock.patch.object(function, "updateListSats"),
-        mock.patch.object(
-            mw4.gui.mainWaddon.tabSat_Search, "findRangeRate",
-            return_value=[1, 2, 3]
-        ),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSunlit",
-                          return_value=True),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "calcAppMag",
-                          return_value=10),
-        mock.patch.object(QRect, "intersects", return_value=True),
+        mock.patch.object(function, "showSatStates") as show,
     ):
         function.calcSatListDynamic()
+    assert not show.called
 
 
-def test_calcSatListDynamic_8(function: SatSearch) -> None:
-    function.satellites.dataValid = True
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-    function.ui.mainTabWidget.setCurrentIndex(5)
-    function.ui.listSats.setRowCount(0)
-    function.ui.listSats.setColumnCount(2)
-    function.ui.listSats.insertRow(0)
-    entry = QTableWidgetItem("NOAA 8")
-    function.ui.listSats.setItem(0, 1, entry)
-    function.ui.listSats.setRowHidden(0, False)
-    function.satellites.objects = {"NOAA 8": sat}
+def test_calcSatListDynamic_5(function: SatSearch) -> None:
+    prepareSatRow(function)
+    function.ui.satTabWidget.setCurrentIndex(0)
     with (
         mock.patch.object(function.ui.satTabWidget, "isVisible", return_value=True),
-        mock.patch.object(function, "updateListSats"),
-        mock.patch.object(
-            mw4.gui.mainWaddon.tabSat_Search, "findRangeRate",
-            return_value=[np.nan, 2, 3]
-        ),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSunlit",
-                          return_value=True),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "calcAppMag",
-                          return_value=10),
-        mock.patch.object(QRect, "intersects", return_value=True),
+        mock.patch.object(function, "updateListSats") as update,
     ):
         function.calcSatListDynamic()
+    assert update.call_count == 1
+    assert update.call_args.args[0] == 0
+    assert not np.isnan(update.call_args.args[1][0])
+
+
+def test_showSatStates_1(function: SatSearch) -> None:
+    states = SatBatchResult(
+        satRange=np.array([1000.0]),
+        radRate=np.array([1.0]),
+        latRate=np.array([0.1]),
+        lonRate=np.array([0.1]),
+        isSunlit=np.array([True]),
+        appMag=np.array([3.0]),
+    )
+    with mock.patch.object(function, "updateListSats") as update:
+        function.showSatStates([0], states)
+    assert update.call_args.kwargs["appMag"] == 3.0
+
+
+def test_showSatStates_2(function: SatSearch) -> None:
+    states = SatBatchResult(
+        satRange=np.array([np.nan]),
+        radRate=np.array([np.nan]),
+        latRate=np.array([np.nan]),
+        lonRate=np.array([np.nan]),
+        isSunlit=np.array([False]),
+        appMag=np.array([99.0]),
+    )
+    with mock.patch.object(function, "updateListSats") as update:
+        function.showSatStates([0], states, np.array([np.nan]), np.array([5]))
+    assert update.call_args.args[2:] == ([], False, 99, 4)
+
+
+def test_showSatStates_3(function: SatSearch) -> None:
+    states = SatBatchResult(
+        satRange=np.array([1000.0, 2000.0]),
+        radRate=np.array([1.0, 1.0]),
+        latRate=np.array([0.1, 0.1]),
+        lonRate=np.array([0.1, 0.1]),
+        isSunlit=np.array([True, False]),
+        appMag=np.array([3.0, 99.0]),
+    )
+    timesUp = np.array([2459318.9, np.nan])
+    with mock.patch.object(function, "updateListSats") as update:
+        function.showSatStates([0, 1], states, timesUp, np.array([2, 5]))
+    assert update.call_args_list[0].args[2][0].tt == pytest.approx(2459318.9)
+    assert update.call_args_list[1].args[2] == []
 
 
 def test_checkSatOk_1(function: SatSearch) -> None:
-    tle = [
-        "STARLINK-1914",
-        "1 47180U 20088BL  21303.19708368  .16584525  12000-4  30219-2 0  9999",
-        "2 47180  53.0402 223.8709 0008872 210.0671 150.2394 16.31518727 52528",
-    ]
-    ts = function.app.dReg["mount"].obsSite.ts
-    tEnd = ts.tt_jd(2459523.2430)
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-    suc = function.checkSatOk(sat, tEnd)
+    sat = EarthSatellite(NOAA_8[1], NOAA_8[2], name=NOAA_8[0])
+    suc = function.checkSatOk(sat, "mean motion less than 0.0")
     assert not suc
 
 
 def test_checkSatOk_2(function: SatSearch) -> None:
-    tle = [
-        "CALSPHERE 1",
-        "1 00900U 64063C   21307.74429300  .00000461  00000-0  48370-3 0  9996",
-        "2 00900  90.1716  36.8626 0025754 343.8320 164.5583 13.73613883839670",
-    ]
-    ts = function.app.dReg["mount"].obsSite.ts
-    tEnd = ts.tt_jd(2459523.2430)
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-    suc = function.checkSatOk(sat, tEnd)
+    sat = EarthSatellite(NOAA_8[1], NOAA_8[2], name=NOAA_8[0])
+    suc = function.checkSatOk(sat, None)
     assert suc
 
 
-def test_calcSat_1(function: SatSearch) -> None:
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-
-    with (
-        mock.patch.object(
-            mw4.gui.mainWaddon.tabSat_Search, "findRangeRate", return_value=(1, 1, 1, 1)
-        ),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSunlit", return_value=False),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSatUp"),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "checkTwilight"),
-        mock.patch.object(function, "updateListSats"),
-    ):
-        function.calcSat(sat, 0, 0, 0, 0, 0, 0)
-
-
-def test_calcSat_2(function: SatSearch) -> None:
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-
-    with (
-        mock.patch.object(
-            mw4.gui.mainWaddon.tabSat_Search, "findRangeRate", return_value=(1, 1, 1, 1)
-        ),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSunlit",
-                          return_value=True),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "findSatUp"),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "checkTwilight"),
-        mock.patch.object(mw4.gui.mainWaddon.tabSat_Search, "calcAppMag",
-                          return_value=0),
-        mock.patch.object(function, "updateListSats"),
-    ):
-        function.calcSat(sat, 0, 0, 0, 0, 0, 0)
-
-
-def test_calcSat_3(function: SatSearch) -> None:
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-
-    with (
-        mock.patch.object(
-            mw4.gui.mainWaddon.tabSat_Search, "findRangeRate",
-            return_value=(np.nan, 0, 0, 0)
-        ),
-        mock.patch.object(function, "updateListSats"),
-    ):
-        function.calcSat(sat, 0, 0, 0, 0, 0, 0)
-
-
 def test_runnerCalcSatList_1(function: SatSearch) -> None:
     function.ui.listSats.setRowCount(0)
     function.runnerCalcSatList()
 
 
 def test_runnerCalcSatList_2(function: SatSearch) -> None:
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-
-    class Test:
-        objects: ClassVar = {"sat1": sat}
-
-    function.satellites = Test()
-    function.ui.listSats.setRowCount(0)
-    function.ui.listSats.setColumnCount(9)
-    function.ui.listSats.insertRow(0)
-    entry = QTableWidgetItem("sat1")
-    function.ui.listSats.setItem(0, 1, entry)
-
-    with mock.patch.object(function, "checkSatOk", return_value=False):
+    prepareSatRow(function)
+    with (
+        mock.patch.object(function, "checkSatOk", return_value=False),
+        mock.patch.object(function, "showSatStates") as show,
+    ):
         function.runnerCalcSatList()
+    assert not show.called
 
 
 def test_runnerCalcSatList_3(function: SatSearch) -> None:
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-
-    class Test:
-        objects: ClassVar = {"sat1": sat}
-
-    function.satellites = Test()
-    function.ui.listSats.setRowCount(0)
-    function.ui.listSats.setColumnCount(9)
-    function.ui.listSats.insertRow(0)
-    entry = QTableWidgetItem("sat1")
-    function.ui.listSats.setItem(0, 1, entry)
-
-    with (
-        mock.patch.object(function, "checkSatOk", return_value=True),
-        mock.patch.object(function, "calcSat"),
-    ):
+    prepareSatRow(function)
+    with mock.patch.object(function, "updateListSats") as update:
         function.runnerCalcSatList()
+    assert update.call_count == 1
 
 
 def test_runnerCalcSatList_4(function: SatSearch) -> None:
     """Test runnerCalcSatList with hidden row - hidden rows are still processed."""
-    tle = [
-        "NOAA 8",
-        "1 13923U 83022A   20076.90417581  .00000005  00000-0  19448-4 0  9998",
-        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
-    ]
-    sat = EarthSatellite(tle[1], tle[2], name=tle[0])
-
-    class Test:
-        objects: ClassVar = {"sat1": sat}
-
-    function.satellites = Test()
-    function.ui.listSats.setRowCount(0)
-    function.ui.listSats.setColumnCount(9)
-    function.ui.listSats.insertRow(0)
-    entry = QTableWidgetItem("sat1")
-    function.ui.listSats.setItem(0, 1, entry)
-    function.ui.listSats.setRowHidden(0, True)
-
-    with (
-        mock.patch.object(function, "checkSatOk", return_value=True),
-        mock.patch.object(function, "calcSat"),
-    ):
+    prepareSatRow(function, hidden=True)
+    with mock.patch.object(function, "updateListSats") as update:
         function.runnerCalcSatList()
+    assert update.call_count == 1
 
 
 def test_calcSatList_1(function: SatSearch) -> None:
@@ -15,6 +15,7 @@
 ###########################################################
 import mw4.gui
 import mw4.gui.utilities.qtMain
+import numpy as np
 import pytest
 from mw4.gui.mainWaddon.astroObjects import AstroObjects
 from mw4.gui.mainWaddon.tabSat_Track import SatTrack
@@ -559,7 +560,9 @@ def test_filterHorizonForward_1(function):
     alt = [5, 6, 7, 45, 46, 47, 48, 7, 6, 5]
     az = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
     function.app.data.horizonP = [[40, 0], [40, 360]]
-    with mock.patch.object(function.app.buildPoint, "isAboveHorizon", return_value=False):
+    with mock.patch.object(
+        function.app.buildPoint, "isAboveHorizonBatch", return_value=np.zeros(10, dtype=bool)
+    ):
         alt, az, delay = function.filterHorizonForward(alt, az)
         assert delay == 10
 
@@ -568,7 +571,9 @@ def test_filterHorizonForward_2(function):
     alt = [5, 6, 7, 45, 46, 47, 48, 7, 6, 5]
     az = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
     function.app.data.horizonP = [[40, 0], [40, 360]]
-    with mock.patch.object(function.app.data, "isAboveHorizon", return_value=True):
+    with mock.patch.object(
+        function.app.buildPoint, "isAboveHorizonBatch", return_value=np.ones(10, dtype=bool)
+    ):
         alt, az, delay = function.filterHorizonForward(alt, az)
         assert delay == 0
 
@@ -577,7 +582,9 @@ def test_filterHorizonReverse_1(function):
     alt = [5, 6, 7, 45, 46, 47, 48, 7, 6, 5]
     az = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
     function.app.data.horizonP = [[40, 0], [40, 360]]
-    with mock.patch.object(function.app.buildPoint, "isAboveHorizon", return_value=False):
+    with mock.patch.object(
+        function.app.buildPoint, "isAboveHorizonBatch", return_value=np.zeros(10, dtype=bool)
+    ):
         alt, az, delay = function.filterHorizonReverse(alt, az)
         assert delay == 10
 
@@ -586,7 +593,9 @@ def test_filterHorizonReverse_2(function):
     alt = [5, 6, 7, 45, 46, 47, 48, 7, 6, 5]
     az = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
     function.app.data.horizonP = [[40, 0], [40, 360]]
-    with mock.patch.object(function.app.data, "isAboveHorizon", return_value=True):
+    with mock.patch.object(
+        function.app.buildPoint, "isAboveHorizonBatch", return_value=np.ones(10, dtype=bool)
+    ):
         alt, az, delay = function.filterHorizonReverse(alt, az)
         assert delay == 0
 
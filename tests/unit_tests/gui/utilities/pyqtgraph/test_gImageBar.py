@@ -16,6 +16,7 @@
 import numpy as np
 import pytest
 from mw4.gui.utilities.pyqtgraph.gImageBar import ImageBar
+from mw4.logic.file.imagePyramid import ImagePyramid
 from unittest import mock
 
 
@@ -54,6 +55,56 @@ def test_ImageBar_setImage_3():
     assert suc
 
 
+def test_ImageBar_setImage_4():
+    function = ImageBar()
+    img = np.random.rand(50, 100)
+    suc = function.setImage(img, size=(400, 200))
+    assert suc
+    assert function.imageItem.mapRectToParent(function.imageItem.boundingRect()).width() == 400
+
+
+def test_ImageBar_setImagePyramid_1():
+    function = ImageBar()
+    pyramid = ImagePyramid(np.random.rand(200, 300) + 1)
+    with mock.patch.object(function.tileTimer, "start") as start:
+        suc = function.setImagePyramid(pyramid)
+        assert suc
+        start.assert_called_once()
+    assert function.pyramid is pyramid
+    function.setImage(np.random.rand(10, 10))
+    assert function.pyramid is None
+
+
+def test_ImageBar_updateTile_1():
+    function = ImageBar()
+    assert not function.updateTile()
+
+
+def test_ImageBar_updateTile_2():
+    function = ImageBar()
+    function.setImagePyramid(ImagePyramid(np.random.rand(200, 300) + 1))
+    assert not function.updateTile()
+
+
+def test_ImageBar_updateTile_3():
+    function = ImageBar()
+    with mock.patch.object(ImagePyramid, "PREVIEW_SIZE", 100):
+        pyramid = ImagePyramid(np.random.rand(200, 300) + 1)
+    function.setImagePyramid(pyramid)
+    function.p[0].getViewBox().setRange(xRange=(10, 110), yRange=(20, 120), padding=0)
+    with mock.patch.object(pyramid, "stepForScale", return_value=1):
+        assert function.updateTile()
+    assert function.tileItem.isVisible()
+    assert function.tileItem.image.shape == (100, 100)
+
+
+def test_ImageBar_updateTile_4():
+    function = ImageBar()
+    function.setImagePyramid(ImagePyramid(np.random.rand(200, 300) + 1))
+    function.p[0].getViewBox().setRange(xRange=(-500, -400), yRange=(10, 50), padding=0)
+    assert not function.updateTile()
+
+
 def test_ImageBar_showCrosshair():
     function = ImageBar()
     function.lx = mock.MagicMock()
@@ -273,26 +273,6 @@ def test_setStatusBuildPFailed(function):
     assert function.buildP[1][2] == 1
 
 
-def test_isCloseHorizonLine_1(function):
-    point = (45, 45)
-    margin = 5
-    azI = range(0, 361, 1)
-    altI = np.interp(azI, [0, 90, 180, 360], [42, 42, 42, 42])
-    horizonI = np.asarray([[x, y] for x, y in zip(azI, altI)])
-    suc = function.isCloseHorizonLine(point, margin, horizonI)
-    assert suc
-
-
-def test_isCloseHorizonLine_2(function):
-    point = (45, 45)
-    margin = 1
-    azI = range(0, 361, 1)
-    altI = np.interp(azI, [0, 90, 180, 360], [42, 42, 42, 42])
-    horizonI = np.asarray([[x, y] for x, y in zip(azI, altI)])
-    suc = function.isCloseHorizonLine(point, margin, horizonI)
-    assert not suc
-
-
 def test_isAboveHorizon_1(function):
     function.clearHorizonP()
     suc = function.isAboveHorizon([10, 50])
@@ -311,6 +291,33 @@ def test_isAboveHorizon_2(function):
     assert suc
 
 
+def test_isAboveHorizonBatch_1(function):
+    function.horizonP = [[20, 0], [20, 360]]
+    isAbove = function.isAboveHorizonBatch(np.array([10, 30]), np.array([50, 50]))
+    assert list(isAbove) == [False, True]
+
+
+def test_horizonMask_1(function):
+    function.horizonP = [[20, 0], [20, 360]]
+    mask = function.horizonMask
+    assert function.horizonMask is mask
+    function.addHorizonP([30, 360], 2)
+    assert function.horizonMask is not mask
+    mask = function.horizonMask
+    function.delHorizonP(2)
+    assert function.horizonMask is not mask
+    mask = function.horizonMask
+    function.clearHorizonP()
+    assert function.horizonMask is not mask
+
+
+def test_horizonMask_2(function):
+    function.horizonP = [[20, 0], [20, 360]]
+    mask = function.horizonMask
+    function.horizonP = [[20, 0], [20, 360]]
+    assert function.horizonMask is not mask
+
+
 def test_isCloseMeridian_2(function):
     function.app.mount.setting.meridianLimitSlew = 5
     function.app.mount.setting.meridianLimitTrack = 5
@@ -367,6 +374,13 @@ def test_deleteCloseHorizonLine_2(function):
     function.deleteCloseHorizonLine(0)
 
 
+def test_deleteCloseHorizonLine_3(function):
+    function.buildP = [[45, 45, 1], [30, 100, 1], [42, 200, 1]]
+    function.horizonP = [[42, 0], [42, 360]]
+    function.deleteCloseHorizonLine(5)
+    assert function.buildP == [[30, 100, 1]]
+
+
 def test_sortAz_1(function):
     function.buildP = [[10, 10, 1], [5, 40, 1], [350, 60, 1], [180, 20, 1]]
     function.sortAz()
@@ -377,19 +391,70 @@ def test_sortAz_1(function):
 
 
 def test_sortDomeAz_1(function):
-    function.buildP = [[10, 10, 1]]
+    function.buildP = [[10, 10, 1], [20, 20, 1], [30, 30, 1]]
     with mock.patch.object(
-        function.app.mount, "calcMountAltAzToDomeAltAz", return_value=(10, Angle(degrees=350))
+        function.app.mount,
+        "calcMountAltAzToDomeAltAzBatch",
+        return_value=(None, Angle(degrees=np.array([100, 350, 200]))),
     ):
         function.sortDomeAz()
+    assert function.buildP == [[20, 20, 0], [30, 30, 0], [10, 10, 0]]
 
 
 def test_sortDomeAz_2(function):
-    function.buildP = [[10, 10, 1]]
+    function.buildP = [[10, 10, 1], [20, 20, 1]]
     with mock.patch.object(
-        function.app.mount, "calcMountAltAzToDomeAltAz", return_value=(10, None)
+        function.app.mount,
+        "calcMountAltAzToDomeAltAzBatch",
+        return_value=(None, Angle(degrees=np.array([np.nan, 20]))),
     ):
         function.sortDomeAz()
+    assert function.buildP == [[20, 20, 0]]
+
+
+def test_sortDomeAz_3(function):
+    function.buildP = []
+    with mock.patch.object(function.app.mount, "calcMountAltAzToDomeAltAzBatch") as calc:
+        function.sortDomeAz()
+    assert not calc.called
+
+
+def test_sortSlewTime_1(function):
+    function.buildP = [[10, 10, 1]]
+    with mock.patch("mw4.logic.buildData.buildpoints.SlewPath") as slewPath:
+        function.sortSlewTime()
+    assert not slewPath.called
+
+
+def test_sortSlewTime_2(function):
+    function.app.mount.obsSite.location = wgs84.latlon(
+        latitude_degrees=48, longitude_degrees=11
+    )
+    function.app.mount.obsSite.Alt = Angle(degrees=60)
+    function.app.mount.obsSite.Az = Angle(degrees=90)
+    function.app.mount.obsSite.pierside = "W"
+    points = [[40, 270, 0], [40, 100, 0], [40, 260, 0], [40, 80, 0]]
+    function.buildP = list(points)
+    function.sortSlewTime()
+    assert function.buildP == [points[1], points[3], points[0], points[2]]
+
+
+def test_sortSlewTime_3(function):
+    function.app.mount.obsSite.location = wgs84.latlon(
+        latitude_degrees=48, longitude_degrees=11
+    )
+    function.app.mount.obsSite.Alt = Angle(degrees=60)
+    function.app.mount.obsSite.Az = Angle(degrees=90)
+    function.app.mount.obsSite.pierside = "W"
+    function.buildP = [[40, 270, 0], [40, 100, 0], [40, 260, 0]]
+    with mock.patch.object(
+        function.app.mount,
+        "calcMountAltAzToDomeAltAzBatch",
+        return_value=(None, Angle(degrees=np.array([0, 270, 100, 260]))),
+    ) as calc:
+        function.sortSlewTime(withDome=True)
+    assert calc.called
+    assert len(function.buildP) == 3
 
 
 def test_sortAlt_1(function):
@@ -1107,23 +1172,6 @@ def test_loadHorizonP_with_txt_extension(function):
     assert len(function.horizonP) == 3
 
 
-def test_sortDomeAz_multiple_points(function):
-    """Test sortDomeAz with multiple points returning angles"""
-    function.buildP = [[10, 10, 1], [20, 20, 1], [30, 30, 1]]
-    angle1 = Angle(degrees=350)
-    angle2 = Angle(degrees=200)
-    angle3 = Angle(degrees=100)
-
-    with mock.patch.object(
-        function.app.mount,
-        "calcMountAltAzToDomeAltAz",
-        side_effect=[(None, angle1), (None, angle2), (None, angle3)],
-    ):
-        function.sortDomeAz()
-        # Should be sorted by dome azimuth descending
-        assert len(function.buildP) == 3
-
-
 def test_sortActualPierside_preserves_coordinates(function):
     """Test sortActualPierside maintains coordinate integrity"""
     function.buildP = [[45, 90, 1], [50, 200, 1]]
@@ -0,0 +1,80 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+from mw4.logic.buildData.horizonMask import HorizonMask
+
+
+def test_init_1():
+    mask = HorizonMask([])
+    assert mask.source == ()
+    assert len(mask.azimuth) == 3601
+    assert not mask.altitude.any()
+
+
+def test_init_2():
+    mask = HorizonMask([[10, 0], [30, 180], [10, 360]])
+    assert mask.altitude[0] == 10
+    assert mask.altitude[900] == 20
+    assert mask.altitude[1800] == 30
+
+
+def test_altitudeAt_1():
+    mask = HorizonMask([[0, 0], [36, 360]])
+    alt = mask.altitudeAt([-10, 0, 100.04, 370])
+    assert np.allclose(alt, [0, 0, 10, 36])
+
+
+def test_isAbove_1():
+    mask = HorizonMask([[20, 0], [20, 360]])
+    isAbove = mask.isAbove([10, 20, 30, 50], [10, 100, 200, 400])
+    assert list(isAbove) == [False, False, True, True]
+
+
+def test_isAbove_2():
+    mask = HorizonMask([])
+    assert mask.isAbove(10, 50)
+    assert not mask.isAbove(-10, 50)
+
+
+def test_isAbove_3():
+    horizon = [[10, 0], [40, 90], [5, 200], [25, 360]]
+    mask = HorizonMask(horizon)
+    alt = np.random.uniform(0, 60, 1000)
+    az = np.random.uniform(0, 360, 1000)
+    refAlt = np.interp(az, [x[1] for x in horizon], [x[0] for x in horizon])
+    isAbove = mask.isAbove(alt, az)
+    clear = np.abs(alt - refAlt) > 0.1
+    assert np.array_equal(isAbove[clear], (alt > refAlt)[clear])
+
+
+def test_distance_1():
+    mask = HorizonMask([[42, 0], [42, 360]])
+    dist = mask.distance([45, 42, 50], [45, 100, 200])
+    assert np.allclose(dist, [3, 0, 8])
+
+
+def test_isClose_1():
+    mask = HorizonMask([[42, 0], [42, 360]])
+    isClose = mask.isClose([45, 45], [45, 45], 5)
+    assert isClose.all()
+    isClose = mask.isClose([45], [45], 1)
+    assert not isClose.any()
+
+
+def test_isClose_2():
+    mask = HorizonMask([[42, 0], [42, 360]])
+    isClose = mask.isClose([], [], 1)
+    assert len(isClose) == 0
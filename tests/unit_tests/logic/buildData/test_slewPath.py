@@ -0,0 +1,106 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import itertools
+import numpy as np
+from mw4.logic.buildData.slewPath import SlewPath
+from unittest import mock
+
+
+def randomTimes(number: int, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    ha = rng.uniform(-90, 90, number)
+    dec = rng.uniform(-20, 85, number)
+    pierside = np.where(ha < 0, "W", "E")
+    domeAz = rng.uniform(0, 360, number)
+    return SlewPath(2, 3).slewTimes(ha, dec, pierside, domeAz)
+
+
+def test_axisPositions_1():
+    raAxis, decAxis = SlewPath.axisPositions([-30, 30], [40, 40], ["W", "E"])
+    assert np.allclose(raAxis, [60, -60])
+    assert np.allclose(decAxis, [40, 140])
+
+
+def test_slewTimes_1():
+    times = SlewPath(2).slewTimes([-30, -10], [40, 80], ["W", "W"])
+    assert np.allclose(times, [[0, 20], [20, 0]])
+
+
+def test_slewTimes_2():
+    times = SlewPath(2).slewTimes([-10, 10], [40, 40], ["W", "E"])
+    assert times[0, 1] == 80 + SlewPath.FLIP_TIME
+    assert times[1, 0] == times[0, 1]
+
+
+def test_slewTimes_3():
+    times = SlewPath(2, 1).slewTimes([-30, -10], [40, 40], ["W", "W"], [350, 100])
+    assert np.allclose(times, [[0, 110], [110, 0]])
+
+
+def test_slewTimes_4():
+    times = SlewPath(2, 1).slewTimes([-30, -10], [40, 40], ["W", "W"], [np.nan, 100])
+    assert np.allclose(times, [[0, 10], [10, 0]])
+
+
+def test_pathTime_1():
+    times = np.array([[0, 1, 5], [1, 0, 2], [5, 2, 0]])
+    assert SlewPath.pathTime(times, [0, 1, 2]) == 3
+    assert SlewPath.pathTime(times, [0, 2, 1]) == 7
+
+
+def test_nearestNeighbor_1():
+    times = np.array([[0, 3, 1], [3, 0, 2], [1, 2, 0]])
+    assert SlewPath.nearestNeighbor(times) == [0, 2, 1]
+
+
+def test_optimize_1():
+    assert SlewPath(2).optimize(np.zeros((1, 1))) == []
+    assert SlewPath(2).optimize(np.zeros((2, 2))) == [0]
+
+
+def test_optimize_2():
+    times = randomTimes(8)
+    slewPath = SlewPath(2)
+    order = slewPath.optimize(times)
+    best = min(
+        slewPath.pathTime(times, [0, *[index + 1 for index in path]])
+        for path in itertools.permutations(range(7))
+    )
+    assert sorted(order) == list(range(7))
+    assert np.isclose(slewPath.pathTime(times, [0, *[index + 1 for index in order]]), best)
+
+
+def test_optimize_3():
+    times = randomTimes(100)
+    slewPath = SlewPath(2)
+    order = slewPath.optimize(times)
+    path = [0, *[index + 1 for index in order]]
+    assert sorted(order) == list(range(99))
+    assert slewPath.pathTime(times, path) <= slewPath.pathTime(
+        times, slewPath.nearestNeighbor(times)
+    )
+
+
+def test_optimize_4():
+    times = randomTimes(50)
+    slewPath = SlewPath(2)
+    with (
+        mock.patch.object(slewPath, "twoOpt") as twoOpt,
+        mock.patch("mw4.logic.buildData.slewPath.time.monotonic", side_effect=[0, 0, 5]),
+    ):
+        order = slewPath.optimize(times)
+    twoOpt.assert_called_once()
+    assert order == [index - 1 for index in slewPath.nearestNeighbor(times)[1:]]
@@ -14,7 +14,6 @@
 #
 ###########################################################
 import importlib
-import mw4.logic
 import mw4.logic.camera.camera as cameraModule
 import platform
 import pytest
@@ -244,15 +243,16 @@ def test_sendGain_2(function) -> None:
         function.sendGain()
 
 
-def test_writeImageFitsHeader_1(function) -> None:
-    hdu = fits.HDUList()
-    hdu.append(fits.PrimaryHDU())
+def test_writeImageFitsHeader_1(function, tmp_path) -> None:
+    function.imagePath = tmp_path / "test.fits"
+    fits.PrimaryHDU().writeto(function.imagePath)
     with (
-        mock.patch.object(fits, "open", return_value=hdu),
-        mock.patch.object(mw4.logic.camera.camera, "writeHeaderPointing"),
-        mock.patch.object(mw4.logic.camera.camera, "writeHeaderCamera"),
+        mock.patch.object(cameraModule, "writeHeaderCamera", side_effect=lambda h, *_: h),
+        mock.patch.object(cameraModule, "writeHeaderPointing", side_effect=lambda h, _: h),
+        mock.patch.object(cameraModule, "updateHeader", wraps=cameraModule.updateHeader) as u,
     ):
         function.writeImageFitsHeader()
+        assert u.call_args.args[0] == function.imagePath
 
 
 @pytest.mark.skipif(platform.system() != "Windows", reason="Windows needed")
@@ -13,7 +13,10 @@
 # License APL2.0
 #
 ###########################################################
+import io
+import numpy as np
 import pytest
+import requests
 from mw4.base.alpacaClass import AlpacaClass
 from mw4.logic.camera.camera import Camera
 from mw4.logic.camera.cameraAlpaca import CameraAlpaca
@@ -75,3 +78,73 @@ def test_startCommunication_2(function):
     ):
         function.startCommunication()
         m_start.assert_called_once()
+
+
+class Response:
+    def __init__(self, contentType, raw=None, value=None):
+        self.headers = {"content-type": contentType}
+        self.raw = raw
+        self.value = value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.value
+
+
+def test_imageFromJson_1(function):
+    data = function.imageFromJson({"ErrorNumber": 0, "Value": [[1, 2], [3, 4]]})
+    assert data.dtype == np.uint16
+    assert np.array_equal(data, [[1, 3], [2, 4]])
+
+
+def test_imageFromJson_2(function):
+    with pytest.raises(ValueError):
+        function.imageFromJson({"ErrorNumber": 1031, "ErrorMessage": "not connected"})
+
+
+def test_getImageData_1(function):
+    header = np.array([1, 0, 0, 0, 44, 2, 8, 2, 3, 2, 0], dtype="<i4").tobytes()
+    pixels = np.arange(6, dtype="<u2").tobytes()
+    response = Response("application/imagebytes", raw=io.BytesIO(header + pixels))
+    with mock.patch.object(function, "session") as session:
+        session.get.return_value = response
+        data = function.getImageData()
+    assert np.array_equal(data, [[0, 2, 4], [1, 3, 5]])
+    kwargs = session.get.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert "application/imagebytes" in kwargs["headers"]["Accept"]
+    assert kwargs["params"]["ClientID"] == function.CLIENT_ID
+
+
+def test_getImageData_2(function):
+    response = Response("application/json", value={"ErrorNumber": 0, "Value": [[7, 8]]})
+    with mock.patch.object(function, "session") as session:
+        session.get.return_value = response
+        data = function.getImageData()
+    assert np.array_equal(data, [[7], [8]])
+
+
+def test_getImageData_3(function):
+    with mock.patch.object(function, "session") as session:
+        session.get.side_effect = requests.ConnectionError("down")
+        assert function.getImageData() is None
+
+
+def test_getImageData_4(function):
+    response = Response("application/imagebytes", raw=io.BytesIO(bytes(10)))
+    with mock.patch.object(function, "session") as session:
+        session.get.return_value = response
+        assert function.getImageData() is None
+
+
+def test_getImageData_5(function):
+    function.session = None
+    assert function.getImageData() is None
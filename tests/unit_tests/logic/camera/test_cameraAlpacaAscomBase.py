@@ -13,8 +13,9 @@
 # License APL2.0
 #
 ###########################################################
+import numpy as np
 import pytest
-from astropy.io import fits
+from mw4.logic.camera import cameraAlpacaAscomBase
 from mw4.logic.camera.camera import Camera
 from mw4.logic.camera.cameraAlpacaAscomBase import CameraAlpacaAscomBase
 from tests.unit_tests.unitTestAddOns.baseTestApp import App
@@ -183,6 +184,33 @@ def test_setExposureState_stateNot2Exposing(function):
     function.parent.exposing = False
 
 
+def test_getImageData_1(function):
+    with mock.patch.object(function, "getDeviceProp", return_value=None):
+        assert function.getImageData() is None
+
+
+def test_getImageData_2(function):
+    with mock.patch.object(function, "getDeviceProp", return_value=[[1, 2, 3], [4, 5, 6]]):
+        data = function.getImageData()
+    assert data.dtype == np.uint16
+    assert np.array_equal(data, [[1, 4], [2, 5], [3, 6]])
+
+
+def test_setExposureState_noImageData(function):
+    function.parent.exposing = True
+    function.exposing = True
+    with (
+        mock.patch.object(function, "getDeviceProp", side_effect=[0, True, True]),
+        mock.patch.object(function, "getImageData", return_value=None),
+        mock.patch.object(cameraAlpacaAscomBase, "writeImage") as mw,
+    ):
+        function.setExposureState()
+    mw.assert_not_called()
+    assert function.exposing is True
+    function.exposing = False
+    function.parent.exposing = False
+
+
 def test_setExposureState_stateNot2ExposingImageReady(function):
     # state != 2, self.exposing=True, ImageReady=True
     # -> saves and finishes
@@ -193,7 +221,7 @@ def test_setExposureState_stateNot2ExposingImageReady(function):
         mock.patch.object(function, "getDeviceProp", side_effect=[0, True, True, fakeImage]),
         mock.patch.object(function.parent, "writeImageFitsHeader"),
         mock.patch.object(function.parent, "exposeFinished") as mf,
-        mock.patch.object(fits.PrimaryHDU, "writeto"),
+        mock.patch.object(cameraAlpacaAscomBase, "writeImage"),
     ):
         function.setExposureState()
     assert function.exposing is False
@@ -223,7 +251,7 @@ def test_setExposureState_state2NotExposingImageReady(function):
         mock.patch.object(function, "getDeviceProp", side_effect=[2, True, True, fakeImage]),
         mock.patch.object(function.parent, "writeImageFitsHeader"),
         mock.patch.object(function.parent, "exposeFinished") as mf,
-        mock.patch.object(fits.PrimaryHDU, "writeto"),
+        mock.patch.object(cameraAlpacaAscomBase, "writeImage"),
     ):
         function.setExposureState()
     assert function.exposing is False
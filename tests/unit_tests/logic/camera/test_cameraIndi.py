@@ -13,6 +13,7 @@
 # License APL2.0
 #
 ###########################################################
+import numpy as np
 import pytest
 from mw4.base.indiClass import IndiClass
 from mw4.logic.camera.camera import Camera
@@ -21,6 +22,7 @@ from pathlib import Path
 from queue import Queue
 from tests.unit_tests.unitTestAddOns.baseTestApp import App
 from unittest import mock
+from xisf import XISF
 
 
 @pytest.fixture(autouse=True, scope="module")
@@ -298,41 +300,32 @@ def test_addOffsetLimits_without_min_max(function):
 # ---------------------------------------------------------------------------
 
 
-def test_writeImageXisfHeader(function):
-    """writeImageXisfHeader reads XISF, sets FITSKeywords, and calls XISF.write."""
-    function.parent.imagePath = Path("tests/work/temp/capture.xisf")
-    mock_xisf_instance = mock.MagicMock()
-    mock_xisf_instance.get_file_metadata.return_value = {"meta": "data"}
-    mock_ims_meta = [{"FITSKeywords": {}}]
-    mock_xisf_instance.get_images_metadata.return_value = mock_ims_meta
-    mock_xisf_instance.read_image.return_value = mock.MagicMock()
+def test_writeImageXisfHeader_1(function, tmp_path):
+    imagePath = tmp_path / "capture.xisf"
+    XISF.write(imagePath, np.ones((16, 16, 1), dtype=np.uint16))
+    function.parent.imagePath = imagePath
+    function.writeImageXisfHeader()
+    meta = XISF(imagePath).get_images_metadata()[0]["FITSKeywords"]
+    assert meta["OBJECT"][0]["value"] == "SKY_OBJECT"
+    assert meta["AUTHOR"][0]["value"] == "MountWizzard4"
+    assert meta["FRAME"] == [{"value": "Light", "comment": "Modeling works with light frames"}]
+    assert (XISF(imagePath).read_image(0) == 1).all()
 
-    with mock.patch("mw4.logic.camera.cameraIndi.XISF") as mock_xisf_cls:
-        mock_xisf_cls.return_value = mock_xisf_instance
+
+def test_writeImageXisfHeader_2(function, tmp_path):
+    imagePath = tmp_path / "capture.xisf"
+    imagePath.write_bytes(b"SIMPLE  =")
+    function.parent.imagePath = imagePath
+    with mock.patch.object(function.log, "warning") as warning:
         function.writeImageXisfHeader()
+        warning.assert_called_once()
+
 
-        mock_xisf_cls.assert_called_once_with(function.parent.imagePath)
-        mock_xisf_instance.get_file_metadata.assert_called_once()
-        mock_xisf_instance.get_images_metadata.assert_called_once()
-        mock_xisf_instance.read_image.assert_called_once_with(0)
-        assert mock_ims_meta[0]["FITSKeywords"]["OBJECT"] == [
-            {"value": "SKY_OBJECT", "comment": "default name from MW4"}
-        ]
-        assert mock_ims_meta[0]["FITSKeywords"]["AUTHOR"] == [
-            {"value": "MountWizzard4", "comment": "default name from MW4"}
-        ]
-        assert mock_ims_meta[0]["FITSKeywords"]["FRAME"] == [
-            {"value": "Light", "comment": "Modeling works with light frames"}
-        ]
-        mock_xisf_cls.write.assert_called_once_with(
-            function.parent.imagePath,
-            mock_xisf_instance.read_image.return_value,
-            creator_app="MountWizzard4",
-            image_metadata=mock_ims_meta[0],
-            xisf_metadata={"meta": "data"},
-            codec="lz4hc",
-            shuffle=True,
-        )
+def test_writeImageXisfHeader_3(function, tmp_path):
+    function.parent.imagePath = tmp_path / "missing.xisf"
+    with mock.patch.object(function.log, "warning") as warning:
+        function.writeImageXisfHeader()
+        warning.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
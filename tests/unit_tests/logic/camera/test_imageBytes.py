@@ -0,0 +1,113 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import io
+import numpy as np
+import pytest
+from mw4.logic.camera.imageBytes import (
+    HEADER_LENGTH,
+    ImageBytesHeader,
+    readExactly,
+    readImageBytes,
+)
+
+
+def imageBytes(data, transmissionType=8, errorNumber=0, dataStart=HEADER_LENGTH, rank=2):
+    shape = list(data.shape) + [0] * (3 - data.ndim)
+    header = np.array(
+        [1, errorNumber, 2, 3, dataStart, 2, transmissionType, rank, *shape], dtype="<i4"
+    )
+    padding = bytes(dataStart - HEADER_LENGTH)
+    return io.BytesIO(header.tobytes() + padding + data.tobytes())
+
+
+class ChunkedStream(io.RawIOBase):
+    def __init__(self, content, chunk):
+        self.content = content
+        self.position = 0
+        self.chunk = chunk
+
+    def readinto(self, buffer):
+        part = self.content[self.position : self.position + min(self.chunk, len(buffer))]
+        buffer[: len(part)] = part
+        self.position += len(part)
+        return len(part)
+
+
+def test_header_fromBytes_1():
+    raw = np.arange(11, dtype="<i4").tobytes()
+    header = ImageBytesHeader.fromBytes(raw)
+    assert header.metadataVersion == 0
+    assert header.dimension3 == 10
+    assert header.shape == (8, 9)
+
+
+def test_header_fromBytes_2():
+    with pytest.raises(ValueError):
+        ImageBytesHeader.fromBytes(bytes(10))
+
+
+def test_header_shape():
+    header = ImageBytesHeader(1, 0, 0, 0, 44, 2, 2, 3, 4, 5, 3)
+    assert header.shape == (4, 5, 3)
+
+
+def test_readExactly_1():
+    buffer = bytearray(10)
+    readExactly(ChunkedStream(bytes(range(10)), 3), memoryview(buffer))
+    assert buffer == bytes(range(10))
+
+
+def test_readExactly_2():
+    with pytest.raises(ValueError):
+        readExactly(io.BytesIO(bytes(5)), memoryview(bytearray(10)))
+
+
+def test_readImageBytes_1():
+    data = np.arange(12, dtype="<u2").reshape((4, 3))
+    image = readImageBytes(imageBytes(data))
+    assert image.shape == (3, 4)
+    assert np.array_equal(image, data.transpose())
+
+
+def test_readImageBytes_2():
+    data = np.arange(12, dtype="<i4").reshape((4, 3)) * 1000
+    image = readImageBytes(imageBytes(data, transmissionType=2, dataStart=64))
+    assert np.array_equal(image, data.transpose())
+
+
+def test_readImageBytes_3():
+    data = np.arange(24, dtype="u1").reshape((4, 2, 3))
+    image = readImageBytes(imageBytes(data, transmissionType=6, rank=3))
+    assert image.shape == (3, 2, 4)
+    assert np.array_equal(image, data.transpose())
+
+
+def test_readImageBytes_4():
+    data = np.arange(1000, dtype="<u2").reshape((40, 25))
+    content = imageBytes(data).getvalue()
+    image = readImageBytes(ChunkedStream(content, 77))
+    assert np.array_equal(image, data.transpose())
+
+
+def test_readImageBytes_5():
+    stream = imageBytes(np.frombuffer(b"Not ready", dtype="u1"), errorNumber=0x40B)
+    with pytest.raises(ValueError, match="Not ready"):
+        readImageBytes(stream)
+
+
+def test_readImageBytes_6():
+    with pytest.raises(ValueError):
+        readImageBytes(imageBytes(np.zeros((2, 2), dtype="<u2"), transmissionType=99))
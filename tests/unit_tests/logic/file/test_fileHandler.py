@@ -13,11 +13,14 @@
 # License APL2.0
 #
 ###########################################################
+import mw4.logic.file.fileHandler
 import numpy as np
 import pytest
 import shutil
 from astropy.io import fits
 from mw4.logic.file.fileHandler import FileHandler, FileHandlerSignals
+from mw4.logic.file.imagePyramid import ImagePyramid
+from mw4.logic.fits.fitsHeader import writeImage
 from pathlib import Path
 from tests.unit_tests.unitTestAddOns.baseTestApp import App
 from unittest import mock
@@ -41,116 +44,65 @@ def test_signals(function):
     FileHandlerSignals()
 
 
-def test_debayerImage_1(function):
-    function.w = 100
-    function.h = 100
-    function.image = np.random.rand(100, 100)
-    suc = function.debayerImage("GBRG")
-    assert suc
-    assert function.image.shape == (100, 100)
-
-
-def test_debayerImage_2(function):
-    function.w = 100
-    function.h = 100
-    function.image = np.random.rand(100, 100)
-    suc = function.debayerImage("RGGB")
-    assert suc
-    assert function.image.shape == (100, 100)
-
-
-def test_debayerImage_3(function):
-    function.w = 100
-    function.h = 100
-    function.image = np.random.rand(100, 100)
-    suc = function.debayerImage("GRBG")
-    assert suc
-    assert function.image.shape == (100, 100)
-
-
-def test_debayerImage_4(function):
-    function.w = 100
-    function.h = 100
-    function.image = np.random.rand(100, 100)
-    suc = function.debayerImage("BGGR")
-    assert suc
-    assert function.image.shape == (100, 100)
-
-
-def test_debayerImage_5(function):
-    function.w = 100
-    function.h = 100
-    function.image = np.random.rand(100, 100)
-    suc = function.debayerImage("test")
-    assert not suc
+def test_image_1(function):
+    function.image = None
+    function.pyramid = ImagePyramid(np.ones((100, 100)))
     assert function.image.shape == (100, 100)
+    assert function.image is function.pyramid.fullImage()
 
 
-def test_cleanImageFormat_1(function):
-    function.image = np.random.rand(100, 100) + 1
-    function.flipV = False
-    function.flipH = True
-    function.cleanImageFormat()
-    assert function.image.dtype == np.dtype("uint8")
+def test_image_2(function):
+    function.image = None
+    function.pyramid = None
+    assert function.image is None
 
 
 def test_checkValidImageFormat_1(function):
-    function.image = None
+    function.data = None
     suc = function.checkValidImageFormat()
     assert not suc
 
 
 def test_checkValidImageFormat_2(function):
-    function.image = np.random.rand(100, 100)
+    function.data = np.random.rand(100, 100)
     function.header = None
     suc = function.checkValidImageFormat()
     assert not suc
 
 
 def test_checkValidImageFormat_3(function):
-    function.image = np.random.rand(100, 100)
+    function.data = np.random.rand(100, 100)
     function.header = {}
     suc = function.checkValidImageFormat()
     assert not suc
 
 
 def test_checkValidImageFormat_4(function):
-    function.image = np.random.rand(100, 100)
+    function.data = np.random.rand(100, 100)
     function.header = {"NAXIS": 2}
     suc = function.checkValidImageFormat()
     assert suc
 
 
-def test_loadFITS_1(function):
-    class Data:
-        data = np.random.rand(100, 100)
-        header = None
-
-    class HDUList:
-        def __enter__(self):
-            return [Data(), Data()]
-
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            return
-
-    with mock.patch.object(fits, "open", return_value=HDUList()):
-        function.loadFITS()
-
-
-def test_loadFITS_2(function):
-    class Data:
-        data = None
-        header = None
-
-    class HDUList:
-        def __enter__(self):
-            return [Data(), Data()]
+def test_loadFITS_1(function, tmp_path):
+    data = np.arange(600, dtype=np.uint16).reshape((20, 30))
+    function.imagePath = tmp_path / "test.fits"
+    fits.PrimaryHDU(data).writeto(function.imagePath)
+    function.loadFITS()
+    assert not isinstance(function.data, np.memmap)
+    assert function.scaling == (1, 32768)
+    assert function.header["NAXIS1"] == 30
+    writeImage(function.imagePath, np.zeros((5, 5), dtype=np.uint16))
+    assert np.array_equal(function.data.astype(int) + 32768, data)
 
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            return
 
-    with mock.patch.object(fits, "open", return_value=HDUList()):
-        function.loadFITS()
+def test_loadFITS_2(function, tmp_path):
+    data = np.arange(600, dtype=np.float32).reshape((20, 30))
+    function.imagePath = tmp_path / "test.fits"
+    hduList = fits.HDUList([fits.PrimaryHDU(), fits.CompImageHDU(data)])
+    hduList.writeto(function.imagePath)
+    function.loadFITS()
+    assert np.array_equal(function.data, data)
 
 
 def test_convHeaderXISF2FITS(function):
@@ -210,10 +162,11 @@ def test_workerLoadImage_3(function):
     with (
         mock.patch.object(function, "loadFITS"),
         mock.patch.object(function, "checkValidImageFormat", return_value=True),
-        mock.patch.object(function, "cleanImageFormat"),
-        mock.patch.object(function, "debayerImage"),
+        mock.patch.object(mw4.logic.file.fileHandler, "ImagePyramid") as pyramid,
     ):
         function.runnerLoadImage(imageFileName)
+        assert pyramid.call_args.args[3] == "RGGB"
+        assert function.pyramid is pyramid.return_value
 
 
 def test_loadImage_1(function):
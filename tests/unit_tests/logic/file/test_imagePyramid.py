@@ -0,0 +1,157 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+import pytest
+from mw4.logic.file.imagePyramid import ImagePyramid
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(1).uniform(1, 1000, (300, 500)).astype(np.float32)
+
+
+def displayImage(data, flipH, flipV):
+    image = data if flipV else np.flipud(data)
+    image = np.fliplr(image) if flipH else image
+    return np.clip(image * 255 / np.max(data), 0, 255).astype(np.uint8)
+
+
+def test_init_1(data):
+    pyramid = ImagePyramid(data)
+    assert pyramid.previewStep == 1
+    assert pyramid.preview.shape == (300, 500)
+    assert pyramid.preview.dtype == np.uint8
+
+
+def test_init_2(data):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ImagePyramid, "PREVIEW_SIZE", 100)
+        pyramid = ImagePyramid(data)
+    assert pyramid.previewStep == 8
+    assert pyramid.preview.shape == (38, 63)
+
+
+def test_init_3(data):
+    pyramid = ImagePyramid(data, bayerPattern="test")
+    assert pyramid.bayer is None
+
+
+def test_init_5():
+    data = np.ones((400, 400), dtype=np.uint16)
+    data[1, 1] = 1000
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ImagePyramid, "PREVIEW_SIZE", 100)
+        pyramid = ImagePyramid(data, flipV=True)
+    assert not pyramid.preview[0, 0]
+    assert pyramid.scale == pytest.approx(0.255)
+    assert pyramid.tile(0, 0, 4, 4)[1, 1] == 255
+
+
+def test_maximum_1():
+    raw = np.array([[-100, 200]], dtype=np.int16)
+    pyramid = ImagePyramid(raw, scaling=(-2, 0))
+    assert pyramid.maximum() == 200
+
+
+def test_init_4():
+    pyramid = ImagePyramid(np.zeros((10, 10)))
+    assert pyramid.scale == 0
+    assert not pyramid.preview.any()
+
+
+@pytest.mark.parametrize("flipH", [False, True])
+@pytest.mark.parametrize("flipV", [False, True])
+def test_fullImage_1(data, flipH, flipV):
+    pyramid = ImagePyramid(data, flipH, flipV)
+    pyramid.BAND_ROWS = 64
+    image = pyramid.fullImage()
+    reference = displayImage(data, flipH, flipV)
+    assert np.abs(image.astype(int) - reference).max() <= 1
+    assert pyramid.fullImage() is image
+
+
+@pytest.mark.parametrize("flipH", [False, True])
+@pytest.mark.parametrize("flipV", [False, True])
+def test_tile_1(data, flipH, flipV):
+    pyramid = ImagePyramid(data, flipH, flipV)
+    tile = pyramid.tile(100, 50, 220, 170)
+    assert np.array_equal(tile, pyramid.fullImage()[50:170, 100:220])
+
+
+def test_tile_2(data):
+    pyramid = ImagePyramid(data)
+    tile = pyramid.tile(-10, -10, 1000, 1000, 4)
+    assert tile.shape == (75, 125)
+
+
+@pytest.mark.parametrize("pattern", ["GBRG", "RGGB", "GRBG", "BGGR"])
+@pytest.mark.parametrize("flipV", [False, True])
+def test_bayer_1(data, pattern, flipV):
+    pyramid = ImagePyramid(data, flipV=flipV, bayerPattern=pattern)
+    pyramid.BAND_ROWS = 50
+    image = pyramid.fullImage()
+    assert image.shape == data.shape
+    tile = pyramid.tile(101, 51, 221, 171)
+    assert np.array_equal(tile, image[51:171, 101:221])
+    assert pyramid.tile(0, 0, 500, 300, 4).shape == (75, 125)
+
+
+def test_bayer_2():
+    data = np.zeros((4, 4))
+    data[0::2, 0::2] = 100
+    pyramid = ImagePyramid(data, flipV=True, bayerPattern="RGGB")
+    assert pyramid.tile(0, 0, 4, 4, 2).shape == (2, 2)
+    assert (pyramid.tile(0, 0, 4, 4, 2) == 255).all()
+
+
+def test_scaling_1(data):
+    raw = (data - 32768).astype(np.int16)
+    pyramid = ImagePyramid(raw, scaling=(1, 32768))
+    reference = ImagePyramid(raw.astype(np.float32) + 32768)
+    assert np.array_equal(pyramid.fullImage(), reference.fullImage())
+
+
+def test_stepForScale_1(data):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ImagePyramid, "PREVIEW_SIZE", 100)
+        pyramid = ImagePyramid(data)
+    assert pyramid.stepForScale(0.5) == 1
+    assert pyramid.stepForScale(3) == 2
+    assert pyramid.stepForScale(100) == 8
+
+
+def test_level_1(data):
+    pyramid = ImagePyramid(data)
+    level = pyramid.level(2)
+    assert level.shape == (150, 250)
+    assert pyramid.level(2) is level
+
+
+def test_analysisImage_1(data):
+    raw = (data - 32768).astype(np.int16)
+    pyramid = ImagePyramid(raw, flipV=True, scaling=(1, 32768))
+    pyramid.BAND_ROWS = 64
+    analysis = pyramid.analysisImage()
+    assert analysis.dtype == np.float32
+    assert np.array_equal(analysis, raw.astype(np.float32) + 32768)
+    assert pyramid.analysisImage() is analysis
+
+
+def test_analysisImage_2(data):
+    pyramid = ImagePyramid(data)
+    reference = pyramid.tile(0, 0, 500, 300)
+    pyramid.analysisImage()
+    assert np.array_equal(pyramid.fullImage(), reference)
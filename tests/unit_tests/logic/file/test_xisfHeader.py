@@ -0,0 +1,120 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+import pytest
+import xml.etree.ElementTree as ET
+from mw4.logic.file.xisfHeader import XisfHeader
+from xisf import XISF
+
+
+@pytest.fixture
+def image():
+    return np.arange(64 * 48, dtype=np.uint16).reshape((48, 64, 1))
+
+
+def writeImage(path, image, codec=None):
+    XISF.write(path, image, creator_app="test", codec=codec, shuffle=codec is not None)
+    return path
+
+
+def test_read_1(tmp_path):
+    path = tmp_path / "test.xisf"
+    path.write_bytes(b"SIMPLE  = T" + bytes(100))
+    with pytest.raises(ValueError):
+        XisfHeader(path)
+
+
+def test_read_2(tmp_path, image):
+    header = XisfHeader(writeImage(tmp_path / "test.xisf", image))
+    assert len(header.attachments()) == 1
+    assert header.getFITSKeyword("OBJECT") is None
+
+
+def test_read_3(tmp_path, image):
+    path = writeImage(tmp_path / "test.xisf", image)
+    header = XisfHeader(path)
+    assert header.prolog.startswith(b"<?xml")
+    assert header.prolog == path.read_bytes()[16:].split(b"<xisf")[0]
+    assert header.serialize().startswith(header.prolog + b"<xisf")
+
+
+def test_read_4(tmp_path, image):
+    path = writeImage(tmp_path / "test.xisf", image)
+    header = XisfHeader(path)
+    prolog = b'<?xml version="1.0" encoding="UTF-8"?>\n<!-- created by test -->\n'
+    header.prolog = prolog
+    header.root.insert(0, ET.Comment(" inside "))
+    header.save()
+    header = XisfHeader(path)
+    assert header.prolog == prolog
+    assert b"<!-- inside -->" in header.serialize()
+    assert header.attachments()
+
+
+def test_setFITSKeyword_1(tmp_path, image):
+    header = XisfHeader(writeImage(tmp_path / "test.xisf", image))
+    header.setFITSKeyword("OBJECT", "M51", "first")
+    header.setFITSKeyword("OBJECT", "M31", "second")
+    assert header.getFITSKeyword("OBJECT") == "M31"
+    assert len(header.image().findall(header.tag("FITSKeyword"))) == 1
+
+
+@pytest.mark.parametrize("codec", [None, "lz4hc", "zlib"])
+def test_save_1(tmp_path, image, codec):
+    path = writeImage(tmp_path / "test.xisf", image, codec)
+    size = path.stat().st_size
+    header = XisfHeader(path)
+    header.setFITSKeyword("OBJECT", "SKY_OBJECT", "default name from MW4")
+    header.setFITSKeyword("FRAME", "Light")
+    assert header.save()
+    assert path.stat().st_size == size
+
+    xisf = XISF(path)
+    keywords = xisf.get_images_metadata()[0]["FITSKeywords"]
+    assert keywords["OBJECT"] == [{"value": "SKY_OBJECT", "comment": "default name from MW4"}]
+    assert keywords["FRAME"][0]["value"] == "Light"
+    assert np.array_equal(xisf.read_image(0), image)
+
+
+@pytest.mark.parametrize("codec", [None, "lz4hc"])
+def test_save_2(tmp_path, image, codec):
+    path = writeImage(tmp_path / "test.xisf", image, codec)
+    header = XisfHeader(path)
+    for i in range(200):
+        header.setFITSKeyword(f"KEY{i}", f"value{i}", "comment to fill the header")
+    assert not header.save()
+    assert not path.with_name(path.name + ".tmp").exists()
+    _, position, _ = header.attachments()[0]
+    assert position % header.BLOCK_ALIGNMENT == 0
+
+    xisf = XISF(path)
+    keywords = xisf.get_images_metadata()[0]["FITSKeywords"]
+    assert keywords["KEY199"][0]["value"] == "value199"
+    assert np.array_equal(xisf.read_image(0), image)
+    assert XisfHeader(path).save()
+
+
+def test_save_3(tmp_path, image):
+    path = writeImage(tmp_path / "test.xisf", image)
+    header = XisfHeader(path)
+    for i in range(200):
+        header.setFITSKeyword(f"KEY{i}", f"value{i}")
+    header.save()
+    header = XisfHeader(path)
+    for i in range(200):
+        header.setFITSKeyword(f"KEY{i}", "1")
+    assert header.save()
+    assert np.array_equal(XISF(path).read_image(0), image)
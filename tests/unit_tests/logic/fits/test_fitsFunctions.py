@@ -43,12 +43,12 @@ def function() -> None:
     pass
 
 
-def test_getImageHeader_1() -> None:
-    hdu = fits.HDUList()
-    hdu.append(fits.PrimaryHDU())
-    with mock.patch.object(fits, "open", return_value=hdu):
-        header = getImageHeader("test")
-        assert header == hdu[0].header
+def test_getImageHeader_1(tmp_path) -> None:
+    hdu = fits.PrimaryHDU(np.zeros((10, 10)))
+    hdu.header["OBJECT"] = "M51"
+    hdu.writeto(tmp_path / "test.fits")
+    header = getImageHeader(tmp_path / "test.fits")
+    assert header == hdu.header
 
 
 def test_getCoordinatesFromHeader_0() -> None:
@@ -356,9 +356,8 @@ def test_writeSolutionToHeader_1() -> None:
     assert result["MIRRORED"] is False
 
 
-def test_updateImageFileHeaderWithSolution_1() -> None:
-    hdu = fits.HDUList()
-    hdu.append(fits.PrimaryHDU())
+def test_updateImageFileHeaderWithSolution_1(tmp_path) -> None:
+    fits.PrimaryHDU(np.ones((10, 10))).writeto(tmp_path / "test.fits")
     solution = {
         "raJ2000S": Angle(hours=12),
         "decJ2000S": Angle(degrees=45),
@@ -366,14 +365,15 @@ def test_updateImageFileHeaderWithSolution_1() -> None:
         "scaleS": 0,
         "mirroredS": False,
     }
-    with mock.patch.object(fits, "open", return_value=hdu):
-        updateImageFileHeaderWithSolution("test", solution)
-    assert hdu[0].header["RA"] == 180
-    assert hdu[0].header["DEC"] == 45
-    assert hdu[0].header["ANGLE"] == 0
-    assert hdu[0].header["SCALE"] == 0
-    assert hdu[0].header["PIXSCALE"] == 0
-    assert hdu[0].header["MIRRORED"] is False
+    updateImageFileHeaderWithSolution(tmp_path / "test.fits", solution)
+    with fits.open(tmp_path / "test.fits") as hdu:
+        assert hdu[0].header["RA"] == 180
+        assert hdu[0].header["DEC"] == 45
+        assert hdu[0].header["ANGLE"] == 0
+        assert hdu[0].header["SCALE"] == 0
+        assert hdu[0].header["PIXSCALE"] == 0
+        assert hdu[0].header["MIRRORED"] is False
+        assert (hdu[0].data == 1).all()
 
 
 def test_getSolutionFromWCSHeader_1() -> None:
@@ -0,0 +1,209 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+import pytest
+from astropy.io import fits
+from mw4.logic.fits.fitsHeader import (
+    BLOCK_LENGTH,
+    mapImageData,
+    readHeader,
+    readHeaderBlocks,
+    readImageData,
+    updateHeader,
+    writeImage,
+)
+
+
+def createImage(path, data, **keywords):
+    hdu = fits.PrimaryHDU(data)
+    for key, value in keywords.items():
+        hdu.header[key] = value
+    hdu.writeto(path)
+    return path
+
+
+def test_readHeaderBlocks_1(tmp_path):
+    path = createImage(tmp_path / "test.fits", np.zeros((20, 30)))
+    header = readHeaderBlocks(path)
+    assert len(header) == BLOCK_LENGTH
+    assert header.startswith(b"SIMPLE  =")
+
+
+def test_readHeaderBlocks_2(tmp_path):
+    path = tmp_path / "test.fits"
+    path.write_bytes(b"NOFITS" + bytes(BLOCK_LENGTH))
+    with pytest.raises(ValueError):
+        readHeaderBlocks(path)
+
+
+def test_readHeaderBlocks_3(tmp_path):
+    path = createImage(tmp_path / "test.fits", np.zeros((20, 30)))
+    path.write_bytes(path.read_bytes()[:BLOCK_LENGTH].replace(b"END ", b"    "))
+    with pytest.raises(ValueError):
+        readHeaderBlocks(path)
+
+
+def test_readHeader_1(tmp_path):
+    keywords = {f"KEY{i}": i for i in range(60)}
+    path = createImage(tmp_path / "test.fits", np.zeros((20, 30)), **keywords)
+    header = readHeader(path)
+    assert header["NAXIS1"] == 30
+    assert header["KEY59"] == 59
+    assert len(readHeaderBlocks(path)) == 2 * BLOCK_LENGTH
+
+
+def test_readHeader_2(tmp_path):
+    path = createImage(tmp_path / "test.fits", np.zeros((20, 30)), OBJECT="M51")
+    content = path.read_bytes()
+    path.write_bytes(content.replace(b"'M51     '", "'Mé1     '".encode("latin-1")))
+    header = readHeader(path)
+    assert header["OBJECT"] == "M?1"
+    assert header["NAXIS1"] == 30
+
+
+def test_updateHeader_1(tmp_path):
+    data = np.arange(600, dtype=np.float32).reshape((20, 30))
+    path = createImage(tmp_path / "test.fits", data)
+    size = path.stat().st_size
+
+    def modify(header):
+        header.append(("OBJECT", "M51", "test"))
+        return header
+
+    assert updateHeader(path, modify)
+    assert path.stat().st_size == size
+    with fits.open(path) as hdu:
+        assert hdu[0].header["OBJECT"] == "M51"
+        assert np.array_equal(hdu[0].data, data)
+
+
+def test_updateHeader_2(tmp_path):
+    data = np.arange(600, dtype=np.int16).reshape((20, 30))
+    path = createImage(tmp_path / "test.fits", data)
+
+    def modify(header):
+        for i in range(60):
+            header.append((f"KEY{i}", i))
+        return header
+
+    assert not updateHeader(path, modify)
+    assert not path.with_name(path.name + ".tmp").exists()
+    with fits.open(path) as hdu:
+        assert hdu[0].header["KEY59"] == 59
+        assert np.array_equal(hdu[0].data, data)
+
+
+def test_updateHeader_3(tmp_path):
+    path = createImage(tmp_path / "test.fits", np.zeros((20, 30)))
+
+    def modify(header):
+        header.append(fits.Card.fromstring("object  = 'M51'"))
+        return header
+
+    with pytest.raises(fits.VerifyError):
+        updateHeader(path, modify, verify="exception")
+    assert "OBJECT" not in readHeader(path)
+    assert updateHeader(path, modify)
+    assert readHeader(path)["OBJECT"] == "M51"
+
+
+def test_mapImageData_1(tmp_path):
+    path = createImage(tmp_path / "test.fits", None)
+    assert mapImageData(path) is None
+
+
+@pytest.mark.parametrize(
+    "dataType", [np.uint8, np.int16, np.uint16, np.int32, np.float32, np.float64]
+)
+def test_mapImageData_2(tmp_path, dataType):
+    data = np.arange(600).reshape((20, 30)).astype(dataType)
+    path = createImage(tmp_path / "test.fits", data)
+    image = mapImageData(path)
+    with fits.open(path) as hdu:
+        assert np.array_equal(image, hdu[0].data)
+        assert image.dtype == hdu[0].data.dtype
+
+
+def test_mapImageData_3(tmp_path):
+    data = np.arange(600, dtype=np.int16).reshape((20, 30))
+    path = createImage(tmp_path / "test.fits", data, BSCALE=2.0, BZERO=10.0)
+    with fits.open(path) as hdu:
+        assert np.allclose(mapImageData(path), hdu[0].data)
+
+
+def test_mapImageData_4(tmp_path):
+    data = np.arange(600, dtype=np.float32).reshape((20, 30))
+    path = createImage(tmp_path / "test.fits", data)
+    assert isinstance(mapImageData(path), np.memmap)
+
+
+def test_readImageData_1(tmp_path):
+    path = createImage(tmp_path / "test.fits", None)
+    assert readImageData(path) is None
+
+
+def test_readImageData_2(tmp_path):
+    data = np.arange(600, dtype=np.int16).reshape((20, 30))
+    path = createImage(tmp_path / "test.fits", data, BSCALE=2.0, BZERO=10.0)
+    image = readImageData(path)
+    assert not isinstance(image, np.memmap)
+    with fits.open(path) as hdu:
+        assert np.allclose(image, hdu[0].data)
+    assert np.array_equal(readImageData(path, scaled=False), data)
+
+
+def test_writeImage_1(tmp_path):
+    data = np.arange(600, dtype=np.uint16).reshape((30, 20)) * 100
+    path = tmp_path / "test.fits"
+    writeImage(path, data.transpose())
+    assert path.stat().st_size % BLOCK_LENGTH == 0
+    with fits.open(path) as hdu:
+        assert hdu[0].data.dtype == np.uint16
+        assert np.array_equal(hdu[0].data, data.transpose())
+        assert hdu[0].header["BZERO"] == 32768
+
+
+def test_writeImage_2(tmp_path):
+    data = np.arange(24, dtype=np.int32).reshape((2, 3, 4))
+    path = tmp_path / "test.fits"
+    writeImage(path, data)
+    with fits.open(path) as hdu:
+        assert hdu[0].header["NAXIS1"] == 4
+        assert hdu[0].header["NAXIS3"] == 2
+        assert np.array_equal(hdu[0].data, data)
+
+
+def test_writeImage_3(tmp_path):
+    path = tmp_path / "test.fits"
+    writeImage(path, np.zeros((0, 5), dtype=np.uint16))
+    assert readHeader(path)["NAXIS2"] == 0
+
+
+def test_writeImage_4(tmp_path):
+    data = np.array([[-5.0, 0.4, 1000.6], [65535.0, 70000.0, 12.0]], dtype=">f4")
+    path = tmp_path / "test.fits"
+    writeImage(path, data.transpose())
+    with fits.open(path) as hdu:
+        assert hdu[0].data.dtype == np.uint16
+        assert np.array_equal(hdu[0].data, [[0, 65535], [0, 65535], [1000, 12]])
+
+
+def test_writeImage_5(tmp_path):
+    path = tmp_path / "test.fits"
+    path.write_bytes(b"keep")
+    with pytest.raises(ValueError):
+        writeImage(path, np.array([["a", "b"]]))
+    assert path.read_bytes() == b"keep"
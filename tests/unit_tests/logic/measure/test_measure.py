@@ -100,29 +100,13 @@ def test_checkStart_2(function):
 
 
 def test_checkStart_3(function):
-    function.data = {"time": [2, 2, 2]}
+    function.buffer.configure([])
+    for _ in range(3):
+        function.buffer.append(np.datetime64("2024-01-01T00:00:00"), [])
     function.shorteningStart = True
     function.checkStart()
-
-
-def test_checkSize_1(function):
-    function.data.clear()
-    function.data["time"] = np.array([0, 0, 0, 0, 0, 0, 0, 0])
-    function.data["directWeather-WEATHER_PARAMETERS.WEATHER_TEMPERATURE"] = np.array(
-        [0, 0, 0, 0, 0, 0, 0, 0]
-    )
-    function.MAXSIZE = 20
-    function.checkSize()
-
-
-def test_checkSize_2(function):
-    function.data.clear()
-    function.data["time"] = np.array([0, 0, 0, 0, 0, 0, 0, 0])
-    function.data["directWeather-WEATHER_PARAMETERS.WEATHER_TEMPERATURE"] = np.array(
-        [0, 0, 0, 0, 0, 0, 0, 0]
-    )
-    function.MAXSIZE = 5
-    function.checkSize()
+    assert function.buffer.size == 1
+    assert not function.shorteningStart
 
 
 def test_measureTask_1(function):
@@ -141,11 +125,28 @@ def test_measureTask_2(function):
 
     function.measuredDevices = {"directWeather": Data(data=data)}
     function.clearData()
-    with (
-        mock.patch.object(function, "checkStart"),
-        mock.patch.object(function, "checkSize"),
-    ):
+    with mock.patch.object(function, "checkStart"):
+        function.measureTask()
+
+
+def test_measureTask_3(function):
+    data = {
+        "WEATHER_PARAMETERS.WEATHER_TEMPERATURE": 10,
+        "WEATHER_PARAMETERS.WEATHER_PRESSURE": 1000,
+        "WEATHER_PARAMETERS.WEATHER_DEWPOINT": 5,
+    }
+
+    function.measuredDevices = {"directWeather": Data(data=data)}
+    function.clearData()
+    with mock.patch.object(function, "checkStart"):
+        function.measureTask()
         function.measureTask()
+    assert len(function.data["time"]) == 2
+    assert function.data["time"].dtype == np.dtype("datetime64[us]")
+    temp = function.data["directWeather-WEATHER_PARAMETERS.WEATHER_TEMPERATURE"]
+    assert list(temp) == [10, 10]
+    humidity = function.data["directWeather-WEATHER_PARAMETERS.WEATHER_HUMIDITY"]
+    assert list(humidity) == [0, 0]
 
 
 def test_collectDataDevices_noneClass(function):
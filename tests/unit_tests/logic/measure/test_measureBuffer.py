@@ -0,0 +1,118 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+import pytest
+from mw4.logic.measure.measureBuffer import MeasureBuffer
+
+T0 = np.datetime64("2024-01-01T00:00:00", "us")
+
+
+@pytest.fixture
+def function():
+    func = MeasureBuffer(capacity=4, slack=2)
+    func.configure(["a", "b"])
+    yield func
+
+
+def fill(buffer: MeasureBuffer, number: int) -> None:
+    for i in range(number):
+        buffer.append(T0 + np.timedelta64(i, "s"), [i, 10 * i])
+
+
+def test_init():
+    func = MeasureBuffer(capacity=100)
+    assert func.slack == 25
+    assert func.initial == 125
+    assert func.size == 0
+    func = MeasureBuffer(capacity=100000)
+    assert func.initial == func.INITIAL_SIZE
+
+
+def test_configure(function):
+    assert function.block.shape == (3, 6)
+    assert function.size == 0
+    data = function.views()
+    assert list(data) == ["time", "a", "b"]
+    assert len(data["time"]) == 0
+
+
+def test_append(function):
+    fill(function, 3)
+    data = function.views()
+    assert function.size == 3
+    assert data["time"][0] == T0
+    assert data["time"][2] == T0 + np.timedelta64(2, "s")
+    assert list(data["a"]) == [0, 1, 2]
+    assert list(data["b"]) == [0, 10, 20]
+
+
+def test_append_retention(function):
+    fill(function, 5)
+    data = function.views()
+    assert function.size == 4
+    assert list(data["a"]) == [1, 2, 3, 4]
+    assert data["time"][0] == T0 + np.timedelta64(1, "s")
+
+
+def test_append_compact(function):
+    fill(function, 11)
+    data = function.views()
+    assert function.size == 4
+    assert function.end <= function.block.shape[1]
+    assert list(data["a"]) == [7, 8, 9, 10]
+    assert list(data["b"]) == [70, 80, 90, 100]
+    assert data["time"][-1] == T0 + np.timedelta64(10, "s")
+
+
+def test_append_grow():
+    func = MeasureBuffer(capacity=100, slack=20, initial=8)
+    func.configure(["a", "b"])
+    fill(func, 9)
+    assert func.block.shape == (3, 16)
+    fill(func, 200)
+    assert func.block.shape == (3, 120)
+    assert func.size == 100
+
+
+def test_views_afterCompact(function):
+    fill(function, 6)
+    data = function.views()
+    function.append(T0, [99, 990])
+    assert list(data["a"]) == [2, 3, 4, 5]
+    assert not np.shares_memory(data["a"], function.block)
+    assert list(function.views()["a"]) == [3, 4, 5, 99]
+
+
+def test_append_invalidValue(function):
+    function.append(T0, [None, "abc"])
+    data = function.views()
+    assert np.isnan(data["a"][0])
+    assert np.isnan(data["b"][0])
+
+
+def test_views_zeroCopy(function):
+    fill(function, 3)
+    data = function.views()
+    assert np.shares_memory(data["a"], function.block)
+    assert np.shares_memory(data["time"], function.block)
+
+
+def test_discardOldest(function):
+    fill(function, 3)
+    function.discardOldest(2)
+    assert function.size == 1
+    function.discardOldest(5)
+    assert function.size == 0
@@ -0,0 +1,166 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import json
+import os
+import pytest
+import shutil
+from mw4.logic.modelBuild.modelIndex import ModelIndex, getModelIndex, modelIndexes
+from unittest import mock
+
+
+def writeModel(path, stars):
+    model = [
+        {"errorIndex": i, "haMountModel": ha, "decMountModel": dec}
+        for i, (ha, dec) in enumerate(stars, start=1)
+    ]
+    with open(path, "w") as outFile:
+        json.dump(model, outFile)
+
+
+@pytest.fixture
+def function(tmp_path):
+    writeModel(tmp_path / "a.model", [(1, 10), (2, 20), (3, 30), (4, 40)])
+    writeModel(tmp_path / "b.model", [(5, 50), (6, 60), (7, 70)])
+    yield ModelIndex(tmp_path)
+
+
+def test_load_1(function):
+    assert function.entries == {}
+
+
+def test_load_2(function):
+    with open(function.indexPath, "w") as outFile:
+        outFile.write("{")
+    function.load()
+    assert function.entries == {}
+
+
+def test_load_3(function):
+    with open(function.indexPath, "w") as outFile:
+        json.dump({"version": 0, "files": {"a.model": {}}}, outFile)
+    function.load()
+    assert function.entries == {}
+
+
+def test_save_1(function):
+    function.refresh()
+    function.save()
+    assert not function.changed
+    index = ModelIndex(function.modelDir)
+    assert index.entries == function.entries
+
+
+def test_save_2(function):
+    function.changed = True
+    with mock.patch("builtins.open", side_effect=OSError):
+        function.save()
+    assert function.changed
+
+
+def test_cellOf_1():
+    assert ModelIndex.cellOf(1.004, -10.004) == (100, -500)
+
+
+def test_neighbourCells_1():
+    cells = ModelIndex.neighbourCells(1, 10)
+    assert len(cells) == 9
+    assert (100, 500) in cells
+    assert (101, 501) in cells
+
+
+def test_buildEntry_1(function):
+    entry = function.buildEntry(function.modelDir / "a.model")
+    assert entry["numberPoints"] == 4
+    assert entry["cells"][0] == [100, 500]
+
+
+def test_buildEntry_2(function):
+    entry = function.buildEntry(function.modelDir / "c.model")
+    assert entry is None
+
+
+def test_addFile_1(function):
+    function.addFile(function.modelDir / "a.model")
+    assert "a.model" in function.entries
+    assert function.changed
+
+
+def test_addFile_2(function):
+    function.entries["c.model"] = {}
+    function.addFile(function.modelDir / "c.model")
+    assert "c.model" not in function.entries
+
+
+def test_refresh_1(function):
+    function.refresh()
+    assert sorted(function.entries) == ["a.model", "b.model"]
+
+
+def test_refresh_2(function):
+    function.refresh()
+    function.changed = False
+    with mock.patch.object(function, "buildEntry") as build:
+        function.refresh()
+    build.assert_not_called()
+    assert not function.changed
+
+
+def test_refresh_3(function):
+    function.refresh()
+    writeModel(function.modelDir / "a.model", [(8, 80)])
+    stat = os.stat(function.modelDir / "a.model")
+    os.utime(function.modelDir / "a.model", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    function.refresh()
+    assert function.entries["a.model"]["numberPoints"] == 1
+
+
+def test_refresh_4(function):
+    function.refresh()
+    os.remove(function.modelDir / "b.model")
+    function.refresh()
+    assert list(function.entries) == ["a.model"]
+
+
+def test_findCandidates_1(function):
+    function.refresh()
+    mountModelData = {1: {"ha": 1, "dec": 10}, 2: {"ha": 2, "dec": 20}}
+    assert function.findCandidates(mountModelData) == []
+
+
+def test_findCandidates_2(function):
+    function.refresh()
+    mountModelData = {
+        1: {"ha": 1.00005, "dec": 10},
+        2: {"ha": 2, "dec": 20.001},
+        3: {"ha": 3, "dec": 30},
+        4: {"ha": 6, "dec": 60},
+    }
+    candidates = function.findCandidates(mountModelData)
+    assert candidates == [function.modelDir / "a.model"]
+
+
+def test_findCandidates_3(function):
+    shutil.copy(function.modelDir / "a.model", function.modelDir / "0.model")
+    function.refresh()
+    mountModelData = {i: {"ha": i, "dec": i * 10} for i in range(1, 8)}
+    candidates = function.findCandidates(mountModelData)
+    assert [x.name for x in candidates] == ["0.model", "a.model", "b.model"]
+
+
+def test_getModelIndex_1(tmp_path):
+    index = getModelIndex(tmp_path)
+    assert getModelIndex(tmp_path) is index
+    del modelIndexes[tmp_path]
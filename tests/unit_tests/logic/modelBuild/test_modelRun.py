@@ -41,45 +41,192 @@ def function():
     yield function
 
 
-@pytest.fixture
-def mocked_sleepAndEvents(monkeypatch, function):
-    def test(a):
-        function.pauseBatch = False
+def test_markStage_1(function):
+    function.modelBuildData = {}
+    function.stageTimes = {}
+    function.markStage("image-000", "slew")
+    assert function.stageTimes == {}
 
-    monkeypatch.setattr("mw4.logic.modelBuild.modelRun.mainThreadSleep", test)
 
+def test_markStage_2(function):
+    function.modelBuildData = {"image-000": {}}
+    function.stageTimes = {}
+    function.markStage("image-000", "slew")
+    assert "slew" in function.stageTimes["image-000"]
 
-@pytest.fixture
-def mocked_sleepAndEvents_2(monkeypatch, function):
-    def test(a):
-        function.cancelBatch = True
 
-    monkeypatch.setattr("mw4.logic.modelBuild.modelRun.mainThreadSleep", test)
+def test_stageDurations_1(function):
+    function.stageTimes = {}
+    assert function.stageDurations("image-000") == {}
+
+
+def test_stageDurations_2(function):
+    function.stageTimes = {"image-000": {"slew": 10, "settle": 25, "expose": 27, "save": 40}}
+    assert function.stageDurations("image-000") == {"slew": 15, "settle": 2}
+
+
+def test_logStageTimings(function):
+    function.stageTimes = {
+        "image-000": {"slew": 10, "settle": 20},
+        "image-001": {"slew": 30, "settle": 60},
+    }
+    with mock.patch.object(function.log, "debug") as debug:
+        function.logStageTimings()
+    assert "slew: [20.00]" in debug.call_args.args[0]
+
+
+def test_inFlightLimit_1(function):
+    cam = function.app.dReg["camera"].instance
+    cam.widthASCOM = 100
+    cam.heightASCOM = 100
+    workers = function.app.dReg["plateSolve"].instance.NUMBER_WORKERS
+    assert function.inFlightLimit() == 2 * workers
+
+
+def test_inFlightLimit_2(function):
+    cam = function.app.dReg["camera"].instance
+    cam.widthASCOM = 20000
+    cam.heightASCOM = 20000
+    assert function.inFlightLimit() == 1
+    cam.widthASCOM = 100
+    cam.heightASCOM = 100
+
+
+def test_startSlewIfCapacity_1(function):
+    function.inFlight = {"image-000", "image-001"}
+    function.maxInFlight = 2
+    with mock.patch.object(function, "startNewSlew") as startNewSlew:
+        function.startSlewIfCapacity()
+    assert function.slewPending
+    startNewSlew.assert_not_called()
+
+
+def test_startSlewIfCapacity_2(function):
+    function.inFlight = {"image-000"}
+    function.maxInFlight = 2
+    with mock.patch.object(function, "startNewSlew") as startNewSlew:
+        function.startSlewIfCapacity()
+    assert not function.slewPending
+    startNewSlew.assert_called_once()
 
 
 def test_setImageExposed(function):
     function.modelTiming = 2
-    with mock.patch.object(function, "startNewSlew"):
-        function.setImageExposed()
+    function.inFlight = set()
+    function.maxInFlight = 1
+    with (
+        mock.patch.object(function, "startNewSlew") as startNewSlew,
+        mock.patch.object(function, "markStage") as markStage,
+    ):
+        function.setImageExposed(Path("image-000.fits"))
+    markStage.assert_called_once_with("image-000", "download")
+    startNewSlew.assert_called_once()
 
 
 def test_setImageDownloaded(function):
     function.modelTiming = 1
-    with mock.patch.object(function, "startNewSlew"):
-        function.setImageDownloaded()
+    with (
+        mock.patch.object(function, "startNewSlew") as startNewSlew,
+        mock.patch.object(function, "markStage") as markStage,
+    ):
+        function.setImageDownloaded(Path("image-000.fits"))
+    markStage.assert_called_once_with("image-000", "save")
+    startNewSlew.assert_called_once()
 
 
-def test_setImageSaved(function):
+def test_setImageSaved_1(function):
     function.modelTiming = 0
-    with mock.patch.object(function, "startNewSlew"):
-        function.setImageSaved()
+    function.exposurePending = False
+    with (
+        mock.patch.object(function, "startNewSlew") as startNewSlew,
+        mock.patch.object(function, "markStage") as markStage,
+    ):
+        function.setImageSaved(Path("image-000.fits"))
+    markStage.assert_called_once_with("image-000", "solve")
+    startNewSlew.assert_called_once()
+
+
+def test_setImageSaved_2(function):
+    function.modelTiming = 2
+    function.exposurePending = True
+    function.pauseBatch = False
+    with (
+        mock.patch.object(function, "startNewSlew") as startNewSlew,
+        mock.patch.object(function, "startNewImageExposure") as expose,
+    ):
+        function.setImageSaved(Path("image-000.fits"))
+    startNewSlew.assert_not_called()
+    expose.assert_called_once()
+
+
+def test_setImageSaved_3(function):
+    function.modelTiming = 2
+    function.exposurePending = True
+    function.pauseBatch = True
+    with mock.patch.object(function, "startNewImageExposure") as expose:
+        function.setImageSaved(Path("image-000.fits"))
+    expose.assert_not_called()
+    function.pauseBatch = False
+    function.exposurePending = False
+
+
+def test_setPauseBatch_1(function):
+    function.exposurePending = True
+    with mock.patch.object(function, "startNewImageExposure") as start:
+        function.setPauseBatch(True)
+    assert function.pauseBatch
+    start.assert_not_called()
+
+
+def test_setPauseBatch_2(function):
+    function.exposurePending = True
+    with mock.patch.object(function, "startNewImageExposure") as start:
+        function.setPauseBatch(False)
+    assert not function.pauseBatch
+    start.assert_called_once()
+
+
+def test_setPauseBatch_3(function):
+    function.exposurePending = False
+    with mock.patch.object(function, "startNewImageExposure") as start:
+        function.setPauseBatch(False)
+    start.assert_not_called()
+
+
+def test_setCancelBatch(function):
+    function.cancelBatch = False
+    with mock.patch.object(function, "checkRunFinished") as check:
+        function.setCancelBatch()
+    assert function.cancelBatch
+    check.assert_called_once()
+    function.cancelBatch = False
+
+
+def test_setEndBatch(function):
+    function.endBatch = False
+    with mock.patch.object(function, "checkRunFinished") as check:
+        function.setEndBatch()
+    assert function.endBatch
+    check.assert_called_once()
+    function.endBatch = False
 
 
 def test_startExposureAfterSlew_1(function):
     function.mountSlewed = True
     function.domeSlewed = True
-    with mock.patch.object(function, "startNewImageExposure"):
+    function.waitTimeExposure = 2
+    with mock.patch.object(function.settleTimer, "start") as start:
         function.setMountSlewed()
+    start.assert_called_once_with(2000)
+
+
+def test_startExposureAfterSlew_2(function):
+    function.mountSlewed = True
+    function.domeSlewed = False
+    function.app.dReg.d["dome"].stat = True
+    with mock.patch.object(function.settleTimer, "start") as start:
+        function.startExposureAfterSlew()
+    start.assert_not_called()
 
 
 def test_setMountSlewed_1(function):
@@ -301,8 +448,14 @@ def test_generateSaveData_1(function):
 
 def test_saveModelData_1(function):
     function.modelSaveData = [1, 2, 3]
-    with mock.patch.object(builtins, "open"), mock.patch.object(json, "dump"):
-        function.saveModelData(Path(""))
+    with (
+        mock.patch.object(builtins, "open"),
+        mock.patch.object(json, "dump"),
+        mock.patch.object(mw4.logic.modelBuild.modelRun, "getModelIndex") as getIndex,
+    ):
+        function.saveModelData(Path("tests/work/model/test.model"))
+    getIndex.assert_called_once_with(Path("tests/work/model"))
+    getIndex.return_value.addFile.assert_called_once_with(Path("tests/work/model/test.model"))
 
 
 def test_buildProgModel_1(function):
@@ -387,21 +540,61 @@ def test_addMountDataToModelBuildData_1(function):
     assert "decJNowM" in function.modelBuildData["im-00"]
 
 
-def test_startNewImageExposure_1(function, mocked_sleepAndEvents):
+def test_startNewImageExposure_1(function):
     function.cancelBatch = True
-    function.startNewImageExposure()
+    with mock.patch.object(function, "addMountDataToModelBuildData") as add:
+        function.startNewImageExposure()
+    add.assert_not_called()
+    function.cancelBatch = False
 
 
-def test_startNewImageExposure_2(function, mocked_sleepAndEvents):
+def test_startNewImageExposure_2(function):
     function.pauseBatch = True
     function.cancelBatch = False
-    function.exposureWaitTime = 1
+    function.endBatch = False
+    with mock.patch.object(function, "addMountDataToModelBuildData") as add:
+        function.startNewImageExposure()
+    add.assert_not_called()
+    assert function.exposurePending
+    function.pauseBatch = False
+
+
+def test_startNewImageExposure_3(function):
+    function.pauseBatch = False
+    function.cancelBatch = False
+    function.endBatch = False
+    function.exposurePending = True
+    function.inFlight = set()
+    function.modelRunKey = "im-00"
     function.modelBuildData = {"im-00": {"imagePath": Path("test")}}
+    function.app.dReg.d["camera"].instance.exposing = False
     with (
         mock.patch.object(function, "addMountDataToModelBuildData"),
-        mock.patch.object(function.app.dReg.d["camera"].instance, "expose"),
+        mock.patch.object(function.app.dReg.d["camera"].instance, "expose") as expose,
     ):
         function.startNewImageExposure()
+    expose.assert_called_once()
+    assert not function.exposurePending
+    assert "expose" in function.stageTimes["im-00"]
+    assert function.inFlight == {"im-00"}
+
+
+def test_startNewImageExposure_4(function):
+    function.pauseBatch = False
+    function.cancelBatch = False
+    function.endBatch = False
+    function.exposurePending = False
+    function.app.dReg.d["camera"].instance.exposing = True
+    with (
+        mock.patch.object(function, "addMountDataToModelBuildData") as add,
+        mock.patch.object(function.app.dReg.d["camera"].instance, "expose") as expose,
+    ):
+        function.startNewImageExposure()
+    add.assert_not_called()
+    expose.assert_not_called()
+    assert function.exposurePending
+    function.app.dReg.d["camera"].instance.exposing = False
+    function.exposurePending = False
 
 
 def test_startNewPlateSolve_1(function):
@@ -529,6 +722,28 @@ def test_collectPlateSolveResult_4(function):
         function.collectPlateSolveResult(result)
 
 
+def test_collectPlateSolveResult_5(function):
+    function.modelBuildData = {
+        "im-00": {"countSequence": 0, "processed": False},
+        "im-01": {"countSequence": 1, "processed": False},
+    }
+    function.inFlight = {"im-00", "im-01"}
+    function.maxInFlight = 2
+    function.slewPending = True
+    result = {"success": False, "imagePath": Path("im-01.fits"), "message": "Failed"}
+    with (
+        mock.patch.object(function, "sendModelProgress"),
+        mock.patch.object(function, "startNewSlew") as startNewSlew,
+    ):
+        function.collectPlateSolveResult(result)
+    assert function.inFlight == {"im-00"}
+    assert not function.slewPending
+    startNewSlew.assert_called_once()
+    assert list(function.modelBuildData) == ["im-00", "im-01"]
+    assert function.modelBuildData["im-01"]["processed"]
+    assert not function.modelBuildData["im-00"]["processed"]
+
+
 def test_prepareModelBuildData_1(function):
     function.modelInputData = [(5, 0, True), (20, 1, True)]
     function.app.dReg.d["mount"].instance.setting.horizonLimitLow = 10
@@ -588,14 +803,58 @@ def test_checkModelFinished_2(function):
     assert not function.checkModelFinished()
 
 
-def test_runThroughModelBuildData_1(function, mocked_sleepAndEvents_2):
+def test_isRunFinished(function):
     function.cancelBatch = False
-    function.endBatch = False
+    function.endBatch = True
+    with mock.patch.object(function, "checkModelFinished", return_value=False):
+        assert function.isRunFinished()
+        function.endBatch = False
+        assert not function.isRunFinished()
+
+
+def test_checkRunFinished_1(function):
+    function.runLoop = None
+    function.checkRunFinished()
+
+
+def test_checkRunFinished_2(function):
+    function.runLoop = mock.MagicMock()
+    function.runLoop.isRunning.return_value = True
+    with mock.patch.object(function, "isRunFinished", return_value=False):
+        function.checkRunFinished()
+    function.runLoop.quit.assert_not_called()
+    with mock.patch.object(function, "isRunFinished", return_value=True):
+        function.checkRunFinished()
+    function.runLoop.quit.assert_called_once()
+    function.runLoop = None
+
+
+def test_runThroughModelBuildData_1(function):
+    function.modelRunList = []
+    with (
+        mock.patch.object(function, "startNewSlew"),
+        mock.patch("mw4.logic.modelBuild.modelRun.QEventLoop") as loop,
+    ):
+        function.runThroughModelBuildData()
+    loop.return_value.exec.assert_not_called()
+    assert function.runLoop is None
+
+
+def test_runThroughModelBuildData_2(function):
+    function.modelRunList = ["image-000"]
+    function.modelBuildData = {"image-000": {"processed": True}}
+
+    def finish() -> None:
+        function.modelBuildData["image-000"]["processed"] = True
+
     with (
         mock.patch.object(function, "startNewSlew"),
-        mock.patch.object(function, "checkModelFinished", return_value=False),
+        mock.patch("mw4.logic.modelBuild.modelRun.QEventLoop") as loop,
     ):
+        loop.return_value.exec.side_effect = finish
         function.runThroughModelBuildData()
+    loop.return_value.exec.assert_called_once()
+    assert not function.exposurePending
 
 
 def test_generateRunIterator_1(function):
@@ -15,6 +15,7 @@
 ###########################################################
 
 import json
+import mw4.logic.modelBuild.modelIndex
 import mw4.logic.modelBuild.modelRunSupport
 import shutil
 from datetime import datetime
@@ -284,25 +285,54 @@ def test_compareFile_2():
     assert len(valOut) == 58
 
 
-def test_findFittingModel_1():
+def test_findFittingModel_1(tmp_path):
+    shutil.copy("tests/testData/test.model", tmp_path / "test.model")
+    with open("tests/testData/test.model") as inFile:
+        fileModel = json.load(inFile)
+    mountModelData = {
+        star["errorIndex"]: {"ha": star["haMountModel"], "dec": star["decMountModel"]}
+        for star in fileModel[:5]
+    }
     with mock.patch.object(
-        mw4.logic.modelBuild.modelRunSupport, "generateMountModelData", return_value={}
+        mw4.logic.modelBuild.modelRunSupport,
+        "generateMountModelData",
+        return_value=mountModelData,
     ):
-        with mock.patch.object(
-            mw4.logic.modelBuild.modelRunSupport, "compareFile", return_value=([1, 2, 3], [4])
-        ):
-            filePath, pointsOut = findFittingModel({}, Path("tests/testData"))
-        assert pointsOut == [4]
-        assert filePath == Path("tests/testData/test.model")
-
-
-def test_findFittingModel_2():
-    with mock.patch.object(
-        mw4.logic.modelBuild.modelRunSupport, "generateMountModelData", return_value={}
+        filePath, pointsOut = findFittingModel({}, tmp_path)
+    assert filePath == tmp_path / "test.model"
+    assert len(pointsOut) == 53
+    assert (tmp_path / "modelIndex.json").is_file()
+
+
+def test_findFittingModel_2(tmp_path):
+    shutil.copy("tests/testData/test.model", tmp_path / "test.model")
+    with (
+        mock.patch.object(
+            mw4.logic.modelBuild.modelRunSupport, "generateMountModelData", return_value={}
+        ),
+        mock.patch.object(mw4.logic.modelBuild.modelRunSupport, "compareFile") as compare,
     ):
-        with mock.patch.object(
+        filePath, pointsOut = findFittingModel({}, tmp_path)
+    compare.assert_not_called()
+    assert pointsOut == []
+    assert filePath == Path()
+
+
+def test_findFittingModel_3(tmp_path):
+    shutil.copy("tests/testData/test.model", tmp_path / "test.model")
+    with (
+        mock.patch.object(
+            mw4.logic.modelBuild.modelRunSupport, "generateMountModelData", return_value={}
+        ),
+        mock.patch.object(
+            mw4.logic.modelBuild.modelIndex.ModelIndex,
+            "findCandidates",
+            return_value=[tmp_path / "test.model"],
+        ),
+        mock.patch.object(
             mw4.logic.modelBuild.modelRunSupport, "compareFile", return_value=([1], [4])
-        ):
-            filePath, pointsOut = findFittingModel({}, Path("tests/testData"))
-        assert pointsOut == [4]
-        assert filePath == Path()
+        ),
+    ):
+        filePath, pointsOut = findFittingModel({}, tmp_path)
+    assert pointsOut == [4]
+    assert filePath == Path()
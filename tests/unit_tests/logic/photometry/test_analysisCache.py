@@ -0,0 +1,101 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import hashlib
+import numpy as np
+import os
+import pytest
+from mw4.logic.photometry.analysisCache import AnalysisCache
+from unittest import mock
+
+
+@pytest.fixture
+def function():
+    return AnalysisCache()
+
+
+def test_contentKey_1(function, tmp_path):
+    imagePath = tmp_path / "test.fits"
+    imagePath.write_bytes(b"test")
+    copyPath = tmp_path / "copy.fits"
+    copyPath.write_bytes(b"test")
+    key = function.contentKey(imagePath)
+    assert key == hashlib.blake2b(b"test").hexdigest()
+    assert function.contentKey(copyPath) == key
+
+
+def test_contentKey_2(function, tmp_path):
+    imagePath = tmp_path / "test.fits"
+    imagePath.write_bytes(b"test")
+    key = function.contentKey(imagePath)
+    with mock.patch.object(hashlib, "file_digest") as digest:
+        assert function.contentKey(imagePath) == key
+        digest.assert_not_called()
+
+
+def test_contentKey_3(function, tmp_path):
+    imagePath = tmp_path / "test.fits"
+    imagePath.write_bytes(b"test")
+    key = function.contentKey(imagePath)
+    imagePath.write_bytes(b"new")
+    os.utime(imagePath, ns=(1, 1))
+    assert function.contentKey(imagePath) != key
+
+
+def test_contentKey_4(function, tmp_path):
+    with pytest.raises(OSError):
+        function.contentKey(tmp_path / "missing.fits")
+
+
+def test_result_1(function):
+    assert function.result("a", (30, 3.0)) is None
+    function.store("a", (30, 3.0), {"hfr": 1})
+    assert function.result("a", (30, 3.0)) == {"hfr": 1}
+    assert function.result("a", (20, 3.0)) is None
+
+
+def test_entry_1(function):
+    for key in "abcde":
+        function.store(key, 0, {})
+    assert list(function.entries) == ["b", "c", "d", "e"]
+    function.result("b", 0)
+    function.store("f", 0, {})
+    assert list(function.entries) == ["d", "e", "b", "f"]
+
+
+def test_resultBytes(function):
+    result = {"hfr": np.zeros(10, dtype=np.float32), "hfrMedian": 1.0}
+    assert function.resultBytes(result) == 40
+
+
+def test_store_1(function):
+    function.store("a", 0, {"hfr": np.zeros(10)})
+    function.store("a", 0, {"hfr": np.zeros(20)})
+    function.store("a", 1, {"hfr": np.zeros(5)})
+    assert function.entries["a"].nbytes == 200
+
+
+def test_store_2(function):
+    with mock.patch.object(AnalysisCache, "MAX_BYTES", 1000):
+        function.store("a", 0, {"background": np.zeros(100)})
+        function.store("b", 0, {"background": np.zeros(100)})
+        assert list(function.entries) == ["b"]
+        function.store("c", 0, {"background": np.zeros(200)})
+        assert list(function.entries) == ["c"]
+
+
+def test_result_2(function):
+    function.result("a", 0)
+    assert function.entries == {}
@@ -0,0 +1,96 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+import pytest
+from mw4.logic.photometry.gridInterpolator import GridInterpolator
+from scipy.interpolate import griddata
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(5)
+    x = rng.uniform(0, 400, 500)
+    y = rng.uniform(0, 300, 500)
+    xm, ym = np.meshgrid(np.linspace(0, 400, 80), np.linspace(0, 300, 60))
+    values = rng.uniform(1, 5, 500)
+    return x, y, xm, ym, values
+
+
+def test_init(points):
+    x, y, xm, ym, _ = points
+    interpolator = GridInterpolator(x, y, xm, ym)
+    assert interpolator.shape == (60, 80)
+    assert interpolator.nearest.shape == (60, 80)
+    assert interpolator.weights.shape == (interpolator.inside.sum(), 3)
+    assert np.allclose(interpolator.weights.sum(axis=1), 1)
+
+
+def test_spacing():
+    assert GridInterpolator.spacing(np.array([0, 2.5, 5])) == 2.5
+    assert GridInterpolator.spacing(np.array([3])) == 1
+
+
+def test_nearestNode_1():
+    axis = np.array([0, 10, 20, 30])
+    values = np.array([-5, 4, 6, 14, 29, 35])
+    nodes = GridInterpolator.nearestNode(axis, values)
+    assert np.array_equal(nodes, [0, 0, 1, 1, 3, 3])
+
+
+def test_nearestNode_2():
+    nodes = GridInterpolator.nearestNode(np.array([5]), np.array([1, 9]))
+    assert np.array_equal(nodes, [0, 0])
+
+
+def test_nearestGrid_1(points):
+    _, _, xm, ym, _ = points
+    rng = np.random.default_rng(6)
+    nodes = rng.choice(xm.size, 300, replace=False)
+    x = xm.ravel()[nodes]
+    y = ym.ravel()[nodes]
+    interpolator = GridInterpolator(x, y, xm, ym)
+    nearest = interpolator.nearestGrid(np.arange(len(x)))
+    expected = griddata((x, y), np.arange(len(x)), (xm, ym), method="nearest").astype(int)
+    distance = np.hypot(x[nearest] - xm, y[nearest] - ym)
+    minimum = np.hypot(x[expected] - xm, y[expected] - ym)
+    assert np.allclose(distance, minimum)
+
+
+def test_nearestGrid_2(points):
+    x, y, xm, ym, _ = points
+    interpolator = GridInterpolator(x, y, xm, ym)
+    nearest = interpolator.nearestGrid(np.arange(len(x)))
+    distance = np.hypot(x[nearest] - xm, y[nearest] - ym)
+    expected = griddata((x, y), np.arange(len(x)), (xm, ym), method="nearest").astype(int)
+    minimum = np.hypot(x[expected] - xm, y[expected] - ym)
+    nodeSpacing = np.hypot(xm[0, 1] - xm[0, 0], ym[1, 0] - ym[0, 0])
+    assert np.all(distance <= minimum + nodeSpacing)
+
+
+def test_linearGrid_1(points):
+    x, y, xm, ym, values = points
+    interpolator = GridInterpolator(x, y, xm, ym)
+    fill = np.min(values)
+    expected = griddata((x, y), values, (xm, ym), method="linear", fill_value=fill)
+    assert np.allclose(interpolator.linearGrid(values, fillValue=fill), expected)
+
+
+def test_linearGrid_2(points):
+    x, y, xm, ym, values = points
+    interpolator = GridInterpolator(x, y, xm, ym)
+    grid = interpolator.linearGrid(values)
+    assert np.isnan(grid).sum() == np.sum(~interpolator.inside)
+    assert not interpolator.inside.all()
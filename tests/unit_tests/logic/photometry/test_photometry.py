@@ -14,11 +14,12 @@
 #
 ###########################################################
 
-import mw4.logic.photometry.photometry
 import numpy as np
 import pytest
 import sep
+from mw4.logic.photometry.analysisCache import AnalysisCache
 from mw4.logic.photometry.photometry import Photometry, PhotometrySignals
+from pathlib import Path
 from tests.unit_tests.unitTestAddOns.baseTestApp import App
 from unittest import mock
 
@@ -43,30 +44,28 @@ def test_signals(function):
 def test_workerGetHFR(function):
     function.filterConstH = 5
     function.filterConstW = 5
-    function.xm = np.linspace(0, 100, 100)
-    function.ym = np.linspace(0, 100, 100)
-    function.objs = {"x": np.linspace(0, 100, 20), "y": np.linspace(0, 100, 20)}
-    function.hfr = np.ones((20, 30))
+    function.xm, function.ym = np.meshgrid(np.linspace(0, 100, 100), np.linspace(0, 50, 20))
+    rng = np.random.default_rng(1)
+    function.objs = {"x": rng.uniform(0, 100, 30), "y": rng.uniform(0, 50, 30)}
+    function.hfr = np.ones(30)
+    function.calcInterpolator()
     function.runnerGetHFR()
-    assert function.hfrGrid.shape[0] == 100
+    assert function.hfrGrid.shape == (20, 100)
 
 
 def test_workerGetRoundness(function):
     function.filterConstH = 5
     function.filterConstW = 5
-    function.xm = np.linspace(0, 100, 100)
-    function.ym = np.linspace(0, 100, 100)
     function.objs = {
         "x": np.linspace(0, 100, 20),
         "y": np.linspace(0, 100, 20),
-        "a": np.random.rand(20, 1) + 1,
-        "b": np.random.rand(20, 1) + 1,
+        "a": np.random.rand(20) + 1,
+        "b": np.random.rand(20) + 1,
     }
-    with mock.patch.object(
-        mw4.logic.photometry.photometry, "griddata", return_value=np.ones((20, 100))
-    ):
-        function.runnerGetRoundness()
-        assert len(function.roundnessGrid) == 20
+    function.interpolator = mock.Mock()
+    function.interpolator.linearGrid.return_value = np.ones((20, 100))
+    function.runnerGetRoundness()
+    assert len(function.roundnessGrid) == 20
 
 
 def test_workerCalcTiltValuesSquare(function):
@@ -111,8 +110,9 @@ def test_showTabBackground(function):
     img = np.random.rand(100, 100) + 1
     function.filterConstH = 5
     function.filterConstW = 5
-    function.bkg = sep.Background(img)
-    function.backSignal = function.bkg.back()
+    bkg = sep.Background(img)
+    function.backGlobal = bkg.globalback
+    function.backSignal = bkg.back()
     function.calcBackground()
 
 
@@ -120,8 +120,7 @@ def test_showTabBackgroundRMS(function):
     img = np.random.rand(100, 100) + 1
     function.filterConstH = 5
     function.filterConstW = 5
-    function.bkg = sep.Background(img)
-    function.backRMS = function.bkg.rms()
+    function.backRMS = sep.Background(img).rms()
     function.calcBackgroundRMS()
 
 
@@ -136,6 +135,7 @@ def test_runCalcs_1(function):
     function.hfr = np.array([1, 2, 3])
     with (
         mock.patch.object(function, "baseCalcs"),
+        mock.patch.object(function, "calcInterpolator"),
         mock.patch.object(function, "runnerGetHFR"),
         mock.patch.object(function, "runnerCalcTiltValuesSquare"),
         mock.patch.object(function, "runnerCalcTiltValuesTriangle"),
@@ -151,6 +151,7 @@ def test_runCalcs_2(function):
     function.hfr = np.array([1] * 20)
     with (
         mock.patch.object(function, "baseCalcs"),
+        mock.patch.object(function, "calcInterpolator"),
         mock.patch.object(function, "runnerGetHFR"),
         mock.patch.object(function, "runnerCalcTiltValuesSquare"),
         mock.patch.object(function, "runnerCalcTiltValuesTriangle"),
@@ -171,7 +172,7 @@ def test_workerCalcPhotometry_1(function):
     function.image[49][50] = 50
     with mock.patch.object(function, "runCalcs"):
         function.runnerCalcPhotometry()
-        assert function.bkg is not None
+        assert function.backSignal.shape == (100, 100)
         assert function.hfr is not None
         assert function.objs is not None
 
@@ -203,12 +204,100 @@ def test_unlockPhotometry(function):
 
 def test_processPhotometry_2(function):
     function.lock.lock()
-    function.processPhotometry(np.array(np.random.rand(100, 100) + 1), 0)
+    with mock.patch.object(function.threadPool, "start") as start:
+        function.processPhotometry(Path("test.fits"), mock.MagicMock(), 0)
+        start.assert_not_called()
     function.lock.unlock()
 
 
 def test_processPhotometry_3(function):
-    function.image = np.array(np.random.rand(100, 100) + 1)
-    with mock.patch.object(function.threadPool, "start"):
-        function.processPhotometry(np.array(np.random.rand(100, 100) + 1), 0)
+    with mock.patch.object(function.threadPool, "start") as start:
+        function.processPhotometry(Path("test.fits"), mock.MagicMock(), 1, (True, False))
+        start.assert_called_once()
+    assert function.snTarget == function.SN[1]
+    assert function.workerCalcPhotometry.args[-1] == (True, False)
     function.lock.unlock()
+
+
+def test_snapshot_restore(function):
+    function.hfrMedian = 2.5
+    result = function.snapshot()
+    assert set(result) == set(function.RESULTS)
+    function.hfrMedian = 1
+    function.restore(result)
+    assert function.hfrMedian == 2.5
+
+
+def test_emitResults_1(function):
+    function.hfr = np.ones(5)
+    with mock.patch.object(function, "signals") as signals:
+        function.emitResults()
+        signals.hfr.emit.assert_not_called()
+
+
+def test_emitResults_2(function):
+    function.hfr = np.ones(20)
+    with mock.patch.object(function, "signals") as signals:
+        function.emitResults()
+        signals.backgroundRMS.emit.assert_called_once()
+
+
+def test_runnerAnalysis_1(function, tmp_path):
+    imagePath = tmp_path / "test.fits"
+    imagePath.write_bytes(b"image content 1")
+    image = np.random.rand(100, 100).astype(np.float32)
+    render = mock.MagicMock(return_value=image)
+    function.cache = AnalysisCache()
+    with mock.patch.object(function, "runnerCalcPhotometry") as calc:
+        function.runnerAnalysis(imagePath, render)
+        function.runnerAnalysis(imagePath, render)
+        calc.assert_called_once()
+    assert render.call_count == 2
+    assert function.image is image
+    assert "image" not in vars(function.cache.entries[function.cache.contentKey(imagePath)])
+
+
+def test_runnerAnalysis_orientation(function, tmp_path):
+    imagePath = tmp_path / "test.fits"
+    imagePath.write_bytes(b"image content 4")
+    render = mock.MagicMock(return_value=np.zeros((10, 10), dtype=np.float32))
+    function.cache = AnalysisCache()
+    with mock.patch.object(function, "runnerCalcPhotometry") as calc:
+        function.runnerAnalysis(imagePath, render, (False, False))
+        function.runnerAnalysis(imagePath, render, (True, False))
+        function.runnerAnalysis(imagePath, render, (True, False))
+        assert calc.call_count == 2
+
+
+def test_runnerAnalysis_2(function, tmp_path):
+    imagePath = tmp_path / "test.fits"
+    imagePath.write_bytes(b"image content 2")
+    copyPath = tmp_path / "copy.fits"
+    copyPath.write_bytes(b"image content 2")
+    function.cache = AnalysisCache()
+    function.hfr = np.ones(20)
+    function.hfrMedian = 3
+    with mock.patch.object(function, "runnerCalcPhotometry"):
+        function.runnerAnalysis(imagePath, mock.MagicMock())
+    function.hfrMedian = 0
+    other = Photometry(Parent(), np.zeros((1, 1)))
+    other.cache = function.cache
+    other.snTarget = function.snTarget
+    other.sepThreshold = function.sepThreshold
+    with (
+        mock.patch.object(other, "runnerCalcPhotometry") as calc,
+        mock.patch.object(other, "signals") as signals,
+    ):
+        other.runnerAnalysis(copyPath, mock.MagicMock())
+        calc.assert_not_called()
+        signals.hfr.emit.assert_called_once()
+    assert other.hfrMedian == 3
+
+
+def test_runnerAnalysis_3(function, tmp_path):
+    render = mock.MagicMock(return_value=np.zeros((10, 10)))
+    function.cache = AnalysisCache()
+    with mock.patch.object(function, "runnerCalcPhotometry") as calc:
+        function.runnerAnalysis(tmp_path / "missing.fits", render)
+        calc.assert_called_once()
+    render.assert_called_once()
@@ -0,0 +1,172 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+import pytest
+import sep
+from concurrent.futures import CancelledError
+from concurrent.futures.process import BrokenProcessPool
+from mw4.logic.photometry.tiledExtraction import TiledExtraction, extractTile
+from unittest import mock
+
+
+@pytest.fixture(scope="module")
+def image():
+    rng = np.random.default_rng(7)
+    data = rng.normal(100, 5, (600, 700)).astype(np.float32)
+    y, x = np.mgrid[-4:5, -4:5]
+    for yc, xc in zip(rng.uniform(10, 590, 300), rng.uniform(10, 690, 300)):
+        iy, ix = int(yc), int(xc)
+        star = 300 * np.exp(-((x - xc + ix) ** 2 + (y - yc + iy) ** 2) / 3)
+        data[iy - 4 : iy + 5, ix - 4 : ix + 5] += star.astype(np.float32)
+    return data
+
+
+@pytest.fixture
+def function():
+    func = TiledExtraction()
+    yield func
+    func.shutdown()
+
+
+def reference(image):
+    bkg = sep.Background(image, bw=32, bh=32)
+    back = bkg.back()
+    objs = sep.extract(image - back, 3.0, err=bkg.rms(), filter_kernel=None, minarea=7)
+    return objs, back
+
+
+def test_tiles_1(function):
+    tiles = function.tiles(100, 200)
+    assert tiles == [((0, 100, 0, 200), (0, 100, 0, 200))]
+
+
+def test_tiles_2(function):
+    with mock.patch.object(TiledExtraction, "TILE_SIZE", 256):
+        tiles = function.tiles(600, 700)
+    assert len(tiles) == 9
+    covered = np.zeros((600, 700), dtype=int)
+    for (y0, _, x0, _), (cy0, cy1, cx0, cx1) in tiles:
+        covered[y0 + cy0 : y0 + cy1, x0 + cx0 : x0 + cx1] += 1
+    assert np.all(covered == 1)
+    assert tiles[4] == ((192, 576, 192, 576), (64, 320, 64, 320))
+
+
+def test_extractTile(image):
+    data = np.ascontiguousarray(image[100:300, 200:400])
+    result = extractTile(data, 3.0, (50, 150, 50, 150), (100, 200))
+    assert result.back.shape == (100, 100)
+    assert result.rms.shape == (100, 100)
+    assert np.all((result.objs["x"] >= 249.5) & (result.objs["x"] < 349.5))
+    assert np.all((result.objs["y"] >= 149.5) & (result.objs["y"] < 249.5))
+    assert np.all(result.objs["xmin"] >= 200)
+
+
+def test_extract_1(function, image):
+    objs, back = reference(image)
+    result, resultBack, _, _ = function.extract(image, 3.0)
+    assert len(result) == len(objs)
+    assert np.allclose(resultBack, back)
+
+
+def test_extract_2(function, image):
+    objs, back = reference(image)
+    with (
+        mock.patch.object(TiledExtraction, "TILE_SIZE", 256),
+        mock.patch.object(TiledExtraction, "NUMBER_WORKERS", 1),
+    ):
+        result, resultBack, resultRMS, globalBack = function.extract(image, 3.0)
+    assert len(result) == len(objs)
+    assert np.allclose(np.sort(result["x"]), np.sort(objs["x"]), atol=0.01)
+    assert np.allclose(resultBack, back, atol=0.5)
+    assert resultRMS.shape == image.shape
+    assert globalBack == pytest.approx(100, abs=1)
+    assert function.executor is None
+
+
+def test_extract_3(function, image):
+    with (
+        mock.patch.object(TiledExtraction, "TILE_SIZE", 256),
+        mock.patch.object(TiledExtraction, "NUMBER_WORKERS", 1),
+    ):
+        local = function.extract(image, 3.0)
+    with (
+        mock.patch.object(TiledExtraction, "TILE_SIZE", 256),
+        mock.patch.object(TiledExtraction, "NUMBER_WORKERS", 2),
+        mock.patch.object(TiledExtraction, "POOL_MIN_TILES", 4),
+        mock.patch.object(TiledExtraction, "POOL_MIN_WORKERS", 2),
+    ):
+        shared = function.extract(image, 3.0)
+    assert function.executor is not None
+    assert np.array_equal(local[0], shared[0])
+    assert np.array_equal(local[1], shared[1])
+    assert np.array_equal(local[2], shared[2])
+    assert local[3] == shared[3]
+
+
+def test_extract_4(function, image):
+    with (
+        mock.patch.object(TiledExtraction, "TILE_SIZE", 256),
+        mock.patch.object(TiledExtraction, "NUMBER_WORKERS", 64),
+    ):
+        function.extract(image, 3.0)
+    assert function.executor is None
+
+
+def test_usePool(function):
+    with mock.patch.object(TiledExtraction, "NUMBER_WORKERS", 8):
+        assert function.usePool(16)
+        assert not function.usePool(9)
+    with mock.patch.object(TiledExtraction, "NUMBER_WORKERS", 4):
+        assert not function.usePool(16)
+
+
+def test_extractShared_broken(function, image):
+    tiles = function.tiles(*image.shape)
+    executor = mock.MagicMock()
+    executor.submit.return_value.result.side_effect = BrokenProcessPool
+    function.executor = executor
+    objs, _, _, _ = function.extractShared(image, 3.0, tiles)
+    assert function.executor is None
+    executor.shutdown.assert_called_once()
+    assert np.array_equal(objs, function.extractLocal(image, 3.0, tiles)[0])
+
+
+def test_extractShared_cancelled(function, image):
+    tiles = function.tiles(*image.shape)
+    executor = mock.MagicMock()
+    executor.submit.return_value.result.side_effect = CancelledError
+    function.executor = executor
+    with pytest.raises(RuntimeError):
+        function.extractShared(image, 3.0, tiles)
+    function.executor = None
+
+
+def test_dropPool(function):
+    executor = mock.MagicMock()
+    function.executor = mock.MagicMock()
+    function.dropPool(executor)
+    assert function.executor is not None
+    executor.shutdown.assert_called_once()
+    function.executor = None
+
+
+def test_shutdown(function):
+    function.shutdown()
+    assert function.executor is None
+    function.pool()
+    assert function.executor is not None
+    function.shutdown()
+    assert function.executor is None
@@ -57,6 +57,17 @@ def test_solve_1(function):
         assert res["success"]
 
 
+def test_solve_2(function):
+    workDir = Path("tests/work/temp/solver-1")
+    with (
+        mock.patch.object(function.parent, "runSolverBin", return_value=(0, "")) as run,
+        mock.patch.object(function.parent, "prepareResult") as prepare,
+    ):
+        function.solve(Path("tests/work/image/m51.fit"), True, workDir)
+    assert run.call_args.args[0][4] == workDir / "temp"
+    assert prepare.call_args.args[3] == workDir / "temp.wcs"
+
+
 def test_checkAvailabilityProgram_1(function):
     with mock.patch.object(Path, "is_file", return_value=True):
         suc = function.checkAvailabilityProgram(Path("test"))
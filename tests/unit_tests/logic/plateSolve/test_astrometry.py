@@ -73,6 +73,7 @@ def test_solve_1(function):
     ):
         res = function.solve(Path("tests/work/image/m51.fit"), True)
         assert not res["success"]
+        assert res["imagePath"] == Path("tests/work/image/m51.fit")
 
 
 def test_solve_2(function):
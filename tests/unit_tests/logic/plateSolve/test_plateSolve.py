@@ -21,7 +21,7 @@ import queue
 import shutil
 import subprocess
 from contextlib import suppress
-from mw4.logic.plateSolve.plateSolve import PlateSolve
+from mw4.logic.plateSolve.plateSolve import PlateSolve, SolveJob
 from pathlib import Path
 from tests.unit_tests.unitTestAddOns.baseTestApp import App
 from unittest import mock
@@ -60,7 +60,7 @@ def mocked_queueGet(monkeypatch, function):
 
 @pytest.fixture
 def mocked_processSolveQueue(monkeypatch, function):
-    def test(a, b, c):
+    def test(a, b, c, d):
         function.solveLoopRunning = False
 
     monkeypatch.setattr("mw4.logic.plateSolve.plateSolve.PlateSolve.processSolveQueue", test)
@@ -206,6 +206,22 @@ def test_processSolveQueue_2(function):
         function.processSolveQueue(Path("tests/work/image/m51.fit"), False)
 
 
+def test_processSolveQueue_3(function):
+    function.framework = "astap"
+    results = []
+    function.signals.result.connect(results.append)
+    with (
+        mock.patch.object(Path, "is_file", return_value=True),
+        mock.patch.object(
+            function.run["astap"],
+            "solve",
+            return_value={"success": False, "message": "failed"},
+        ),
+    ):
+        function.processSolveQueue(Path("tests/work/image/m51.fit"), False)
+    assert results[0]["imagePath"] == Path("tests/work/image/m51.fit")
+
+
 def test_workerSolveLoop_1(function, mocked_queueGet):
     with function.solveQueue.mutex:
         function.solveQueue.queue.clear()
@@ -216,9 +232,31 @@ def test_workerSolveLoop_1(function, mocked_queueGet):
 
 def test_workerSolveLoop_2(function, mocked_processSolveQueue):
     function.solveLoopRunning = True
-    function.solveQueue.put(("tests/work/image/m51.fit", False))
+    function.solve(Path("tests/work/image/m51.fit"))
     with suppress(Exception):
         function.runnerSolveLoop()
+    assert not function.runningJobs
+
+
+def test_workerSolveLoop_3(function):
+    function.solveLoopRunning = True
+    function.solve(Path("tests/work/image/m51.fit"))
+    function.cancelJobs(function.PRIORITY_BATCH)
+    results = []
+    function.signals.result.connect(results.append)
+
+    def mock_get(*args, **kwargs):
+        function.solveLoopRunning = False
+        return queue.PriorityQueue.get(function.solveQueue, *args, **kwargs)
+
+    with (
+        mock.patch.object(function.solveQueue, "get", side_effect=mock_get),
+        mock.patch.object(function, "processSolveQueue") as process,
+    ):
+        function.runnerSolveLoop()
+    function.signals.result.disconnect(results.append)
+    assert not process.called
+    assert results[0]["message"] == "Solve cancelled"
 
 
 def test_workerSolveLoop_empty_queue(function, monkeypatch):
@@ -234,16 +272,18 @@ def test_workerSolveLoop_empty_queue(function, monkeypatch):
 
 def test_startSolveLoop_1(function):
     function.solveLoopRunning = False
-    with mock.patch.object(function.threadPool, "start"):
+    with mock.patch.object(function.threadPool, "start") as start:
         function.startSolveLoop()
     assert function.solveLoopRunning
+    assert start.call_count == function.NUMBER_WORKERS
 
 
 def test_startSolveLoop_2(function):
     function.solveLoopRunning = True
-    with mock.patch.object(function.threadPool, "start"):
+    with mock.patch.object(function.threadPool, "start") as start:
         function.startSolveLoop()
     assert function.solveLoopRunning
+    assert not start.called
 
 
 def test_checkAvailabilityProgram_1(function):
@@ -286,11 +326,64 @@ def test_stopCommunication(function):
 def test_solve_1(function):
     function.framework = "astap"
     file = "tests/work/image/m51.fit"
-    function.solve(imagePath=file)
+    assert function.solve(imagePath=file)
+    job = function.solveQueue.get_nowait()
+    assert job.imagePath == Path(file)
+    assert job.priority == function.PRIORITY_BATCH
+
+
+def test_solve_2(function):
+    function.solve(Path("batch.fit"))
+    function.solve(Path("image.fit"), True, function.PRIORITY_INTERACTIVE)
+    assert function.solveQueue.get_nowait().imagePath == Path("image.fit")
+    assert function.solveQueue.get_nowait().imagePath == Path("batch.fit")
+
+
+def test_solve_3(function):
+    results = []
+    function.signals.result.connect(results.append)
+    with mock.patch.object(function.solveQueue, "put_nowait", side_effect=queue.Full):
+        suc = function.solve(Path("image.fit"))
+    function.signals.result.disconnect(results.append)
+    assert not suc
+    assert results[0]["message"] == "Solve queue full"
+
+
+def test_checkJob_1(function):
+    function.solve(Path("image.fit"))
+    function.solve(Path("image.fit"))
+    first = function.solveQueue.get_nowait()
+    second = function.solveQueue.get_nowait()
+    assert function.checkJob(first) == "superseded"
+    assert function.checkJob(second) == "run"
+    function.runningJobs.clear()
+
+
+def test_checkJob_2(function):
+    function.solve(Path("image.fit"), priority=function.PRIORITY_INTERACTIVE)
+    function.solve(Path("batch.fit"))
+    function.cancelJobs(function.PRIORITY_BATCH)
+    first = function.solveQueue.get_nowait()
+    second = function.solveQueue.get_nowait()
+    assert function.checkJob(first) == "run"
+    assert function.checkJob(second) == "cancelled"
+    function.runningJobs.clear()
+
+
+def test_cancelJobs_1(function):
+    process = mock.MagicMock()
+    other = mock.MagicMock()
+    function.runningJobs = {1: SolveJob(1, 1, Path("a")), 2: SolveJob(0, 2, Path("b"))}
+    function.processes = {1: process, 2: other}
+    function.cancelJobs(function.PRIORITY_BATCH)
+    assert process.kill.called
+    assert not other.kill.called
+    function.runningJobs = {}
+    function.processes = {}
 
 
 def test_abort_no_process(function):
-    function.process = None
+    function.processes = {}
     function.abort()
 
 
@@ -302,6 +395,7 @@ def test_abort_with_process(function):
             self.killed = True
 
     fake = FakeProcess()
-    function.process = fake
+    function.processes = {1: fake}
     function.abort()
     assert fake.killed
+    function.processes = {}
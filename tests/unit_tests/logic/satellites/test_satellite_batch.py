@@ -0,0 +1,166 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+
+import numpy as np
+import pytest
+from mw4.logic.satellites.satellite_batch import (
+    calcAppMagBatch,
+    calcSatStatesBatch,
+    checkTwilightBatch,
+    findCulminationTimes,
+    findSatMessagesBatch,
+    findSatUpBatch,
+)
+from mw4.logic.satellites.satellite_calculations import (
+    calcAppMag,
+    checkTwilight,
+    findRangeRate,
+    findSatUp,
+    findSunlit,
+)
+from skyfield.api import EarthSatellite, wgs84
+from tests.unit_tests.unitTestAddOns.baseTestApp import App
+
+TLES = [
+    [
+        "ISS (ZARYA)",
+        "1 25544U 98067A   21103.51063550  .00000247  00000-0  12689-4 0  9995",
+        "2 25544  51.6440 300.6013 0002785 249.6598 185.5302 15.48867952278608",
+    ],
+    [
+        "NOAA 8",
+        "1 13923U 83022A   21103.90417581  .00000005  00000-0  19448-4 0  9998",
+        "2 13923  98.6122  63.2579 0016304  96.9736 263.3301 14.28696485924954",
+    ],
+    [
+        "CALSPHERE 1",
+        "1 00900U 64063C   21103.74429300  .00000461  00000-0  48370-3 0  9996",
+        "2 00900  90.1716  36.8626 0025754 343.8320 164.5583 13.73613883839670",
+    ],
+]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def function():
+    yield App()
+
+
+@pytest.fixture(scope="module")
+def sats(function):
+    ts = function.mount.obsSite.ts
+    return [EarthSatellite(tle[1], tle[2], tle[0], ts) for tle in TLES]
+
+
+def test_calcSatStatesBatch_1(function):
+    loc = wgs84.latlon(48, 11, 500)
+    t = function.mount.obsSite.ts.tt_jd(2459318.8)
+    result = calcSatStatesBatch([], loc, function.ephemeris, t)
+    assert len(result.satRange) == 0
+    assert result.messages == []
+
+
+def test_calcSatStatesBatch_2(function, sats):
+    loc = wgs84.latlon(48, 11, 500)
+    eph = function.ephemeris
+    t = function.mount.obsSite.ts.tt_jd(2459318.8)
+    result = calcSatStatesBatch(sats, loc, eph, t)
+    for i, sat in enumerate(sats):
+        satParam = findRangeRate(sat, loc, t)
+        assert result.satRange[i] == pytest.approx(satParam[0], abs=1e-6)
+        assert result.radRate[i] == pytest.approx(satParam[1], abs=1e-9)
+        assert result.latRate[i] == pytest.approx(satParam[2], abs=1e-9)
+        assert result.lonRate[i] == pytest.approx(satParam[3], abs=1e-9)
+        isSunlit = findSunlit(sat, eph, t)
+        assert result.isSunlit[i] == isSunlit
+        if isSunlit:
+            appMag = calcAppMag(sat, loc, eph, satParam[0], t)
+            assert result.appMag[i] == pytest.approx(appMag, abs=1e-9)
+        else:
+            assert result.appMag[i] == 99
+        assert result.messages[i] is None
+
+
+def test_calcAppMagBatch_1():
+    val = calcAppMagBatch(np.array([np.pi / 2]), np.array([1000.0]))
+    assert val[0] == pytest.approx(-1.3)
+
+
+def test_findSatMessagesBatch_1(function):
+    assert findSatMessagesBatch([], function.mount.obsSite.ts.now()) == []
+
+
+def test_findSatMessagesBatch_2(function):
+    tle = [
+        "STARLINK-1914",
+        "1 47180U 20088BL  21303.19708368  .16584525  12000-4  30219-2 0  9999",
+        "2 47180  53.0402 223.8709 0008872 210.0671 150.2394 16.31518727 52528",
+    ]
+    ts = function.mount.obsSite.ts
+    sat = EarthSatellite(tle[1], tle[2], tle[0], ts)
+    t = ts.tt_jd(2459523.2430)
+    val = findSatMessagesBatch([sat], t)
+    assert val[0] == sat.at(t).message
+
+
+def test_findCulminationTimes_1():
+    alt = np.array([[10.0, 20.0]])
+    val = findCulminationTimes(alt, np.array([0.0, 1.0]), 5)
+    assert np.isnan(val[0])
+
+
+def test_findCulminationTimes_2():
+    alt = np.array([[10.0, 20.0, 25.0, 20.0, 10.0], [1.0, 2.0, 3.0, 2.0, 1.0]])
+    val = findCulminationTimes(alt, np.arange(5.0), 5)
+    assert val[0] == pytest.approx(2.0)
+    assert np.isnan(val[1])
+
+
+def test_findSatUpBatch_1(function):
+    loc = wgs84.latlon(48, 11, 500)
+    t = function.mount.obsSite.ts.now()
+    assert len(findSatUpBatch([], loc, t, t, 30)) == 0
+
+
+def test_findSatUpBatch_2(function, sats):
+    loc = wgs84.latlon(48, 11, 500)
+    ts = function.mount.obsSite.ts
+    tStart = ts.tt_jd(2459318.8)
+    tEnd = ts.tt_jd(tStart.tt + 1)
+    val = findSatUpBatch(sats, loc, tStart, tEnd, 30)
+    for i, sat in enumerate(sats):
+        isUp = findSatUp(sat, loc, tStart, tEnd, 30)
+        if len(isUp):
+            assert val[i] == pytest.approx(isUp[0].tt, abs=10 / 86400)
+        else:
+            assert np.isnan(val[i])
+
+
+def test_checkTwilightBatch_1(function):
+    loc = wgs84.latlon(48, 11, 500)
+    ts = function.mount.obsSite.ts
+    val = checkTwilightBatch(function.ephemeris, loc, ts, np.array([np.nan]))
+    assert val[0] == 5
+
+
+def test_checkTwilightBatch_2(function):
+    loc = wgs84.latlon(48, 11, 500)
+    ts = function.mount.obsSite.ts
+    eph = function.ephemeris
+    times = np.array([2459318.9, np.nan, 2459319.2])
+    val = checkTwilightBatch(eph, loc, ts, times)
+    assert val[0] == checkTwilight(eph, loc, [ts.tt_jd(times[0])])
+    assert val[1] == 5
+    assert val[2] == checkTwilight(eph, loc, [ts.tt_jd(times[2])])
@@ -0,0 +1,133 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import pytest
+import threading
+from mw4.mountcontrol.commandBatcher import BatchRequest, CommandBatcher
+from unittest import mock
+
+
+@pytest.fixture
+def batcher():
+    yield CommandBatcher()
+
+
+def test_takeBatch_empty(batcher):
+    assert batcher.takeBatch() == []
+
+
+def test_takeBatch_all(batcher):
+    batcher.pending = [BatchRequest(":GS#", 1), BatchRequest(":GJD1#", 1)]
+    batch = batcher.takeBatch()
+    assert len(batch) == 2
+    assert not batcher.pending
+
+
+def test_takeBatch_limit(batcher):
+    long = ":GS#" * (batcher.MAX_BATCH_LENGTH // 4)
+    batcher.pending = [BatchRequest(long, 128), BatchRequest(":GJD1#", 1)]
+    batch = batcher.takeBatch()
+    assert len(batch) == 1
+    assert len(batcher.pending) == 1
+
+
+def test_takeBatch_firstTooLong(batcher):
+    long = ":GS#" * batcher.MAX_BATCH_LENGTH
+    batcher.pending = [BatchRequest(long, 512)]
+    batch = batcher.takeBatch()
+    assert len(batch) == 1
+
+
+def test_distribute_ok(batcher):
+    batch = [BatchRequest(":GS#:GDUT#", 2), BatchRequest(":GJD1#", 1)]
+    batcher.distribute(batch, True, ["a", "b", "c"])
+    assert batch[0].suc
+    assert batch[0].response == ["a", "b"]
+    assert batch[1].suc
+    assert batch[1].response == ["c"]
+
+
+def test_distribute_wrongCount(batcher):
+    batch = [BatchRequest(":GS#:GDUT#", 2), BatchRequest(":GJD1#", 1)]
+    batcher.distribute(batch, True, ["a", "b"])
+    assert not batch[0].suc
+    assert not batch[1].suc
+    assert batch[1].response == []
+
+
+def test_distribute_fail(batcher):
+    batch = [BatchRequest(":GJD1#", 1)]
+    batcher.distribute(batch, False, [])
+    assert not batch[0].suc
+
+
+def test_sendBatches_exception(batcher):
+    connection = mock.Mock()
+    connection.communicate.side_effect = Exception("Test")
+    request = BatchRequest(":GJD1#", 1)
+    batcher.pending = [request]
+    batcher.collecting = True
+    batcher.sendBatches(connection)
+    assert request.done
+    assert not request.suc
+    assert not batcher.collecting
+
+
+def test_submit_single(batcher):
+    connection = mock.Mock()
+    connection.communicate.return_value = (True, ["2460000.5"], 1)
+    suc, response = batcher.submit(connection, ":GJD1#", 1)
+    assert suc
+    assert response == ["2460000.5"]
+    connection.communicate.assert_called_once_with(":GJD1#")
+    assert not batcher.collecting
+
+
+def test_submit_noWindow(batcher):
+    connection = mock.Mock()
+    connection.communicate.return_value = (True, ["2460000.5"], 1)
+    with mock.patch("mw4.mountcontrol.commandBatcher.QThread") as thread:
+        batcher.submit(connection, ":GJD1#", 1)
+        thread.msleep.assert_not_called()
+        batcher.concurrent = True
+        batcher.submit(connection, ":GJD1#", 1)
+        thread.msleep.assert_called_once_with(batcher.BATCH_WINDOW)
+    assert not batcher.concurrent
+
+
+def test_submit_coalesce(batcher):
+    connection = mock.Mock()
+    connection.communicate.return_value = (True, ["a", "b", "c"], 3)
+    results = {}
+    started = threading.Event()
+
+    def leader():
+        started.set()
+        results["leader"] = batcher.submit(connection, ":GS#:GDUT#", 2)
+
+    thread = threading.Thread(target=leader)
+    batcher.concurrent = True
+    with mock.patch.object(batcher, "BATCH_WINDOW", 200):
+        thread.start()
+        started.wait()
+        while not batcher.collecting:
+            pass
+        results["follower"] = batcher.submit(connection, ":GJD1#", 1)
+        thread.join()
+
+    connection.communicate.assert_called_once_with(":GS#:GDUT#:GJD1#")
+    assert results["leader"] == (True, ["a", "b"])
+    assert results["follower"] == (True, ["c"])
+    assert batcher.concurrent
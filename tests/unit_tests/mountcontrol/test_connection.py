@@ -13,8 +13,11 @@
 # License APL2.0
 #
 ###########################################################
+from mw4.mountcontrol.commandBatcher import CommandBatcher
 from mw4.mountcontrol.connection import Connection
+from mw4.mountcontrol.connectionPool import ConnectionPool
 from PySide6.QtCore import QByteArray
+from PySide6.QtNetwork import QAbstractSocket
 from unittest import mock
 
 
@@ -43,6 +46,8 @@ def makeParent(host=None, loggingTrace: bool = False) -> object:
     p = Parent()
     p.loggingTrace = loggingTrace
     p.mountIsUp = True
+    p.connectionPool = ConnectionPool()
+    p.commandBatcher = CommandBatcher()
 
     config = Config()
     if isinstance(host, tuple) and len(host) == 2:
@@ -589,3 +594,197 @@ class TestCommandP:
         conn = Connection(makeParent())
         assert isinstance(conn.COMMAND_P, frozenset)
         assert frozenset({":RC", ":Rc", ":RG", ":Suaf"}) == conn.COMMAND_P
+
+
+class TestPooledCommunicate:
+    """Tests for reusing pooled sockets in communicate."""
+
+    @staticmethod
+    def makeConnectedClient(data: bytes = b"") -> mock.MagicMock:
+        client = makeClient(data=data)
+        client.state.return_value = QAbstractSocket.SocketState.ConnectedState
+        client.bytesAvailable.return_value = 0
+        return client
+
+    def test_acquireClient_fromPool(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        client = self.makeConnectedClient()
+        with mock.patch.object(conn.pool, "acquire", return_value=client):
+            result, reused = conn.acquireClient()
+        assert result is client
+        assert reused
+
+    def test_acquireClient_build(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        client = self.makeConnectedClient()
+        with (
+            mock.patch.object(conn.pool, "acquire", return_value=None),
+            mock.patch.object(conn, "buildClient", return_value=client),
+        ):
+            result, reused = conn.acquireClient()
+        assert result is client
+        assert not reused
+
+    def test_acquireClient_mountNotUp(self):
+        parent = makeParent(host=("localhost", 3492))
+        parent.mountIsUp = False
+        conn = Connection(parent)
+        with mock.patch.object(conn.pool, "acquire") as m_acquire:
+            result, reused = conn.acquireClient()
+        m_acquire.assert_not_called()
+        assert result is None
+        assert not reused
+
+    def test_communicate_releasesClient(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        client = self.makeConnectedClient(data=b"10micron GM1000HPS#")
+        client.waitForReadyRead.side_effect = [True, False]
+        with mock.patch.object(conn, "buildClient", return_value=client):
+            suc, response, _ = conn.communicate(":GVN#")
+        assert suc
+        assert response == ["10micron GM1000HPS"]
+        client.abort.assert_not_called()
+        assert len(conn.pool.idleClients) == 1
+
+    def test_communicate_noReply_releasesClient(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        client = self.makeConnectedClient()
+        client.waitForReadyRead.return_value = False
+        with mock.patch.object(conn, "buildClient", return_value=client):
+            suc, response, _ = conn.communicate(":AP#")
+        assert suc
+        assert response == []
+        assert len(conn.pool.idleClients) == 1
+
+    def test_communicate_reusesClient(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        client = self.makeConnectedClient(data=b"1#")
+        client.waitForReadyRead.side_effect = [True, False, False, True, False]
+        with mock.patch.object(conn, "buildClient", return_value=client) as m_build:
+            conn.communicate(":GVN#")
+            suc, response, _ = conn.communicate(":GVN#")
+        assert m_build.call_count == 1
+        assert suc
+        assert response == ["1"]
+
+    def test_communicate_reconnect_lostSocket(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        stale = self.makeConnectedClient()
+        stale.waitForReadyRead.return_value = False
+        stale.state.return_value = QAbstractSocket.SocketState.UnconnectedState
+        fresh = self.makeConnectedClient(data=b"1#")
+        with (
+            mock.patch.object(conn, "acquireClient", return_value=(stale, True)),
+            mock.patch.object(conn, "buildClient", return_value=fresh),
+        ):
+            suc, response, _ = conn.communicate(":GVN#")
+        assert suc
+        assert response == ["1"]
+        stale.abort.assert_called_once()
+
+    def test_communicate_noReconnect_lostSocket_action(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        stale = self.makeConnectedClient()
+        stale.waitForReadyRead.return_value = False
+        stale.state.return_value = QAbstractSocket.SocketState.UnconnectedState
+        with (
+            mock.patch.object(conn, "acquireClient", return_value=(stale, True)),
+            mock.patch.object(conn, "buildClient") as m_build,
+        ):
+            suc, _, _ = conn.communicate(":MS#")
+        assert not suc
+        m_build.assert_not_called()
+
+    def test_communicate_noReconnect_sendFailed_action(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        stale = self.makeConnectedClient()
+        stale.write.side_effect = Exception("Test")
+        with (
+            mock.patch.object(conn, "acquireClient", return_value=(stale, True)),
+            mock.patch.object(conn, "buildClient") as m_build,
+        ):
+            suc, _, _ = conn.communicate(":PO#")
+        assert not suc
+        m_build.assert_not_called()
+
+    def test_isReadOnly(self):
+        assert Connection.isReadOnly(":GR#:GD#")
+        assert not Connection.isReadOnly(":GR#:MS#")
+        assert not Connection.isReadOnly(":PO#")
+        assert not Connection.isReadOnly("")
+
+    def test_communicate_reconnect_fails(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        stale = self.makeConnectedClient()
+        stale.write.side_effect = Exception("Test")
+        with (
+            mock.patch.object(conn, "acquireClient", return_value=(stale, True)),
+            mock.patch.object(conn, "buildClient", return_value=None),
+        ):
+            suc, response, _ = conn.communicate(":GVN#")
+        assert not suc
+        assert response == []
+
+    def test_communicate_noReconnect_timeout(self):
+        conn = Connection(makeParent(host=("localhost", 3492)))
+        client = self.makeConnectedClient()
+        client.waitForReadyRead.return_value = False
+        with (
+            mock.patch.object(conn, "acquireClient", return_value=(client, True)),
+            mock.patch.object(conn, "buildClient") as m_build,
+        ):
+            suc, _, _ = conn.communicate(":GVN#")
+        assert not suc
+        m_build.assert_not_called()
+        client.abort.assert_called_once()
+
+
+class TestBatchedCommunicate:
+    """Tests for isBatchable and communicateBatched."""
+
+    def test_isBatchable_chunks(self):
+        conn = Connection(makeParent())
+        assert conn.isBatchable(":GS#:GDUT#:TLESCK#:Ginfo#:GaE#")
+
+    def test_isBatchable_commandB_inside(self):
+        conn = Connection(makeParent())
+        assert conn.isBatchable(":GMs#:Guaf#:Gdat#:Gh#")
+
+    def test_isBatchable_commandB_last(self):
+        conn = Connection(makeParent())
+        assert not conn.isBatchable(":GMs#:Gdat#")
+
+    def test_isBatchable_commandA_last(self):
+        conn = Connection(makeParent())
+        assert conn.isBatchable(":GMs#:AP#")
+
+    def test_isBatchable_noReply(self):
+        conn = Connection(makeParent())
+        assert not conn.isBatchable(":AP#")
+
+    def test_communicateBatched_invalid(self):
+        conn = Connection(makeParent())
+        suc, response, chunks = conn.communicateBatched(":test#")
+        assert not suc
+        assert response == []
+        assert chunks == 0
+
+    def test_communicateBatched_notBatchable(self):
+        conn = Connection(makeParent())
+        with mock.patch.object(conn, "communicate", return_value=(True, [], 0)) as m_comm:
+            conn.communicateBatched(":FLIP#", responseCheck="1")
+        m_comm.assert_called_once_with(":FLIP#", responseCheck="1")
+
+    def test_communicateBatched_ok(self):
+        conn = Connection(makeParent())
+        with mock.patch.object(conn.batcher, "submit", return_value=(True, ["1", "2"])):
+            suc, response, chunks = conn.communicateBatched(":GS#:GDUT#")
+        assert suc
+        assert response == ["1", "2"]
+        assert chunks == 2
+
+    def test_communicateBatched_responseCheck(self):
+        conn = Connection(makeParent())
+        with mock.patch.object(conn.batcher, "submit", return_value=(True, ["0"])):
+            suc, _, _ = conn.communicateBatched(":GS#", responseCheck="1")
+        assert not suc
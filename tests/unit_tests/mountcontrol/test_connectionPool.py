@@ -0,0 +1,214 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import pytest
+import threading
+import time
+from mw4.mountcontrol.connectionPool import ConnectionPool
+from PySide6.QtCore import QThread
+from PySide6.QtNetwork import QAbstractSocket
+from unittest import mock
+
+HOST = ("localhost", 3492)
+
+
+def makeClient(
+    state: QAbstractSocket.SocketState = QAbstractSocket.SocketState.ConnectedState,
+    readyRead: bool = False,
+    available: int = 0,
+) -> mock.MagicMock:
+    client = mock.MagicMock()
+    client.state.return_value = state
+    client.waitForReadyRead.return_value = readyRead
+    client.bytesAvailable.return_value = available
+    return client
+
+
+@pytest.fixture
+def pool():
+    yield ConnectionPool()
+
+
+def test_closeClient_1(pool):
+    client = makeClient()
+    pool.closeClient(client)
+    client.abort.assert_called_once()
+    client.close.assert_called_once()
+
+
+def test_closeClient_2(pool):
+    client = makeClient()
+    client.abort.side_effect = Exception
+    pool.closeClient(client)
+
+
+def test_isHealthy_1(pool):
+    assert pool.isHealthy(makeClient())
+
+
+def test_isHealthy_2(pool):
+    client = makeClient(state=QAbstractSocket.SocketState.UnconnectedState)
+    assert not pool.isHealthy(client)
+
+
+def test_isHealthy_3(pool):
+    assert not pool.isHealthy(makeClient(readyRead=True))
+
+
+def test_isHealthy_4(pool):
+    assert not pool.isHealthy(makeClient(available=3))
+
+
+def test_isHealthy_5(pool):
+    client = makeClient()
+    client.state.side_effect = [
+        QAbstractSocket.SocketState.ConnectedState,
+        QAbstractSocket.SocketState.UnconnectedState,
+    ]
+    assert not pool.isHealthy(client)
+
+
+def test_isHealthy_6(pool):
+    client = makeClient()
+    client.state.side_effect = Exception
+    assert not pool.isHealthy(client)
+
+
+def test_acquire_empty(pool):
+    assert pool.acquire(HOST) is None
+
+
+def test_release_acquire(pool):
+    client = makeClient()
+    pool.release(HOST, client)
+    assert pool.acquire(HOST) is client
+    assert pool.acquire(HOST) is None
+
+
+def test_release_unhealthy(pool):
+    client = makeClient(state=QAbstractSocket.SocketState.UnconnectedState)
+    pool.release(HOST, client)
+    assert not pool.idleClients
+    client.abort.assert_called_once()
+
+
+def test_release_replaces(pool):
+    client1 = makeClient()
+    client2 = makeClient()
+    pool.release(HOST, client1)
+    pool.release(HOST, client2)
+    assert pool.acquire(HOST) is client2
+    client1.abort.assert_called_once()
+
+
+def test_acquire_otherHost(pool):
+    pool.release(HOST, makeClient())
+    assert pool.acquire(("192.168.2.15", 3492)) is None
+
+
+def test_acquire_unhealthy(pool):
+    client = makeClient()
+    pool.release(HOST, client)
+    client.bytesAvailable.return_value = 5
+    assert pool.acquire(HOST) is None
+    client.abort.assert_called_once()
+
+
+def test_acquire_otherThread(pool):
+    client = makeClient()
+    pool.release(HOST, client)
+    result = []
+    thread = threading.Thread(target=lambda: result.append(pool.acquire(HOST)))
+    thread.start()
+    thread.join()
+    assert result == [None]
+    assert pool.acquire(HOST) is client
+
+
+def test_takeThreadClients_expired(pool):
+    client = makeClient()
+    pool.release(HOST, client)
+    key = next(iter(pool.idleClients))
+    pool.idleClients[key] = (client, time.monotonic() - pool.MAX_IDLE_TIME - 1)
+    assert pool.acquire(HOST) is None
+    client.abort.assert_called_once()
+
+
+def test_takeThreadClients_foreign(pool):
+    client = makeClient()
+    pool.idleClients[(HOST, -1)] = (client, time.monotonic() - pool.MAX_IDLE_TIME - 1)
+    assert pool.acquire(HOST) is None
+    assert (HOST, -1) in pool.idleClients
+    client.abort.assert_not_called()
+
+
+def test_closeThreadClients(pool):
+    client1 = makeClient()
+    client2 = makeClient()
+    pool.idleClients[(HOST, -1)] = (client1, time.monotonic())
+    pool.retiredClients[-1] = [client2]
+    pool.watchedThreads.add(-1)
+    pool.closeThreadClients(-1)
+    assert not pool.idleClients
+    assert not pool.retiredClients
+    assert not pool.watchedThreads
+    client1.abort.assert_called_once()
+    client2.abort.assert_called_once()
+
+
+def test_watchThread(pool):
+    pool.watchThread(-1)
+    pool.watchThread(-1)
+    assert pool.watchedThreads == {-1}
+
+
+def test_threadFinished(pool):
+    client = makeClient()
+    closedIn = []
+    client.abort.side_effect = lambda: closedIn.append(threading.get_ident())
+    threadIds = []
+
+    class Runner(QThread):
+        def run(self) -> None:
+            threadIds.append(threading.get_ident())
+            pool.release(HOST, client)
+
+    thread = Runner()
+    thread.start()
+    thread.wait()
+    assert not pool.idleClients
+    assert closedIn == threadIds
+
+
+def test_clear(pool):
+    client1 = makeClient()
+    client2 = makeClient()
+    pool.release(HOST, client1)
+    pool.idleClients[(HOST, -1)] = (client2, time.monotonic())
+    pool.clear()
+    assert not pool.idleClients
+    client1.abort.assert_called_once()
+    client2.abort.assert_not_called()
+    assert pool.retiredClients == {-1: [client2]}
+
+
+def test_release_closesRetired(pool):
+    client1 = makeClient()
+    client2 = makeClient()
+    pool.retiredClients[threading.get_ident()] = [client1]
+    pool.release(HOST, client2)
+    client1.abort.assert_called_once()
+    client2.abort.assert_not_called()
+    assert not pool.retiredClients
@@ -16,7 +16,10 @@
 
 import math
 import mw4.mountcontrol
+import numpy as np
+import pytest
 from mw4.mountcontrol.convert import (
+    altAzToTopo,
     convertDecToAngle,
     convertLatToAngle,
     convertLonToAngle,
@@ -232,6 +235,25 @@ def test_valueToFloat_not_ok_2():
     assert value == 0
 
 
+def test_altAzToTopo_1():
+    ha, dec = altAzToTopo(Angle(degrees=90), Angle(degrees=0), Angle(degrees=50))
+    assert abs(ha.hours) < 1e-9
+    assert dec.degrees == pytest.approx(50)
+
+
+def test_altAzToTopo_2():
+    lat = Angle(degrees=50)
+    alt = np.array([10.0, 45.0, 80.0])
+    az = np.array([30.0, 180.0, 300.0])
+    ha, dec = altAzToTopo(Angle(degrees=alt), Angle(degrees=az), lat)
+    assert ha.hours[0] < 0
+    assert ha.hours[2] > 0
+    for i in range(3):
+        altR, azR = topoToAltAz(Angle(hours=ha.hours[i]), Angle(degrees=dec.degrees[i]), lat)
+        assert altR.degrees == pytest.approx(alt[i])
+        assert azR.degrees == pytest.approx(az[i])
+
+
 def test_topoToAltAz_ok2():
     alt, az = topoToAltAz(Angle(hours=0), Angle(degrees=0), Angle(degrees=0))
     assert alt.degrees == 90
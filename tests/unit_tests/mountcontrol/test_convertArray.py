@@ -0,0 +1,65 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import numpy as np
+from mw4.mountcontrol.convert import stringToDegree, topoToAltAz, valueToFloat
+from mw4.mountcontrol.convertArray import stringsToDegrees, topoToAltAzArray, valuesToFloats
+from skyfield.api import Angle
+
+
+def test_stringsToDegrees_1():
+    values = ["12:30:00.00", "+45*30:00.0", "-12*30:00.0", "011:35:00.0", "+45*30"]
+    result = stringsToDegrees(values)
+    assert np.allclose(result, [12.5, 45.5, -12.5, 11 + 35 / 60, 45.5])
+
+
+def test_stringsToDegrees_2():
+    values = ["E", "", "+-1:2", "12:aa:30", "12 30 00", None, "1:2:3:4", "12deg 30 00"]
+    result = stringsToDegrees(values)
+    assert list(result) == [stringToDegree(value) for value in values]
+
+
+def test_stringsToDegrees_3():
+    values = ["-00*30:00.0", "-00:30"]
+    result = stringsToDegrees(values)
+    assert list(result) == [stringToDegree(value) for value in values]
+
+
+def test_stringsToDegrees_4():
+    result = stringsToDegrees([])
+    assert len(result) == 0
+
+
+def test_valuesToFloats_1():
+    values = ["1.5", " 100", 3, "-0.25"]
+    result = valuesToFloats(values)
+    assert list(result) == [1.5, 100, 3, -0.25]
+
+
+def test_valuesToFloats_2():
+    values = ["1.5", "E", None, "abc", [1]]
+    result = valuesToFloats(values)
+    assert list(result) == [valueToFloat(value) for value in values]
+
+
+def test_topoToAltAzArray_1():
+    lat = Angle(degrees=48.1)
+    ha = Angle(hours=np.array([-6, -1, 0, 1, 6, 12]))
+    dec = Angle(degrees=np.array([10, 45, 89, -20, 0, 60]))
+    alt, az = topoToAltAzArray(ha, dec, lat)
+    for i in range(6):
+        altS, azS = topoToAltAz(Angle(hours=ha.hours[i]), Angle(degrees=dec.degrees[i]), lat)
+        assert alt.degrees[i] == altS.degrees
+        assert az.degrees[i] == azS.degrees
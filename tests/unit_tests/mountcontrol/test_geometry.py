@@ -13,6 +13,7 @@
 # License APL2.0
 #
 ###########################################################
+import numpy as np
 import pytest
 from mw4.mountcontrol.geometry import Geometry
 from mw4.mountcontrol.mount import MountDevice
@@ -865,3 +866,54 @@ def test_updateDomeSettings_signal_connected(function):
     function.geometry.offGEM = 0.0
     function.geometry.parent.app.updateDomeSettings.emit()
     assert function.geometry.offGEM == 999.0
+
+
+def test_transformRotStack_1(function):
+    angles = np.array([10.0, 45.0, 200.0])
+    for axis in ["x", "y", "z"]:
+        T = function.geometry.transformRotStack(axis, angles)
+        assert T.shape == (3, 4, 4)
+        for i, angle in enumerate(angles):
+            assert np.allclose(T[i], function.geometry.transformRot(axis, angle))
+
+
+@pytest.mark.parametrize("latitude", [50, -35])
+def test_calcTransformationMatricesBatch_1(function, latitude):
+    function.geometry.initializeGeometry("10micron GM2000HPS")
+    function.geometry.offNorth = 0.1
+    function.geometry.offEast = 0.2
+    function.geometry.offVert = 0.3
+    function.geometry.offGEM = 0.1
+    function.geometry.cfg["offLAT"] = 0.05
+    function.geometry.cfg["radius"] = 1.5
+    lat = Angle(degrees=latitude)
+    ha = np.array([-5.0, -1.0, 0.5, 3.0, 11.0])
+    dec = np.array([-20.0, 10.0, 45.0, 60.0, 89.0])
+    pierside = ["W", "E", "E", "W", "E"]
+    alt, az, intersect, PB, PD = function.geometry.calcTransformationMatricesBatch(
+        Angle(hours=ha), Angle(degrees=dec), lat, pierside
+    )
+    for i in range(len(ha)):
+        altS, azS, intersectS, PBS, PDS = function.geometry.calcTransformationMatrices(
+            Angle(hours=ha[i]), Angle(degrees=dec[i]), lat, pierside[i]
+        )
+        assert alt.degrees[i] == pytest.approx(altS.degrees)
+        assert az.degrees[i] == pytest.approx(azS.degrees)
+        assert np.allclose(intersect[i], intersectS)
+        assert np.allclose(PB[i], PBS)
+        assert np.allclose(PD[i], PDS)
+
+
+def test_calcTransformationMatricesBatch_2(function):
+    function.geometry.initializeGeometry("10micron GM1000HPS")
+    function.geometry.offNorth = 100
+    function.geometry.offEast = 100
+    function.geometry.offVert = 100
+    function.geometry.cfg["offLAT"] = 100
+    function.geometry.cfg["radius"] = 0.01
+    alt, az, intersect, _, _ = function.geometry.calcTransformationMatricesBatch(
+        Angle(hours=np.array([0.0])), Angle(degrees=np.array([89.0])), Angle(degrees=89), ["E"]
+    )
+    assert np.isnan(alt.degrees[0])
+    assert np.isnan(az.degrees[0])
+    assert np.isnan(intersect).all()
@@ -18,6 +18,8 @@ import mw4.mountcontrol
 import numpy
 import skyfield.api
 from mw4.mountcontrol import obsSite
+from mw4.mountcontrol.commandBatcher import CommandBatcher
+from mw4.mountcontrol.connectionPool import ConnectionPool
 from mw4.mountcontrol.model import Model, ModelStar, ProgStar
 from skyfield.api import Angle, Star, wgs84
 from tests.unit_tests.unitTestAddOns.baseTestApp import App
@@ -41,6 +43,8 @@ def makeParent():
         config = Config()
         loggingTrace = False
         obsSite = ObsSite()
+        connectionPool = ConnectionPool()
+        commandBatcher = CommandBatcher()
 
     return Parent()
 
@@ -640,6 +644,33 @@ def test_Model_parseStars_not_ok1():
     assert len(model.starList) == 0
 
 
+def test_Model_parseStars_not_ok2():
+    model = Model(parent=makeParent())
+    response = [
+        "21:52:58.95,+08*56:10.1,   5.7,201",
+        "21:06:10.79,+45*20:52.8,  12.1",
+    ]
+    suc = model.parseStars(response, 2)
+    assert not suc
+    assert len(model.starList) == 0
+
+
+def test_Model_parseStars_values():
+    obsSite = App().mount.obsSite
+    obsSite.location = wgs84.latlon(latitude_degrees=0, longitude_degrees=0, elevation_m=0)
+
+    model = Model(parent=makeParent())
+    response = ["12:30:00.00,-10*30:00.0,   5.7,090"]
+    suc = model.parseStars(response, 1)
+    assert suc
+    star = model.starList[0]
+    assert star.coord.ra.hours == 12.5
+    assert star.coord.dec.degrees == -10.5
+    assert star.errorRMS == 5.7
+    assert star.errorAngle.degrees == 90
+    assert star.number == 0
+
+
 def test_getStarCount_1():
     model = Model(parent=makeParent())
     with (
@@ -13,6 +13,7 @@
 # License APL2.0
 #
 ###########################################################
+import numpy as np
 import pytest
 import wakeonlan
 from mw4.mountcontrol.mount import MountDevice
@@ -443,6 +444,23 @@ def test_calcMountAltAzToDomeAltAz_2(function):
         assert valAz is None
 
 
+def test_calcMountAltAzToDomeAltAzBatch_1(function):
+    function.obsSite.location = wgs84.latlon(
+        latitude_degrees=50, longitude_degrees=11, elevation_m=500
+    )
+    alt = np.array([30.0, 60.0])
+    az = np.array([90.0, 270.0])
+    with mock.patch.object(
+        function.geometry,
+        "calcTransformationMatricesBatch",
+        return_value=(Angle(degrees=alt), Angle(degrees=az), 0, 0, 0),
+    ) as calc:
+        valAlt, valAz = function.calcMountAltAzToDomeAltAzBatch(alt, az)
+    assert np.allclose(valAlt.degrees, alt)
+    assert list(calc.call_args.args[3]) == ["W", "E"]
+    assert np.allclose(valAz.degrees, az)
+
+
 def test_clearCyclePointing_alert_status_1_98(function):
     function.obsSite.status = 98
     function.statusAlert = False
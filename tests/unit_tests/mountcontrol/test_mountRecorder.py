@@ -0,0 +1,102 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import pytest
+import threading
+from mw4.mountcontrol.connection import Connection
+from mw4.mountcontrol.mountRecorder import (
+    Exchange,
+    MountRecorder,
+    MountReplay,
+    expectedReply,
+    loadSession,
+    replyComplete,
+    saveSession,
+)
+from mw4.mountcontrol.mountSimulator import (
+    MountSimulatorServer,
+    SimulatedMount,
+    SimulatorConfig,
+)
+from tests.unit_tests.mountcontrol.test_mountSimulator import Parent
+
+
+def startServer(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def stopServer(server):
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    server = startServer(MountSimulatorServer(SimulatorConfig(port=0)))
+    yield server
+    stopServer(server)
+
+
+def test_expectedReply_1():
+    assert expectedReply(":U2#:Gev#:Gg#:Gt#") == (3, 0)
+    assert expectedReply(":Sdat1#:AP#") == (0, 1)
+
+
+def test_replyComplete_1():
+    assert not replyComplete(b"1#", 2, 0)
+    assert replyComplete(b"1#2#", 2, 0)
+    assert replyComplete(b"1", 0, 1)
+
+
+def test_session_1(tmp_path):
+    sessionFile = tmp_path / "session.json"
+    exchanges = [Exchange(":GVN#", "3.2.9#", 0.01), Exchange(":Sdat1#", "1", 0.02)]
+    saveSession(sessionFile, exchanges)
+    assert loadSession(sessionFile) == exchanges
+
+
+def test_record_replay_1(simulator, tmp_path):
+    recorder = startServer(MountRecorder(SimulatorConfig(port=0), simulator.address))
+    conn = Connection(Parent(recorder.address))
+    commands = [":U2#:Gev#:Gg#:Gt#", ":Sdat1#", ":GVN#", ":AP#"]
+    expected = [conn.communicate(command) for command in commands]
+    stopServer(recorder)
+    assert [exchange.command for exchange in recorder.exchanges] == commands
+    assert recorder.exchanges[1].response == "1"
+    assert recorder.exchanges[3].response == ""
+
+    sessionFile = tmp_path / "session.json"
+    recorder.save(sessionFile)
+    replay = startServer(MountReplay(SimulatorConfig(port=0), loadSession(sessionFile)))
+    conn = Connection(Parent(replay.address))
+    assert [conn.communicate(command) for command in commands] == expected
+    stopServer(replay)
+
+
+def test_replay_1():
+    exchanges = [Exchange(":GS#", "10:00:00.00#"), Exchange(":GS#", "10:00:01.00#")]
+    with MountReplay(SimulatorConfig(port=0), exchanges) as replay:
+        assert replay.respond(":GS#") == "10:00:00.00#"
+        assert replay.respond(":GS#") == "10:00:01.00#"
+        assert replay.respond(":GS#") == "10:00:01.00#"
+        assert replay.respond(":GVN#") == ""
+
+
+def test_replay_2():
+    config = SimulatorConfig(port=0)
+    with MountReplay(config, [], fallback=SimulatedMount()) as replay:
+        assert replay.respond(":GVN#:Sdat1#") == "3.2.9#1"
@@ -0,0 +1,298 @@
+############################################################
+#
+#       #   #  #   #   #    #
+#      ##  ##  #  ##  #    #
+#     # # # #  # # # #    #  #
+#    #  ##  #  ##  ##    ######
+#   #   #   #  #   #       #
+#
+# Python-based Tool for interaction with the 10_micron mounts
+# GUI with PySide
+#
+# written in python3, (c) 2019-2026 by mworion
+# License APL2.0
+#
+###########################################################
+import os
+import pytest
+import threading
+from mw4.mountcontrol.commandBatcher import CommandBatcher
+from mw4.mountcontrol.connection import Connection
+from mw4.mountcontrol.connectionPool import ConnectionPool
+from mw4.mountcontrol.firmware import Firmware
+from mw4.mountcontrol.mountSimulator import (
+    MountSimulatorServer,
+    SimulatedMount,
+    SimulatorConfig,
+    formatDMS,
+    formatHMS,
+    replyType,
+)
+from mw4.mountcontrol.obsSite import MountStatus, ObsSite
+from mw4.mountcontrol.setting import Setting
+from pathlib import Path
+from skyfield.api import Angle
+
+TLE = [
+    "ISS (ZARYA)",
+    "1 25544U 98067A   21103.51063550  .00000247  00000-0  12689-4 0  9995",
+    "2 25544  51.6440 302.6231 0002845 223.0251 174.1262 15.48881308278524",
+]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.time = 1700000000.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class Parent:
+    loggingTrace = False
+    mountIsUp = True
+    pathToData = Path(os.getcwd() + "/data")
+
+    def __init__(self, address: tuple[str, int]) -> None:
+        class Config:
+            hostAddress = address[0]
+            port = address[1]
+
+        self.config = Config()
+        self.connectionPool = ConnectionPool()
+        self.commandBatcher = CommandBatcher()
+
+
+@pytest.fixture
+def mount():
+    yield SimulatedMount(slewTime=2.0, clock=Clock())
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = MountSimulatorServer(SimulatorConfig(port=0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_formatHMS_1():
+    assert formatHMS(12.5) == "12:30:00.00"
+
+
+def test_formatDMS_1():
+    assert formatDMS(-11.5, 3, ":") == "-011:30:00.0"
+    assert formatDMS(45) == "+45*00:00.0"
+
+
+def test_replyType_1():
+    assert replyType(":AP") == "A"
+    assert replyType(":RC2") == "A"
+    assert replyType(":Sdat1") == "B"
+    assert replyType(":GS") == "C"
+
+
+def test_reply_1(mount):
+    assert mount.reply(":AP") is None
+    assert mount.reply(":Sdat0") == "1"
+    assert mount.reply(":Gdat") == "0"
+    assert mount.reply(":GVN") == "3.2.9#"
+
+
+def test_reply_2(mount):
+    assert mount.reply(":GMAC") == "00:00:00:00:00:00#"
+    assert mount.reply(":unknown") == "0#"
+
+
+def test_replies_1(mount):
+    replies = mount.replies(":U2#:Gev#:Gg#:Gt#")
+    assert replies == [
+        (":U2", None),
+        (":Gev", "+0585.2#"),
+        (":Gg", "-011:35:00.0#"),
+        (":Gt", "+48:07:00.0#"),
+    ]
+
+
+def test_localSidereal_1(mount):
+    lst = mount.localSidereal()
+    mount.clock.time += 3600
+    assert mount.localSidereal() == pytest.approx((lst + mount.SIDEREAL) % 24)
+
+
+def test_tracking_1(mount):
+    mount.reply(":AP")
+    assert mount.status == MountStatus.TRACKING
+    ha, dec = mount.position()
+    mount.clock.time += 3600
+    assert mount.position()[0] == pytest.approx(ha + mount.SIDEREAL, abs=1e-5)
+    assert mount.position()[1] == dec
+
+
+def test_slew_1(mount):
+    mount.reply(":Sr10:00:00.00")
+    mount.reply(":Sd+20*00:00.0")
+    assert mount.reply(":MS") == "0"
+    assert mount.status == MountStatus.SLEWING
+    mount.clock.time += 1
+    assert mount.reply(":Ginfo").endswith(",6,1#")
+    mount.clock.time += 2
+    ra, dec, *_ = mount.reply(":Ginfo").split(",")
+    assert mount.status == MountStatus.TRACKING
+    assert float(ra) == pytest.approx(10, abs=1e-4)
+    assert float(dec) == pytest.approx(20)
+
+
+def test_park_1(mount):
+    mount.reply(":hP")
+    mount.clock.time += 3
+    mount.position()
+    assert mount.status == MountStatus.PARKED
+    assert mount.reply(":MS") == "1"
+    mount.reply(":PO")
+    assert mount.status == MountStatus.TRACKING_OFF
+
+
+def test_stop_1(mount):
+    mount.reply(":AP")
+    mount.reply(":STOP")
+    assert mount.status == MountStatus.STOPPED
+    assert not mount.tracking
+
+
+def test_targetPierside_1(mount):
+    mount.reply(":Sa+45*00:00.0")
+    mount.reply(":Sz090*00:00.0")
+    assert mount.reply(":GTsid") == "2"
+    mount.reply(":Sz270*00:00.0")
+    assert mount.reply(":GTsid") == "3"
+    mount.reply(":Sa-10*00:00.0")
+    assert mount.reply(":GTsid") == "0"
+
+
+def test_setter_1(mount):
+    mount.reply(":Sw4")
+    assert mount.reply(":GMs") == "4#"
+
+
+def test_clock_1(mount):
+    julD = float(mount.reply(":GJD1")[:-1])
+    assert mount.reply(":NUtim+1000") == "1#"
+    assert float(mount.reply(":GJD1")[:-1]) == pytest.approx(julD + 1 / 86400)
+
+
+def test_model_1(mount):
+    assert mount.reply(":getain") == "E#"
+    assert mount.reply(":newalig") == "V#"
+    for i in range(3):
+        mount.reply(
+            f":newalpt1{i}:00:00.0,+45*00:00.0,E,1{i}:00:01.0,+45*00:01.0,1{i}:30:00.0"
+        )
+    assert mount.reply(":endalig") == "V#"
+    assert mount.reply(":getalst") == "3#"
+    assert len(mount.reply(":getain").split(",")) == 9
+    assert mount.reply(":getalp1").startswith("00:30:00.00,+45*00:00.0,")
+    assert mount.reply(":delalst1") == "1#"
+    assert mount.reply(":getalst") == "2#"
+    assert mount.reply(":delalig") == "#"
+    assert mount.reply(":getalst") == "0#"
+
+
+def test_modelNames_1(mount):
+    assert mount.reply(":modelcnt") == "0#"
+    mount.reply(":modelsv0test")
+    assert mount.reply(":modelcnt") == "1#"
+    assert mount.reply(":modelnam1") == "test#"
+    assert mount.reply(":modelld0test") == "1#"
+    assert mount.reply(":modeldel0test") == "1#"
+    assert mount.reply(":modeldel0test") == "0#"
+
+
+def test_satellite_1(mount):
+    assert mount.reply(":TLEG") == "E#"
+    assert mount.reply(":TLEL0" + "$0a".join(TLE)) == "V#"
+    assert mount.reply(":TLEG") == "$0A".join(TLE) + "$0A#"
+    alt, az = mount.reply(":TLEGAZ2459318.5")[:-1].split(",")
+    assert -90 <= float(alt) <= 90
+    assert 0 <= float(az) <= 360
+
+
+def test_satellite_2(mount):
+    assert mount.reply(":TLEL0broken") == "E#"
+    assert mount.reply(":TLEGEQ2459318.5") == "E#"
+
+
+def test_trajectory_1(mount):
+    assert mount.reply(":TRNEW2459318.5") == "V#"
+    assert mount.reply(":TRP") == "E#"
+    assert mount.reply(":TRADD180.0,45.0") == "1#"
+    assert mount.reply(":TRADD181.0,46.0") == "2#"
+    start, end, _ = mount.reply(":TRP")[:-1].split(",")
+    assert float(start) == 2459318.5
+    assert float(end) > float(start)
+
+
+def test_offsets_1(mount):
+    assert mount.reply(":TROFFSET2,1.5") == "V#"
+    assert mount.reply(":TROFFADD2,1.0") == "V#"
+    assert mount.reply(":TROFFGET2") == "+02.5#"
+    assert mount.reply(":TROFFCLR") == "V#"
+    assert mount.reply(":TROFFGET2") == "+00.0#"
+
+
+def test_server_delay_1():
+    config = SimulatorConfig(port=0, latency=0.1, jitter=0.05, seed=1)
+    with MountSimulatorServer(config) as first, MountSimulatorServer(config) as second:
+        delays = [first.delay() for _ in range(10)]
+        assert delays == [second.delay() for _ in range(10)]
+        assert all(0.05 <= delay <= 0.15 for delay in delays)
+
+
+def test_server_connection_1(server):
+    conn = Connection(Parent(server.address))
+    suc, response, chunks = conn.communicate(":U2#:Gev#:Gg#:Gt#")
+    assert suc
+    assert chunks == 3
+    assert response == ["+0585.2", "-011:35:00.0", "+48:07:00.0"]
+
+
+def test_server_connection_2(server):
+    conn = Connection(Parent(server.address))
+    suc, response, _ = conn.communicate(":Sdat1#")
+    assert suc
+    assert response == ["1"]
+
+
+def test_server_firmware_1(server):
+    fw = Firmware(parent=Parent(server.address))
+    assert fw.poll()
+    assert fw.vString == "3.2.9"
+    assert fw.product == "10micron GM1000HPS"
+
+
+def test_server_obsSite_1(server):
+    obsSite = ObsSite(parent=Parent(server.address))
+    obsSite.setLoaderAndTimescale()
+    assert obsSite.getLocation()
+    assert obsSite.location.latitude.degrees == pytest.approx(48 + 7 / 60)
+    assert obsSite.pollPointing()
+    assert obsSite.pierside in ["E", "W"]
+
+
+def test_server_obsSite_2(server):
+    obsSite = ObsSite(parent=Parent(server.address))
+    obsSite.setLoaderAndTimescale()
+    suc = obsSite.setTargetAltAz(Angle(degrees=45), Angle(degrees=90))
+    assert suc
+    assert obsSite.piersideTarget == "W"
+
+
+def test_server_setting_1(server):
+    parent = Parent(server.address)
+    parent.firmware = Firmware(parent=parent)
+    parent.firmware.vString = "3.2.9"
+    setting = Setting(parent=parent)
+    assert setting.pollSetting()
+    assert setting.refractionTemp == 10.0
@@ -415,6 +415,7 @@ def test_pollSyncClock_success(function):
         assert mock_connection.called
         call_args = mock_conn_instance.communicate.call_args
         assert call_args[0][0] == ":GJD1#"
+        mock_conn_instance.communicateBatched.assert_not_called()
         assert function._timeDiff[0] != 0
 
 
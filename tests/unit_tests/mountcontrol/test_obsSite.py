@@ -16,7 +16,8 @@
 
 import math
 import os
-from mw4.mountcontrol.obsSite import ObsSite
+import pytest
+from mw4.mountcontrol.obsSite import MountStatus, ObsSite
 from pathlib import Path
 from skyfield.api import Angle, Loader, Timescale, wgs84
 from unittest import mock
@@ -263,7 +264,7 @@ def test_Site_pierside():
     assert obsSite.pierside == "E"
     obsSite.pierside = "w"
     assert obsSite.pierside == "W"
-    assert obsSite._pierside == "W"
+    assert obsSite.pointing.pierside == "W"
     obsSite.pierside = "W"
     assert obsSite.pierside == "W"
     obsSite.pierside = "WW"
@@ -564,7 +565,7 @@ def test_Site_statusSlew():
     assert obsSite.statusSlew
     obsSite.statusSlew = 1
     assert obsSite.statusSlew
-    assert obsSite._statusSlew
+    assert obsSite.pointing.statusSlew
     obsSite.statusSlew = True
     assert obsSite.statusSlew
     obsSite.statusSlew = False
@@ -715,6 +716,122 @@ def test_ObsSite_parsePointing_ok3():
     assert isinstance(obsSite.Alt, Angle)
 
 
+def test_ObsSite_parsePointing_ok4():
+    obsSite = ObsSite(parent=Parent())
+
+    response = [
+        "13:15:35.68",
+        "0.12",
+        "T",
+        "19.44591,+88.0032,w,002.9803,+47.9945,2458352.10403639,10,1",
+        "2458352.10403639, 100, 100, 0.1, 0.1",
+    ]
+    suc = obsSite.parsePointing(response, 5)
+    assert suc
+    assert obsSite.pointing.ra == 19.44591
+    assert obsSite.pointing.pierside == "W"
+    assert obsSite.pointing.status == 10
+    assert obsSite.pointing.statusSlew
+    assert obsSite.pointing.errorAngularPosDEC == 0.1
+    assert obsSite._raJNow is None
+    assert obsSite.raJNow.hours == 19.44591
+    assert obsSite.raJNow is obsSite.raJNow
+    assert obsSite.timeSidereal.hours == pytest.approx(13.25991111)
+    assert obsSite.angularPosRA.degrees == 100
+    assert obsSite.isFollowingSatellite
+    assert obsSite.statusSat == "T"
+
+
+class InvalidatingObsSite(ObsSite):
+    """
+    resets each cached value right after it was stored, like the poll thread
+    does it with invalidatePointing between store and return of a getter.
+    """
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("_raJNow", "_Alt", "_timeJD") and value is not None:
+            super().__setattr__(name, None)
+
+
+def test_ObsSite_invalidateWhileBuilding():
+    obsSite = InvalidatingObsSite(parent=Parent())
+    obsSite.parent.mountIsUp = True
+    obsSite.pointing.ra = 5.0
+    obsSite.pointing.alt = 30.0
+    obsSite.pointing.julianDate = 2458352.1
+    assert obsSite.raJNow.hours == 5.0
+    assert obsSite.Alt.degrees == 30.0
+    assert obsSite.timeJD is not None
+
+
+def test_ObsSite_parsePointing_ok5():
+    obsSite = ObsSite(parent=Parent())
+
+    response = [
+        "13:15:35.68",
+        "0.12",
+        "X",
+        "19.44591,E,X,002.9803,+47.9945,2458352.10403639,77,0",
+        "2458352.10403639, 100, 100, 0.1, 0.1",
+    ]
+    suc = obsSite.parsePointing(response, 5)
+    assert suc
+    assert obsSite.decJNow.degrees == 0
+    assert obsSite.pierside == "E"
+    assert obsSite.status == MountStatus.ERROR
+    assert obsSite.statusSat == "E"
+
+
+def test_ObsSite_parsePointing_not_ok1():
+    obsSite = ObsSite(parent=Parent())
+
+    response = [
+        "13:15:35.68",
+        "0.12",
+        "V",
+        "19.44591,+88.0032,W,002.9803",
+        "2458352.10403639, 100, 100, 0.1, 0.1",
+    ]
+    suc = obsSite.parsePointing(response, 5)
+    assert not suc
+
+
+def test_ObsSite_parsePointing_AzDirection():
+    obsSite = ObsSite(parent=Parent())
+
+    response = [
+        "13:15:35.68",
+        "0.12",
+        "V",
+        "19.44591,+88.0032,W,359.0000,+47.9945,2458352.10403639,0,0",
+        "2458352.10403639, 100, 100, 0.1, 0.1",
+    ]
+    obsSite.parsePointing(response, 5)
+    assert obsSite.AzDirection == -1
+    response[3] = "19.44591,+88.0032,W,001.0000,+47.9945,2458352.10403639,0,0"
+    obsSite.parsePointing(response, 5)
+    assert obsSite.AzDirection == 1
+    assert obsSite.lastAz == 1
+
+
+def test_ObsSite_timeJD_lazy():
+    obsSite = ObsSite(parent=Parent())
+    obsSite.parent.mountIsUp = True
+    obsSite.UTC2TT = 0
+
+    response = [
+        "13:15:35.68",
+        "0.12",
+        "V",
+        "19.44591,+88.0032,W,002.9803,+47.9945,2458352.10403639,5,0",
+        "2458352.10403639, 100, 100, 0.1, 0.1",
+    ]
+    obsSite.parsePointing(response, 5)
+    assert obsSite._timeJD is None
+    assert obsSite.timeJD.tt == 2458352.10403639
+
+
 def test_ObsSite_pollPointing_ok4():
     obsSite = ObsSite(parent=Parent())
 
@@ -727,7 +844,7 @@ def test_ObsSite_pollPointing_ok4():
     ]
 
     with mock.patch("mw4.mountcontrol.obsSite.Connection") as mConn:
-        mConn.return_value.communicate.return_value = True, response, 5
+        mConn.return_value.communicateBatched.return_value = True, response, 5
         suc = obsSite.pollPointing()
         assert suc
 
@@ -743,7 +860,7 @@ def test_ObsSite_pollPointing_not_ok1():
     ]
 
     with mock.patch("mw4.mountcontrol.obsSite.Connection") as mConn:
-        mConn.return_value.communicate.return_value = False, response, 3
+        mConn.return_value.communicateBatched.return_value = False, response, 3
         suc = obsSite.pollPointing()
         assert not suc
 
@@ -759,7 +876,7 @@ def test_ObsSite_pollPointing_not_ok2():
     ]
 
     with mock.patch("mw4.mountcontrol.obsSite.Connection") as mConn:
-        mConn.return_value.communicate.return_value = True, response, 5
+        mConn.return_value.communicateBatched.return_value = True, response, 5
         suc = obsSite.pollPointing()
         assert not suc
 
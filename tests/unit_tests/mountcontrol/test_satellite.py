@@ -493,7 +493,7 @@ def test_statTLE_1():
     sat = Satellite(App().mount)
 
     with mock.patch("mw4.mountcontrol.satellite.Connection") as mConn:
-        mConn.return_value.communicate.return_value = False, "E", 1
+        mConn.return_value.communicateBatched.return_value = False, "E", 1
 
         suc = sat.statTLE()
         assert not suc
@@ -503,7 +503,7 @@ def test_statTLE_2():
     sat = Satellite(App().mount)
 
     with mock.patch("mw4.mountcontrol.satellite.Connection") as mConn:
-        mConn.return_value.communicate.return_value = True, "E", 1
+        mConn.return_value.communicateBatched.return_value = True, "E", 1
 
         suc = sat.statTLE()
         assert suc
@@ -565,7 +565,7 @@ def test_Setting_poll_ok1(function):
     ]
 
     with mock.patch("mw4.mountcontrol.setting.Connection") as mConn:
-        mConn.return_value.communicate.return_value = True, response, 27
+        mConn.return_value.communicateBatched.return_value = True, response, 27
         suc = function.pollSetting()
         assert suc
 
@@ -603,7 +603,7 @@ def test_Setting_poll_ok2(function):
     ]
 
     with mock.patch("mw4.mountcontrol.setting.Connection") as mConn:
-        mConn.return_value.communicate.return_value = True, response, 27
+        mConn.return_value.communicateBatched.return_value = True, response, 27
         suc = function.pollSetting()
         assert suc
 
@@ -641,7 +641,7 @@ def test_Setting_poll_not_ok1(function):
     ]
 
     with mock.patch("mw4.mountcontrol.setting.Connection") as mConn:
-        mConn.return_value.communicate.return_value = False, response, 27
+        mConn.return_value.communicateBatched.return_value = False, response, 27
         suc = function.pollSetting()
         assert not suc
 
@@ -677,7 +677,7 @@ def test_Setting_poll_not_ok2(function):
     ]
 
     with mock.patch("mw4.mountcontrol.setting.Connection") as mConn:
-        mConn.return_value.communicate.return_value = False, response, 6
+        mConn.return_value.communicateBatched.return_value = False, response, 6
         suc = function.pollSetting()
         assert not suc
 
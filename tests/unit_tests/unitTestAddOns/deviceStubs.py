@@ -26,6 +26,9 @@ class DeviceConfigOnlineWeather:
 
 
 class PlateSolve:
+    PRIORITY_INTERACTIVE = 0
+    PRIORITY_BATCH = 1
+
     def __init__(self):
         from mw4.base.signalsDevices import Signals
 
@@ -36,7 +39,11 @@ class PlateSolve:
         self.defaultConfig = {"framework": "", "frameworks": {"indi": {"dummy": {}}}}
 
     @staticmethod
-    def solve(a, b):
+    def solve(a, b=False, c=1):
+        return
+
+    @staticmethod
+    def cancelJobs(a):
         return
 
     @staticmethod
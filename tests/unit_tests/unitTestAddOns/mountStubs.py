@@ -15,6 +15,8 @@
 ###########################################################
 import numpy as np
 from dataclasses import dataclass, field
+from mw4.mountcontrol.commandBatcher import CommandBatcher
+from mw4.mountcontrol.connectionPool import ConnectionPool
 from packaging.version import Version
 from PySide6.QtCore import QObject, Signal
 from skyfield.api import Angle, Loader, load, wgs84
@@ -174,6 +176,7 @@ class MountSetting:
         self.autoPowerOn = "None"
         self.typeConnection = 1
         self.trackingRate = 60.2
+        self.slewRate = 0
         self.slewRateMin = 0
         self.slewRateMax = 1
         self.webInterfaceStat = True
@@ -472,6 +475,8 @@ class Mount(QObject):
         self.host = None
         self.MAC = None
         self.loggingTrace = False
+        self.connectionPool = ConnectionPool()
+        self.commandBatcher = CommandBatcher()
         self.stat = False
         self.instance = self
         self.framework = "mountcontrol"
@@ -531,6 +536,10 @@ class Mount(QObject):
     def calcMountAltAzToDomeAltAz():
         return
 
+    @staticmethod
+    def calcMountAltAzToDomeAltAzBatch(alt, az):
+        return Angle(degrees=alt), Angle(degrees=az)
+
     @staticmethod
     def calcTransformationMatricesActual():
         return (1, 1, np.array([0, 0, 0]), np.array([0, 0, 0]), np.array([0, 0, 0]))